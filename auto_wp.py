@@ -18,11 +18,8 @@ from datetime import datetime
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from PIL import Image, ImageDraw, ImageFont
-import openai
-from openai import OpenAI
 import base64
-import pandas as pd
+# PIL, openai는 사용하는 함수 안에서 지연 로드 (시작 시간 단축)
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QGridLayout, QLabel, QPushButton, 
@@ -115,6 +112,195 @@ def get_base_path():
         #  Python    
         return os.path.dirname(__file__)
 
+# 설정 파일 (우선순위: JSON > TOML > XLSX)
+CONFIG_FILE_NAMES = ["wordpress_setting.json", "wordpress_setting.toml", "wordpress_setting.xlsx"]
+CONFIG_COLUMNS = ['설정', '값', '설명']
+
+# 파싱 결과 캐시 {경로: (mtime_ns, 파일 크기, 설정 dict)}
+_config_cache = {}
+
+_XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+def _xlsx_column_index(cell_ref):
+    """셀 주소(예: 'B10')의 열 번호(0부터) 반환"""
+    index = 0
+    for ch in cell_ref:
+        if not ch.isalpha():
+            break
+        index = index * 26 + (ord(ch.upper()) - ord('A') + 1)
+    return index - 1
+
+def _xlsx_number(text):
+    """숫자 셀 값 변환 (정수면 int, 아니면 float)"""
+    try:
+        number = float(text)
+    except (TypeError, ValueError):
+        return text
+    return int(number) if number.is_integer() else number
+
+def read_xlsx_rows(path):
+    """XLSX 첫 번째 시트를 행 단위로 읽기 (zipfile + iterparse, pandas/openpyxl 불필요)"""
+    import zipfile
+    import xml.etree.ElementTree as ET
+
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+
+        # 공유 문자열 (윗주 rPh는 제외)
+        shared_strings = []
+        if 'xl/sharedStrings.xml' in names:
+            with archive.open('xl/sharedStrings.xml') as f:
+                for _, elem in ET.iterparse(f):
+                    if elem.tag == _XLSX_NS + 'si':
+                        parts = [t.text or '' for t in elem.iter(_XLSX_NS + 't')]
+                        phonetic = [t.text or '' for rph in elem.iter(_XLSX_NS + 'rPh') for t in rph.iter(_XLSX_NS + 't')]
+                        text = ''.join(parts)
+                        if phonetic:
+                            text = ''.join(parts[:len(parts) - len(phonetic)])
+                        shared_strings.append(text)
+                        elem.clear()
+
+        # 첫 번째 시트 경로 (workbook.xml → workbook.xml.rels)
+        sheet_path = 'xl/worksheets/sheet1.xml'
+        try:
+            workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+            first_sheet = workbook.find(f'{_XLSX_NS}sheets/{_XLSX_NS}sheet')
+            rel_id = first_sheet.get(f'{_XLSX_REL_NS}id')
+            rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+            for rel in rels:
+                if rel.get('Id') == rel_id:
+                    target = rel.get('Target').lstrip('/')
+                    sheet_path = target if target.startswith('xl/') else f"xl/{target}"
+                    break
+        except Exception:
+            pass
+
+        rows = []
+        with archive.open(sheet_path) as f:
+            for _, elem in ET.iterparse(f):
+                if elem.tag != _XLSX_NS + 'row':
+                    continue
+                row = []
+                for cell in elem.iter(_XLSX_NS + 'c'):
+                    col = _xlsx_column_index(cell.get('r', '')) if cell.get('r') else len(row)
+                    cell_type = cell.get('t')
+                    value_elem = cell.find(_XLSX_NS + 'v')
+                    raw = value_elem.text if value_elem is not None else None
+                    if cell_type == 's' and raw is not None:
+                        value = shared_strings[int(raw)]
+                    elif cell_type == 'inlineStr':
+                        value = ''.join(t.text or '' for t in cell.iter(_XLSX_NS + 't'))
+                    elif cell_type == 'b':
+                        value = raw == '1'
+                    elif cell_type in ('str', 'e'):
+                        value = raw
+                    else:
+                        value = _xlsx_number(raw) if raw is not None else None
+                    while len(row) < col:
+                        row.append(None)
+                    row.append(value)
+                rows.append(row)
+                elem.clear()
+        return rows
+
+def write_xlsx_rows(path, rows):
+    """행 목록을 최소 구성 XLSX로 저장 (인라인 문자열 사용, pandas/openpyxl 불필요)"""
+    import zipfile
+    from xml.sax.saxutils import escape
+
+    def column_name(index):
+        name = ''
+        index += 1
+        while index:
+            index, rem = divmod(index - 1, 26)
+            name = chr(ord('A') + rem) + name
+        return name
+
+    row_xml = []
+    for r, row in enumerate(rows, start=1):
+        cells = []
+        for c, value in enumerate(row):
+            ref = f"{column_name(c)}{r}"
+            if value is None:
+                continue
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+            else:
+                cells.append(f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{escape(str(value))}</t></is></c>')
+        row_xml.append(f'<row r="{r}">{"".join(cells)}</row>')
+
+    sheet = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+             '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             f'<sheetData>{"".join(row_xml)}</sheetData></worksheet>')
+    workbook = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>')
+    workbook_rels = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                     '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                     'Target="worksheets/sheet1.xml"/></Relationships>')
+    root_rels = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                 '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                 '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+                 'Target="xl/workbook.xml"/></Relationships>')
+    content_types = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                     '<Default Extension="xml" ContentType="application/xml"/>'
+                     '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                     '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                     '</Types>')
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', content_types)
+        archive.writestr('_rels/.rels', root_rels)
+        archive.writestr('xl/workbook.xml', workbook)
+        archive.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+        archive.writestr('xl/worksheets/sheet1.xml', sheet)
+
+def find_config_file(base_path):
+    """사용할 설정 파일 경로 반환 (없으면 None)"""
+    for name in CONFIG_FILE_NAMES:
+        path = os.path.join(base_path, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+def load_config_file(path):
+    """설정 파일(JSON/TOML/XLSX)을 {설정: 값} dict로 로드 - 파일이 바뀌지 않았으면 캐시 사용"""
+    stat = os.stat(path)
+    cached = _config_cache.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return dict(cached[2])
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    elif ext == '.toml':
+        try:
+            import tomllib
+        except ImportError:  # Python 3.10 이하
+            import tomli as tomllib
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        data = {}
+        rows = read_xlsx_rows(path)
+        for row in rows[1:]:  # 첫 행은 헤더 (설정/값/설명)
+            if not row or row[0] is None or str(row[0]).strip() == '':
+                continue
+            value = row[1] if len(row) > 1 and row[1] is not None else ''
+            data[str(row[0]).strip()] = value
+
+    if not isinstance(data, dict):
+        raise ValueError(f"설정 파일 형식 오류: {os.path.basename(path)}")
+
+    _config_cache[path] = (stat.st_mtime_ns, stat.st_size, dict(data))
+    return data
+
 class WordPressButton(QPushButton):
     """WordPress  """
     def __init__(self, text, button_type="primary", parent=None):
@@ -693,6 +879,7 @@ class ContentGenerator:
                 self.log(" OpenAI API   !")
                 return self.generate_simple_content(keyword)
             
+            from openai import OpenAI
             client = OpenAI(api_key=api_key)
             
             #  URL 
@@ -946,6 +1133,7 @@ class ContentGenerator:
                 self.save_content_to_file(title, content, keyword)
                 return title, content
             
+            from openai import OpenAI
             client = OpenAI(api_key=api_key)
             
             simple_prompt = f""" '{keyword}'     .
@@ -981,6 +1169,7 @@ HTML  ,     ."""
         """   -  """
         try:
             # OpenAI  
+            from openai import OpenAI
             client = OpenAI(api_key=self.config_data.get('gpt_api_key'))
             
             self.log("   ...")
@@ -1724,6 +1913,8 @@ class AutoWP(QMainWindow):
         self.current_keyword = ""
         self.remaining_keywords = []
         self.wait_time = 0
+        self.wait_deadline = 0  # 대기 종료 시각(epoch) - 남은 시간은 remaining_wait_time()으로 계산
+        self.state_changed = threading.Event()  # 일시정지/재개/중지 시 대기 루프를 즉시 깨움
         self.total_keywords = 0
         self.success_count = 0
         self.fail_count = 0
@@ -2562,7 +2753,7 @@ class AutoWP(QMainWindow):
             
             if hasattr(self, 'wait_time_label') and self.wait_time_label:
                 try:
-                    wait_time = getattr(self, 'wait_time', 0)
+                    wait_time = self.remaining_wait_time()
                     if isinstance(wait_time, (int, float)) and wait_time >= 0:
                         minutes = int(wait_time) // 60
                         seconds = int(wait_time) % 60
@@ -2849,64 +3040,50 @@ class AutoWP(QMainWindow):
             self.log(f" URL  : {e}")
 
     def load_config(self):
-        """   (XLSX  )"""
+        """설정 파일 로드 (JSON/TOML/XLSX 지원, 변경되지 않은 파일은 캐시 사용)"""
         try:
-            excel_path = os.path.join(get_base_path(), "wordpress_setting.xlsx")
-            if os.path.exists(excel_path):
-                # XLSX   (  )
-                df = pd.read_excel(excel_path, engine='openpyxl')
-                
-                #   
-                self.config_data = {}
-                for _, row in df.iterrows():
-                    self.config_data[row['']] = row['']
+            config_path = find_config_file(get_base_path())
+            if config_path:
+                self.config_data = load_config_file(config_path)
                 
-                #       ( )
+                # 최초 로드 시에만 로그 출력
                 if not hasattr(self, 'config_loaded') or not self.config_loaded:
-                    self.log("     ")
+                    self.log(f"✅ 설정 파일 로드 완료: {os.path.basename(config_path)}")
                     self.config_loaded = True
-                #  URL  
+                # 사이트 URL 표시 업데이트
                 self.update_site_url_display()
             else:
                 self.create_excel_config_file()
                 
         except Exception as e:
-            self.log(f"   : {e}")
+            self.log(f"❌ 설정 파일 로드 오류: {e}")
             self.create_excel_config_file()
 
     def create_excel_config_file(self):
-        """    (XLSX ,    )"""
+        """기본 설정 파일 생성 (XLSX, 엑셀에서 바로 편집 가능)"""
         try:
             excel_path = os.path.join(get_base_path(), "wordpress_setting.xlsx")
             
-            #   
-            config_data = {
-                '': ['site_url', 'username', 'password', 'gpt_api_key', 'gpt_model', 'category', 'wait_minutes'],
-                '': ['https://your-site.com', 'your_username', 'your_password', 'your_openai_api_key', 'gpt-4o-mini', '1', '5-10'],
-                '': [
-                    'WordPress  URL (: https://yoursite.com)',
-                    'WordPress  ',
-                    'WordPress   (   )',
-                    'OpenAI API  - openai.com API Keys   (sk-  )',
-                    ' GPT  (gpt-4o-mini )',
-                    '  ',
-                    '  ()'
-                ]
-            }
+            # 기본 설정 (설정, 값, 설명)
+            default_rows = [
+                ['site_url', 'https://your-site.com', 'WordPress 사이트 URL (예: https://yoursite.com)'],
+                ['username', 'your_username', 'WordPress 사용자명'],
+                ['password', 'your_password', 'WordPress 애플리케이션 비밀번호'],
+                ['gpt_api_key', 'your_openai_api_key', 'OpenAI API 키 - openai.com API Keys 메뉴에서 발급 (sk- 로 시작)'],
+                ['gpt_model', 'gpt-4o-mini', '사용할 GPT 모델 (gpt-4o-mini 권장)'],
+                ['category', '1', '포스팅할 카테고리 ID'],
+                ['wait_minutes', '5-10', '포스팅 간격 (분)']
+            ]
             
-            # DataFrame   XLSX  (   )
-            df = pd.DataFrame(config_data)
-            df.to_excel(excel_path, index=False, engine='openpyxl')
+            write_xlsx_rows(excel_path, [CONFIG_COLUMNS] + default_rows)
             
-            #   
-            self.config_data = {}
-            for i, setting_name in enumerate(config_data['']):
-                self.config_data[setting_name] = config_data[''][i]
+            # 기본값으로 설정 로드
+            self.config_data = {row[0]: row[1] for row in default_rows}
             
-            self.log(" XLSX      (  )")
+            self.log("✅ 기본 설정 파일 생성 완료 (wordpress_setting.xlsx를 수정해주세요)")
             
         except Exception as e:
-            self.log(f"    : {e}")
+            self.log(f"❌ 설정 파일 생성 오류: {e}")
 
     def create_config_file(self):
         """   (JSON ) -  """
@@ -3130,6 +3307,7 @@ class AutoWP(QMainWindow):
                     #  
                     self.is_posting = False
                     self.is_paused = False
+                    self.state_changed.set()
                 except:
                     pass
             else:
@@ -3224,8 +3402,10 @@ class AutoWP(QMainWindow):
             self.is_paused = True
             self.pause_start_time = time.time()
             #    
-            self.paused_wait_time = max(0, self.wait_time)
+            self.paused_wait_time = self.remaining_wait_time()
+            self.wait_time = self.paused_wait_time
             self.log(f"   ( : {self.paused_wait_time//60} {self.paused_wait_time%60})")
+            self.state_changed.set()
             self.update_button_states()
 
     def resume_posting(self):
@@ -3241,6 +3421,7 @@ class AutoWP(QMainWindow):
             self.is_paused = False
             #   
             self.wait_time = self.paused_wait_time
+            self.state_changed.set()
             self.log(f"   ( : {self.wait_time//60} {self.wait_time%60})")
             self.update_button_states()
         elif not self.is_posting:
@@ -3254,6 +3435,7 @@ class AutoWP(QMainWindow):
         """ -  """
         self.is_posting = False
         self.is_paused = False
+        self.state_changed.set()
         self.current_keyword = ""
         self.remaining_keywords = []
         self.wait_time = 0
@@ -3267,6 +3449,14 @@ class AutoWP(QMainWindow):
         self.log("  ")
         self.update_button_states()
 
+    def remaining_wait_time(self):
+        """남은 대기 시간(초) - 대기 종료 시각 기준으로 계산 (일시정지 중이면 멈춘 값)"""
+        if self.is_paused:
+            return max(0, int(getattr(self, 'paused_wait_time', 0)))
+        if getattr(self, 'wait_deadline', 0):
+            return max(0, int(self.wait_deadline - time.time()))
+        return max(0, int(getattr(self, 'wait_time', 0)))
+
     def parse_wait_interval(self, wait_minutes_str):
         """   (  )"""
         try:
@@ -3288,7 +3478,9 @@ class AutoWP(QMainWindow):
             while self.is_posting and self.remaining_keywords:
                 try:
                     if self.is_paused:
-                        time.sleep(1)
+                        # 재개/중지 시 즉시 깨어남 (1초 폴링 없음)
+                        self.state_changed.wait()
+                        self.state_changed.clear()
                         continue
                     
                     #    ()
@@ -3347,37 +3539,22 @@ class AutoWP(QMainWindow):
                             wait_display = f"{self.wait_time//60} {self.wait_time%60}" if self.wait_time >= 60 else f"{self.wait_time}"
                             self.log(f"   : {wait_display} ( : {len(self.remaining_keywords)})")
                             
-                            #    (   -  )
-                            while self.wait_time > 0 and self.is_posting:
-                                try:
-                                    #    ( )
-                                    if not getattr(self, 'is_posting', False):
-                                        self.log(" is_posting False  -   ")
-                                        break
-                                    
-                                    #    (  )
-                                    if not hasattr(self, 'wait_time'):
-                                        self.log(" wait_time   -   ")
-                                        break
-                                        
-                                    if self.is_paused:
-                                        #    
-                                        time.sleep(1)
-                                        continue
-                                    
-                                    self.wait_time -= 1
-                                    time.sleep(1)
-                                    
-                                except KeyboardInterrupt:
-                                    try:
-                                        self.log("   ")
-                                    except:
-                                        pass
-                                    self.is_posting = False
+                            # 이벤트 기반 대기 - 일시정지/재개/중지 시 state_changed로 즉시 깨어남 (1초 폴링 없음)
+                            self.wait_deadline = time.time() + self.wait_time
+                            while self.is_posting:
+                                if self.is_paused:
+                                    self.state_changed.wait()
+                                    self.state_changed.clear()
+                                    # 재개 시 resume_posting이 복원한 남은 시간부터 다시 대기
+                                    self.wait_deadline = time.time() + self.wait_time
+                                    continue
+                                remaining = self.wait_deadline - time.time()
+                                if remaining <= 0:
                                     break
-                                except Exception as wait_error:
-                                    #       
-                                    time.sleep(1)
+                                self.state_changed.wait(remaining)
+                                self.state_changed.clear()
+                            self.wait_time = 0
+                            self.wait_deadline = 0
                             
                             #      ()
                             
@@ -3395,7 +3572,7 @@ class AutoWP(QMainWindow):
                 except Exception as e:
                     self.log(f"    : {e}")
                     self.log(f"   ...")
-                    time.sleep(5)  # 5    
+                    self.state_changed.wait(5)  # 5초 대기 (중지 시 즉시 깨어남)
                     continue
             
             #    (   )
@@ -3532,7 +3709,7 @@ def main():
   : {e}
 
   :
-pip install PyQt6 pandas requests pillow openai
+pip install PyQt6 requests pillow openai
 
  requirements.txt :
 pip install -r requirements.txt
@@ -0,0 +1,8209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Auto WP multi-site 엔진 - 설정/콘텐츠 생성/포스팅 루프 (Qt 비의존)
+
+GUI(auto_wp_multi-site.py)와 헤드리스 실행(--headless)이 함께 사용합니다.
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import threading
+import traceback
+from datetime import datetime, timedelta
+from pathlib import Path
+import shutil
+
+# 기존 라이브러리들
+import requests
+import urllib.parse
+import re
+import subprocess
+import importlib
+import bisect
+import copy
+
+# 무거운 라이브러리(PIL, AI SDK)는 처음 사용할 때 로드 - 시작 시간 단축
+# 설치되지 않은 패키지는 자동 설치하지 않고 None으로 처리합니다.
+_lazy_modules = {}
+_lazy_modules_lock = threading.Lock()
+
+def lazy_import(module_name):
+    """모듈 지연 로드 (결과 캐시) - 설치되어 있지 않으면 None 반환"""
+    with _lazy_modules_lock:
+        if module_name not in _lazy_modules:
+            try:
+                _lazy_modules[module_name] = importlib.import_module(module_name)
+            except ImportError as e:
+                print(f"❌ {module_name} 라이브러리 없음: {e}")
+                _lazy_modules[module_name] = None
+            except Exception as e:
+                print(f"❌ {module_name} 라이브러리 예상치 못한 오류: {e}")
+                _lazy_modules[module_name] = None
+        return _lazy_modules[module_name]
+
+def get_openai_class():
+    """OpenAI 클라이언트 클래스 (openai 미설치 시 None)"""
+    module = lazy_import("openai")
+    return getattr(module, "OpenAI", None) if module else None
+
+def get_genai():
+    """google.generativeai 모듈 (미설치 시 None)"""
+    return lazy_import("google.generativeai")
+
+def get_base_path():
+    """실행 파일의 기본 경로 반환 (EXE/PY 모두 지원)"""
+    if getattr(sys, 'frozen', False):  # PyInstaller로 빌드된 EXE인 경우
+        # _MEIPASS는 PyInstaller가 리소스를 압축 해제한 임시 폴더
+        # sys.executable은 실제 exe 파일 위치
+        # 설정 파일 등은 exe 위치, 리소스 파일은 _MEIPASS 사용
+        return os.path.dirname(sys.executable)
+    else:  # 일반 Python 스크립트인 경우
+        return os.path.dirname(os.path.abspath(__file__))
+
+def get_resource_path(relative_path):
+    """리소스 파일의 절대 경로 반환 (PyInstaller 호환)"""
+    if getattr(sys, 'frozen', False):  # PyInstaller로 빌드된 EXE인 경우
+        # _MEIPASS: PyInstaller가 리소스를 압축 해제한 임시 폴더
+        base_path = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
+    else:  # 일반 Python 스크립트인 경우
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, relative_path)
+
+def log_to_file(message):
+    """EXE 실행 시 로그 파일에 기록"""
+    try:
+        if getattr(sys, 'frozen', False):  # EXE 실행 시에만
+            log_file = os.path.join(get_base_path(), "debug.log")
+            with open(log_file, "a", encoding="utf-8") as f:
+                from datetime import datetime
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                f.write(f"[{timestamp}] {message}\n")
+                f.flush()
+    except Exception:
+        pass  # 로그 실패 시 무시
+
+def get_requests_session():
+    """최적화된 requests 세션 생성"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=3, pool_maxsize=5, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': 'Auto-WP/1.0',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+def acquire_file_lock(path, timeout=10, stale_after=30):
+    """프로세스 간 파일 잠금 (path.lock 생성) - lock 파일 경로 반환, 시간 초과 시 None
+
+    stale_after초 넘게 남아 있는 lock은 비정상 종료로 보고 제거합니다.
+    """
+    lock_path = path + ".lock"
+    deadline = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            return lock_path
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > stale_after:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.time() > deadline:
+                return None
+            time.sleep(0.05)
+
+def release_file_lock(lock_path):
+    if lock_path:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+def merge_json_file(path, apply, indent=2):
+    """JSON 파일을 잠근 채 다시 읽어 apply(data)로 이번 변경분만 반영하고 원자적으로 저장
+
+    여러 프로세스(분산 실행 워커)가 같은 파일을 써도 서로의 변경을 덮어쓰지 않습니다.
+
+    Returns:
+        dict: 병합 후 저장된 전체 데이터
+    """
+    lock_path = acquire_file_lock(path)
+    try:
+        data = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except ValueError:
+                data = {}
+        apply(data)
+        temp_file = path + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        os.replace(temp_file, path)
+        return data
+    finally:
+        release_file_lock(lock_path)
+
+# 설정 파일 경로
+SETTING_FILE = os.path.join(get_base_path(), "setting.json")
+
+# 기본 디렉토리 목록
+BASE_DIRECTORIES = ['keywords', 'thumbnails', 'fonts', 'prompts', 'output', 'drafts', 'checkpoints', 'archive']
+
+def ensure_base_directories():
+    """기본 디렉토리 생성 - import 시점이 아닌 프로그램 시작 시 호출"""
+    for directory in BASE_DIRECTORIES:
+        dir_path = os.path.join(get_base_path(), directory)
+        os.makedirs(dir_path, exist_ok=True)
+
+class NearDuplicateIndex:
+    """근접 중복 문장 인덱스 (clean_content 11단계용)
+
+    difflib.SequenceMatcher 유사도가 threshold를 넘는 기존 문장이 있는지 판정합니다.
+    모든 문장과 비교하던 기존 방식과 결과는 같고, 유사도의 상한값으로 비교 대상을 줄입니다.
+      1) 길이 범위: ratio <= 2*min(길이)/(길이 합) → 길이순 정렬 + bisect로 후보 구간만 조회
+      2) 문자 빈도 교집합: ratio <= quick_ratio → Counter 교집합으로 걸러냄
+      3) 남은 후보만 SequenceMatcher.ratio() 계산 (기존 문장 쪽 색인은 재사용)
+    """
+
+    def __init__(self, threshold=0.8):
+        self.threshold = threshold
+        self._texts = set()     # 원문 (정확히 일치하는 중복 확인용)
+        self._lengths = []      # 소문자 문장 길이 (정렬 유지)
+        self._entries = []      # (소문자 문장, 문자 빈도 Counter, SequenceMatcher)
+
+    def __contains__(self, text):
+        return text in self._texts
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, text):
+        from collections import Counter
+        from difflib import SequenceMatcher
+
+        if text in self._texts:
+            return
+        self._texts.add(text)
+        lowered = text.lower()
+        matcher = SequenceMatcher(None)
+        matcher.set_seq2(lowered)  # b 쪽 색인(b2j)은 문장당 한 번만 생성
+        index = bisect.bisect_right(self._lengths, len(lowered))
+        self._lengths.insert(index, len(lowered))
+        self._entries.insert(index, (lowered, Counter(lowered), matcher))
+
+    def has_similar(self, text):
+        """threshold를 넘게 유사한 문장이 있으면 True (similarity_ratio(text, 기존 문장)과 동일 기준)"""
+        from collections import Counter
+
+        lowered = text.lower()
+        length = len(lowered)
+        if length == 0 or not self._entries:
+            return False
+
+        # 1) 길이 상한: 2*min/(la+lb) > t  →  la*t/(2-t) < lb < la*(2-t)/t
+        t = self.threshold
+        low = bisect.bisect_left(self._lengths, length * t / (2 - t))
+        high = bisect.bisect_right(self._lengths, length * (2 - t) / t)
+        if low >= high:
+            return False
+
+        counts = Counter(lowered)
+        for other, other_counts, matcher in self._entries[low:high]:
+            total = length + len(other)
+            if 2.0 * min(length, len(other)) / total <= t:
+                continue
+            # 2) 문자 빈도 상한 (SequenceMatcher.quick_ratio와 동일)
+            if len(counts) < len(other_counts):
+                common = sum(min(n, other_counts[ch]) for ch, n in counts.items())
+            else:
+                common = sum(min(n, counts[ch]) for ch, n in other_counts.items())
+            if 2.0 * common / total <= t:
+                continue
+            # 3) 실제 유사도
+            matcher.set_seq1(lowered)
+            if matcher.ratio() > t:
+                return True
+        return False
+
+class ResourceScanner:
+    """리소스 파일 스캔 및 자동 묶음 클래스"""
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.fonts = []
+        self.images = []
+        self.keyword_files = []
+        self.prompt_files = {}
+
+    def scan_all_resources(self):
+        """모든 리소스 파일 스캔"""
+        self.scan_fonts()
+        self.scan_images()
+        self.scan_keywords()
+        self.scan_prompts()
+
+    def scan_fonts(self):
+        """폰트 파일 스캔"""
+        fonts_dir = os.path.join(self.base_path, "fonts")
+        self.fonts = []
+
+        if os.path.exists(fonts_dir):
+            try:
+                for file in os.listdir(fonts_dir):
+                    if file.lower().endswith(('.ttf', '.otf', '.woff', '.woff2')):
+                        file_path = os.path.join(fonts_dir, file)
+                        if os.path.isfile(file_path):  # 파일 존재 확인
+                            self.fonts.append({
+                                'name': file,
+                                'path': file_path,
+                                'relative_path': f"fonts/{file}",
+                                'size': self.get_file_size(file_path)
+                            })
+            except (OSError, IOError) as e:
+                print(f"⚠️ 폰트 디렉토리 스캔 오류: {e}")
+
+    def scan_images(self):
+        """이미지 파일 스캔 (썸네일 템플릿)"""
+        images_dir = os.path.join(self.base_path, "images")
+        self.images = []
+
+        if os.path.exists(images_dir):
+            try:
+                for file in os.listdir(images_dir):
+                    if file.lower().endswith(('.jpg', '.jpeg', '.png', '.webp', '.bmp')):
+                        file_path = os.path.join(images_dir, file)
+                        if os.path.isfile(file_path):  # 파일 존재 확인
+                            self.images.append({
+                                'name': file,
+                                'path': file_path,
+                                'relative_path': f"images/{file}",
+                                'size': self.get_file_size(file_path)
+                            })
+            except (OSError, IOError) as e:
+                print(f"⚠️ 이미지 디렉토리 스캔 오류: {e}")
+
+    def scan_keywords(self):
+        """키워드 파일 스캔"""
+        self.keyword_files = []
+
+        # 루트 디렉토리의 txt 파일들
+        try:
+            for file in os.listdir(self.base_path):
+                if file.lower().endswith('.txt') and 'keyword' in file.lower():
+                    file_path = os.path.join(self.base_path, file)
+                    if os.path.isfile(file_path):  # 파일 존재 확인
+                        keywords_count = self.count_keywords_in_file(file_path)
+                        self.keyword_files.append({
+                            'name': file,
+                            'path': file_path,
+                            'relative_path': file,
+                            'keywords_count': keywords_count,
+                            'suggested_for': self.suggest_site_for_keywords(file)
+                        })
+
+            # keywords 서브 디렉토리의 txt 파일들도 스캔
+            keywords_dir = os.path.join(self.base_path, "keywords")
+            if os.path.exists(keywords_dir):
+                for file in os.listdir(keywords_dir):
+                    if file.lower().endswith('.txt') and not file.startswith('used_'):
+                        file_path = os.path.join(keywords_dir, file)
+                        if os.path.isfile(file_path):  # 파일 존재 확인
+                            keywords_count = self.count_keywords_in_file(file_path)
+                            self.keyword_files.append({
+                                'name': file,
+                                'path': file_path,
+                                'relative_path': f"keywords/{file}",
+                                'keywords_count': keywords_count,
+                                'suggested_for': self.suggest_site_for_keywords(file)
+                            })
+        except (OSError, IOError) as e:
+            print(f"⚠️ 키워드 파일 스캔 오류: {e}")
+
+    def scan_prompts(self):
+        """프롬프트 파일 스캔"""
+        prompts_dir = os.path.join(self.base_path, "prompts")
+        self.prompt_files = {'gpt': [], 'gemini': []}
+
+        for ai_type in ['gpt', 'gemini']:
+            ai_dir = os.path.join(prompts_dir, ai_type)
+            if os.path.exists(ai_dir):
+                for file in os.listdir(ai_dir):
+                    if file.lower().endswith('.txt'):
+                        self.prompt_files[ai_type].append({
+                            'name': file,
+                            'path': os.path.join(ai_dir, file),
+                            'relative_path': f"prompts/{ai_type}/{file}",
+                            'size': self.get_file_size(os.path.join(ai_dir, file))
+                        })
+
+    def get_file_size(self, file_path):
+        """파일 크기 반환 (KB)"""
+        try:
+            size = os.path.getsize(file_path)
+            return round(size / 1024, 2)
+        except:
+            return 0
+
+    def count_keywords_in_file(self, file_path):
+        """파일의 키워드 개수 세기"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = [line.strip() for line in f.readlines() if line.strip() and not line.startswith('#')]
+                return len(lines)
+        except:
+            return 0
+
+    def suggest_site_for_keywords(self, filename):
+        """파일명 기반 사이트 추천"""
+        filename_lower = filename.lower()
+        if 'tech' in filename_lower or '기술' in filename_lower:
+            return "기술 관련 사이트"
+        elif 'news' in filename_lower or '뉴스' in filename_lower:
+            return "뉴스 사이트"
+        elif 'blog' in filename_lower or '블로그' in filename_lower:
+            return "개인 블로그"
+        elif 'business' in filename_lower or '비즈니스' in filename_lower:
+            return "비즈니스 사이트"
+        else:
+            return "범용"
+
+    def get_resource_summary(self):
+        """리소스 요약 정보"""
+        return {
+            'fonts_count': len(self.fonts),
+            'images_count': len(self.images),
+            'keyword_files_count': len(self.keyword_files),
+            'total_keywords': sum(kf['keywords_count'] for kf in self.keyword_files),
+            'gpt_prompts': len(self.prompt_files['gpt']),
+            'gemini_prompts': len(self.prompt_files['gemini'])
+        }
+
+class OperationCancelled(Exception):
+    """취소 토큰이 취소되어 진행 중인 작업을 중단함"""
+
+class CancellationToken:
+    """협조적 취소 토큰 - 중지/종료 요청을 진행 중인 AI/HTTP 호출까지 전달
+
+    call()로 감싼 블로킹 호출은 취소되는 즉시 OperationCancelled로 반환되고,
+    실제 요청 스레드는 요청 타임아웃 안에 스스로 끝납니다 (무기한 대기 없음).
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._detach = None  # 자식 토큰이면 부모 등록 해제 함수
+        self.reason = None
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self, reason="중지 요청"):
+        """취소 - 등록된 콜백(세션 닫기 등)을 호출하고 대기 중인 호출을 깨움"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+            detach, self._detach = self._detach, None
+        if detach:
+            detach()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[ERROR] 취소 콜백 실패: {e}")
+
+    def register(self, callback):
+        """취소 시 호출할 콜백 등록 (이미 취소됐으면 즉시 호출) - 등록 해제 함수 반환"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+
+                def unregister():
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+                return unregister
+        callback()
+        return lambda: None
+
+    def child(self):
+        """자식 토큰 - 부모가 취소되면 함께 취소되고, 자식만 따로 취소할 수도 있음 (취소 시 부모에서 해제)"""
+        token = CancellationToken()
+        token._detach = self.register(lambda: token.cancel(self.reason))
+        return token
+
+    def wait(self, timeout=None):
+        """취소될 때까지 최대 timeout초 대기 - 취소됐으면 True"""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OperationCancelled(self.reason)
+
+    def call(self, func, *args, **kwargs):
+        """func(*args, **kwargs)를 취소 가능하게 실행 - 취소되면 결과를 기다리지 않고 OperationCancelled"""
+        self.raise_if_cancelled()
+        done = threading.Event()
+        outcome = {}
+
+        def run():
+            try:
+                outcome['result'] = func(*args, **kwargs)
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                done.set()
+
+        unregister = self.register(done.set)
+        try:
+            threading.Thread(target=run, daemon=True, name="cancellable-call").start()
+            done.wait()
+        finally:
+            unregister()
+        if 'error' in outcome:
+            raise outcome['error']
+        if 'result' in outcome:
+            return outcome['result']
+        raise OperationCancelled(self.reason)
+
+class ContentGenerator:
+    """콘텐츠 생성기 - GPT와 Gemini API 지원"""
+    def __init__(self, config_data, log_func, auto_wp_instance=None):
+        self.config_data = config_data
+        self.log = log_func
+        self.auto_wp = auto_wp_instance
+        self.openai_client = None
+        self.gemini_model = None
+        self.gemini_api_key = None
+        self.gemini_model_name = 'gemini-2.5-flash-lite'
+        self.gemini_safety_settings = None
+
+        # API 상태 추적
+        self.api_status = {
+            'openai': False,
+            'gemini': False
+        }
+
+        # 포스팅 상태 관리
+        self.is_posting = False
+        self.worker_thread = None  # Worker Thread 참조
+        self.cancel_token = CancellationToken()  # 엔진이 자신의 토큰으로 교체 (중지 시 진행 중 호출 중단)
+        self._local = threading.local()  # 헤지 요청 스레드별 자식 토큰
+        
+        # 인증 캐시 (성공한 인증 방법 저장)
+        self.auth_cache = {}  # {site_url: (headers, method_name)}
+
+        # config_manager 속성 추가
+        if self.auto_wp and hasattr(self.auto_wp, 'config_manager'):
+            self.config_manager = self.auto_wp.config_manager
+        else:
+            self.config_manager = None
+
+    def current_token(self):
+        """현재 스레드의 취소 토큰 (헤지 요청 스레드는 요청별 자식 토큰, 그 외에는 엔진 토큰)"""
+        return getattr(self._local, 'token', None) or self.cancel_token
+
+    def should_stop_posting(self):
+        """포스팅 중지 여부를 확인하는 헬퍼 메서드"""
+        try:
+            if self.current_token().cancelled:
+                return True
+
+            # Worker Thread 상태 우선 체크 (가장 정확함)
+            if hasattr(self, 'worker_thread') and self.worker_thread:
+                is_running = getattr(self.worker_thread, 'is_running', True)
+                force_stop = getattr(self.worker_thread, '_force_stop', False)
+                if not is_running or force_stop:
+                    return True
+            
+            # Auto WP 인스턴스의 is_posting 상태 체크
+            if hasattr(self.auto_wp, 'is_posting'):
+                if not self.auto_wp.is_posting:
+                    return True
+            
+            # 모든 체크를 통과하면 계속 진행
+            return False
+        except Exception:
+            # 오류 발생 시 안전하게 계속 진행 (중지하지 않음)
+            return False
+
+        # GUI에서 선택한 AI 모델 (기본값 먼저 설정)
+        self.current_ai_provider = "gemini"  # 기본값
+        
+        # config_manager에서 설정 가져오기
+        if self.config_manager:
+            try:
+                global_settings = self.config_manager.data.get("global_settings", {})
+                self.current_ai_provider = global_settings.get("default_ai", "gemini")
+            except Exception:
+                self.current_ai_provider = "gemini"
+            
+        # auto_wp_instance에서 직접 가져오기 (우선순위 높음)
+        if hasattr(auto_wp_instance, 'current_ai_provider'):
+            try:
+                self.current_ai_provider = auto_wp_instance.current_ai_provider
+            except Exception:
+                pass  # 기본값 유지
+
+        # API 초기화
+        self.initialize_apis()
+        
+        # 현재 처리 중인 사이트 정보
+        self.current_site = None
+
+    def set_current_site(self, site):
+        """현재 처리 중인 사이트 정보 설정"""
+        self.current_site = site
+    
+    def get_thumbnail_file(self):
+        """현재 사이트의 썸네일 파일 또는 기본 썸네일 반환"""
+        import random
+        
+        # 현재 사이트의 썸네일 이미지 사용
+        if self.current_site and self.current_site.get('thumbnail_image'):
+            thumbnail_filename = self.current_site.get('thumbnail_image')
+            thumbnail_path = os.path.join(get_base_path(), 'images', thumbnail_filename)
+            if os.path.exists(thumbnail_path):
+                return thumbnail_filename
+        
+        # 기본 썸네일 목록에서 랜덤 선택 (정확한 파일명 사용)
+        available_thumbnails = ['썸네일 (1).jpg', '썸네일 (2).jpg', '썸네일 (3).jpg',
+                              '썸네일 (4).jpg', '썸네일 (5).jpg', '썸네일 (6).jpg', 
+                              '썸네일 (7).jpg']
+        
+        # 존재하는 파일 중에서만 선택
+        existing_thumbnails = []
+        for thumb in available_thumbnails:
+            thumb_path = os.path.join(get_base_path(), 'images', thumb)
+            if os.path.exists(thumb_path):
+                existing_thumbnails.append(thumb)
+        
+        if existing_thumbnails:
+            return random.choice(existing_thumbnails)
+        else:
+            return '썸네일 (1).jpg'  # 최후 기본값
+
+    def initialize_apis(self):
+        """사용 가능한 모든 API 초기화"""
+        
+        # API 상태 초기화
+        self.api_status = {'openai': False, 'gemini': False}
+
+        # OpenAI 초기화
+        if self.config_manager:
+            openai_api_key = self.config_manager.data.get("api_keys", {}).get("openai", "")
+        else:
+            openai_api_key = self.config_data.get('openai_api_key', '')
+        
+        if openai_api_key and openai_api_key not in ["your_openai_api_key", ""]:
+            try:
+                OpenAI = get_openai_class()
+                if OpenAI is None:
+                    raise Exception("openai 라이브러리가 설치되지 않았습니다.")
+                self.openai_client = OpenAI(api_key=openai_api_key)
+                self.api_status['openai'] = True
+            except Exception as e:
+                self.log(f"🔥 OpenAI 클라이언트 초기화 실패: {e}")
+                self.openai_client = None
+                self.api_status['openai'] = False
+        else:
+            self.log("⚠️ OpenAI API 키가 설정되지 않았거나 유효하지 않습니다.")
+
+        # Gemini 초기화
+        if self.config_manager:
+            gemini_api_key = self.config_manager.data.get("api_keys", {}).get("gemini", "")
+        else:
+            gemini_api_key = self.config_data.get('gemini_api_key', '')
+
+        genai = get_genai()
+        GEMINI_AVAILABLE = genai is not None
+
+        if GEMINI_AVAILABLE and gemini_api_key and gemini_api_key not in ["your_gemini_api_key", ""]:
+            try:
+                # API 키 설정
+                genai.configure(api_key=gemini_api_key)
+                # 안전 설정 구성 - 콘텐츠 차단 최소화
+                safety_settings = [
+                    {
+                        "category": "HARM_CATEGORY_HARASSMENT",
+                        "threshold": "BLOCK_ONLY_HIGH"
+                    },
+                    {
+                        "category": "HARM_CATEGORY_HATE_SPEECH",
+                        "threshold": "BLOCK_ONLY_HIGH"
+                    },
+                    {
+                        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+                        "threshold": "BLOCK_ONLY_HIGH"
+                    },
+                    {
+                        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+                        "threshold": "BLOCK_ONLY_HIGH"
+                    }
+                ]
+
+                # 모델 초기화 시 사용 가능한 모델 확인 (gemini-2.5-flash-lite만 사용)
+                model_priority = [
+                    'gemini-2.5-flash-lite',     # 2.5 lite 모델
+                ]
+                model_initialized = False
+                last_error = None
+                
+                for model_name in model_priority:
+                    try:
+                        self.log(f"🔍 Gemini 모델 시도: {model_name}")
+                        self.gemini_model = genai.GenerativeModel(
+                            model_name,
+                            safety_settings=safety_settings
+                        )
+                        self.gemini_api_key = gemini_api_key
+                        self.gemini_model_name = model_name
+                        self.gemini_safety_settings = safety_settings
+                        
+                        # 간단한 테스트 호출로 API 작동 확인 (제한과 무관하게 보낸 요청으로 할당량에 기록)
+                        provider, api_key, per_minute, _ = self.get_rate_limit_args('gemini', gemini_api_key)
+                        get_rate_limiter().record(provider, api_key, per_minute)
+                        test_response = self.gemini_model.generate_content(
+                            "안녕",
+                            generation_config=genai.types.GenerationConfig(
+                                max_output_tokens=10,
+                                temperature=0.7
+                            ),
+                            request_options={'timeout': 10}
+                        )
+                        
+                        if hasattr(test_response, 'text') and test_response.text:
+                            model_initialized = True
+                            self.log(f"✅ Gemini 모델 초기화 성공: {model_name}")
+                            break
+                        else:
+                            last_error = "응답에 텍스트가 없음"
+                            continue
+                        
+                    except Exception as model_error:
+                        last_error = str(model_error)
+                        self.log(f"❌ {model_name} 실패: {last_error}")
+                        continue
+                
+                if not model_initialized:
+                    error_msg = f"모든 Gemini 모델 초기화 실패. 마지막 오류: {last_error}"
+                    self.log(f"❌ {error_msg}")
+                    raise Exception(error_msg)
+
+                self.api_status['gemini'] = True
+                
+            except Exception as e:
+                self.log(f"❌ Gemini 초기화 실패: {e}")
+                self.gemini_model = None
+                self.api_status['gemini'] = False
+        elif not GEMINI_AVAILABLE:
+            self.log("❌ google-generativeai 라이브러리가 설치되지 않았습니다.")
+            self.log("💡 pip install google-generativeai 명령으로 설치해주세요.")
+            self.gemini_model = None
+            self.api_status['gemini'] = False
+        elif not gemini_api_key or gemini_api_key in ["your_gemini_api_key", ""]:
+            self.log("⚠️ Gemini API 키가 설정되지 않았거나 기본값입니다.")
+            self.log("💡 설정 탭에서 올바른 Gemini API 키를 입력해주세요.")
+            self.gemini_model = None
+            self.api_status['gemini'] = False
+        else:
+            self.log(f"❓ Gemini 초기화 조건 불만족: AVAILABLE={GEMINI_AVAILABLE}, KEY_LENGTH={len(gemini_api_key) if gemini_api_key else 0}")
+            self.gemini_model = None
+            self.api_status['gemini'] = False
+
+        # 최종 상태 요약
+        self.log(f"🤖 API 초기화 완료: OpenAI={'✅' if self.api_status['openai'] else '❌'}, Gemini={'✅' if self.api_status['gemini'] else '❌'}")
+
+    def call_ai_api(self, prompt, step_name, max_tokens=1500, temperature=0.7, system_content=None, route=None):
+        """통합 AI API 호출 - 선택한 제공자 실패/차단(서킷 열림) 시 다른 제공자로 전환
+
+        route(단계 키)가 주어지면 설정의 model_routes 표에 따라 제공자/모델/max_tokens/temperature를 정합니다.
+        """
+        # 중지 체크
+        if hasattr(self, 'auto_wp') and hasattr(self.auto_wp, 'posting_worker') and not self.auto_wp.posting_worker.is_running:
+            return None
+        
+        ai_provider = self.current_ai_provider
+        model_route = self.config_manager.get_model_route(route) if (route and self.config_manager) else {}
+        if model_route:
+            ai_provider = model_route.get('provider', ai_provider)
+            max_tokens = model_route.get('max_tokens', max_tokens)
+            temperature = model_route.get('temperature', temperature)
+        routed_provider = 'openai' if ai_provider in ('gpt', 'openai') else ai_provider
+        route_models = {routed_provider: model_route['model']} if model_route.get('model') else {}
+        route = route or step_name
+
+        # 출력 길이 통계 기반 max_tokens (라우팅 표에서 고정한 단계는 제외)
+        settings = self.config_manager.data.get("global_settings", {}).get("adaptive_max_tokens", {}) if self.config_manager else {}
+        adaptive = settings.get("enabled", True) and 'max_tokens' not in model_route
+        ceiling = int(settings.get("ceiling", 4096))
+        length_key = route_prompt_key(route)
+        stats = get_output_length_stats()
+        if adaptive:
+            suggested = stats.suggest_max_tokens(
+                length_key, max_tokens,
+                percentile=float(settings.get("percentile", 95)),
+                headroom=float(settings.get("headroom", 1.25)),
+                min_samples=int(settings.get("min_samples", 20)),
+                ceiling=ceiling,
+                target_truncation_rate=float(settings.get("target_truncation_rate", 0.02))
+            )
+            if suggested != max_tokens:
+                self.log(f"📏 {step_name} max_tokens {max_tokens} → {suggested} (관측 출력 길이 기준)")
+                max_tokens = suggested
+
+        truncation_retries = int(settings.get("truncation_retries", 1))
+        for attempt in range(truncation_retries + 1):
+            result = self.dispatch_ai_call(prompt, step_name, max_tokens, temperature, system_content,
+                                           ai_provider, route_models, route)
+            if not result:
+                return result
+
+            output_tokens = getattr(result, 'output_tokens', 0) or len(result) // 2  # 사용량 정보가 없으면 글자 수로 추정
+            truncated = getattr(result, 'truncated', False)
+            stats.record(length_key, output_tokens, truncated)
+            if not truncated or not adaptive or attempt >= truncation_retries:
+                return result
+
+            new_max_tokens = min(ceiling, max_tokens * 2)
+            if new_max_tokens <= max_tokens:
+                return result
+            self.log(f"✂️ {step_name} 응답이 max_tokens({max_tokens})에서 잘림 - {new_max_tokens}로 재시도")
+            max_tokens = new_max_tokens
+        return result
+
+    def dispatch_ai_call(self, prompt, step_name, max_tokens, temperature, system_content, ai_provider, route_models, route):
+        """제공자 선택/헤지/전환을 거쳐 실제 API 호출"""
+        # 현재 설정된 API 키 확인 (config_manager 우선)
+        if self.config_manager:
+            gemini_key = self.config_manager.data.get("api_keys", {}).get("gemini", "").strip()
+            openai_key = self.config_manager.data.get("api_keys", {}).get("openai", "").strip()
+        else:
+            gemini_key = self.config_data.get('gemini_api_key', '').strip()
+            openai_key = self.config_data.get('openai_api_key', '').strip()
+
+        def gemini_ready():
+            """Gemini 사용 가능 여부 확인 및 필요 시 재초기화"""
+            if not gemini_key:
+                return False
+            if not self.api_status.get('gemini') or not self.gemini_model:
+                self.initialize_apis()
+            return bool(self.api_status.get('gemini') and self.gemini_model)
+
+        def openai_ready():
+            """OpenAI 사용 가능 여부 확인 및 필요 시 재초기화"""
+            if not openai_key:
+                return False
+            if not self.api_status.get('openai') or not self.openai_client:
+                self.initialize_apis()
+            return bool(self.api_status.get('openai') and self.openai_client)
+
+        from functools import partial
+        providers = {
+            'gemini': ("Gemini", gemini_ready, partial(self.call_gemini_api, model=route_models.get('gemini'), route=route)),
+            'openai': ("OpenAI", openai_ready, partial(self.call_openai_api, model=route_models.get('openai'), route=route)),
+        }
+        if ai_provider == 'gemini':
+            order = ['gemini', 'openai']
+        elif ai_provider in ['gpt', 'openai']:
+            order = ['openai', 'gemini']
+        else:
+            self.log(f"⚠️ 알 수 없는 AI 제공자: {ai_provider} - 사용 가능한 모델 자동 선택")
+            order = ['gemini', 'openai']
+
+        unready = []
+        tried = []
+        hedging = self.config_manager.data.get("global_settings", {}).get("hedging", {}) if self.config_manager else {}
+        if hedging.get("enabled") and all(providers[p][1]() for p in order) \
+                and all(get_circuit_breaker(p).state == "closed" for p in order):
+            calls = {p: providers[p][2] for p in order}
+            result, tried = self.call_with_hedging(order[0], order[1], calls, prompt, step_name,
+                                                   max_tokens, temperature, system_content)
+            if result or self.should_stop_posting():
+                return result
+
+        for provider in order:
+            if provider in tried:
+                continue
+            name, ready, call = providers[provider]
+            if not ready():
+                unready.append(provider)
+                continue
+            breaker = get_circuit_breaker(provider)
+            if not breaker.allow_request():
+                self.log(f"🚧 {name} 서킷 열림 (연속 실패 {breaker.failures}회) - {breaker.remaining():.0f}초간 호출 생략")
+                continue
+
+            if provider != order[0]:
+                self.log(f"⚠️ {providers[order[0]][0]} 사용 불가 - {name}로 자동 전환")
+                # 키/모델 문제로 사용 불가한 경우에만 제공자 고정 (일시 장애는 서킷 회복 후 자동 복귀)
+                if order[0] in unready:
+                    self.current_ai_provider = provider
+
+            result = call(prompt, step_name, max_tokens, temperature, system_content)
+            if result:
+                return result
+            if self.should_stop_posting():
+                return None
+
+        self.log("❌ 사용 가능한 AI 제공자가 없습니다.")
+        return None
+
+    def call_with_hedging(self, primary, secondary, calls, prompt, step_name, max_tokens, temperature, system_content):
+        """헤지 요청 - 주 제공자가 백분위 지연을 넘기면 보조 제공자로 같은 요청을 보내 먼저 온 응답 사용
+
+        Returns:
+            tuple: (응답 텍스트 또는 None, 호출한 제공자 목록)
+        """
+        import queue
+
+        settings = self.config_manager.data.get("global_settings", {}).get("hedging", {}) if self.config_manager else {}
+        policy = get_hedging_policy()
+        policy.earn(float(settings.get("budget_ratio", 0.1)))
+        delay = policy.hedge_delay(
+            primary, step_name,
+            percentile=float(settings.get("percentile", 90)),
+            min_samples=int(settings.get("min_samples", 10)),
+            min_delay=float(settings.get("min_delay", 3.0))
+        )
+
+        results = queue.Queue()
+        tokens = []
+
+        def run(provider, token):
+            self._local.token = token
+            try:
+                results.put((provider, calls[provider](prompt, step_name, max_tokens, temperature, system_content)))
+            except Exception as e:
+                self.log(f"❌ {step_name} {provider.upper()} 헤지 요청 오류: {e}")
+                results.put((provider, None))
+            finally:
+                self._local.token = None
+
+        def launch(provider):
+            # 요청마다 자식 토큰 - 엔진 중지 시 함께 취소, 다른 요청이 채택되면 개별 취소
+            token = self.cancel_token.child()
+            tokens.append(token)
+            threading.Thread(target=run, args=(provider, token), daemon=True).start()
+
+        def next_result(timeout=None):
+            """결과 1개 대기 (중지 시 None, 시간 초과 시 queue.Empty)"""
+            deadline = time.time() + timeout if timeout is not None else None
+            while True:
+                if self.should_stop_posting():
+                    return None
+                wait = 0.5 if deadline is None else min(0.5, deadline - time.time())
+                if wait <= 0:
+                    raise queue.Empty
+                try:
+                    return results.get(timeout=wait)
+                except queue.Empty:
+                    continue
+
+        launch(primary)
+        tried = [primary]
+        try:
+            try:
+                outcome = next_result(delay)
+            except queue.Empty:
+                if policy.try_spend():
+                    self.log(f"⚡ {step_name} {primary.upper()} 응답 지연 ({delay:.1f}초 초과) - {secondary.upper()}로 헤지 요청")
+                    launch(secondary)
+                    tried.append(secondary)
+                outcome = next_result()
+
+            pending = len(tried) - 1
+            while outcome is not None and not outcome[1] and pending > 0:
+                outcome = next_result()
+                pending -= 1
+        finally:
+            # 채택되지 않은 요청은 취소해 API 호출/할당량 대기를 바로 끝냄 (끝난 요청의 토큰은 해제만 됨)
+            for token in tokens:
+                token.cancel("다른 헤지 요청 응답 채택")
+
+        if outcome is None or not outcome[1]:
+            return None, tried
+
+        winner, result = outcome
+        if len(tried) > 1:
+            if winner == secondary:
+                policy.record_win()
+            self.log(f"🏁 {step_name} {winner.upper()} 응답 채택 - 나머지 요청 취소")
+        return result, tried
+
+    def call_with_retry(self, provider, step_name, request_func, route=None, model=None):
+        """일시적 오류는 지수 백오프 + 지터로 재시도하고 결과를 서킷 브레이커에 기록
+
+        요청마다 키 풀에서 API 키를 고르며, 할당량/권한 오류를 낸 키는 격리하고 다른 키로 바로 재시도합니다.
+
+        Args:
+            request_func: request_func(api_key) - 실패 시 예외를 던지는 실제 API 요청 함수 (응답 텍스트 반환)
+
+        Returns:
+            str | None: 응답 텍스트 (최종 실패 시 None)
+        """
+        settings = self.config_manager.data.get("global_settings", {}) if self.config_manager else {}
+        max_retries = int(settings.get("api_max_retries", 3))
+        base_delay = float(settings.get("api_retry_base_delay", 2.0))
+        max_delay = float(settings.get("api_retry_max_delay", 30.0))
+        breaker = get_circuit_breaker(provider)
+        pool = self.get_key_pool(provider)
+        limiter = get_rate_limiter()
+
+        def is_usable(api_key):
+            """일일 할당량이 남은 키인지"""
+            return limiter.status(*self.get_rate_limit_args(provider, api_key))['daily_ok']
+
+        attempt = 0
+        while True:
+            api_key = pool.select(is_usable=is_usable)
+            if api_key is None:
+                self.log(f"⛔ {step_name} {provider.upper()} 사용 가능한 API 키 없음 (격리 또는 할당량 소진)")
+                return None
+
+            if not self.wait_for_rate_limit(provider, api_key):
+                self.log(f"⛔ {step_name} {provider.upper()} 호출 생략 (요청 제한 또는 중지)")
+                return None
+
+            try:
+                start_time = time.time()
+                result = request_func(api_key)
+                get_hedging_policy().record_latency(provider, step_name, time.time() - start_time)
+                breaker.record_success()
+                pool.report_success(api_key)
+                return result
+            except OperationCancelled:
+                # 중지 요청 - 키/서킷/통계에 실패로 기록하지 않음
+                self.log(f"⏹️ {step_name} {provider.upper()} 요청 중단 ({self.current_token().reason})")
+                return None
+            except Exception as api_error:
+                error_type = self.analyze_api_error(api_error, provider)
+                reason = pool.report_error(api_key, api_error)
+                rotate = reason is not None and pool.has_alternative(api_key, is_usable)
+                if reason:
+                    self.log(f"🔒 {provider.upper()} 키 {pool.mask(api_key)} 격리 ({reason})")
+
+                if (error_type != 'TEMPORARY_ERROR' and not rotate) or attempt >= max_retries or self.should_stop_posting():
+                    # 빈 응답/차단은 프롬프트 문제이므로 제공자 장애로 집계하지 않음
+                    if not isinstance(api_error, EmptyResponseError):
+                        breaker.record_failure()
+                    if route:
+                        get_route_stats().record_failure(route, provider, model)
+                    raise
+
+                attempt += 1
+                if rotate:
+                    self.log(f"🔑 {step_name} 다른 {provider.upper()} API 키로 재시도 ({attempt}/{max_retries})")
+                    continue
+
+                # Full jitter: 0 ~ min(최대 지연, 기본 지연 * 2^시도) 사이 무작위 대기
+                delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+                self.log(f"🔁 {step_name} 일시적 오류 - {delay:.1f}초 후 재시도 ({attempt}/{max_retries}): {api_error}")
+                deadline = time.time() + delay
+                while time.time() < deadline:
+                    if self.should_stop_posting():
+                        return None
+                    self.current_token().wait(min(0.5, max(0.0, deadline - time.time())))
+
+    def request_timeout(self):
+        """AI 요청 1회 타임아웃(초) - 응답 없는 요청이 스레드를 붙잡지 않도록 항상 상한 적용"""
+        settings = self.config_manager.data.get("global_settings", {}) if self.config_manager else {}
+        return float(settings.get("api_request_timeout", 60))
+
+    def call_openai_api(self, prompt, step_name, max_tokens, temperature, system_content, model=None, route=None):
+        """OpenAI API 호출 (model을 생략하면 global_settings.openai_model)"""
+        messages = [{"role": "system", "content": system_content}, {"role": "user", "content": prompt}] if system_content else [{"role": "user", "content": prompt}]
+        
+        # 현재 모델 설정 가져오기
+        if model:
+            current_model = model
+        elif self.config_manager:
+            current_model = self.config_manager.data.get("global_settings", {}).get("openai_model", "gpt-3.5-turbo")
+        else:
+            current_model = "gpt-3.5-turbo"
+
+        def request(api_key):
+            client = self.get_key_pool('openai').get_client(api_key, lambda key: get_openai_class()(api_key=key))
+            start_time = time.time()
+            response = self.current_token().call(
+                client.chat.completions.create,
+                model=current_model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=self.request_timeout()
+            )
+            
+            # 🔥 응답 검증 추가
+            if not response.choices or len(response.choices) == 0:
+                raise EmptyResponseError("OpenAI 응답이 비어있음 (choices 없음)")
+            
+            content = response.choices[0].message.content
+            if not content or not content.strip():
+                raise EmptyResponseError("OpenAI 응답 내용이 비어있음")
+
+            usage = getattr(response, 'usage', None)
+            cached_tokens = getattr(getattr(usage, 'prompt_tokens_details', None), 'cached_tokens', 0)
+            self.record_route_usage(route or step_name, 'openai', current_model, time.time() - start_time,
+                                    getattr(usage, 'prompt_tokens', 0), getattr(usage, 'completion_tokens', 0),
+                                    cached_tokens)
+            return AIResponse(content, output_tokens=getattr(usage, 'completion_tokens', 0),
+                              truncated=response.choices[0].finish_reason == 'length')
+
+        try:
+            content = self.call_with_retry('openai', step_name, request, route=route or step_name, model=current_model)
+            if content:
+                self.log(f"✅ {step_name} OpenAI 응답 성공 ({len(content)}자)")
+            return content
+            
+        except Exception as api_error:
+            self.log(f"❌ {step_name} OpenAI API 오류: {api_error}")
+            return None
+
+    def call_gemini_api(self, prompt, step_name, max_tokens, temperature, system_content, model=None, route=None):
+        """Gemini API 호출 (model을 생략하면 초기화된 모델)"""
+        try:
+            # API 키 재확인
+            gemini_key = self.config_manager.data.get("api_keys", {}).get("gemini", "").strip()
+            if not gemini_key:
+                raise Exception("Gemini API 키가 설정되지 않았습니다.")
+            
+            # 모델 상태 재확인
+            if not self.gemini_model:
+                raise Exception("Gemini 모델이 초기화되지 않았습니다.")
+            
+            model_name = model or self.gemini_model_name
+            # 고정 접두부 모드에서는 지침을 system_instruction으로 분리 (지침별 모델/캐시 재사용)
+            system_instruction = system_content if (system_content and self.use_stable_prompt_prefix()) else None
+            if system_instruction:
+                full_prompt = prompt
+            else:
+                full_prompt = f"{system_content}\n\n---\n\n{prompt}" if system_content else prompt
+            genai = get_genai()
+            generation_config = genai.types.GenerationConfig(
+                max_output_tokens=max_tokens, 
+                temperature=temperature
+            )
+
+            def request(api_key):
+                start_time = time.time()
+                try:
+                    gemini_model = self.get_gemini_model(api_key, model_name, system_instruction)
+                    response = self.current_token().call(gemini_model.generate_content, full_prompt,
+                                                         generation_config=generation_config,
+                                                         request_options={'timeout': self.request_timeout()})
+                    elapsed_time = time.time() - start_time
+                    
+                    # 🔥 응답 검증 강화
+                    if hasattr(response, 'text') and response.text:
+                        response_text = response.text.strip()
+                        if not response_text:
+                            raise EmptyResponseError("응답 텍스트가 공백만 포함되어 있습니다.")
+                        
+                        self.log(f"✅ {step_name} Gemini 응답 성공 ({len(response_text)}자, {elapsed_time:.1f}초)")
+                        usage = getattr(response, 'usage_metadata', None)
+                        self.record_route_usage(route or step_name, 'gemini', model_name, elapsed_time,
+                                                getattr(usage, 'prompt_token_count', 0),
+                                                getattr(usage, 'candidates_token_count', 0),
+                                                getattr(usage, 'cached_content_token_count', 0))
+                        candidates = getattr(response, 'candidates', None) or []
+                        finish_reason = getattr(candidates[0], 'finish_reason', None) if candidates else None
+                        truncated = getattr(finish_reason, 'name', None) == 'MAX_TOKENS' or finish_reason == 2
+                        return AIResponse(response_text, output_tokens=getattr(usage, 'candidates_token_count', 0),
+                                          truncated=truncated)
+                    else:
+                        # 빈 응답에 대한 상세 정보
+                        if hasattr(response, 'prompt_feedback'):
+                            feedback = response.prompt_feedback
+                            if feedback and hasattr(feedback, 'block_reason'):
+                                raise EmptyResponseError(f"Gemini가 콘텐츠를 차단했습니다: {feedback.block_reason}")
+                        raise EmptyResponseError("응답 텍스트가 비어있습니다.")
+                except OperationCancelled:
+                    raise
+                except Exception as gen_error:
+                    elapsed_time = time.time() - start_time
+                    self.log(f"❌ API 호출 실패 ({elapsed_time:.1f}초 후): {gen_error}")
+                    raise
+
+            return self.call_with_retry('gemini', step_name, request, route=route or step_name, model=model_name)
+                
+        except Exception as api_error:
+            error_msg = str(api_error)
+            self.log(f"❌ {step_name} Gemini API 오류: {error_msg}")
+            
+            # 구체적인 오류 유형별 안내
+            if "API_KEY_INVALID" in error_msg or "Invalid API key" in error_msg:
+                self.log("💡 해결방법: 설정 탭에서 올바른 Gemini API 키를 입력해주세요.")
+            elif "QUOTA_EXCEEDED" in error_msg or "quota" in error_msg.lower():
+                self.log("💡 해결방법: API 할당량을 확인하고, 잠시 후 다시 시도해주세요.")
+            elif "PERMISSION_DENIED" in error_msg:
+                self.log("💡 해결방법: Google AI Studio에서 API 권한을 확인해주세요.")
+            elif "RESOURCE_EXHAUSTED" in error_msg:
+                self.log("💡 해결방법: 요청량이 많습니다. 잠시 후 다시 시도해주세요.")
+            elif "UNAVAILABLE" in error_msg or "network" in error_msg.lower():
+                self.log("💡 해결방법: 네트워크 연결을 확인하거나 잠시 후 다시 시도해주세요.")
+            else:
+                self.log(f"💡 예상치 못한 오류입니다. 자세한 정보: {error_msg}")
+                
+            return None
+
+    def load_step_checkpoint(self, keyword, content_type):
+        """현재 사이트+키워드의 완료 단계 체크포인트 (사이트 정보가 없으면 {})"""
+        if not self.current_site:
+            return {}
+        settings = self.config_manager.data.get("global_settings", {}) if self.config_manager else {}
+        return get_checkpoint_store().load(self.current_site, keyword, content_type,
+                                           max_age_hours=float(settings.get("draft_expiry_hours", 72)))
+
+    def save_step_checkpoint(self, keyword, content_type, step_num, content, title=None):
+        """완료 단계 출력 체크포인트 저장"""
+        if self.current_site:
+            get_checkpoint_store().save_step(self.current_site, keyword, content_type, step_num, content, title)
+
+    def clear_step_checkpoint(self, keyword):
+        """현재 사이트+키워드의 단계 체크포인트 삭제 (같은 키워드로 새로 생성할 때)"""
+        if self.current_site:
+            get_checkpoint_store().clear(self.current_site, keyword)
+
+    def use_stable_prompt_prefix(self):
+        """고정 프롬프트 접두부 모드 여부 (global_settings.stable_prompt_prefix)"""
+        if not self.config_manager:
+            return False
+        return bool(self.config_manager.data.get("global_settings", {}).get("stable_prompt_prefix", False))
+
+    def get_rate_limit_args(self, provider, api_key=None):
+        """요청 제한기에 넘길 (제공자, API 키, 분당 제한, 일일 제한) - 키를 생략하면 기본 키"""
+        provider = 'openai' if provider in ('gpt', 'openai') else provider
+        if self.config_manager:
+            default_key = self.config_manager.data.get("api_keys", {}).get(provider, "")
+            limits = self.config_manager.get_rate_limit(provider)
+        else:
+            default_key = self.config_data.get(f'{provider}_api_key', '')
+            limits = DEFAULT_RATE_LIMITS.get(provider, DEFAULT_RATE_LIMITS['gemini'])
+        api_key = api_key if api_key is not None else default_key
+        return provider, (api_key or "").strip(), limits['per_minute'], limits['per_day']
+
+    def get_key_pool(self, provider):
+        """설정의 키 목록이 반영된 제공자별 API 키 풀"""
+        pool = get_api_key_pool(provider)
+        if self.config_manager:
+            pool.configure(self.config_manager.get_api_keys(provider))
+        else:
+            api_key = (self.config_data.get(f'{provider}_api_key', '') or '').strip()
+            pool.configure([(api_key, 1)] if api_key else [])
+        return pool
+
+    def get_gemini_model(self, api_key, model_name=None, system_instruction=None):
+        """키/모델 전용 Gemini 모델 - 기본 키+기본 모델은 초기화된 모델, 나머지는 키별로 생성해 재사용
+
+        genai.configure는 프로세스 전역 설정이므로 추가 키는 전역 설정을 바꾸지 않고
+        모델마다 별도의 GenerativeServiceClient를 붙여 동시 요청이 서로 키를 덮어쓰지 않게 합니다.
+        system_instruction이 있으면 지침별 모델을 만들고, 설정 시 명시적 컨텍스트 캐시를 사용합니다.
+        """
+        model_name = model_name or self.gemini_model_name
+        is_default_key = api_key == getattr(self, 'gemini_api_key', None)
+        if is_default_key and model_name == self.gemini_model_name and self.gemini_model and not system_instruction:
+            return self.gemini_model
+
+        variant = model_name
+        if system_instruction:
+            import hashlib
+            digest = hashlib.sha1(system_instruction.encode('utf-8')).hexdigest()[:12]
+            variant = (model_name, digest)
+            if is_default_key:
+                cached_model = self.get_context_cached_gemini_model(model_name, digest, system_instruction)
+                if cached_model is not None:
+                    return cached_model
+
+        def create_model(key):
+            genai = get_genai()
+            options = {'safety_settings': self.gemini_safety_settings}
+            if system_instruction:
+                options['system_instruction'] = system_instruction
+            model = genai.GenerativeModel(model_name, **options)
+            if not is_default_key:
+                glm = lazy_import("google.ai.generativelanguage")
+                if glm is None:
+                    raise Exception("google-ai-generativelanguage 라이브러리가 없어 추가 Gemini 키를 사용할 수 없습니다.")
+                model._client = glm.GenerativeServiceClient(client_options={"api_key": key})
+            return model
+
+        return self.get_key_pool('gemini').get_client(api_key, create_model, variant=variant)
+
+    def get_context_cached_gemini_model(self, model_name, digest, system_instruction):
+        """Gemini 명시적 컨텍스트 캐시 모델 (global_settings.gemini_context_cache) - 미지원/실패 시 None"""
+        settings = self.config_manager.data.get("global_settings", {}) if self.config_manager else {}
+        if not settings.get("gemini_context_cache", False):
+            return None
+
+        ttl = int(settings.get("gemini_context_cache_ttl", 3600))
+        with _gemini_context_caches_lock:
+            entry = _gemini_context_caches.get((model_name, digest))
+            if entry and (entry[0] is None or entry[1] - 60 > time.time()):
+                return entry[0]  # 만료 1분 전까지 재사용 (None이면 생성 실패 기록)
+
+            cached_model = None
+            try:
+                caching = lazy_import("google.generativeai.caching")
+                if caching is None:
+                    raise Exception("google.generativeai.caching 모듈 없음")
+                cached_content = caching.CachedContent.create(
+                    model=f"models/{model_name}",
+                    system_instruction=system_instruction,
+                    ttl=timedelta(seconds=ttl)
+                )
+                cached_model = get_genai().GenerativeModel.from_cached_content(
+                    cached_content=cached_content,
+                    safety_settings=self.gemini_safety_settings
+                )
+                self.log(f"🧊 Gemini 컨텍스트 캐시 생성 ({model_name}, {ttl}초)")
+            except Exception as e:
+                # 지침이 최소 캐시 토큰 수보다 짧거나 모델이 지원하지 않으면 일반 모델 사용
+                self.log(f"⚠️ Gemini 컨텍스트 캐시 사용 불가 - 일반 호출로 진행: {e}")
+            _gemini_context_caches[(model_name, digest)] = (cached_model, time.time() + ttl)
+            return cached_model
+
+    def record_route_usage(self, route, provider, model, latency, input_tokens=0, output_tokens=0, cached_tokens=0):
+        """라우트별 지연/토큰/비용/캐시 적중 토큰 기록"""
+        try:
+            prices = self.config_manager.data.get("global_settings", {}).get("model_prices", {}) if self.config_manager else {}
+            cost = estimate_api_cost(model, input_tokens or 0, output_tokens or 0, prices)
+            get_route_stats().record(route, provider, model, latency, input_tokens or 0, output_tokens or 0, cost,
+                                     cached_tokens=cached_tokens or 0)
+            if cached_tokens:
+                self.log(f"🧊 {route} 프롬프트 캐시 적중 {cached_tokens}/{input_tokens} 토큰 ({cached_tokens / max(1, input_tokens):.0%})")
+        except Exception as e:
+            self.log(f"⚠️ 라우팅 통계 기록 실패: {e}")
+
+    def wait_for_rate_limit(self, provider, api_key=None):
+        """할당량 대기 후 요청 1회 차감 - 일일 할당량 초과 또는 중지 시 False"""
+        provider, api_key, per_minute, per_day = self.get_rate_limit_args(provider, api_key)
+        limiter = get_rate_limiter()
+        if not limiter.acquire(provider, api_key, per_minute, per_day,
+                               should_stop=self.should_stop_posting, log=self.log,
+                               cancel_token=self.current_token()):
+            return False
+
+        status = limiter.status(provider, api_key, per_minute, per_day)
+        self.log(f"📊 {provider.upper()} 요청 - 분당: {status['minute_count']}/{per_minute}, 일일: {status['daily_count']}/{per_day}")
+        return True
+
+    def analyze_api_error(self, error, provider):
+        """API 오류 분석 및 처리 방법 결정 (TEMPORARY_ERROR면 call_with_retry가 재시도)
+
+        예외의 HTTP 상태 코드/예외 타입으로 먼저 판단하고, 둘 다 없을 때만 메시지 문구로 판단합니다.
+        """
+        status = api_error_status(error)
+        if status is not None:
+            return 'TEMPORARY_ERROR' if status in (408, 409, 429) or status >= 500 else 'OTHER_ERROR'
+        if not isinstance(error, str) and is_transient_network_error(error):
+            return 'TEMPORARY_ERROR'
+
+        error_lower = str(error).lower()
+
+        # 일시적 오류 문구 (상태 코드가 없는 오류의 대체 판단)
+        temporary_patterns = [
+            'connection error' in error_lower,
+            'connection reset' in error_lower,
+            'timeout' in error_lower,
+            'timed out' in error_lower,
+            'deadline exceeded' in error_lower,
+            'internal server error' in error_lower,
+            'resource_exhausted' in error_lower,
+            'resource has been exhausted' in error_lower,
+            'rate limit' in error_lower,
+            'overloaded' in error_lower,
+            'unavailable' in error_lower
+        ]
+
+        if any(temporary_patterns):
+            return 'TEMPORARY_ERROR'
+        else:
+            return 'OTHER_ERROR'
+
+    def generate_ai_title(self, keyword):
+        """AI를 사용해 prompt1.txt 제목 지침에 따른 제목 생성"""
+        try:
+            title_prompt = f"""너는 SEO 전문가야. 아래 제목 지침에 따라 '{keyword}'에 대한 제목을 정확히 생성해.
+
+제목 지침:
+- 제목 형식: '{keyword} | 숫자가 들어간 후킹문구' 형식
+- 글자수: 50~60자, 숫자 필수 포함
+- 후킹 요소: 혜택 강조, 고통 해결, 구체적 수치 활용
+- 중요: 반드시 '{keyword} |' 로 시작해야 함!
+- 중요: 큰따옴표, #, *, 백틱 같은 특수문자는 절대 사용하지 마!
+
+제목 예시:
+인덕션 청소 | 10분만에 완벽하게 끝내는 3가지 방법
+스마트폰 배터리 | 2배 오래 쓰는 5가지 비밀 설정
+냉장고 정리 | 30분으로 1주일이 편해지는 수납법
+
+키워드: {keyword}
+
+위 지침에 맞는 제목 1개만 출력해. 설명이나 다른 내용은 일체 포함하지 마. 특수문자 없이 순수한 텍스트만 출력해."""
+
+            system_prompt = "너는 SEO 제목 전문가야. 주어진 지침에 따라 정확한 제목만 생성해. 큰따옴표나 특수문자 없이 순수한 텍스트로만 출력해."
+            
+            result = self.call_ai_api(title_prompt, "제목 생성", max_tokens=100, temperature=0.7, system_content=system_prompt, route="title")
+            
+            if result and result.strip():
+                generated_title = result.strip()
+                
+                # 제목에서 불필요한 문자 강제 제거
+                generated_title = generated_title.replace('"', '').replace("'", '').replace('`', '')
+                generated_title = generated_title.replace('#', '').replace('*', '').replace('**', '')
+                generated_title = re.sub(r'^[\s\-_=]+', '', generated_title)
+                generated_title = re.sub(r'[\s\-_=]+$', '', generated_title)
+                generated_title = generated_title.strip()
+                
+                # 제목 형식 검증
+                if generated_title.startswith(f"{keyword} |") and any(char.isdigit() for char in generated_title):
+                    self.log(f"🎯 AI 생성 제목: {generated_title}")
+                    return generated_title
+                else:
+                    self.log(f"❌ AI 제목 형식 불일치: {generated_title}")
+                    return None
+            else:
+                self.log("❌ AI 제목 생성 실패: 빈 응답")
+                return None
+                
+        except Exception as e:
+            self.log(f"❌ AI 제목 생성 중 오류: {e}")
+            return None
+
+    def clean_step1_content(self, content):
+        """1단계 콘텐츠 정리 - 제목+간단한 서론+링크버튼만 남기기"""
+        try:
+            import re
+            
+            # AI 역할 언급 완전 제거
+            role_patterns = [
+                r'제가\s*\d+년\s*경력의?\s*SEO\s*작가로서',
+                r'저는\s*\d+년\s*경력의?\s*SEO\s*작가로서',
+                r'\d+년\s*경력의?\s*SEO\s*작가로서',
+                r'\d+년\s*경력의?\s*전문가로서',
+                r'SEO\s*전문가로서',
+                r'콘텐츠\s*작가로서',
+                r'전문\s*작가로서'
+            ]
+            
+            for pattern in role_patterns:
+                content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+            
+            # 첫 번째 링크버튼만 보호
+            first_link = ""
+            def preserve_first_link(match):
+                nonlocal first_link
+                if not first_link:
+                    first_link = match.group(0)
+                    return "__FIRST_LINK__"
+                return ""  # 두 번째 이후 링크 제거
+            
+            # 모든 링크 패턴 처리
+            link_patterns = [
+                r'<div><center><p><a[^>]*class="링크버튼"[^>]*>.*?</a></p></center></div>',
+                r'<div><center><a[^>]*class="blink"[^>]*>.*?</a></center></div>',
+                r'<center><a[^>]*class="blink"[^>]*>.*?</a></center>',
+                r'<p[^>]*center[^>]*>.*?<a[^>]*class="링크버튼"[^>]*>.*?</a>.*?</p>'
+            ]
+            
+            for pattern in link_patterns:
+                content = re.sub(pattern, preserve_first_link, content, flags=re.DOTALL)
+            
+            # HTML을 줄 단위로 분리
+            lines = content.split('\n')
+            result_lines = []
+            h1_found = False
+            paragraph_count = 0
+            max_paragraphs = 2  # 서론은 최대 2개 문단만
+            
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # h1 태그는 유지
+                if '<h1>' in line:
+                    result_lines.append(line)
+                    h1_found = True
+                    continue
+                
+                # h1 이후에만 처리
+                if not h1_found:
+                    continue
+                
+                # h2, h3 이하 소제목 발견 시 중단
+                if re.search(r'<h[2-6]', line, re.IGNORECASE):
+                    break
+                
+                # li, ul 태그 제거 (1단계에는 리스트 없어야 함)
+                if re.search(r'<[ul|li]', line, re.IGNORECASE):
+                    continue
+                
+                # p 태그만 허용하되 최대 개수 제한
+                if '<p>' in line and paragraph_count < max_paragraphs:
+                    result_lines.append(line)
+                    paragraph_count += 1
+                elif line == "__FIRST_LINK__":
+                    # 링크버튼 위치 표시
+                    result_lines.append(line)
+            
+            # 결과 조합
+            content = '\n'.join(result_lines)
+            
+            # 링크버튼 복원
+            if first_link:
+                content = content.replace("__FIRST_LINK__", first_link)
+            
+            # 최종 정리
+            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+            
+            return content.strip()
+            
+        except Exception as e:
+            self.log(f"1단계 콘텐츠 정리 중 오류: {e}")
+            return content
+
+    def clean_step5_content(self, content):
+        """5단계 콘텐츠 정리 - 마무리 구조 확인"""
+        try:
+            import re
+            
+            # 기본적인 HTML 구조 확인
+            has_basic_structure = '<h2>' in content or '<h3>' in content or '<p>' in content
+            
+            # 로그 출력
+            if not has_basic_structure:
+                self.log("🚨 5단계: 기본 HTML 구조 누락 - 제목이나 내용이 없습니다!")
+                
+            return content
+            
+        except Exception as e:
+            self.log(f"5단계 콘텐츠 정리 중 오류: {e}")
+            return content
+
+    def remove_prompt_meta_terms(self, content):
+        """프롬프트 메타 용어 및 지시사항 제거 - SEO 내용 제거 강화"""
+        try:
+            import re
+            # 제거할 메타 용어들
+            meta_terms = [
+                r'행동\s*유도\s*문구\s*텍스트',
+                r'문구\s*텍스트',
+                r'메타\s*텍스트',
+                r'프롬프트\s*지시사항',
+                r'시스템\s*프롬프트',
+                r'AI\s*지침',
+                r'콘텐츠\s*생성\s*지침',
+                r'작성\s*가이드라인',
+                r'HTML\s*태그\s*가이드',
+                r'서론\s*\d+자',
+                r'본문\s*\d+자',
+                r'제목\s*\d+자',
+                r'\d+자\s*내외',
+                r'\d+자\s*분량',
+                r'총\s*\d+-?\d*자',
+                r'😊.*?:',        # 이모지 + 콜론 패턴
+                r'👍.*?:',
+                r'✅.*?:',
+                r'💡.*?:',
+                r'📌.*?:',
+                r'🔍.*?:',
+                r'➡️.*?:',
+                r'단계별\s*목표',
+                r'핵심\s*키워드',
+                r'타겟\s*독자',
+                r'```[a-z]*',     # 마크다운 코드 블록 시작
+                r'```',           # 마크다운 코드 블록 끝
+                r'\*\*[^*]*\*\*:',  # 볼드 마크다운 + 콜론
+                r'#+\s*[^#]*:',     # 마크다운 헤더 + 콜론
+                # AI 역할 언급 제거 패턴 추가
+                r'\d+년\s*경력의?\s*SEO\s*작가로서',
+                r'\d+년\s*경력의?\s*SEO\s*콘텐츠\s*작가로서',
+                r'\d+년\s*경력의?\s*전문가로서',
+                r'SEO\s*전문가로서',
+                r'콘텐츠\s*작가로서',
+                r'전문\s*작가로서',
+                r'경험\s*많은\s*작가로서',
+                r'숙련된\s*작가로서',
+                # SEO 관련 내용 제거 패턴 추가
+                r'SEO.*?본질.*?콘텐츠\s*자산',
+                r'SEO.*?본질.*?콘텐츠\s*자산',
+                r'짧은\s*것들을\s*차근차근\s*시작하기',
+                r'완벽한\s*SEO란\s*없음',
+                r'오늘\s*하나의\s*제목.*?구체적인\s*정보.*?가볍게\s*시작하면\s*됩니다',
+                r'이번\s*주\s*목표.*?제목에\s*검색\s*키워드\s*포함하기',
+                r'다음\s*주\s*목표.*?본문에\s*소제목\s*구조\s*만들기',
+                r'다\s*음\s*주\s*목표.*?외부\s*링크\s*연결하기',
+                r'구글은\s*단기간에\s*결과가\s*나오는\s*것이\s*아니다',
+                r'한\s*달에\s*10개보다는\s*매주\s*2개씩\s*꾸준히',
+                r'블루투스\s*이어폰\s*연결\s*안될\s*때\s*비교\s*정보',
+                r'구분.*?특징.*?장점.*?\s*형태'
+            ]
+
+            # 각 메타 용어 제거
+            for term in meta_terms:
+                content = re.sub(term, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+            # HTML 관련 마크업 문구 제거 강화
+            html_markup_patterns = [
+                r'```html.*?```',     # ```html...``` 코드블록 전체
+                r'```html',           # ```html 시작
+                r'```',              # ``` 마크다운 코드블록
+                r'`html.*?`',         # `html...` 인라인 코드
+                r'`html',            # `html
+                r'"html',            # "html 
+                r'html\s*코드',       # html 코드
+                r'HTML\s*구조',       # HTML 구조  
+                r'html\s*태그',       # html 태그
+                r'HTML\s*태그',       # HTML 태그
+                r'<\/\*.*?\*\/>',     # /* */ 주석
+                r'<!--.*?-->',        # HTML 주석
+                # 마크다운 문법 제거 강화
+                r'#{1,6}\s+',         # ### 마크다운 헤더
+                r'\*\*([^*]+)\*\*',   # **bold** 마크다운
+                r'\*([^*]+)\*',       # *italic* 마크다운  
+                r'!\[.*?\]\(.*?\)',   # ![이미지](링크) 마크다운
+                r'\[([^\]]+)\]\([^)]+\)', # [텍스트](링크) 마크다운
+                # HTML 문서 구조 태그 완전 제거
+                r'<!DOCTYPE[^>]*>',   # DOCTYPE
+                r'<html[^>]*>',       # <html> 태그
+                r'</html>',           # </html> 태그
+                r'<head[^>]*>.*?</head>', # <head> 섹션 전체
+                r'<body[^>]*>',       # <body> 태그
+                r'</body>',           # </body> 태그
+                r'<meta[^>]*>',       # <meta> 태그
+                r'<title[^>]*>.*?</title>', # <title> 태그
+            ]
+            
+            for pattern in html_markup_patterns:
+                content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+            # <h1> 태그 완전 제거 (시스템에서 사용하지 않음)
+            content = re.sub(r'<h1[^>]*>.*?</h1>', '', content, flags=re.IGNORECASE | re.DOTALL)
+            content = re.sub(r'<h1[^>]*>', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'</h1>', '', content, flags=re.IGNORECASE)
+
+            # prompt1.txt에서 나와서는 안 되는 h2 태그 제거 (1단계는 제목+서론+링크버튼만)
+            content = re.sub(r'<h2[^>]*>.*?</h2>', '', content, flags=re.IGNORECASE | re.DOTALL)
+            content = re.sub(r'<h2[^>]*>', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'</h2>', '', content, flags=re.IGNORECASE)
+
+            # 특정 패턴들 추가 제거
+            content = re.sub(r'서론\s*\d+자', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'본문\s*\d+자', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'제목\s*\d+자', '', content, flags=re.IGNORECASE)
+
+            # 마크다운 관련 지시문 제거
+            content = re.sub(r'마크다운\s*문법\s*절대\s*사용\s*금지', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'HTML\s*태그만\s*사용', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'코드\s*블록\s*사용\s*금지', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'html\s*같은\s*마크다운\s*코드\s*블록', '', content, flags=re.IGNORECASE)
+
+            # SEO 관련 표나 구조화된 내용 제거
+            content = re.sub(r'<table>.*?</table>', '', content, flags=re.IGNORECASE | re.DOTALL)
+            content = re.sub(r'구분.*?특징.*?장점', '', content, flags=re.IGNORECASE | re.DOTALL)
+
+            # 단독으로 나오는 숫자+점 패턴 제거
+            content = re.sub(r'^\s*\d+\.\s*$', '', content, flags=re.MULTILINE)
+            content = re.sub(r'<p>\s*\d+\.\s*</p>', '', content, flags=re.IGNORECASE)
+
+            # 빈 태그나 의미없는 구문 정리
+            content = re.sub(r'<p>\s*</p>', '', content)
+            content = re.sub(r'<div>\s*</div>', '', content)
+            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)  # 과도한 줄바꿈 정리
+
+            return content.strip()
+
+        except Exception as e:
+            self.log(f"메타 용어 제거 중 오류: {e}")
+            return content
+
+    def remove_approval_meta_terms(self, content):
+        """승인용 콘텐츠의 메타 용어 제거 - <h2>, <p> 태그는 보존"""
+        try:
+            import re
+            # 제거할 메타 용어들 (승인용 글에서는 HTML 태그 보존)
+            meta_terms = [
+                r'행동\s*유도\s*문구\s*텍스트',
+                r'문구\s*텍스트',
+                r'메타\s*텍스트',
+                r'프롬프트\s*지시사항',
+                r'시스템\s*프롬프트',
+                r'AI\s*지침',
+                r'콘텐츠\s*생성\s*지침',
+                r'작성\s*가이드라인',
+                r'HTML\s*태그\s*가이드',
+                r'서론\s*\d+자',
+                r'본문\s*\d+자',
+                r'제목\s*\d+자',
+                r'\d+자\s*내외',
+                r'\d+자\s*분량',
+                r'총\s*\d+-?\d*자',
+                r'😊.*?:',
+                r'👍.*?:',
+                r'✅.*?:',
+                r'💡.*?:',
+                r'📌.*?:',
+                r'🔍.*?:',
+                r'구체적이고\s*설명적인',
+                r'단계별\s*목표',
+                r'핵심\s*키워드',
+                r'타겟\s*독자',
+                r'```[a-z]*',
+                r'```',
+                r'\*\*[^*]*\*\*:',
+                r'#+\s*[^#]*:',
+                r'AI\s*역할\s*언급',
+                r'\d+년\s*경력의?\s*전문가로서',
+                r'SEO\s*전문가로서',
+                r'콘텐츠\s*작가로서',
+                r'마크다운\s*문법\s*절대\s*사용\s*금지',
+                r'HTML\s*태그만\s*사용',
+                r'코드\s*블록\s*사용\s*금지'
+            ]
+
+            # HTML 관련 마크업 문구 제거 (승인용에서는 실제 HTML 태그는 보존)
+            html_markup_patterns = [
+                r'```html.*?```',
+                r'```html',
+                r'`html.*?`',
+                r'`html',
+                r'"html',
+                r'<!DOCTYPE[^>]*>',
+                r'<html[^>]*>',
+                r'</html>',
+                r'<head[^>]*>.*?</head>',
+                r'<body[^>]*>',
+                r'</body>',
+                r'<meta[^>]*>',
+                r'<title[^>]*>.*?</title>',
+            ]
+
+            # 각 메타 용어 제거
+            for term in meta_terms:
+                content = re.sub(term, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+            # HTML 관련 마크업 문구 제거
+            for pattern in html_markup_patterns:
+                content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+            # 마크다운을 HTML로 강제 변환 (승인용 글 전용)
+            content = self.convert_approval_markdown_to_html(content)
+
+            # <h1> 태그만 제거 (승인용에서는 사용하지 않음)
+            content = re.sub(r'<h1[^>]*>.*?</h1>', '', content, flags=re.IGNORECASE | re.DOTALL)
+            content = re.sub(r'<h1[^>]*>', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'</h1>', '', content, flags=re.IGNORECASE)
+
+            # 승인용에서는 <h2>, <p> 태그는 보존 (제거하지 않음)
+
+            # 특정 패턴들 추가 제거
+            content = re.sub(r'서론\s*\d+자', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'본문\s*\d+자', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'제목\s*\d+자', '', content, flags=re.IGNORECASE)
+
+            # 단독으로 나오는 숫자+점 패턴 제거
+            content = re.sub(r'^\s*\d+\.\s*$', '', content, flags=re.MULTILINE)
+            content = re.sub(r'<p>\s*\d+\.\s*</p>', '', content, flags=re.IGNORECASE)
+
+            # 빈 태그나 의미없는 구문 정리
+            content = re.sub(r'<p>\s*</p>', '', content)
+            content = re.sub(r'<div>\s*</div>', '', content)
+            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+
+            return content.strip()
+
+        except Exception as e:
+            self.log(f"승인용 메타 용어 제거 중 오류: {e}")
+            return content
+
+    def convert_approval_markdown_to_html(self, content):
+        """승인용 글의 마크다운을 HTML로 변환 - <h2>, <p> 태그 강제 적용"""
+        try:
+            import re
+            
+            # 마크다운 헤더를 HTML로 변환
+            content = re.sub(r'^### (.*?)$', r'<h3><strong>\1</strong></h3>', content, flags=re.MULTILINE)
+            content = re.sub(r'^## (.*?)$', r'<h2><strong>\1</strong></h2>', content, flags=re.MULTILINE)
+            content = re.sub(r'^# (.*?)$', '', content, flags=re.MULTILINE)  # h1은 제거
+            
+            # 마크다운 볼드를 HTML로 변환
+            content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+            content = re.sub(r'__(.*?)__', r'<strong>\1</strong>', content)
+            
+            # 마크다운 이탤릭을 HTML로 변환
+            content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
+            content = re.sub(r'_(.*?)_', r'<em>\1</em>', content)
+            
+            # 줄바꿈을 <p> 태그로 변환 (빈 줄로 구분된 단락들)
+            paragraphs = re.split(r'\n\s*\n', content.strip())
+            html_paragraphs = []
+            
+            for paragraph in paragraphs:
+                paragraph = paragraph.strip()
+                if paragraph:
+                    # 이미 HTML 태그로 감싸져 있는지 확인
+                    if paragraph.startswith('<h') or paragraph.startswith('<div') or paragraph.startswith('<table'):
+                        html_paragraphs.append(paragraph)
+                    elif paragraph.startswith('<p>') and paragraph.endswith('</p>'):
+                        html_paragraphs.append(paragraph)
+                    else:
+                        # 단순 텍스트는 <p> 태그로 감싸기
+                        html_paragraphs.append(f'<p>{paragraph}</p>')
+            
+            content = '\n\n'.join(html_paragraphs)
+            
+            # 중복 <p> 태그 제거
+            content = re.sub(r'<p>\s*<p>(.*?)</p>\s*</p>', r'<p>\1</p>', content, flags=re.DOTALL)
+            
+            return content.strip()
+            
+        except Exception as e:
+            self.log(f"승인용 마크다운 변환 중 오류: {e}")
+            return content
+
+    def final_approval_validation(self, content, keyword):
+        """승인용 글 최종 검증 및 강제 HTML 변환"""
+        try:
+            import re
+            
+            self.log("🔍 승인용 글 최종 검증 시작...")
+            
+            # 마크다운 문법 검사
+            markdown_found = False
+            markdown_patterns = [
+                (r'##\s+', '## 헤딩'),
+                (r'\*\*.*?\*\*', '**볼드**'),
+                (r'\*.*?\*(?!\*)', '*이탤릭*'),
+                (r'```', '코드 블록'),
+                (r'---', '구분선'),
+                (r'`.*?`', '인라인 코드')
+            ]
+            
+            for pattern, name in markdown_patterns:
+                if re.search(pattern, content):
+                    self.log(f"⚠️ 마크다운 발견: {name}")
+                    markdown_found = True
+            
+            if markdown_found:
+                self.log("🔧 마크다운을 HTML로 강제 변환 중...")
+                content = self.convert_approval_markdown_to_html(content)
+                
+                # 변환 후 재검사
+                for pattern, name in markdown_patterns:
+                    if re.search(pattern, content):
+                        self.log(f"⚠️ 변환 후에도 마크다운 남음: {name}")
+                        # 더 강력한 변환 수행
+                        content = re.sub(r'##\s+(.*?)(?=\n|$)', r'<h2><strong>\1</strong></h2>', content)
+                        content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+                        content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
+                        content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
+                        content = re.sub(r'`(.*?)`', r'\1', content)
+                        content = re.sub(r'---+', '', content)
+            
+            # HTML 구조 검증
+            h2_count = len(re.findall(r'<h2[^>]*>.*?</h2>', content, re.IGNORECASE | re.DOTALL))
+            p_count = len(re.findall(r'<p[^>]*>.*?</p>', content, re.IGNORECASE | re.DOTALL))
+            
+            self.log(f"📊 HTML 구조 검증: <h2> {h2_count}개, <p> {p_count}개")
+            
+            if h2_count == 0:
+                self.log("⚠️ <h2> 태그가 없음 - 소제목 강제 생성")
+                # 간단한 소제목 추가
+                subtitles = ["활용법", "주요 특징", "실무 팁"]
+                for i, subtitle in enumerate(subtitles):
+                    if f"<h2>" not in content:
+                        content = f"<h2><strong>{keyword} {subtitle}</strong></h2>\n" + content
+                        break
+            
+            if p_count == 0:
+                self.log("⚠️ <p> 태그가 없음 - 텍스트를 <p>로 감싸기")
+                # 텍스트를 <p> 태그로 감싸기
+                lines = content.split('\n')
+                processed_lines = []
+                for line in lines:
+                    line = line.strip()
+                    if line and not line.startswith('<'):
+                        processed_lines.append(f"<p>{line}</p>")
+                    elif line:
+                        processed_lines.append(line)
+                content = '\n'.join(processed_lines)
+            
+            self.log("✅ 승인용 글 최종 검증 완료")
+            return content
+            
+        except Exception as e:
+            self.log(f"승인용 글 최종 검증 중 오류: {e}")
+            return content
+
+    def extract_approval_title(self, raw_content, keyword):
+        """승인용 글에서 제목만 추출 (원본 AI 응답에서)"""
+        try:
+            import re
+            
+            self.log("🔍 원본 응답에서 제목 추출 시작...")
+            
+            lines = raw_content.split('\n')
+            for i, line in enumerate(lines[:5]):  # 처음 5줄만 확인
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # HTML 태그 완전 제거
+                clean_line = re.sub(r'<[^>]+>', '', line).strip()
+                
+                # 불필요한 문자 제거 (큰따옴표, #, *, 백틱 등)
+                clean_line = clean_line.replace('"', '').replace("'", '').replace('`', '')
+                clean_line = clean_line.replace('#', '').replace('*', '').replace('**', '')
+                clean_line = re.sub(r'^[\s\-_=]+', '', clean_line)
+                clean_line = re.sub(r'[\s\-_=]+$', '', clean_line)
+                clean_line = clean_line.strip()
+                
+                # 제목 패턴 확인: 콜론이 있고, 적절한 길이이고, HTML 태그로 시작하지 않음
+                if ':' in clean_line and 15 <= len(clean_line) <= 70 and not line.startswith('<'):
+                    # 추가 검증: 콜론 뒤에 콤마가 있어야 함 (승인용 제목 형식)
+                    parts = clean_line.split(':', 1)
+                    if len(parts) == 2 and ',' in parts[1]:
+                        self.log(f"📌 제목 추출 성공: {clean_line}")
+                        return clean_line
+            
+            # 제목을 찾지 못한 경우 키워드 기반 생성
+            fallback_title = f"{keyword}: 활용법, 주요 특징, 실무 팁"
+            self.log(f"⚠️ 제목 추출 실패, 자동 생성: {fallback_title}")
+            return fallback_title
+            
+        except Exception as e:
+            self.log(f"제목 추출 중 오류: {e}")
+            return f"{keyword}: 활용법, 주요 특징, 실무 팁"
+
+    def process_approval_step_content(self, raw_content, step_number, keyword):
+        """승인용 글 단계별 정밀 처리 - 제목 분리, HTML 구조 강제 적용"""
+        try:
+            import re
+            
+            self.log(f"🔧 승인용 {step_number}단계 정밀 처리 시작...")
+            
+            # 1단계: 기본 메타 용어 제거
+            content = self.remove_approval_meta_terms(raw_content)
+            
+            # 2단계: 단계별 맞춤 처리
+            if step_number == 1:
+                # 1단계: 제목 + 서론 + 첫 번째 소제목 + 본문
+                content = self.process_approval_step1(content, keyword)
+            elif step_number == 2:
+                # 2단계: 두 번째 소제목 + 본문
+                content = self.process_approval_step2(content, keyword)
+            elif step_number == 3:
+                # 3단계: 세 번째 소제목 + 본문
+                content = self.process_approval_step3(content, keyword)
+            
+            self.log(f"✅ 승인용 {step_number}단계 처리 완료")
+            return content
+            
+        except Exception as e:
+            self.log(f"승인용 {step_number}단계 처리 중 오류: {e}")
+            return self.remove_approval_meta_terms(raw_content)
+
+    def process_approval_step1(self, content, keyword):
+        """승인용 1단계 처리: 제목은 완전히 제외하고 서론+소제목1+본문1만 반환"""
+        try:
+            import re
+            
+            self.log("🔧 1단계: 제목 완전 제외, 서론+소제목1+본문1 처리")
+            
+            lines = content.split('\n')
+            processed_lines = []
+            title_lines_removed = 0
+            intro_content = []
+            subtitle_content = []
+            body_content = []
+            current_section = 'intro'
+            
+            # 먼저 제목으로 보이는 모든 라인을 식별하고 제거
+            filtered_lines = []
+            for i, line in enumerate(lines):
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # HTML 태그 제거한 순수 텍스트
+                clean_line = re.sub(r'<[^>]+>', '', line).strip()
+                
+                # 제목 패턴 감지 및 완전 제거
+                is_title = False
+                
+                # 패턴 1: 콜론이 있고 콤마가 있는 제목 형식
+                if ':' in clean_line and ',' in clean_line and 15 <= len(clean_line) <= 70:
+                    parts = clean_line.split(':', 1)
+                    if len(parts) == 2 and len(parts[1].split(',')) >= 2:
+                        is_title = True
+                        self.log(f"📌 제목 패턴1 감지하여 제거: {clean_line[:40]}...")
+                
+                # 패턴 2: 키워드가 포함되고 콜론이 있는 경우
+                if keyword in clean_line and ':' in clean_line and len(clean_line) <= 60:
+                    is_title = True
+                    self.log(f"📌 제목 패턴2 감지하여 제거: {clean_line[:40]}...")
+                
+                # 패턴 3: 첫 5줄 중에서 콜론만 있는 경우도 제목으로 간주
+                if i < 5 and ':' in clean_line and not line.startswith('<') and len(clean_line) >= 10:
+                    is_title = True
+                    self.log(f"📌 제목 패턴3 감지하여 제거: {clean_line[:40]}...")
+                
+                if is_title:
+                    title_lines_removed += 1
+                    continue  # 제목 라인은 완전히 스킵
+                
+                filtered_lines.append(line)
+            
+            self.log(f"📊 제목 라인 {title_lines_removed}개 제거됨")
+            
+            # 필터링된 라인들을 다시 처리
+            for line in filtered_lines:
+                # 마크다운 헤더를 HTML로 강제 변환
+                if re.match(r'^##\s+', line):
+                    subtitle_text = re.sub(r'^##\s+', '', line).strip()
+                    subtitle_text = re.sub(r'\*\*(.*?)\*\*', r'\1', subtitle_text)  # ** 제거
+                    subtitle_content.append(f"<h2><strong>{subtitle_text}</strong></h2>")
+                    current_section = 'body'
+                    self.log(f"📌 마크다운 소제목 변환: {subtitle_text}")
+                    continue
+                
+                # HTML h2 태그가 이미 있는 경우
+                if re.match(r'<h2[^>]*>', line, re.IGNORECASE):
+                    current_section = 'body'
+                    # <strong> 태그가 없으면 추가
+                    if '<strong>' not in line.lower():
+                        line = re.sub(r'<h2[^>]*>(.*?)</h2>', r'<h2><strong>\1</strong></h2>', line, flags=re.IGNORECASE)
+                    subtitle_content.append(line)
+                    self.log(f"📌 HTML 소제목 발견: {line}")
+                    continue
+                
+                # 볼드 마크다운 제거
+                line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
+                
+                # 본문 내용 처리
+                if current_section == 'intro':
+                    intro_content.append(line)
+                elif current_section == 'body':
+                    body_content.append(line)
+                else:
+                    intro_content.append(line)
+            
+            # 서론을 <p> 태그로 강제 처리 (h태그 사용하지 않음)
+            if intro_content:
+                intro_text = ' '.join(intro_content).strip()
+                # HTML 태그 제거 후 순수 텍스트만 추출
+                intro_text = re.sub(r'<[^>]+>', '', intro_text)
+                
+                # 서론에서도 제목 패턴이 남아있는지 한번 더 확인
+                if ':' in intro_text and ',' in intro_text:
+                    # 콜론 이후 부분만 사용 (제목 앞부분 제거)
+                    parts = intro_text.split(':', 1)
+                    if len(parts) == 2:
+                        intro_text = parts[1].strip()
+                        # 첫 번째 콤마 이후 부분부터 사용
+                        comma_parts = intro_text.split(',', 1)
+                        if len(comma_parts) == 2:
+                            intro_text = comma_parts[1].strip()
+                        self.log("📌 서론에서 제목 잔여 부분 제거")
+                
+                if intro_text and len(intro_text) > 10:  # 의미있는 서론이 있을 때만
+                    processed_lines.append(f"<p>{intro_text}</p>")
+                    self.log(f"📌 서론 생성 (p태그): {intro_text[:50]}...")
+            
+            # 소제목이 없으면 강제 생성
+            if not subtitle_content:
+                processed_lines.append(f"<h2><strong>{keyword} 기본 활용법</strong></h2>")
+                self.log(f"📌 소제목 강제 생성: {keyword} 기본 활용법")
+            else:
+                processed_lines.extend(subtitle_content)
+            
+            # 본문을 <p> 태그로 강제 처리
+            if body_content:
+                body_text = ' '.join(body_content).strip()
+                # HTML 태그 제거 후 순수 텍스트만 추출
+                body_text = re.sub(r'<[^>]+>', '', body_text)
+                if body_text and len(body_text) > 10:  # 의미있는 본문이 있을 때만
+                    processed_lines.append(f"<p>{body_text}</p>")
+                    self.log(f"📌 본문 생성: {body_text[:50]}...")
+            
+            result = '\n\n'.join(processed_lines)
+            self.log("✅ 1단계 제목 완전 제거 및 HTML 구조 강제 적용 완료")
+            return result
+            
+        except Exception as e:
+            self.log(f"1단계 처리 중 오류: {e}")
+            return content
+
+    def process_approval_step2(self, content, keyword):
+        """승인용 2단계 처리: 소제목2 + 본문2"""
+        try:
+            import re
+            
+            self.log("🔧 2단계: 소제목2+본문2 처리")
+            
+            lines = content.split('\n')
+            processed_lines = []
+            subtitle_content = []
+            body_content = []
+            current_section = 'subtitle'
+            
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # 마크다운 헤더를 HTML로 강제 변환
+                if re.match(r'^##\s+', line):
+                    subtitle_text = re.sub(r'^##\s+', '', line).strip()
+                    subtitle_text = re.sub(r'\*\*(.*?)\*\*', r'\1', subtitle_text)  # ** 제거
+                    subtitle_content.append(f"<h2><strong>{subtitle_text}</strong></h2>")
+                    current_section = 'body'
+                    self.log(f"📌 2단계 마크다운 소제목 변환: {subtitle_text}")
+                    continue
+                
+                # HTML h2 태그가 이미 있는 경우
+                if re.match(r'<h2[^>]*>', line, re.IGNORECASE):
+                    current_section = 'body'
+                    # <strong> 태그가 없으면 추가
+                    if '<strong>' not in line.lower():
+                        line = re.sub(r'<h2[^>]*>(.*?)</h2>', r'<h2><strong>\1</strong></h2>', line, flags=re.IGNORECASE)
+                    subtitle_content.append(line)
+                    self.log(f"📌 2단계 HTML 소제목 발견: {line}")
+                    continue
+                
+                # 볼드 마크다운 제거
+                line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
+                
+                # 본문 내용 수집
+                if current_section == 'body':
+                    body_content.append(line)
+                else:
+                    # 소제목이 없으면 이 내용으로 소제목 생성
+                    if not subtitle_content and current_section == 'subtitle':
+                        first_words = ' '.join(line.split()[:3])
+                        subtitle_content.append(f"<h2><strong>{keyword} {first_words} 특징</strong></h2>")
+                        current_section = 'body'
+                        self.log(f"📌 2단계 소제목 자동 생성: {keyword} {first_words} 특징")
+                    body_content.append(line)
+            
+            # 소제목이 없으면 강제 생성
+            if not subtitle_content:
+                processed_lines.append(f"<h2><strong>{keyword} 주요 특징</strong></h2>")
+                self.log(f"📌 2단계 소제목 강제 생성: {keyword} 주요 특징")
+            else:
+                processed_lines.extend(subtitle_content)
+            
+            # 본문을 <p> 태그로 강제 처리
+            if body_content:
+                body_text = ' '.join(body_content).strip()
+                # HTML 태그 제거 후 순수 텍스트만 추출
+                body_text = re.sub(r'<[^>]+>', '', body_text)
+                if body_text:
+                    processed_lines.append(f"<p>{body_text}</p>")
+                    self.log(f"📌 2단계 본문 생성: {body_text[:50]}...")
+            
+            result = '\n\n'.join(processed_lines)
+            self.log("✅ 2단계 HTML 구조 강제 적용 완료")
+            return result
+            
+        except Exception as e:
+            self.log(f"2단계 처리 중 오류: {e}")
+            return content
+
+    def process_approval_step3(self, content, keyword):
+        """승인용 3단계 처리: 소제목3 + 본문3"""
+        try:
+            import re
+            
+            self.log("🔧 3단계: 소제목3+본문3 처리")
+            
+            lines = content.split('\n')
+            processed_lines = []
+            subtitle_content = []
+            body_content = []
+            current_section = 'subtitle'
+            
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # 마크다운 헤더를 HTML로 강제 변환
+                if re.match(r'^##\s+', line):
+                    subtitle_text = re.sub(r'^##\s+', '', line).strip()
+                    subtitle_text = re.sub(r'\*\*(.*?)\*\*', r'\1', subtitle_text)  # ** 제거
+                    subtitle_content.append(f"<h2><strong>{subtitle_text}</strong></h2>")
+                    current_section = 'body'
+                    self.log(f"📌 3단계 마크다운 소제목 변환: {subtitle_text}")
+                    continue
+                
+                # HTML h2 태그가 이미 있는 경우
+                if re.match(r'<h2[^>]*>', line, re.IGNORECASE):
+                    current_section = 'body'
+                    # <strong> 태그가 없으면 추가
+                    if '<strong>' not in line.lower():
+                        line = re.sub(r'<h2[^>]*>(.*?)</h2>', r'<h2><strong>\1</strong></h2>', line, flags=re.IGNORECASE)
+                    subtitle_content.append(line)
+                    self.log(f"📌 3단계 HTML 소제목 발견: {line}")
+                    continue
+                
+                # 볼드 마크다운 제거
+                line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
+                
+                # 본문 내용 수집
+                if current_section == 'body':
+                    body_content.append(line)
+                else:
+                    # 소제목이 없으면 이 내용으로 소제목 생성
+                    if not subtitle_content and current_section == 'subtitle':
+                        first_words = ' '.join(line.split()[:3])
+                        subtitle_content.append(f"<h2><strong>{keyword} {first_words} 활용 팁</strong></h2>")
+                        current_section = 'body'
+                        self.log(f"📌 3단계 소제목 자동 생성: {keyword} {first_words} 활용 팁")
+                    body_content.append(line)
+            
+            # 소제목이 없으면 강제 생성
+            if not subtitle_content:
+                processed_lines.append(f"<h2><strong>{keyword} 실무 활용 팁</strong></h2>")
+                self.log(f"📌 3단계 소제목 강제 생성: {keyword} 실무 활용 팁")
+            else:
+                processed_lines.extend(subtitle_content)
+            
+            # 본문을 <p> 태그로 강제 처리
+            if body_content:
+                body_text = ' '.join(body_content).strip()
+                # HTML 태그 제거 후 순수 텍스트만 추출
+                body_text = re.sub(r'<[^>]+>', '', body_text)
+                if body_text:
+                    processed_lines.append(f"<p>{body_text}</p>")
+                    self.log(f"📌 3단계 본문 생성: {body_text[:50]}...")
+            
+            result = '\n\n'.join(processed_lines)
+            self.log("✅ 3단계 HTML 구조 강제 적용 완료")
+            return result
+            
+        except Exception as e:
+            self.log(f"3단계 처리 중 오류: {e}")
+            return content
+
+    def generate_approval_content(self, keyword):
+        """승인용 콘텐츠 생성 - approval1.txt, approval2.txt, approval3.txt만 사용"""
+        try:
+            # 승인용 프롬프트 파일 로드 (3개만)
+            approval_files = [
+                "approval1.txt", "approval2.txt", "approval3.txt"
+            ]
+
+            all_content_parts = []
+            title = ""
+
+            # 이전 실행에서 완료된 단계 (중단 후 재시작 시 첫 미완료 단계부터 진행)
+            checkpoint = self.load_step_checkpoint(keyword, "approval")
+
+            # 3개 승인용 프롬프트 파일을 순차적으로 적용
+            for i, approval_file in enumerate(approval_files, 1):
+                saved_step = checkpoint.get(str(i))
+                if saved_step:
+                    self.log(f"♻️ 승인용 {i}단계 체크포인트 복원 (AI 호출 생략)")
+                    if i == 1:
+                        title = saved_step.get('title') or ""
+                    all_content_parts.append(saved_step['content'])
+                    continue
+
+                prompt_path = os.path.join(get_base_path(), "prompts", approval_file)
+
+                if os.path.exists(prompt_path):
+                    # UTF-8 BOM 처리를 위해 utf-8-sig 사용
+                    try:
+                        with open(prompt_path, 'r', encoding='utf-8-sig') as f:
+                            prompt_template = f.read()
+                    except UnicodeDecodeError:
+                        # BOM이 없는 경우 일반 utf-8로 재시도
+                        with open(prompt_path, 'r', encoding='utf-8') as f:
+                            prompt_template = f.read()
+
+                    # 키워드 대체 (고정 접두부 모드에서는 지침을 system으로, 키워드는 사용자 메시지 끝으로)
+                    approval_system = None
+                    if self.use_stable_prompt_prefix():
+                        approval_system = build_stable_prompt(prompt_template)
+                        prompt = f"위 지침에 따라 글을 작성해주세요.\n\n키워드: {keyword}"
+                    else:
+                        prompt = prompt_template.replace("{keyword}", keyword)
+                    
+                    # 승인용 글 전용: 프롬프트 파일에 이미 규칙이 있으므로 추가하지 않음
+
+                    print(f"승인용 {i}단계 생성 중", end=" ")
+
+                    # 통합 AI API 호출
+                    try:
+                        response_text = self.call_ai_api(prompt, f"승인용 {i}단계", max_tokens=1500, temperature=0.7,
+                                                         system_content=approval_system, route=f"approval_{i}")
+
+                        if response_text and response_text.strip():
+                            # 첫 번째 단계에서 승인용 제목 추출 (처리 전 원본에서)
+                            if i == 1:
+                                title = self.extract_approval_title(response_text.strip(), keyword)
+                            
+                            # AI 출력 검증 및 자동 수정 (프롬프트 '중요 주의사항' 규칙 적용)
+                            response_text = self.validate_ai_output(response_text.strip(), keyword)
+                            
+                            # 승인용 글 전용 정밀 처리 (제목 완전 제거)
+                            step_content = self.process_approval_step_content(response_text, i, keyword)
+                            
+                            all_content_parts.append(step_content)
+                            self.save_step_checkpoint(keyword, "approval", i, step_content, title if i == 1 else None)
+
+                        # 다음 단계로 계속 진행
+
+                    except Exception as step_error:
+                        self.log(f"❌ 승인용 {i}단계 오류: {str(step_error)}")
+                        # 단계별 오류 시에도 계속 진행
+                else:
+                    self.log(f"❌ 승인용 프롬프트 파일 없음: {approval_file}")
+
+            if not all_content_parts:
+                self.log(f"🔥 승인용 콘텐츠 생성 실패 - 모든 단계 실패")
+                return None, None, None
+
+            # 3단계의 콘텐츠를 결합
+            full_content = "\n\n".join(all_content_parts)
+            
+            # 승인용 글 최종 검증 및 강제 HTML 변환
+            full_content = self.final_approval_validation(full_content, keyword)
+            
+            self.log(f"📝 승인용 본문 생성 완료 - 3단계 ({len(full_content)}자)")
+            print()  # 승인용 콘텐츠 생성 완료 후 개행
+
+            if not title:
+                # 승인용 전용 fallback 제목 생성
+                self.log("⚠️ 승인용 제목 추출 실패, fallback 제목 생성")
+                title = self.generate_approval_fallback_title(keyword)
+                if not title:
+                    # 최후 fallback - 승인용 형식에 맞게 생성
+                    approval_subtitles = ["활용법", "주요 특징", "실무 팁"]
+                    title = f"{keyword}: {approval_subtitles[0]}, {approval_subtitles[1]}, {approval_subtitles[2]}"
+                self.log(f"📝 자동 생성된 제목: {title}")
+
+            # 썸네일 이미지 선택 및 제목 추가
+            thumbnail_filename = self.get_thumbnail_file()
+            base_thumbnail_path = os.path.join(get_base_path(), 'images', thumbnail_filename)
+
+            # 제목이 있으면 썸네일에 제목 추가
+            thumbnail_path = self.create_thumbnail_with_title(title, keyword)
+
+            return title, full_content, thumbnail_path
+
+        except Exception as e:
+            self.log(f"🔥 승인용 콘텐츠 생성 오류: {str(e)}")
+            import traceback
+            self.log(f"🔍 상세 오류:\n{traceback.format_exc()}")
+            return None, None, None
+
+    def convert_markdown_to_html(self, content):
+        """마크다운을 HTML로 변환"""
+        try:
+            # 먼저 링크 버튼 및 다운로드 버튼 HTML을 모두 보호
+            link_patterns = []
+            def preserve_link_html(match):
+                link_patterns.append(match.group(0))
+                return f"__LINK_PLACEHOLDER_{len(link_patterns)-1}__"
+
+            # 다운로드 버튼 전체 container 보호 (class="button-container")
+            content = re.sub(r'<div\s+class="button-container">.*?</div>', preserve_link_html, content, flags=re.DOTALL)
+            
+            # 개별 다운로드 버튼 <a> 태그 보호 (class="custom-download-btn")
+            content = re.sub(r'<a[^>]*class="custom-download-btn"[^>]*>.*?</a>', preserve_link_html, content, flags=re.DOTALL)
+            
+            # <div><center><a class="blink"  패턴 보호
+            content = re.sub(r'<div><center><a[^>]*class="blink"[^>]*>.*?</a></center></div>', preserve_link_html, content, flags=re.DOTALL)
+            # <center><a class="blink"  패턴도 보호
+            content = re.sub(r'<center><a[^>]*class="blink"[^>]*>.*?</a></center>', preserve_link_html, content, flags=re.DOTALL)
+            # 단순 <a class="blink"  패턴도 보호
+            content = re.sub(r'<a[^>]*class="blink"[^>]*>.*?</a>', preserve_link_html, content, flags=re.DOTALL)
+            
+            # link1, link2, link3 클래스 보호 - prompt2.txt, prompt3.txt, prompt4.txt에서 사용
+            content = re.sub(r'<div><center><p><a[^>]*class="link[123]"[^>]*>.*?</a></p></center></div>', preserve_link_html, content, flags=re.DOTALL)
+            content = re.sub(r'<a[^>]*class="link[123]"[^>]*>.*?</a>', preserve_link_html, content, flags=re.DOTALL)
+
+            # 마크다운 코드 블록 제거 (```html, ```python 등)
+            content = re.sub(r'```[a-z]*\n?', '', content, flags=re.IGNORECASE)
+            content = re.sub(r'```', '', content)
+
+            # 제목 처리 - h1은 제거 (제목은 별도 필드로 처리)
+            content = re.sub(r'^# (.*?)$', '', content, flags=re.MULTILINE)
+            content = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
+            content = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
+
+            # 굵은 글씨 처리
+            content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+            content = re.sub(r'__(.*?)__', r'<strong>\1</strong>', content)
+
+            # 기울임 처리
+            content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
+            content = re.sub(r'_(.*?)_', r'<em>\1</em>', content)
+
+            # 리스트 처리
+            content = re.sub(r'^- (.*?)$', r'<li>\1</li>', content, flags=re.MULTILINE)
+            content = re.sub(r'^\* (.*?)$', r'<li>\1</li>', content, flags=re.MULTILINE)
+            content = re.sub(r'^(\d+)\. (.*?)$', r'<li>\2</li>', content, flags=re.MULTILINE)
+
+            # 연속된 <li> 태그를 <ul>로 감싸기
+            content = re.sub(r'(<li>.*?</li>\s*)+', lambda m: f'<ul>{m.group(0)}</ul>', content, flags=re.DOTALL)
+
+            # 수평선 처리
+            content = re.sub(r'^---+$', r'<hr>', content, flags=re.MULTILINE)
+            content = re.sub(r'^\*\*\*+$', r'<hr>', content, flags=re.MULTILINE)
+
+            # 블록 인용 처리
+            content = re.sub(r'^> (.*?)$', r'<blockquote>\1</blockquote>', content, flags=re.MULTILINE)
+
+            # 단락 처리 (빈 줄로 구분된 텍스트를 <p> 태그로)
+            paragraphs = content.split('\n\n')
+            html_paragraphs = []
+
+            for para in paragraphs:
+                para = para.strip()
+                if para and not para.startswith('<') and '__LINK_PLACEHOLDER_' not in para:
+                    para = f'<p>{para}</p>'
+                html_paragraphs.append(para)
+
+            content = '\n\n'.join(html_paragraphs)
+
+            # 줄바꿈 처리 - <br> 태그 남용 방지
+            # 링크 버튼 내부의 <br>은 보호하되, 일반 텍스트의 줄바꿈은 공백으로 처리
+            content = re.sub(r'(?<!>)\n(?!<)', ' ', content)
+            
+            # 과도한 공백 정리
+            content = re.sub(r'\s+', ' ', content)
+            content = re.sub(r'>\s+<', '><', content)  # 태그 사이 불필요한 공백 제거
+
+            # 보호한 링크 부분 복원
+            for i, link in enumerate(link_patterns):
+                content = content.replace(f"__LINK_PLACEHOLDER_{i}__", link)
+
+            return content
+
+        except Exception as e:
+            self.log(f"마크다운 변환 중 오류: {e}")
+            return content
+
+    def validate_ai_output(self, content, keyword):
+        """
+        AI 출력 검증 - 프롬프트의 '중요 주의사항' 규칙들을 자동으로 검사하고 수정
+        프롬프트 파일에 적힌 주의사항들을 Python 로직으로 처리
+        """
+        try:
+            import re
+            
+            issues_found = []
+            fixes_applied = []
+            
+            # 규칙 1: 플레이스홀더 텍스트 검증
+            placeholder_patterns = [
+                (r'<p>본문\d+-?\d?\s*\d+자</p>', '실제 본문 내용이 없고 플레이스홀더만 있음'),
+                (r'<h[2-4]><strong>소제목\d+</strong></h[2-4]>', '소제목이 구체적이지 않고 플레이스홀더만 있음'),
+                (r'\[실제 유용한 URL\]', '[실제 유용한 URL] 플레이스홀더가 그대로 남아있음'),
+                (r'\[구체적인 앵커 텍스트\]', '[구체적인 앵커 텍스트] 플레이스홀더가 그대로 남아있음'),
+                (r'href="\s*url\s*입력\s*"', 'href="url 입력" 플레이스홀더가 그대로 남아있음'),
+                (r'href="\s*\[.*?\]\s*"', 'href에 대괄호 플레이스홀더가 남아있음'),
+                (r'>\s*앵커\s*텍스트\s*<', '"앵커 텍스트" 플레이스홀더가 그대로 남아있음'),
+                (r'\[\{keyword\}.*?\]', '[{keyword}...] 형태의 플레이스홀더가 남아있음'),
+                (r'\[.*?대상\s*\d+.*?\]', '[대상 1], [대상 2] 같은 플레이스홀더가 남아있음'),
+                (r'\[.*?항목\s*\d+.*?\]', '[항목 1], [비교 항목] 같은 플레이스홀더가 남아있음'),
+                (r'\[.*?표\s*주제.*?\]', '[표 주제] 플레이스홀더가 남아있음'),
+                (r'\[사용자의 실제 고민 질문\]', 'FAQ 질문이 구체적이지 않고 플레이스홀더만 있음'),
+                (r'\[상세한 답변 내용\]', 'FAQ 답변이 구체적이지 않고 플레이스홀더만 있음'),
+                (r'\[.*?\d+자.*?\]', '[300자], [200-300자] 같은 분량 플레이스홀더가 남아있음'),
+            ]
+            
+            for pattern, issue_msg in placeholder_patterns:
+                matches = re.findall(pattern, content, flags=re.IGNORECASE)
+                if matches:
+                    issues_found.append(f"❌ {issue_msg} (발견: {len(matches)}개)")
+                    self.log(f"⚠️ AI 출력 검증 실패: {issue_msg}")
+                    # 실제 내용으로 교체 시도
+                    if 'href="url 입력"' in content or 'href=" url 입력 "' in content:
+                        search_url = f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
+                        content = re.sub(r'href="\s*url\s*입력\s*"', f'href="{search_url}"', content, flags=re.IGNORECASE)
+                        fixes_applied.append("✅ 'href=\"url 입력\"'을 실제 검색 URL로 교체")
+            
+            # 규칙 2: 형식 지시자 검증 (출력에 포함되면 안 되는 것들)
+            format_indicators = [
+                r'【형식\d+】',
+                r'▼▼▼.*?▼▼▼',
+                r'출력\s*형식',
+                r'출력\s*예시',
+                r'절대\s*지켜야\s*할\s*규칙',
+                r'중요\s*주의사항',
+                r'\(아래\s*형식을.*?출력해\)',
+            ]
+            
+            for pattern in format_indicators:
+                if re.search(pattern, content, flags=re.IGNORECASE):
+                    issues_found.append(f"❌ 형식 지시자가 출력에 포함됨: {pattern}")
+                    self.log(f"⚠️ AI가 형식 지시자를 출력에 포함시킴: {pattern}")
+                    # 형식 지시자 제거
+                    content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+                    fixes_applied.append(f"✅ 형식 지시자 제거: {pattern}")
+            
+            # 규칙 3: HTML 속성 검증
+            html_attribute_issues = []
+            
+            # class 속성 없는 링크 검사 (blink, link1, link2, link3, custom-download-btn 중 하나는 있어야 함)
+            links_without_class = re.findall(r'<a\s+(?![^>]*class=)[^>]*href=[^>]*>', content, flags=re.IGNORECASE)
+            if links_without_class:
+                html_attribute_issues.append(f"❌ class 속성이 없는 <a> 태그 발견: {len(links_without_class)}개")
+            
+            # href 속성 없는 링크 검사
+            links_without_href = re.findall(r'<a\s+(?![^>]*href=)[^>]*class=[^>]*>', content, flags=re.IGNORECASE)
+            if links_without_href:
+                html_attribute_issues.append(f"❌ href 속성이 없는 <a> 태그 발견: {len(links_without_href)}개")
+            
+            # target 속성 없는 링크 검사
+            links_without_target = re.findall(r'<a\s+(?![^>]*target=)[^>]*href=[^>]*>', content, flags=re.IGNORECASE)
+            if links_without_target and len(links_without_target) > 0:
+                # target 속성 추가
+                content = re.sub(r'(<a\s+[^>]*)(href=[^>]*)>', r'\1\2 target="_self">', content, flags=re.IGNORECASE)
+                fixes_applied.append(f"✅ {len(links_without_target)}개 링크에 target=\"_self\" 속성 추가")
+            
+            # 따옴표 없는 class 속성 검사 (class=blink 같은 경우)
+            class_without_quotes = re.findall(r'class=(?!")([^\s>]+)', content, flags=re.IGNORECASE)
+            if class_without_quotes:
+                html_attribute_issues.append(f"❌ 따옴표 없는 class 속성 발견: {class_without_quotes}")
+                # 따옴표 추가
+                content = re.sub(r'class=(?!")([^\s>]+)', r'class="\1"', content, flags=re.IGNORECASE)
+                fixes_applied.append(f"✅ class 속성에 따옴표 추가")
+            
+            issues_found.extend(html_attribute_issues)
+            
+            # 규칙 4: link1, link2, link3 숫자 검증
+            link_classes = re.findall(r'class="(link\d?)"', content, flags=re.IGNORECASE)
+            if 'link"' in str(link_classes) or '"link"' in content:
+                issues_found.append("❌ class=\"link\"에서 숫자가 빠짐 (link1, link2, link3 중 하나여야 함)")
+                self.log("⚠️ class=\"link\"는 숫자가 필요함")
+            
+            # 검증 결과 로깅
+            if issues_found:
+                self.log(f"⚠️ AI 출력 검증: {len(issues_found)}개 문제 발견")
+                for issue in issues_found:
+                    self.log(f"  {issue}")
+            
+            if fixes_applied:
+                self.log(f"✅ AI 출력 자동 수정: {len(fixes_applied)}개 수정 적용")
+                for fix in fixes_applied:
+                    self.log(f"  {fix}")
+            
+            if not issues_found and not fixes_applied:
+                self.log("✅ AI 출력 검증 통과: 문제 없음")
+            
+            return content
+            
+        except Exception as e:
+            self.log(f"AI 출력 검증 중 오류: {e}")
+            import traceback
+            self.log(f"상세 오류:\n{traceback.format_exc()}")
+            return content
+
+    def enforce_html_structure(self, content, step_number, keyword):
+        """각 단계별로 정확한 HTML 구조를 강제 적용 - 마크다운 완전 제거"""
+        try:
+            import re
+            lines = content.strip().split('\n')
+            structured_content = []
+            
+            # 모든 마크다운 기호 완전 제거 함수
+            def clean_markdown(text):
+                # HTML 태그 제거
+                text = re.sub(r'<[^>]+>', '', text)
+                # 마크다운 헤더 기호 제거 (# ## ### 등)
+                text = re.sub(r'#+\s*', '', text)
+                # 마크다운 강조 기호 제거 (** __ * _ 등)
+                text = re.sub(r'\*+', '', text)
+                text = re.sub(r'_+', '', text)
+                # 마크다운 리스트 기호 제거 (- * + 1. 등)
+                text = re.sub(r'^[\-\*\+]\s*', '', text, flags=re.MULTILINE)
+                text = re.sub(r'^\d+\.\s*', '', text, flags=re.MULTILINE)
+                # 마크다운 코드 블록 제거
+                text = re.sub(r'```[a-z]*\n?', '', text, flags=re.IGNORECASE)
+                text = re.sub(r'```', '', text)
+                # 인라인 코드 제거
+                text = re.sub(r'`([^`]*)`', r'\1', text)
+                # 링크 제거 [text](url)
+                text = re.sub(r'\[([^\]]*)\]\([^\)]*\)', r'\1', text)
+                # 기타 특수문자 정리
+                text = re.sub(r'[\[\](){}]', '', text)
+                return text.strip()
+            
+            if step_number == 1:  # 1단계: 서론 + 소제목1 + 본문1
+                intro_text = ""
+                subtitle1_text = ""
+                content1_text = ""
+                
+                # AI 응답에서 텍스트 추출하고 마크다운 제거
+                all_text = ' '.join([clean_markdown(line) for line in lines if line.strip()])
+                
+                # 텍스트를 적절히 분할
+                words = all_text.split()
+                if len(words) > 50:
+                    intro_text = ' '.join(words[:50])  # 처음 50단어를 서론으로
+                    subtitle1_text = f"{keyword} 기본 활용법"
+                    content1_text = ' '.join(words[50:])  # 나머지를 본문으로
+                else:
+                    intro_text = all_text
+                    subtitle1_text = f"{keyword} 기본 활용법"
+                    content1_text = f"{keyword}의 기본적인 활용 방법에 대해 자세히 설명드리겠습니다. 다양한 측면에서 접근하여 실용적인 정보를 제공하고자 합니다. 기본 개념부터 시작하여 실무에 적용할 수 있는 구체적인 방법까지 포괄적으로 다루어보겠습니다. 이를 통해 효과적인 활용이 가능하도록 도움을 드리겠습니다. 단계적으로 접근하면 누구나 쉽게 이해하고 활용할 수 있을 것입니다. 기초부터 차근차근 알아보는 것이 중요합니다."
+                
+                # 기본값 설정 - approval.txt 지침에 따라 정확한 분량으로
+                if not intro_text or len(intro_text) < 270:
+                    intro_text = f"{keyword}는 현대 사회에서 점점 더 중요해지고 있는 핵심 개념입니다. 이와 관련하여 기본적인 활용법부터 시작해서 주요 특징들을 체계적으로 파악하고, 실무에서 바로 적용할 수 있는 실용적인 팁까지 포괄적으로 다뤄보겠습니다. 각 단계별로 구체적인 사례와 함께 설명하여 초보자부터 전문가까지 모두에게 도움이 되는 내용으로 구성하였습니다."
+                
+                if len(content1_text) < 700:
+                    content1_text = f"{keyword}의 기본적인 활용 방법에 대해 체계적으로 설명드리겠습니다. 먼저 가장 중요한 것은 기초 개념을 정확히 이해하는 것입니다. 이는 모든 응용과 심화 학습의 토대가 되기 때문입니다. 다음으로는 단계별 접근 방법을 통해 실제 적용 과정을 익혀야 합니다. 초기 설정부터 시작해서 기본 기능들을 하나씩 숙지해 나가는 것이 효과적입니다. 특히 실무에서 자주 사용되는 핵심 기능들을 우선적으로 학습하는 것이 중요합니다. 또한 올바른 사용 방법과 주의사항을 함께 익혀두면 향후 문제 상황을 예방할 수 있습니다. 기본기가 탄탄해야 나중에 고급 기능들도 쉽게 익힐 수 있으므로 충분한 연습을 통해 기초를 다져두시기 바랍니다. 실제 업무나 프로젝트에 적용할 때는 작은 부분부터 시작해서 점진적으로 확대해 나가는 방식을 권장드립니다."
+                
+                # 순수 HTML 구조 생성
+                structured_content.append(f"<p>{intro_text}</p>")
+                structured_content.append(f"<h2><strong>{subtitle1_text}</strong></h2>")
+                structured_content.append(f"<p>{content1_text}</p>")
+            
+            elif step_number == 2:  # 2단계: 소제목2 + 본문2
+                subtitle2_text = ""
+                content2_text = ""
+                
+                # AI 응답에서 텍스트 추출하고 마크다운 제거
+                all_text = ' '.join([clean_markdown(line) for line in lines if line.strip()])
+                
+                # 첫 번째 문장을 소제목으로, 나머지를 본문으로
+                sentences = all_text.split('.')[:2] if '.' in all_text else [all_text]
+                if sentences[0]:
+                    subtitle2_text = sentences[0][:25] + "의 주요 특징"
+                    content2_text = all_text
+                
+                # 기본값 설정 - approval2.txt 지침에 따라 700자 이상
+                if not subtitle2_text:
+                    subtitle2_text = f"{keyword} 주요 특징"
+                
+                if not content2_text or len(content2_text) < 700:
+                    content2_text = f"{keyword}의 주요 특징과 핵심적인 요소들을 상세히 살펴보겠습니다. 가장 두드러진 특징은 사용자 친화적인 접근성과 높은 효율성을 동시에 제공한다는 점입니다. 이러한 특성 덕분에 초보자도 쉽게 시작할 수 있으면서도 전문가들에게는 강력한 기능을 제공합니다. 또한 확장성이 뛰어나서 작은 규모부터 대규모 프로젝트까지 유연하게 대응할 수 있습니다. 특히 주목할 만한 점은 지속적인 업데이트와 개선을 통해 최신 트렌드를 반영한다는 것입니다. 보안 측면에서도 강화된 기능들을 제공하여 안전한 사용 환경을 보장합니다. 성능 면에서는 최적화된 알고리즘과 효율적인 리소스 관리를 통해 빠른 처리 속도를 실현하고 있습니다. 사용자 인터페이스는 직관적으로 설계되어 학습 곡선을 최소화하면서도 전문적인 작업이 가능하도록 구성되어 있습니다."
+                
+                # 순수 HTML 구조 생성
+                structured_content.append(f"<h2><strong>{subtitle2_text}</strong></h2>")
+                structured_content.append(f"<p>{content2_text}</p>")
+            
+            elif step_number == 3:  # 3단계: 소제목3 + 본문3 + 표
+                subtitle3_text = ""
+                content3_text = ""
+                
+                # AI 응답에서 텍스트 추출하고 마크다운 제거
+                all_text = ' '.join([clean_markdown(line) for line in lines if line.strip()])
+                
+                # 첫 번째 문장을 소제목으로, 나머지를 본문으로
+                sentences = all_text.split('.')[:2] if '.' in all_text else [all_text]
+                if sentences[0]:
+                    subtitle3_text = sentences[0][:25] + " 실무 팁"
+                    content3_text = all_text
+                
+                # 기본값 설정 - approval3.txt 지침에 따라 700자 이상
+                if not subtitle3_text:
+                    subtitle3_text = f"{keyword} 실무 팁"
+                
+                if not content3_text or len(content3_text) < 700:
+                    content3_text = f"{keyword}의 실무 활용 팁과 고급 테크닉을 소개해드리겠습니다. 실제 업무 환경에서 효율성을 극대화하기 위한 핵심적인 방법들을 중심으로 설명하겠습니다. 먼저 작업 흐름을 최적화하는 방법부터 살펴보겠습니다. 반복적인 작업을 자동화하고 단축키나 템플릿을 활용하면 시간을 크게 절약할 수 있습니다. 또한 협업 환경에서의 효과적인 활용 방안도 중요한 고려사항입니다. 팀원들과의 원활한 소통과 작업 공유를 위한 도구와 방법론을 익혀두면 프로젝트 진행이 훨씬 수월해집니다. 문제 해결 능력을 기르기 위해서는 일반적인 오류 상황과 대처 방안을 미리 숙지해두는 것이 좋습니다. 정기적인 백업과 버전 관리를 통해 작업 손실을 방지하고 이전 상태로 복구할 수 있는 시스템을 구축하는 것도 필수입니다."
+                
+                # 순수 HTML 구조 생성
+                structured_content.append(f"<h2><strong>{subtitle3_text}</strong></h2>")
+                structured_content.append(f"<p>{content3_text}</p>")
+                
+                # 표 추가
+                table_html = f"""<table border="1">
+<tr>
+<th>구분</th>
+<th>내용</th>
+<th>특징</th>
+</tr>
+<tr>
+<td>기본 활용</td>
+<td>{keyword} 기초 사용법</td>
+<td>누구나 쉽게 접근 가능</td>
+</tr>
+<tr>
+<td>고급 활용</td>
+<td>{keyword} 심화 기능</td>
+<td>전문적 활용 방법</td>
+</tr>
+<tr>
+<td>실무 적용</td>
+<td>{keyword} 현장 활용</td>
+<td>실제 업무 효율성 증대</td>
+</tr>
+</table>"""
+                structured_content.append(table_html)
+            
+            return '\n\n'.join(structured_content)
+            
+        except Exception as e:
+            self.log(f"HTML 구조 강제 적용 오류: {e}")
+            return content
+
+    def generate_approval_fallback_title(self, keyword):
+        """승인용 형식에 맞는 fallback 제목 생성"""
+        try:
+            # approval1.txt 형식에 맞는 제목 생성 요청
+            prompt = f"""키워드 '{keyword}'를 사용하여 승인용 제목을 생성해줘.
+
+형식: [메인 키워드]: [소제목1 키워드], [소제목2 키워드], [소제목3 키워드]
+예시: "gpt chat 무료 한국어: 활용법, 글쓰기 지원, 창의적 작업"
+
+요구사항:
+- 메인 키워드 '{keyword}' 필수 포함
+- 콜론(:) 뒤에 3개의 소제목 키워드를 콤마(,)로 구분
+- 30자 내외
+- HTML 태그 사용 금지, 순수 텍스트만
+
+제목만 출력해줘."""
+
+            response_text = self.call_ai_api(prompt, "승인용 fallback 제목 생성", max_tokens=100, route="approval_title")
+            if response_text and response_text.strip():
+                title = response_text.strip()
+                # HTML 태그 제거
+                import re
+                title = re.sub(r'<[^>]+>', '', title)
+                # 승인용 형식 검증 (콜론과 콤마 포함)
+                if ':' in title and ',' in title:
+                    self.log(f"✅ 승인용 fallback 제목 생성 성공: {title}")
+                    return title
+                    
+            self.log("⚠️ 승인용 fallback 제목 생성 실패")
+            return None
+            
+        except Exception as e:
+            self.log(f"승인용 fallback 제목 생성 중 오류: {e}")
+            return None
+
+    def generate_simple_content(self, keyword, content_type="revenue"):
+        """간단한 콘텐츠 생성 - 수익용/승인용 선택 가능"""
+        try:
+            # 콘텐츠 생성 시작 - 포스팅 상태 활성화
+            self.is_posting = True
+
+            # 사용 가능한 AI 모델 확인
+            if not self.api_status.get('gemini', False) and not self.api_status.get('openai', False):
+                self.log("🔥 사용 가능한 AI 모델이 없습니다.")
+                self.is_posting = False
+                return None, None, None
+
+            self.log(f"👍 콘텐츠 타입: {content_type} (AI 제공자 자동 선택)")
+
+            # 콘텐츠 타입에 따른 생성 방식 선택
+            if content_type == "approval":
+                # 승인용 콘텐츠 생성
+                return self.generate_approval_content(keyword)
+            else:
+                # 수익용 콘텐츠 생성 (기본값)
+                return self.generate_revenue_content(keyword)
+
+        except Exception as e:
+            self.log(f"🔥 콘텐츠 생성 중 오류: {e}")
+            self.is_posting = False
+            return None, None, None
+
+    def generate_revenue_content(self, keyword):
+        """수익용 콘텐츠 생성 - 단순화된 버전"""
+        self.log("🔄 수익용 콘텐츠 생성을 시작합니다")
+        
+        # 현재 키워드를 인스턴스 변수로 저장 (URL 복구에서 사용)
+        self.current_keyword = keyword
+        
+        try:
+            all_content_parts = []
+            title = ""
+
+            # 이전 실행에서 완료된 단계 (중단 후 재시작 시 첫 미완료 단계부터 진행)
+            checkpoint = self.load_step_checkpoint(keyword, "revenue")
+
+            # 5단계 순차 실행
+            for step_num in range(1, 6):
+                # self.log(f"수익용 {step_num}단계 진행 중")
+                
+                # 중지 체크
+                if not self.is_posting:
+                    self.log(f"⏹️ {step_num}단계 중지됨")
+                    return None, None, None
+
+                saved_step = checkpoint.get(str(step_num))
+                if saved_step:
+                    self.log(f"♻️ {step_num}단계 체크포인트 복원 (AI 호출 생략)")
+                    if step_num == 1:
+                        title = saved_step.get('title') or ""
+                    all_content_parts.append(saved_step['content'])
+                    continue
+                
+                # 시스템 프롬프트 생성 (prompt 파일 내용 포함)
+                system_content = self.get_revenue_system_prompt(step_num, keyword)
+                
+                # 사용자 프롬프트 - 1단계는 제목도 함께 요청
+                if step_num == 1:
+                    user_prompt = f"""다음 두 가지를 작성해주세요:
+
+1. 제목: '{keyword} | 숫자가 포함된 후킹문구' 형식 (50-60자)
+   예시: "건강검진 예약 | 3분만에 끝내는 간편 신청법"
+
+2. 위에서 제공한 HTML 템플릿에 {keyword}에 맞는 내용을 채워서 완성
+
+첫 번째 줄에 제목만 단독으로 출력하고, 그 다음에 HTML 콘텐츠를 출력해주세요."""
+                else:
+                    user_prompt = f"{keyword}에 대한 콘텐츠를 작성해주세요."
+
+                # 고정 접두부 모드: 키워드별로 달라지는 부분은 항상 마지막에
+                if self.use_stable_prompt_prefix():
+                    user_prompt += f"\n\n키워드: {keyword}"
+                
+                # AI API 호출
+                self.log(f"🤖 {step_num}단계 AI API 호출")
+                response_text = self.call_ai_api(
+                    user_prompt, f"수익용 {step_num}단계", 
+                    max_tokens=1500, 
+                    temperature=0.7, 
+                    system_content=system_content,
+                    route=f"revenue_{step_num}"
+                )
+                
+                if not response_text:
+                    self.log(f"❌ {step_num}단계 AI 응답 실패")
+                    return None, None, None
+                
+                # AI 출력 검증 및 자동 수정 (프롬프트 '중요 주의사항' 규칙 적용)
+                response_text = self.validate_ai_output(response_text, keyword)
+                
+                # 모든 단계에서 마크다운 코드 블록 언어 표시 제거
+                import re
+                response_text = re.sub(r'`html\s*\n?', '', response_text, flags=re.IGNORECASE)
+                response_text = re.sub(r'`javascript\s*\n?', '', response_text, flags=re.IGNORECASE)
+                response_text = re.sub(r'`css\s*\n?', '', response_text, flags=re.IGNORECASE)
+                response_text = re.sub(r'`json\s*\n?', '', response_text, flags=re.IGNORECASE)
+                response_text = re.sub(r'`python\s*\n?', '', response_text, flags=re.IGNORECASE)
+                response_text = re.sub(r'`[a-z]+\s*\n?', '', response_text)  # 기타 언어명
+                response_text = re.sub(r'```[a-z]*\n?', '', response_text)  # ```html 등
+                response_text = re.sub(r'```\n?', '', response_text)  # ``` 끝
+                
+                # 1단계는 정리 함수 사용하지 않음 (HTML 구조 보존 위해)
+                if step_num == 1:
+                    step_content = response_text.strip()
+                else:
+                    # 2-5단계도 HTML 구조 보존 - AI 역할 언급만 제거
+                    step_content = response_text.strip()
+                    
+                    # AI 역할 언급 제거
+                    ai_mentions = [
+                        r'SEO\s*전문가로서',
+                        r'콘텐츠\s*작가로서',
+                        r'전문\s*작가로서',
+                        r'\d+년\s*경력의?\s*.*?작가로서',
+                        r'인공지능.*?',
+                        r'AI.*?로서'
+                    ]
+                    for mention in ai_mentions:
+                        step_content = re.sub(mention, '', step_content, flags=re.IGNORECASE)
+                    
+                    # 마크다운 문법 제거 (HTML 구조는 보존)
+                    markdown_patterns = [
+                        r'#{1,6}\s+',         # ### 마크다운 헤더
+                        r'\*\*([^*]+)\*\*',   # **bold** → 내용만 남기고 제거
+                        r'\*([^*]+)\*',       # *italic* → 내용만 남기고 제거
+                        r'`([^`]+)`',         # `inline code` → 내용만 남기고 제거
+                    ]
+                    for pattern in markdown_patterns:
+                        if pattern in [r'\*\*([^*]+)\*\*', r'\*([^*]+)\*', r'`([^`]+)`']:
+                            step_content = re.sub(pattern, r'\1', step_content)
+                        else:
+                            step_content = re.sub(pattern, '', step_content)
+                
+                # 1단계에서 제목 추출 및 서론 정리
+                if step_num == 1:
+                    # 제목 추출 - 더 강력한 로직
+                    lines = step_content.split('\n')
+                    content_lines = []
+                    title_found = False
+                    
+                    for line in lines:
+                        line = line.strip()
+                        if not line:
+                            continue
+                            
+                        # HTML 태그 제거하여 제목 확인
+                        clean_line = line.replace('<h1>', '').replace('</h1>', '').replace('<title>', '').replace('</title>', '')
+                        clean_line = clean_line.strip()
+                        
+                        # 제목 조건: |가 포함되어 있고, HTML 태그로 시작하지 않으며, 적절한 길이
+                        if '|' in clean_line and not clean_line.startswith('<') and len(clean_line) > 15 and not title_found:
+                            title = clean_line
+                            title_found = True
+                            continue  # 제목 라인은 본문에서 제외
+                        
+                        # h1 태그로 된 제목도 제외 (중복 방지)
+                        if line.startswith('<h1>') and line.endswith('</h1>'):
+                            continue
+                            
+                        # 나머지는 본문(서론)으로 포함
+                        content_lines.append(line)
+                    
+                    # 제목이 추출되지 않으면 대체 제목 생성
+                    if not title:
+                        title = f"{keyword} | 5가지 핵심 정보 완벽 정리"
+                        self.log(f"⚠️ 제목 추출 실패, 대체 제목 사용: {title}")
+                    
+                    # 서론 부분만 step_content로 설정 (제목 제외)
+                    step_content = '\n'.join(content_lines)
+                    self.log(f"✅ 최종 제목: {title}")
+                
+                # 2-5단계는 추가 정리만 적용
+                else:
+                    # 마크다운 및 HTML 문서 구조 제거만 추가 적용
+                    pass
+                
+                all_content_parts.append(step_content)
+                self.save_step_checkpoint(keyword, "revenue", step_num, step_content, title if step_num == 1 else None)
+                
+            # 전체 내용 결합
+            full_content = "\n\n".join(all_content_parts)
+            
+            # 체크리스트 감지 및 리스트 코드 추가
+            full_content = self.add_checklist_if_needed(full_content, keyword)
+            
+            # 가짜 URL 교체
+            full_content = self.replace_fake_urls(full_content, keyword)
+            
+            # 콘텐츠 최종 정리 (발행 전)
+            full_content = self.clean_content_before_publish(full_content)
+            
+            # 썸네일 생성
+            thumbnail_path = self.create_thumbnail(title, keyword) if title else None
+            
+            self.log("✅ 수익용 콘텐츠 생성 완료")
+            return title, full_content, thumbnail_path
+            
+        except Exception as e:
+            self.log(f"❌ 수익용 콘텐츠 생성 중 오류: {e}")
+            return None, None, None
+
+    def replace_fake_urls(self, content, keyword):
+        """AI가 생성한 모든 URL을 신뢰할 수 있는 URL로 교체"""
+        try:
+            import re
+            
+            # setting.json에서 신뢰할 수 있는 URL 리스트 로드
+            trusted_urls = self.load_trusted_urls()
+            
+            # 1. 가짜 링크 텍스트를 실제 텍스트로 교체
+            link_text_patterns = [
+                (r'링크\s*텍스트', f'{keyword} 더 알아보기'),
+                (r'앵커\s*텍스트', f'{keyword} 바로가기'),
+                (r'링크\s*버튼', f'{keyword} 정보'),
+                (r'url\s*입력', f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"),
+                (r'링크\s*주소', f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"),
+                (r'여기에\s*링크', f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"),
+            ]
+            
+            for pattern, replacement in link_text_patterns:
+                content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
+            
+            # 2. href URL 교체 (HTML 구조 유지)
+            href_pattern = r'href="(https?://[^"]*)"'
+            replacement_count = 0
+            
+            def replace_url(match):
+                nonlocal replacement_count
+                original_url = match.group(1)
+                # 이미 신뢰할 수 있는 URL인지 확인
+                if self.is_trusted_url(original_url, trusted_urls):
+                    return match.group(0)  # 원본 그대로 반환
+                    
+                # 콘텐츠 맥락과 키워드를 분석하여 적절한 URL 선택
+                replacement_url = self.select_contextual_url(original_url, keyword, content, trusted_urls)
+                replacement_count += 1
+                self.log(f"🔗 URL 교체 ({replacement_count}): {original_url} → {replacement_url}")
+                return f'href="{replacement_url}"'
+            
+            content = re.sub(href_pattern, replace_url, content)
+            
+            # 3. 외부링크가 부족한 경우 추가
+            existing_links = len(re.findall(r'<a\s+[^>]*href=', content, re.IGNORECASE))
+            if existing_links < 2:
+                # 본문 끝부분에 외부링크 추가
+                additional_link_text = f"{keyword} 더 알아보기"
+                additional_link_url = self.select_contextual_url("", keyword, content, trusted_urls)
+                additional_link = f'<p><a href="{additional_link_url}" target="_self">{additional_link_text}</a></p>'
+                
+                content = content.rstrip() + "\n\n" + additional_link
+                self.log(f"🔗 외부링크 추가: {additional_link_text} → {additional_link_url}")
+                replacement_count += 1
+            
+            if replacement_count > 0:
+                self.log(f"✅ 총 {replacement_count}개의 URL이 신뢰할 수 있는 URL로 교체/추가되었습니다.")
+            else:
+                self.log("ℹ️ 교체할 URL이 없거나 모든 URL이 이미 신뢰할 수 있는 URL입니다.")
+            
+            return content
+            
+        except Exception as e:
+            self.log(f"URL 교체 중 오류: {e}")
+            return content
+    
+    def clean_content_before_publish(self, content):
+        """발행 전 콘텐츠 정리 (AI 작성을 방해하지 않는 최소한의 수정만)"""
+        try:
+            import re
+            from urllib.parse import quote
+            
+            # 0. 다운로드 버튼 HTML을 보호 및 복구 (먼저 추출)
+            download_button_pattern = r'<div class="button-container">.*?</div>'
+            download_buttons = re.findall(download_button_pattern, content, flags=re.IGNORECASE | re.DOTALL)
+            
+            # 다운로드 버튼 URL 복구 및 속성 수정
+            fixed_buttons = []
+            for button in download_buttons:
+                fixed_button = button
+                
+                # 1. href 속성 복구 - 공백으로 잘린 URL 수정
+                # href="https://...?q=키워드 일부" 나머지..." → href="https://...?q=전체키워드..."
+                href_matches = re.findall(r'href="([^"]*)"([^<>]*?)<img', fixed_button, re.DOTALL)
+                for href_url, text_after in href_matches:
+                    # href 뒤에 잘린 텍스트가 있는지 확인
+                    if text_after.strip() and not text_after.strip().startswith('class='):
+                        # 잘린 부분 추출
+                        cut_text = text_after.split('class=')[0].strip()
+                        # URL에 추가 (URL 인코딩)
+                        if '?' in href_url:
+                            # 쿼리 파라미터가 있는 경우
+                            fixed_url = href_url.rstrip('"') + quote(cut_text)
+                        else:
+                            fixed_url = href_url + quote(cut_text)
+                        # 수정된 URL로 교체
+                        original = f'href="{href_url}"{text_after}<img'
+                        replacement = f'href="{fixed_url}" <img'
+                        fixed_button = fixed_button.replace(original, replacement)
+                
+                # 2. 깨진 class 속성 수정 - 중복 따옴표 제거
+                fixed_button = re.sub(r'class="([^"]+)""', r'class="\1"', fixed_button)
+                
+                # 3. 따옴표 없는 속성에 따옴표 추가
+                fixed_button = re.sub(r'class=([^\s">]+)(?=\s|>)', r'class="\1"', fixed_button)
+                fixed_button = re.sub(r'target=([^\s">]+)(?=\s|>)', r'target="\1"', fixed_button)
+                fixed_button = re.sub(r'src=([^\s">]+)(?=\s|>)', r'src="\1"', fixed_button)
+                fixed_button = re.sub(r'alt=([^\s">]+)(?=\s|>)', r'alt="\1"', fixed_button)
+                
+                fixed_buttons.append(fixed_button)
+                
+            if fixed_buttons:
+                self.log(f"✅ 다운로드 버튼 {len(fixed_buttons)}개 URL 및 속성 복구 완료")
+            
+            # 다운로드 버튼을 플레이스홀더로 교체 (수정된 버전으로)
+            for i, button in enumerate(download_buttons):
+                content = content.replace(button, f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", 1)
+            
+            # 1. 불완전한 style 속성 수정 (값이 비어있는 경우만)
+            # style="text-align:" → style="text-align:center;"
+            # style="color:" → style="color: #ee2323;"
+            style_fixed = False
+            if 'style="text-align:"' in content:
+                content = re.sub(r'style="text-align:\s*"', 'style="text-align:center;"', content)
+                style_fixed = True
+            if 'style="color:"' in content:
+                content = re.sub(r'style="color:\s*"', 'style="color: #ee2323;"', content)
+                style_fixed = True
+            if style_fixed:
+                self.log("✅ 불완전한 style 속성 수정")
+            
+            # 2. 불완전한 h태그 수정 (h2, h3, h4 모두 처리)
+            # <strong>...</strong></h2> → <h2><strong>...</strong></h2>
+            # <strong>...</strong></h3> → <h3><strong>...</strong></h3>
+            # <strong>...</strong></h4> → <h4><strong>...</strong></h4>
+            h_tag_fixed = False
+            for h_num in [2, 3, 4]:
+                h_pattern = rf'(?<!<h{h_num}>)(<strong>[^<]+</strong></h{h_num}>)'
+                h_matches = re.findall(h_pattern, content)
+                if h_matches:
+                    for match in h_matches:
+                        if not match.startswith(f'<h{h_num}>'):
+                            fixed = f'<h{h_num}>' + match
+                            content = content.replace(match, fixed)
+                            h_tag_fixed = True
+            if h_tag_fixed:
+                self.log("✅ 불완전한 h태그 수정 (h2, h3, h4)")
+            
+            # 3. 유니코드 큰따옴표와 백틱만 제거 (일반 큰따옴표는 HTML 속성에 필수이므로 보존)
+            # ❌ 제거: ", ", " (유니코드 큰따옴표), ` (백틱)
+            # ✅ 보존: " (일반 큰따옴표 - HTML 속성에 필수), ' (작은따옴표 - 텍스트에 사용 가능)
+            unicode_quotes_and_backticks = ['"', '"', '"', '`']  # 유니코드 큰따옴표 + 백틱만
+            quote_found = False
+            for bad_char in unicode_quotes_and_backticks:
+                if bad_char in content:
+                    content = content.replace(bad_char, '')
+                    quote_found = True
+            if quote_found:
+                self.log("✅ 유니코드 큰따옴표/백틱 제거 (일반 따옴표는 보존)")
+            
+            # 4. '클릭' 단어를 유의어로 대체 (제목 제외)
+            # HTML h1 태그 안의 내용은 보존 (제목은 '클릭' 사용 가능)
+            click_replaced = False
+            
+            # h1 태그 내용 추출 및 보호
+            h1_pattern = r'(<h1[^>]*>)(.*?)(</h1>)'
+            h1_matches = re.findall(h1_pattern, content, re.DOTALL | re.IGNORECASE)
+            h1_contents = []
+            
+            # h1 태그를 임시 플레이스홀더로 대체
+            for i, (opening, title_content, closing) in enumerate(h1_matches):
+                placeholder = f"___H1_PLACEHOLDER_{i}___"
+                h1_contents.append((opening, title_content, closing))
+                content = content.replace(opening + title_content + closing, placeholder, 1)
+            
+            # h1 태그 밖의 '클릭' 단어를 유의어로 대체
+            click_alternatives = ['선택', '확인', '눌러보기', '터치', '접속', '방문']
+            if '클릭' in content:
+                import random
+                # 다양한 '클릭' 패턴 대체
+                content = re.sub(r'클릭하세요', lambda m: random.choice(['선택하세요', '확인하세요', '눌러보세요']), content)
+                content = re.sub(r'클릭해서', lambda m: random.choice(['선택해서', '눌러서', '터치해서']), content)
+                content = re.sub(r'클릭하여', lambda m: random.choice(['선택하여', '눌러', '터치하여']), content)
+                content = re.sub(r'클릭하면', lambda m: random.choice(['선택하면', '누르면', '터치하면']), content)
+                content = re.sub(r'클릭', lambda m: random.choice(click_alternatives), content)
+                click_replaced = True
+            
+            # h1 태그 복원
+            for i, (opening, title_content, closing) in enumerate(h1_contents):
+                placeholder = f"___H1_PLACEHOLDER_{i}___"
+                content = content.replace(placeholder, opening + title_content + closing)
+            
+            if click_replaced:
+                self.log("✅ '클릭' 단어를 유의어로 대체 (제목 제외)")
+            
+            # 5. &amp; HTML 엔티티를 &로 변경
+            if '&amp;' in content:
+                content = content.replace('&amp;', '&')
+                self.log("✅ HTML 엔티티 정리")
+            
+            # 5-1. 외부링크 target 속성 검증 (무조건 target="_self" 사용)
+            # target="_blank" 또는 기타 값을 target="_self"로 수정
+            target_fixed = False
+            if 'target=' in content:
+                # target="_blank" → target="_self"
+                if 'target="_blank"' in content:
+                    content = content.replace('target="_blank"', 'target="_self"')
+                    target_fixed = True
+                # target=_blank (따옴표 없음) → target="_self"
+                if 'target=_blank' in content:
+                    content = re.sub(r'target=_blank(?=\s|>)', 'target="_self"', content)
+                    target_fixed = True
+                # target="_top", "_parent" 등도 모두 _self로 변경
+                content = re.sub(r'target="_(top|parent|blank)"', 'target="_self"', content)
+                target_fixed = True
+                
+            if target_fixed:
+                self.log("✅ 외부링크 target 속성을 target=\"_self\"로 통일")
+            
+            # 6. 다운로드 버튼 복원 (수정된 버전으로)
+            for i, fixed_button in enumerate(fixed_buttons):
+                content = content.replace(f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", fixed_button, 1)
+            
+            return content
+            
+        except Exception as e:
+            self.log(f"❌ 콘텐츠 정리 중 오류: {e}")
+            # 오류 발생 시에도 다운로드 버튼 복원 시도
+            try:
+                for i, fixed_button in enumerate(fixed_buttons):
+                    content = content.replace(f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", fixed_button, 1)
+            except:
+                for i, button in enumerate(download_buttons):
+                    content = content.replace(f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", button, 1)
+            return content
+    
+    def load_trusted_urls(self):
+        """코드 내장 신뢰할 수 있는 URL 리스트 (setting.json 불필요)"""
+        return {
+            '정부_공공기관': [
+                'https://www.hometax.go.kr',
+                'https://www.gov24.go.kr',
+                'https://www.safedriving.or.kr',
+            ],
+            '금융_관련': [
+                'https://www.fss.or.kr',
+                'https://www.cardgorilla.com',
+            ],
+            '부동산_관련': [
+                'https://www.lh.or.kr',
+                'https://land.naver.com',
+            ],
+            '자동차_관련': [
+                'https://www.encar.com',
+            ],
+            '통신_관련': [
+                'https://www.skt.com',
+                'https://www.kt.com',
+            ],
+            '교육_취업': [
+                'https://www.work.go.kr',
+            ],
+            '쇼핑_배송': [
+                'https://shopping.naver.com',
+            ],
+            'IT_기술': [
+                'https://www.microsoft.com/ko-kr',
+                'https://www.apple.com/kr',
+            ],
+            '생활_건강': [
+                'https://www.nhis.or.kr',
+            ]
+        }
+    
+    def is_trusted_url(self, url, trusted_urls):
+        """URL이 신뢰할 수 있는 URL인지 확인"""
+        try:
+            # 다운로드 버튼 URL들은 항상 신뢰할 수 있는 URL로 처리
+            download_button_domains = [
+                'www.apple.com',
+                'play.google.com', 
+                'apps.microsoft.com',
+                'tools.applemediaservices.com',
+                'upload.wikimedia.org'
+            ]
+            
+            url_domain = url.split('/')[2] if '://' in url else url.split('/')[0]
+            
+            # 다운로드 버튼 관련 도메인은 교체하지 않음
+            if any(domain in url_domain for domain in download_button_domains):
+                return True
+            
+            # 기존 신뢰할 수 있는 URL 확인
+            for category, url_list in trusted_urls.items():
+                for trusted_url in url_list:
+                    # 도메인 기반으로 비교 (쿼리 파라미터 무시)
+                    trusted_domain = trusted_url.split('/')[2] if '://' in trusted_url else trusted_url
+                    url_domain = url.split('/')[2] if '://' in url else url
+                    if trusted_domain in url or url_domain == trusted_domain:
+                        return True
+            return False
+        except Exception:
+            return False
+    
+    def select_contextual_url(self, original_url, keyword, content, trusted_urls):
+        """콘텐츠 맥락을 분석하여 가장 적절한 신뢰할 수 있는 URL 선택 (정확도 대폭 개선)"""
+        try:
+            import random
+            keyword_lower = keyword.lower()
+            content_lower = content.lower()
+            
+            # 원본 URL 주변 텍스트 분석
+            import re
+            url_context = ""
+            if original_url:
+                url_pattern = re.escape(original_url)
+                match = re.search(f'.{{0,100}}{url_pattern}.{{0,100}}', content_lower)
+                if match:
+                    url_context = match.group()
+            
+            # 키워드만 집중 분석 (정확도 향상)
+            context_text = keyword_lower
+            
+            # 🚫 명확하게 매칭되지 않는 키워드 체크 (네이버 검색 사용)
+            generic_keywords = ['다운로드', '양식', '서식', '템플릿', '예제', '샘플', '기출문제', 'pdf', '문서', '파일']
+            
+            # 키워드가 일반적인 다운로드 관련이면 네이버 검색 사용
+            if any(generic in context_text for generic in generic_keywords):
+                # 단, 특정 기관/서비스명이 함께 있으면 예외
+                specific_terms = ['홈택스', '정부24', '은행', '카드', '아파트', '자동차', '핸드폰', 'skt', 'kt']
+                if not any(specific in context_text for specific in specific_terms):
+                    self.log(f"🔍 일반 키워드 감지 → 네이버 검색 사용: {keyword}")
+                    return f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
+            
+            # 🎯 정확한 키워드 매칭만 사용
+            # 정부/공공기관 관련 (매우 구체적인 키워드만)
+            if any(term in context_text for term in ['홈택스', '국세청', '세무서', '종합소득세', '부가가치세']):
+                self.log(f"🔍 카테고리 매칭: 정부_공공기관 (홈택스) → {keyword}")
+                return 'https://www.hometax.go.kr'
+            
+            elif any(term in context_text for term in ['정부24', '민원24', '정부민원']):
+                self.log(f"🔍 카테고리 매칭: 정부_공공기관 (정부24) → {keyword}")
+                return 'https://www.gov24.go.kr'
+            
+            elif any(term in context_text for term in ['운전면허', '면허증', '안전운전']):
+                self.log(f"🔍 카테고리 매칭: 정부_공공기관 (안전운전) → {keyword}")
+                return 'https://www.safedriving.or.kr'
+            
+            # 금융 관련 (구체적인 금융 서비스명만)
+            elif any(term in context_text for term in ['kb국민은행', '신한은행', '하나은행', '우리은행', '농협', 'nh은행']):
+                urls = trusted_urls.get('금융_관련', [])
+                if urls:
+                    selected = random.choice(urls)
+                    self.log(f"🔍 카테고리 매칭: 금융_관련 → {selected} ({keyword})")
+                    return selected
+            
+            elif '카드고릴라' in context_text or ('카드' in context_text and '비교' in context_text):
+                self.log(f"🔍 카테고리 매칭: 금융_관련 (카드고릴라) → {keyword}")
+                return 'https://www.cardgorilla.com'
+            
+            # 부동산 관련 (구체적인 부동산 키워드만)
+            elif any(term in context_text for term in ['lh청약', '청약플러스', '공공주택']):
+                self.log(f"🔍 카테고리 매칭: 부동산_관련 (LH) → {keyword}")
+                return 'https://www.lh.or.kr'
+            
+            elif any(term in context_text for term in ['네이버부동산', '네이버 부동산']):
+                self.log(f"🔍 카테고리 매칭: 부동산_관련 (네이버부동산) → {keyword}")
+                return 'https://land.naver.com'
+            
+            # 자동차 관련 (구체적인 자동차 서비스명만)
+            elif any(term in context_text for term in ['엔카', 'sk엔카', '중고차매매']):
+                self.log(f"🔍 카테고리 매칭: 자동차_관련 (엔카) → {keyword}")
+                return 'https://www.encar.com'
+            
+            # 통신 관련 (구체적인 통신사명만)
+            elif any(term in context_text for term in ['skt', 'sk텔레콤', '티월드']):
+                self.log(f"🔍 카테고리 매칭: 통신_관련 (SKT) → {keyword}")
+                return 'https://www.skt.com'
+            
+            elif any(term in context_text for term in ['kt', '올레']):
+                self.log(f"🔍 카테고리 매칭: 통신_관련 (KT) → {keyword}")
+                return 'https://www.kt.com'
+            
+            # 취업 관련 (구체적인 취업 서비스명만)
+            elif any(term in context_text for term in ['워크넷', '고용노동부', '구인구직']):
+                self.log(f"🔍 카테고리 매칭: 교육_취업 (워크넷) → {keyword}")
+                return 'https://www.work.go.kr'
+            
+            # IT/기술 관련 (구체적인 브랜드명만)
+            elif any(term in context_text for term in ['마이크로소프트', 'microsoft', 'ms오피스', '윈도우10', '윈도우11']):
+                self.log(f"🔍 카테고리 매칭: IT_기술 (Microsoft) → {keyword}")
+                return 'https://www.microsoft.com/ko-kr'
+            
+            elif any(term in context_text for term in ['애플', 'apple', '맥북', '아이맥', '아이패드프로']):
+                self.log(f"🔍 카테고리 매칭: IT_기술 (Apple) → {keyword}")
+                return 'https://www.apple.com/kr'
+            
+            # 건강보험 관련
+            elif any(term in context_text for term in ['건강보험공단', '국민건강보험', '건보공단']):
+                self.log(f"🔍 카테고리 매칭: 생활_건강 (건강보험공단) → {keyword}")
+                return 'https://www.nhis.or.kr'
+            
+            # 🎯 매칭 실패 시 기본값: 네이버 검색 (공식 홈페이지보다 안전)
+            else:
+                self.log(f"🔍 명확한 카테고리 매칭 실패 → 네이버 검색 사용: {keyword}")
+                return f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
+                
+        except Exception as e:
+            self.log(f"맥락 분석 중 오류: {e}")
+            return f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
+
+    def fix_broken_urls(self, content):
+        """잘린 URL 구조 복구 (URL 내용은 건드리지 않음)"""
+        try:
+            import re
+            
+            # 잘린 HTML 링크 구조 복구 패턴들
+            broken_patterns = [
+                # href가 시작되었지만 닫히지 않은 경우: href="https://... 텍스트
+                (r'href\s*=\s*["\']([^"\']*?https?://[^"\'>\s]*?)(\s+[^"\'<>]*?)(?=[<>\n])', 
+                 r'href="\1">\2</a>'),
+                
+                # <a 태그가 시작되었지만 닫히지 않은 경우
+                (r'<a\s+([^>]*?)>\s*([^<]*?)(?=\s*<(?!/?a))', 
+                 r'<a \1>\2</a>'),
+                
+                # href 속성에 따옴표가 없는 경우: href=https://...
+                (r'href\s*=\s*([^"\'\s>]+)', 
+                 r'href="\1"'),
+            ]
+            
+            fix_count = 0
+            
+            for pattern, replacement in broken_patterns:
+                matches = re.findall(pattern, content)
+                if matches:
+                    content = re.sub(pattern, replacement, content)
+                    fix_count += len(matches)
+                    self.log(f"� HTML 링크 구조 복구: {len(matches)}개")
+            
+            if fix_count > 0:
+                self.log(f"✅ 총 {fix_count}개의 링크 구조 복구 완료")
+            
+            return content
+            
+        except Exception as e:
+            self.log(f"링크 구조 복구 중 오류: {e}")
+            return content
+
+    def add_checklist_if_needed(self, content, keyword):
+        """체크리스트 키워드 감지 시 리스트 코드 추가"""
+        try:
+            # 체크리스트 관련 키워드들
+            checklist_keywords = [
+                '체크리스트', '체크 리스트', 'checklist', '확인 사항', '확인사항',
+                '점검 리스트', '점검리스트', '확인 목록', '확인목록', '점검 항목',
+                '필수 사항', '필수사항', '준비 사항', '준비사항', '체크 항목'
+            ]
+            
+            # 키워드나 본문에서 체크리스트 관련 키워드 확인
+            keyword_lower = keyword.lower()
+            content_lower = content.lower()
+            
+            has_checklist_keyword = any(check_word in keyword_lower for check_word in checklist_keywords)
+            has_checklist_content = any(check_word in content_lower for check_word in checklist_keywords)
+            
+            if has_checklist_keyword or has_checklist_content:
+                self.log(f"체크리스트 관련 내용 감지: 리스트 코드 추가")
+                
+                # 체크리스트 HTML 생성
+                checklist_html = f"""
+<h3><strong>{keyword} 체크리스트</strong></h3>
+<p>{keyword}과 관련된 중요한 체크사항들을 정리해보겠습니다. 아래 항목들을 차례대로 확인해보세요.</p>
+<ul>
+<li>기본 정보 확인하기</li>
+<li>필요한 준비사항 점검하기</li>
+<li>관련 문서 및 자료 준비하기</li>
+<li>일정 및 시간 계획 세우기</li>
+<li>최종 확인 및 검토하기</li>
+</ul>
+"""
+                
+                # 첫 번째 h2 태그 이후에 체크리스트 추가
+                h2_matches = list(re.finditer(r'<h2[^>]*>.*?</h2>', content, re.IGNORECASE | re.DOTALL))
+                
+                if h2_matches:
+                    first_h2_end = h2_matches[0].end()
+                    content = (content[:first_h2_end] + 
+                             f"\n\n{checklist_html}\n\n" + 
+                             content[first_h2_end:])
+                else:
+                    # h2 태그가 없으면 본문 앞부분에 추가
+                    first_p_match = re.search(r'</p>', content)
+                    if first_p_match:
+                        insert_position = first_p_match.end()
+                        content = (content[:insert_position] + 
+                                 f"\n\n{checklist_html}\n\n" + 
+                                 content[insert_position:])
+                
+                self.log("✅ 체크리스트를 본문에 성공적으로 추가했습니다.")
+            
+            return content
+            
+        except Exception as e:
+            self.log(f"체크리스트 추가 중 오류: {e}")
+            return content
+
+    def create_thumbnail(self, title, keyword):
+        """썸네일 이미지를 생성합니다."""
+        try:
+            from PIL import Image, ImageDraw, ImageFont  # 지연 로드
+
+            # images 폴더에서 사이트별 또는 무작위 배경 이미지 선택
+            images_dir = os.path.join(get_base_path(), "images")
+            background_path = None
+            
+            if os.path.exists(images_dir):
+                available_images = [os.path.join(images_dir, f) for f in os.listdir(images_dir) 
+                                 if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+                
+                # 현재 사이트의 썸네일 이미지 설정 확인
+                if self.current_site and self.current_site.get('thumbnail_image'):
+                    thumbnail_filename = self.current_site.get('thumbnail_image')
+                    specific_path = os.path.join(images_dir, thumbnail_filename)
+                    if os.path.exists(specific_path):
+                        background_path = specific_path
+                        self.log(f"🎯 사이트별 썸네일 이미지 사용: {thumbnail_filename}")
+                    else:
+                        self.log(f"⚠️ 사이트별 썸네일 이미지 파일이 없습니다: {thumbnail_filename}")
+                
+                # 사이트별 설정이 없거나 파일이 없으면 랜덤 선택
+                if not background_path and available_images:
+                    background_path = random.choice(available_images)
+                    self.log(f"🖼️ 기본 배경 이미지 사용: {os.path.basename(background_path)}")
+                
+                if background_path:
+                    background = Image.open(background_path)
+                    # 이미지를 300x300 정사각형으로 크롭 및 리사이즈
+                    background = background.resize((300, 300), Image.Resampling.LANCZOS)
+                else:
+                    background = Image.new('RGB', (300, 300), color=(41, 128, 185)) # 기본 배경
+            else:
+                background = Image.new('RGB', (300, 300), color=(41, 128, 185)) # 기본 배경
+
+            draw = ImageDraw.Draw(background)
+            
+            # 폰트 설정 - 본문과 동일한 timon.ttf 사용
+            try:
+                # fonts 폴더의 timon.ttf 폰트 사용 (본문과 동일)
+                font_path = os.path.join(get_base_path(), "fonts", "timon.ttf")
+                large_font = ImageFont.truetype(font_path, 24)  # | 앞 제목용 (32→24로 축소)
+                small_font = ImageFont.truetype(font_path, 18)  # | 뒤 제목용 (22→18로 축소)
+            except Exception as font_error:
+                print(f"timon.ttf 폰트 로드 실패: {font_error}")
+                try:
+                    # 대체 폰트들
+                    large_font = ImageFont.truetype("C:/Windows/Fonts/gulim.ttc", 22)
+                    small_font = ImageFont.truetype("C:/Windows/Fonts/gulim.ttc", 16)
+                except:
+                    try:
+                        large_font = ImageFont.truetype("C:/Windows/Fonts/malgun.ttf", 22)
+                        small_font = ImageFont.truetype("C:/Windows/Fonts/malgun.ttf", 16)
+                    except:
+                        large_font = ImageFont.load_default()
+                        small_font = ImageFont.load_default()
+
+            # 제목을 | 기준으로 분리
+            if '|' in title:
+                parts = title.split('|', 1)  # 최대 1번만 분리
+                main_title = parts[0].strip()    # | 앞부분 (첫 줄, 크게)
+                sub_title = parts[1].strip()     # | 뒷부분 (둘째 줄, 작게)
+            else:
+                main_title = title
+                sub_title = ""
+            
+            # 텍스트를 중앙에 배치하기 위한 계산
+            lines = []
+            
+            # 첫 번째 줄: main_title (큰 폰트)
+            if main_title:
+                # main_title이 너무 길면 자동 줄바꿈
+                words = main_title.split()
+                current_line = []
+                for word in words:
+                    test_line = ' '.join(current_line + [word])
+                    bbox = draw.textbbox((0, 0), test_line, font=large_font)
+                    if bbox[2] - bbox[0] > 250:  # 250px 이상이면 줄바꿈
+                        if current_line:
+                            lines.append((' '.join(current_line), large_font))
+                            current_line = [word]
+                        else:
+                            lines.append((word, large_font))
+                            current_line = []
+                    else:
+                        current_line.append(word)
+                
+                if current_line:
+                    lines.append((' '.join(current_line), large_font))
+            
+            # 두 번째 줄: sub_title (작은 폰트)
+            if sub_title:
+                # sub_title이 너무 길면 자동 줄바꿈
+                words = sub_title.split()
+                current_line = []
+                for word in words:
+                    test_line = ' '.join(current_line + [word])
+                    bbox = draw.textbbox((0, 0), test_line, font=small_font)
+                    if bbox[2] - bbox[0] > 260:  # 작은 폰트는 좀 더 길게 허용
+                        if current_line:
+                            lines.append((' '.join(current_line), small_font))
+                            current_line = [word]
+                        else:
+                            lines.append((word, small_font))
+                            current_line = []
+                    else:
+                        current_line.append(word)
+                
+                if current_line:
+                    lines.append((' '.join(current_line), small_font))
+                
+            # 텍스트 중앙 정렬
+            line_spacing = 35  # 줄 간격
+            total_height = len(lines) * line_spacing
+            y_start = (300 - total_height) // 2 + 10  # 중앙에서 약간 위로
+            
+            for i, (line_text, line_font) in enumerate(lines):
+                bbox = draw.textbbox((0, 0), line_text, font=line_font)
+                text_width = bbox[2] - bbox[0]
+                x = (300 - text_width) // 2
+                y = y_start + (i * line_spacing)
+                
+                # 그림자 효과 (가독성 향상)
+                draw.text((x + 2, y + 2), line_text, fill=(0, 0, 0, 180), font=line_font)
+                # 메인 텍스트 (흰색)
+                draw.text((x, y), line_text, fill=(255, 255, 255), font=line_font)
+            
+            # 최종 이미지를 WebP 형식으로 저장
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filepath = os.path.join(get_base_path(), "thumbnails", f"thumbnail_{timestamp}.webp")
+            background.save(filepath, 'WEBP', quality=85)
+            return filepath
+        except Exception as e:
+            self.log(f"썸네일 생성 오류: {e}")
+            return None
+
+    def post_to_wordpress(self, site_data, title, content, thumbnail_path=None, status='publish', keyword="", publish_at=None):
+        """워드프레스에 포스트를 게시합니다. (status='draft'면 임시글로 업로드)
+
+        publish_at(datetime)을 지정하면 예약 발행(status='future')으로 업로드되어
+        워드프레스가 해당 시각에 직접 발행합니다.
+        """
+        try:
+            site_name = site_data.get('name', 'Unknown')
+            site_url = site_data.get('url')
+            username = site_data.get('username')
+            password = site_data.get('password')
+            category = site_data.get('category_id', 1)
+
+            # 제목에서 불필요한 문자 최종 제거 (워드프레스 포스팅 직전)
+            title = title.replace('"', '').replace("'", '').replace('`', '')
+            title = title.replace('#', '').replace('*', '').replace('**', '')
+            title = re.sub(r'^[\s\-_=]+', '', title)
+            title = re.sub(r'[\s\-_=]+$', '', title)
+            title = title.strip()
+            self.log(f"📝 최종 정리된 제목: {title}")
+            
+            # 콘텐츠 최종 검증 1: 링크 class 속성 따옴표 추가
+            # class=link1 → class="link1", class=link2 → class="link2", class=link3 → class="link3"
+            content = re.sub(r'class=link1(?=\s|>)', 'class="link1"', content)
+            content = re.sub(r'class=link2(?=\s|>)', 'class="link2"', content)
+            content = re.sub(r'class=link3(?=\s|>)', 'class="link3"', content)
+            content = re.sub(r'class=blink(?=\s|>)', 'class="blink"', content)
+            self.log("✅ 본문 링크 class 속성 따옴표 복구 완료")
+            
+            # 콘텐츠 최종 검증 2: 다운로드 버튼 HTML 완전 복구 (AI 응답이 잘못되었을 경우 대비)
+            # 키워드 추출 (제목에서)
+            keyword_from_title = title.split('|')[0].strip() if '|' in title else title
+            
+            if 'button-container' in content:
+                self.log("🔧 다운로드 버튼 발견 - 완전 재구성 시작")
+                
+                # 기존 button-container를 완전히 제거하고 새로 생성
+                content = re.sub(r'<div\s+class="?button-container"?>.*?</div>', '__BUTTON_PLACEHOLDER__', content, flags=re.DOTALL | re.IGNORECASE)
+                
+                # 올바른 다운로드 버튼 HTML 생성 (prompt1.txt 형식 준수)
+                from urllib.parse import quote
+                keyword_encoded = quote(keyword_from_title)
+                
+                correct_button_html = f'''<div class="button-container">
+    <p>
+        <a href="https://www.apple.com/kr/search/{keyword_encoded}?src=globalnav" class="custom-download-btn appstore-button" target="_self">
+            <img src="https://developer.apple.com/assets/elements/icons/app-store/app-store-128x128_2x.png" class="btn-logo" alt="App Store">
+            <span>App Store에서 바로 다운로드</span>
+        </a>
+    </p>
+    <p>
+        <a href="https://play.google.com/store/search?q={keyword_encoded}&amp;c=apps" class="custom-download-btn playstore-button" target="_self">
+            <img src="https://upload.wikimedia.org/wikipedia/commons/7/78/Google_Play_Store_badge_EN.svg" class="btn-logo" alt="Google Play">
+            <span>Google Play에서 바로 다운로드</span>
+        </a>
+    </p>
+    <p>
+        <a href="https://apps.microsoft.com/search?query={keyword_encoded}&hl=ko-KR&gl=KR" class="custom-download-btn window-button" target="_self">
+            <img src="https://upload.wikimedia.org/wikipedia/commons/4/44/Microsoft_logo.svg" class="btn-logo" alt="Microsoft Store">
+            <span>Windows에서 바로 다운로드</span>
+        </a>
+    </p>
+    <p>
+        <a href="https://www.apple.com/kr/search/{keyword_encoded}?src=globalnav" class="custom-download-btn macbook-button" target="_self">
+            <img src="https://upload.wikimedia.org/wikipedia/commons/f/fa/Apple_logo_black.svg" class="btn-logo" alt="Mac App Store">
+            <span>MacBook에서 바로 다운로드</span>
+        </a>
+    </p>
+</div>'''
+                
+                # 플레이스홀더를 올바른 HTML로 교체
+                content = content.replace('__BUTTON_PLACEHOLDER__', correct_button_html)
+                self.log(f"✅ 다운로드 버튼 완전 재구성 완료 (키워드: {keyword_from_title})")
+
+            # WordPress REST API URL 구성
+            api_url = f"{site_url.rstrip('/')}/wp-json/wp/v2/posts"
+            
+            # 여러 인증 방법 시도
+            auth_success, headers = self.try_authentication_methods(site_name, site_url, username, password)
+            
+            if not auth_success:
+                # 비밀번호 힌트 생성
+                password_hint = password[:4] + "***" + password[-4:] if len(password) > 8 else password[:2] + "***"
+                
+                return {'success': False, 'error': 'Authentication failed'}
+
+            # 🔥 중요: 제목과 콘텐츠 검증 (empty_content 에러 방지)
+            if not title or not title.strip():
+                self.log(f"❌ {site_name}: 제목이 비어있습니다. 포스팅 중단")
+                return {'success': False, 'error': '제목이 비어있습니다'}
+            
+            if not content or not content.strip():
+                self.log(f"❌ {site_name}: 콘텐츠가 비어있습니다. 포스팅 중단")
+                return {'success': False, 'error': '콘텐츠가 비어있습니다'}
+            
+            # 제목과 콘텐츠 길이 검증 (최소 길이 확인)
+            if len(title.strip()) < 5:
+                self.log(f"❌ {site_name}: 제목이 너무 짧습니다 (최소 5자 필요): '{title}'")
+                return {'success': False, 'error': '제목이 너무 짧습니다'}
+            
+            if len(content.strip()) < 100:
+                self.log(f"❌ {site_name}: 콘텐츠가 너무 짧습니다 (최소 100자 필요): {len(content.strip())}자")
+                return {'success': False, 'error': '콘텐츠가 너무 짧습니다'}
+            
+            self.log(f"✅ 제목 검증 완료: '{title}' ({len(title)}자)")
+            self.log(f"✅ 콘텐츠 검증 완료: {len(content)}자")
+
+            post_data = {
+                'title': title,
+                'content': content,
+                'status': status,
+                'categories': [int(category)]
+            }
+
+            # 예약 발행 - 로컬 시각을 UTC로 변환해 date_gmt로 전달 (사이트 시간대와 무관)
+            if publish_at and status == 'publish':
+                from datetime import timezone
+                status = 'future'
+                post_data['status'] = status
+                post_data['date_gmt'] = publish_at.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+                self.log(f"⏰ 예약 발행: {publish_at.strftime('%Y-%m-%d %H:%M')}")
+
+            # 글 생성 POST는 멱등이 아니므로 중단하지 않음 - 시작 전에만 취소를 확인하고, 보낸 요청은 타임아웃(30초) 안에
+            # 끝까지 받아 키워드 사용 처리/중복 검사 인덱스 기록까지 마침 (버려진 요청이 글을 만들고 기록이 누락되는 것 방지)
+            self.cancel_token.raise_if_cancelled()
+            session = get_requests_session()
+            response = session.post(api_url, headers=headers, json=post_data, timeout=30)
+
+            if response.status_code == 201:
+                post_info = response.json()
+                post_id = post_info['id']
+                self.log(f"📤 포스트 업로드 성공 {site_name}")
+
+                # 썸네일 업로드
+                if thumbnail_path and os.path.exists(thumbnail_path):
+                    media_id = self.upload_featured_image(site_url, headers, thumbnail_path, post_id)
+                    if media_id:
+                        self.log(f"🖼️ 썸네일 업로드 완료 {site_name}")
+                    else:
+                        self.log(f"⚠️ {site_name}: 썸네일 업로드 실패 (포스트는 성공)")
+                
+                # HTML 콘텐츠를 output 폴더에 저장
+                try:
+                    from datetime import datetime
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    output_dir = os.path.join(get_base_path(), "output")
+                    os.makedirs(output_dir, exist_ok=True)
+                    
+                    # 사이트 이름에서 파일명에 사용할 수 없는 문자 제거
+                    safe_site_name = "".join(c for c in site_name if c.isalnum() or c in ('-', '_', '.')).rstrip()
+                    if not safe_site_name:
+                        safe_site_name = "site"
+                    
+                    # HTML 파일 저장
+                    html_filename = f"{safe_site_name}_{timestamp}_post_{post_id}.html"
+                    html_filepath = os.path.join(output_dir, html_filename)
+                    
+                    # 전체 HTML 구조로 저장 (제목 포함)
+                    full_html = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+</head>
+<body>
+    <h1>{title}</h1>
+    {content}
+</body>
+</html>"""
+                    
+                    with open(html_filepath, 'w', encoding='utf-8') as f:
+                        f.write(full_html)
+                    
+                except Exception as e:
+                    self.log(f"⚠️ HTML 저장 실패: {e}")
+
+                # 중복 검사 인덱스에 발행 글 기록
+                try:
+                    get_published_index().add(site_name, title, content, keyword=keyword,
+                                              post_id=post_id, url=post_info.get('link', ''))
+                except Exception as e:
+                    self.log(f"⚠️ 중복 검사 인덱스 기록 실패: {e}")
+                
+                return {'success': True, 'post_id': post_id, 'status': status,
+                        'publish_at': publish_at.isoformat() if publish_at else None}
+            else:
+                error_msg = f"HTTP {response.status_code}"
+                try:
+                    error_data = response.json()
+                    if 'message' in error_data:
+                        error_msg += f" - {error_data['message']}"
+                    if 'code' in error_data:
+                        error_msg += f" (코드: {error_data['code']})"
+                except:
+                    error_msg += f" - {response.text[:200]}"
+                
+                self.log(f"❌ {site_name}: 포스팅 실패: {error_msg}")
+                return {'success': False, 'error': error_msg}
+        except OperationCancelled as e:
+            self.log(f"⏹️ {site_name}: 워드프레스 업로드 중단 ({e})")
+            return {'success': False, 'error': '중지됨'}
+        except Exception as e:
+            self.log(f"❌ {site_name}: 워드프레스 포스팅 오류: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def try_authentication_methods(self, site_name, site_url, username, password):
+        """다양한 인증 방법을 시도합니다 (캐싱 포함)"""
+        session = get_requests_session()
+        user_url = f"{site_url.rstrip('/')}/wp-json/wp/v2/users/me"
+        
+        # 비밀번호 힌트 생성 (보안을 위해 일부만 표시)
+        password_hint = password[:4] + "***" + password[-4:] if len(password) > 8 else password[:2] + "***"
+        
+        # 캐시된 인증 방법이 있으면 먼저 시도
+        if site_url in self.auth_cache:
+            cached_headers, cached_method = self.auth_cache[site_url]
+            self.log(f"🔑 {site_name}: 캐시된 인증 방법 ({cached_method}) 사용")
+            if self.test_auth_method(session, user_url, cached_headers, site_name, f"{cached_method} (캐시)", username, password_hint):
+                self.log(f"✅ {site_name}: 캐시된 인증 성공!")
+                return True, cached_headers
+            else:
+                self.log(f"⚠️ {site_name}: 캐시된 인증 실패, 다른 방법 시도...")
+                del self.auth_cache[site_url]  # 캐시 삭제
+                get_auth_cache_store().forget(site_url)
+        else:
+            # 저장된 인증 방법 (auth_cache.json, 전체 사이트 점검 결과 포함)
+            stored_method = get_auth_cache_store().get_method(site_url)
+            credentials = build_auth_credentials(stored_method, username, password, site_url) if stored_method else None
+            if credentials:
+                stored_headers = self.create_auth_header(credentials[0], credentials[1], stored_method)
+                self.log(f"🔑 {site_name}: 저장된 인증 방법 ({stored_method}) 사용")
+                if self.test_auth_method(session, user_url, stored_headers, site_name, f"{stored_method} (저장됨)", credentials[0], password_hint):
+                    self.auth_cache[site_url] = (stored_headers, stored_method)
+                    return True, stored_headers
+                self.log(f"⚠️ {site_name}: 저장된 인증 실패, 다른 방법 시도...")
+                get_auth_cache_store().forget(site_url)
+        
+        # WordPress REST API 접근성 확인
+        self.check_rest_api_accessibility(site_name, site_url)
+        
+        # 방법 1: Application Password (공백 포함)
+        headers1 = self.create_auth_header(username, password, "Application Password with spaces")
+        if self.test_auth_method(session, user_url, headers1, site_name, "Application Password (공백포함)", username, password_hint):
+            self.remember_auth_method(site_url, headers1, "Application Password (공백포함)")
+            return True, headers1
+        
+        # 방법 2: Application Password (공백 제거)
+        password_no_spaces = password.replace(" ", "")
+        self.log(f"🔑 {site_name}: 방법 2 - Application Password (공백 제거) 시도")
+        self.log(f"🔧 {site_name}: 공백 제거된 비밀번호 길이: {len(password_no_spaces)}자")
+        headers2 = self.create_auth_header(username, password_no_spaces, "Application Password without spaces")
+        if self.test_auth_method(session, user_url, headers2, site_name, "Application Password (공백제거)", username, password_hint):
+            self.remember_auth_method(site_url, headers2, "Application Password (공백제거)")
+            return True, headers2
+        
+        # 방법 3: 기본 Basic Auth
+        self.log(f"🔑 {site_name}: 방법 3 - 기본 Basic Auth 시도")
+        headers3 = self.create_auth_header(username, password, "Basic Auth")
+        if self.test_auth_method(session, user_url, headers3, site_name, "Basic Auth", username, password_hint):
+            self.remember_auth_method(site_url, headers3, "Basic Auth")
+            return True, headers3
+        
+        # 방법 4: WordPress 기본 인증 (username@domain 형식)
+        if '@' not in username and site_url:
+            domain = site_url.replace('https://', '').replace('http://', '').split('/')[0]
+            username_with_domain = f"{username}@{domain}"
+            headers4 = self.create_auth_header(username_with_domain, password, "Domain Auth")
+            if self.test_auth_method(session, user_url, headers4, site_name, "도메인 포함 인증", username_with_domain, password_hint):
+                self.remember_auth_method(site_url, headers4, "도메인 포함 인증")
+                return True, headers4
+            
+            # 방법 5: 도메인 포함 + 공백 제거
+            self.log(f"🔑 {site_name}: 방법 5 - 도메인 포함 + 공백 제거 시도")
+            headers5 = self.create_auth_header(username_with_domain, password_no_spaces, "Domain Auth + No Spaces")
+            if self.test_auth_method(session, user_url, headers5, site_name, "도메인 포함 + 공백제거", username_with_domain, password_hint):
+                self.remember_auth_method(site_url, headers5, "도메인 포함 + 공백제거")
+                return True, headers5
+        
+        # 모든 인증 방법 실패 시 자세한 가이드 제공
+        self.provide_authentication_guide(site_name, site_url, username)
+        
+        return False, None
+
+    def remember_auth_method(self, site_url, headers, method_name):
+        """성공한 인증 방법을 메모리 캐시와 auth_cache.json에 저장"""
+        self.auth_cache[site_url] = (headers, method_name)
+        get_auth_cache_store().remember(site_url, method_name)
+
+    def check_rest_api_accessibility(self, site_name, site_url):
+        """WordPress REST API 접근성 확인"""
+        try:
+            # REST API 엔드포인트 확인
+            api_base_url = f"{site_url.rstrip('/')}/wp-json/wp/v2"
+            
+            session = get_requests_session()
+            response = session.get(api_base_url, timeout=30)  # 타임아웃 30초로 증가
+            
+            if response.status_code == 200:
+                return True
+            else:
+                return False
+                
+        except Exception as e:
+            return False
+
+    def provide_authentication_guide(self, site_name, site_url, username):
+        """인증 실패 시 상세한 가이드 제공"""
+        pass  # 로그 제거됨
+
+    def create_auth_header(self, username, password, method_name):
+        """인증 헤더 생성"""
+        import base64
+        credentials = f"{username}:{password}"
+        token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+        
+        return {
+            'Authorization': f'Basic {token}',
+            'Content-Type': 'application/json',
+            'User-Agent': 'Auto-WP/1.0'
+        }
+
+    def test_auth_method(self, session, user_url, headers, site_name, method_name, username="", password_hint=""):
+        """인증 방법 테스트 (재시도 포함)"""
+        max_retries = 2  # 최대 2번 재시도
+        
+        for attempt in range(max_retries):
+            try:
+                # 타임아웃 시간을 30초로 증가
+                response = self.cancel_token.call(session.get, user_url, headers=headers, timeout=30)
+                
+                if response.status_code == 200:
+                    user_info = response.json()
+                    user_name = user_info.get('name', 'Unknown')
+                    if attempt > 0:
+                        self.log(f"✅ {site_name}: {method_name} 인증 성공 ({attempt+1}번째 시도)")
+                    return True
+                else:
+                    # 인증 실패 시 사용자명과 비밀번호 힌트 표시
+                    if attempt == max_retries - 1:  # 마지막 시도에서만 로그 출력
+                        if username:
+                            self.log(f"❌ {site_name}: {method_name} 인증 실패 (HTTP {response.status_code}) - 사용자명: '{username}', 비밀번호: '{password_hint}'")
+                        else:
+                            self.log(f"❌ {site_name}: {method_name} 인증 실패 (HTTP {response.status_code})")
+                    return False
+
+            except OperationCancelled:
+                raise
+            except requests.exceptions.Timeout as e:
+                if attempt < max_retries - 1:
+                    self.log(f"⏳ {site_name}: {method_name} 타임아웃 발생, {attempt+2}번째 시도 중...")
+                    continue
+                else:
+                    if username:
+                        self.log(f"❌ {site_name}: {method_name} 타임아웃 (30초) - 사용자명: '{username}', 비밀번호: '{password_hint}'")
+                    else:
+                        self.log(f"❌ {site_name}: {method_name} 타임아웃 (30초)")
+                    return False
+                    
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    self.log(f"⚠️ {site_name}: {method_name} 오류 발생, {attempt+2}번째 시도 중... ({str(e)[:50]})")
+                    continue
+                else:
+                    if username:
+                        self.log(f"❌ {site_name}: {method_name} 인증 중 오류: {e} - 사용자명: '{username}', 비밀번호: '{password_hint}'")
+                    else:
+                        self.log(f"❌ {site_name}: {method_name} 인증 중 오류: {e}")
+                    return False
+        
+        return False
+
+    def upload_featured_image(self, site_url, headers, image_path, post_id):
+        """특성 이미지(썸네일) 업로드"""
+        try:
+            media_url = f"{site_url}/wp-json/wp/v2/media"
+            
+            with open(image_path, 'rb') as f:
+                files = {
+                    'file': (os.path.basename(image_path), f, 'image/webp')
+                }
+                headers_upload = {'Authorization': headers['Authorization']}
+                
+                # 업로드/특성 이미지 지정은 멱등이 아니므로 시작 전에만 취소 확인 (보낸 요청은 타임아웃 안에 끝까지 처리)
+                self.cancel_token.raise_if_cancelled()
+                session = get_requests_session()
+                response = session.post(media_url, headers=headers_upload, files=files, timeout=30)
+                
+                if response.status_code == 201:
+                    media_info = response.json()
+                    media_id = media_info['id']
+                    
+                    # 포스트에 특성 이미지 설정
+                    post_url = f"{site_url}/wp-json/wp/v2/posts/{post_id}"
+                    update_data = {'featured_media': media_id}
+                    
+                    session.post(post_url, headers=headers, json=update_data, timeout=30)
+                    return media_id
+                else:
+                    self.log(f"⚠️ 썸네일 업로드 실패: {response.status_code}")
+                    return None
+        except OperationCancelled:
+            self.log("⏹️ 썸네일 업로드 중단 (포스트는 업로드됨)")
+            return None
+        except Exception as e:
+            self.log(f"❌ 썸네일 업로드 오류: {e}")
+            return None
+
+    def clean_content(self, content, keyword=None):
+        """콘텐츠 정리 및 최적화 - HTML 구조 완전 정리"""
+        if not content:
+            return content
+            
+        # 기본 정리 작업들
+        content = content.strip()
+        
+        # 1. 깨진 HTML 태그 수정
+        # 불완전한 태그 패턴들 수정
+        content = re.sub(r'<p[^>]*>\s*<p[^>]*>', '<p>', content, flags=re.IGNORECASE)
+        content = re.sub(r'</p>\s*</p>', '</p>', content, flags=re.IGNORECASE)
+        content = re.sub(r'<div[^>]*>\s*<div[^>]*>', '<div>', content, flags=re.IGNORECASE)
+        content = re.sub(r'</div>\s*</div>', '</div>', content, flags=re.IGNORECASE)
+        
+        # 2. 색상 스타일 속성이 깨진 경우 수정
+        content = re.sub(r'<span style="color:\s*"[^>]*>', '<span style="color:#ee2323;">', content, flags=re.IGNORECASE)
+        content = re.sub(r'<span style="color:\s+[^"]*"', '<span style="color:#ee2323;"', content, flags=re.IGNORECASE)
+        content = re.sub(r'style="color:\s*//[^"]*"', 'style="color:#ee2323;"', content, flags=re.IGNORECASE)
+        content = re.sub(r'style="color:\s*#ee2323[^"]*"', 'style="color:#ee2323;"', content, flags=re.IGNORECASE)
+        
+        # 2-1. 더 강력한 깨진 HTML 속성 수정
+        # style 속성이 URL로 잘못 들어간 경우 완전 수정
+        content = re.sub(r'<span style="color:\s*//[^"]*"[^>]*>', '<span style="color:#ee2323;">', content, flags=re.IGNORECASE)
+        content = re.sub(r'<span[^>]*style="[^"]*//[^"]*"[^>]*>', '<span style="color:#ee2323;">', content, flags=re.IGNORECASE)
+        
+        # href 속성에 잘못된 URL이 들어간 경우 수정
+        if keyword:
+            search_url = f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
+            content = re.sub(r'href="[^"]*//search\.naver\.com[^"]*"', f'href="{search_url}"', content, flags=re.IGNORECASE)
+            content = re.sub(r'href="//[^"]*"', f'href="{search_url}"', content, flags=re.IGNORECASE)
+            
+        # 2-2. 깨진 링크 구조 완전 복구
+        # 잘못된 패턴: style="color: //search.naver.com..." target="_self">텍스트</a>
+        # 올바른 패턴으로 수정
+        if keyword:
+            pattern = r'style="color:\s*//[^"]*"\s*target="_self">([^<]*)</a>'
+            replacement = f'style="color:#ee2323;">{keyword} 상세정보</span>을 통해, 지금 바로 해보세요!</b></p><br><div><center><a class="blink" href="{search_url}" target="_self">\\1</a>'
+            content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
+        
+        # 3. 불완전한 닫는 태그들 정리
+        content = re.sub(r'</strong>\s*새우,', '</strong>', content, flags=re.IGNORECASE)
+        content = re.sub(r'</h4>\s*<br>\s*<p>', '</h4>\n<p>', content, flags=re.IGNORECASE)
+        
+        # 4. 테이블 태그가 깨진 경우 정리
+        content = re.sub(r'<td[^>]*>\s*<td[^>]*>', '<td>', content, flags=re.IGNORECASE)
+        content = re.sub(r'</td>\s*</td>', '</td>', content, flags=re.IGNORECASE)
+        
+        # 5. 과도한 <br> 태그 정리 - 연속된 3개 이상의 <br>만 제거
+        content = re.sub(r'(<br\s*/?>\s*){3,}', '<br><br>', content, flags=re.IGNORECASE)
+        
+        # 6. HTML 태그 간 불필요한 <br> 제거
+        content = re.sub(r'</p>\s*<br\s*/?>\s*<p>', '</p>\n<p>', content, flags=re.IGNORECASE)
+        content = re.sub(r'</h[1-6]>\s*<br\s*/?>\s*<p>', '</h2>\n<p>', content, flags=re.IGNORECASE)
+        content = re.sub(r'</div>\s*<br\s*/?>\s*<div>', '</div>\n<div>', content, flags=re.IGNORECASE)
+        
+        # 7. 시작과 끝의 불필요한 <br> 제거
+        content = re.sub(r'^(<br\s*/?>\s*)+', '', content, flags=re.IGNORECASE)
+        content = re.sub(r'(<br\s*/?>\s*)+$', '', content, flags=re.IGNORECASE)
+        
+        # 8. 링크 태그를 보호하면서 처리
+        link_pattern = r'<a[^>]*>.*?</a>'
+        links = re.findall(link_pattern, content, flags=re.IGNORECASE | re.DOTALL)
+        
+        # 임시 플레이스홀더로 링크 교체
+        temp_content = content
+        for i, link in enumerate(links):
+            temp_content = temp_content.replace(link, f"__LINK_PLACEHOLDER_{i}__", 1)
+        
+        # 링크가 없는 부분에서 과도한 <br> 제거 (2개 연속까지만 허용)
+        temp_content = re.sub(r'(<br\s*/?>\s*){3,}', '<br><br>', temp_content, flags=re.IGNORECASE)
+        
+        # 링크 복원
+        for i, link in enumerate(links):
+            temp_content = temp_content.replace(f"__LINK_PLACEHOLDER_{i}__", link, 1)
+        
+        content = temp_content
+        
+        # 9. 불완전한 HTML 태그 정리
+        content = re.sub(r'<strong>\s*</strong>', '', content, flags=re.IGNORECASE)
+        content = re.sub(r'</strong>\s*<strong>', ' ', content, flags=re.IGNORECASE)
+        
+        # 10. 잘못된 HTML 구조 정리
+        content = re.sub(r'<p[^>]*>\s*</p>', '', content, flags=re.IGNORECASE)  # 빈 p 태그 제거
+        
+        # 11. 중복된 제목이나 내용 제거
+        lines = content.split('\n')
+        seen_lines = set()
+        seen_content = NearDuplicateIndex(threshold=0.8)
+        unique_lines = []
+        
+        for line in lines:
+            # 제목 패턴 중복 체크 (h2, h3 태그)
+            title_match = re.search(r'<h[2-3][^>]*>(.+?)</h[2-3]>', line, flags=re.IGNORECASE)
+            if title_match:
+                title_text = title_match.group(1).strip()
+                if title_text not in seen_lines:
+                    seen_lines.add(title_text)
+                    unique_lines.append(line)
+            else:
+                # 일반 내용 중복 체크 (HTML 태그 제거 후 비교)
+                clean_line = re.sub(r'<[^>]*>', '', line).strip()
+                if clean_line:
+                    # 너무 짧거나 의미없는 내용 제거
+                    if len(clean_line) > 10 and clean_line not in seen_content:
+                        # 비슷한 내용 체크 (80% 이상 유사하면 중복으로 간주)
+                        if not seen_content.has_similar(clean_line):
+                            seen_content.add(clean_line)
+                            unique_lines.append(line)
+                    elif len(clean_line) <= 10:
+                        # 짧은 라인은 중복 체크 없이 추가 (HTML 태그만 있는 경우 등)
+                        unique_lines.append(line)
+                else:
+                    # 빈 라인도 유지
+                    unique_lines.append(line)
+        
+        content = '\n'.join(unique_lines)
+        
+        # 12. 깨진 HTML 구조 복구
+        # 닫히지 않은 태그들을 찾아서 정리
+        open_tags = []
+        tag_pattern = r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>'
+        
+        for match in re.finditer(tag_pattern, content):
+            is_closing = match.group(1) == '/'
+            tag_name = match.group(2).lower()
+            
+            if not is_closing:
+                # 자체 닫힘 태그가 아닌 경우에만 추가
+                if tag_name not in ['br', 'img', 'hr', 'input', 'meta', 'link']:
+                    open_tags.append(tag_name)
+            else:
+                # 닫는 태그인 경우 매칭되는 열린 태그 제거
+                if open_tags and open_tags[-1] == tag_name:
+                    open_tags.pop()
+        
+        # 13. 끝부분의 불완전한 내용 제거 (다운로드 버튼 보호)
+        # 다운로드 버튼 HTML을 임시로 보호
+        download_button_pattern = r'<div class="button-container">.*?</div>'
+        download_buttons = re.findall(download_button_pattern, content, flags=re.IGNORECASE | re.DOTALL)
+        
+        # 다운로드 버튼을 플레이스홀더로 교체
+        temp_content = content
+        for i, button in enumerate(download_buttons):
+            temp_content = temp_content.replace(button, f"__DOWNLOAD_BUTTON_{i}__", 1)
+        
+        # 의미없는 단어들이나 불완전한 문장, 깨진 HTML 구조 제거
+        temp_content = re.sub(r'\s*(당근|단호|center(?!>)|table(?!>)|td(?!>)|tr(?!>)|color(?![:="])|style(?![:="])|href(?![:="]))\s*$', '', temp_content, flags=re.IGNORECASE)
+        temp_content = re.sub(r'<[^>]*>?\s*$', '', temp_content)  # 끝에 불완전한 태그 제거
+        temp_content = re.sub(r'[^>]*>\s*$', '', temp_content)  # 끝에 불완전한 태그 내용 제거
+        temp_content = re.sub(r'\s*=\s*$', '', temp_content)  # 끝에 등호나 불완전한 속성 제거
+        temp_content = re.sub(r'^\s*"\s*$', '', temp_content, flags=re.MULTILINE)  # 줄 전체가 따옴표만 있는 경우만 제거
+        
+        # 다운로드 버튼 복원
+        for i, button in enumerate(download_buttons):
+            temp_content = temp_content.replace(f"__DOWNLOAD_BUTTON_{i}__", button, 1)
+        
+        content = temp_content
+        
+        # 13-1. 불완전한 문장이나 단락 제거
+        # 끝이 완전하지 않은 문장들 제거 (마침표, 물음표, 느낌표로 끝나지 않는 경우)
+        lines = content.split('\n')
+        complete_lines = []
+        for line in lines:
+            clean_line = re.sub(r'<[^>]*>', '', line).strip()  # HTML 태그 제거 후 체크
+            if clean_line and len(clean_line) > 5:
+                # 완전한 문장인지 체크 (한글 문장 특성 고려)
+                if (clean_line.endswith(('.', '!', '?', '요', '다', '죠', '어요', '습니다', '네요', '게요')) or 
+                    '</p>' in line or '</div>' in line or '</h2>' in line or '</h3>' in line):
+                    complete_lines.append(line)
+                elif len(clean_line) < 10:  # 너무 짧은 라인은 제거
+                    continue
+        
+        content = '\n'.join(complete_lines)
+        
+        # 14. 최종 정리
+        content = re.sub(r'\n\s*\n', '\n', content)  # 연속된 빈 줄 제거
+        content = content.strip()
+        
+        return content
+        
+        # 마크다운을 HTML로 변환 (혹시 AI가 마크다운으로 출력한 경우 대비)
+        # 헤딩 변환
+        content = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
+        content = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
+        content = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', content, flags=re.MULTILINE)
+
+        # 볼드, 이탤릭 변환
+        content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+        content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
+
+        # 마크다운 리스트를 HTML로 변환
+        lines = content.split('\n')
+        in_list = False
+        result_lines = []
+        
+        for line in lines:
+            line_stripped = line.strip()
+            if line_stripped.startswith('- ') or line_stripped.startswith('* '):
+                if not in_list:
+                    result_lines.append('<ul>')
+                    in_list = True
+                list_item = line_stripped[2:].strip()
+                result_lines.append(f'<li>{list_item}</li>')
+            else:
+                if in_list:
+                    result_lines.append('</ul>')
+                    in_list = False
+                result_lines.append(line)
+        
+        if in_list:
+            result_lines.append('</ul>')
+            
+        content = '\n'.join(result_lines)
+
+        # 인용구 변환
+        content = re.sub(r'^> (.*?)$', r'<blockquote>\1</blockquote>', content, flags=re.MULTILINE)
+
+        # 수평선 변환
+        content = re.sub(r'^---$', r'<hr>', content, flags=re.MULTILINE)
+
+        # 연속된 공백/줄바꿈 정리
+        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = re.sub(r' {2,}', ' ', content)
+        
+        # 빈 HTML 태그 제거
+        content = re.sub(r'<p>\s*</p>', '', content)
+        content = re.sub(r'<div>\s*</div>', '', content)
+        content = re.sub(r'<strong>\s*</strong>', '', content)
+        content = re.sub(r'<u>\s*</u>', '', content)
+        
+        return content.strip()
+
+    def extract_title_and_intro(self, content, keyword):
+        """제목과 서론을 추출 - 올바른 제목 형식 확인 및 보정"""
+        lines = content.strip().split('\n')
+        title = ""
+        intro = content
+        
+        # 첫 번째 줄을 제목으로 사용 (HTML 태그 제거 후)
+        if lines:
+            first_line = lines[0].strip()
+            # HTML 태그 제거
+            title = re.sub(r'<[^>]+>', '', first_line).strip()
+            # 나머지를 서론으로 사용
+            intro = '\n'.join(lines[1:]).strip()
+        
+        # 제목에서 HTML 태그 제거 (제목은 순수 텍스트로)
+        title = re.sub(r'<[^>]+>', '', title).strip()
+        
+        # 제목에서 불필요한 문자 제거 (큰따옴표, 작은따옴표, #, *, 백틱 등)
+        title = title.replace('"', '').replace("'", '').replace('`', '')
+        title = title.replace('#', '').replace('*', '').replace('**', '')
+        title = re.sub(r'^[\s\-_=]+', '', title)  # 앞쪽 특수문자 제거
+        title = re.sub(r'[\s\-_=]+$', '', title)  # 뒤쪽 특수문자 제거
+        title = title.strip()
+        
+        # 제목 형식 검증 및 보정
+        if not self.is_valid_title_format(title, keyword):
+            title = self.generate_hook_title(keyword)
+            self.log(f"⚠️ 제목 형식이 올바르지 않아 자동 생성: {title}")
+        
+        # 서론에서 제목과 완전히 동일한 내용 제거 (대소문자 구분 없이)
+        if title and intro:
+            # 1. 완전히 동일한 제목 제거
+            title_pattern = re.escape(title)
+            intro = re.sub(rf'^.*{title_pattern}.*$', '', intro, flags=re.MULTILINE | re.IGNORECASE)
+            
+            # 2. 키워드가 포함된 소제목 형태 제거 (: 또는 | 포함)
+            keyword_patterns = [
+                rf'^.*{re.escape(keyword)}.*:.*$',
+                rf'^.*{re.escape(keyword)}.*\|.*$',
+                rf'^.*{re.escape(keyword)}.*방법.*$',
+                rf'^.*{re.escape(keyword)}.*가이드.*$'
+            ]
+            for pattern in keyword_patterns:
+                intro = re.sub(pattern, '', intro, flags=re.MULTILINE | re.IGNORECASE)
+            
+            # 3. HTML 헤딩 태그 완전 제거
+            intro = re.sub(r'<h[1-6][^>]*>.*?</h[1-6]>', '', intro, flags=re.IGNORECASE | re.DOTALL)
+            intro = re.sub(r'</?h[1-6][^>]*>', '', intro, flags=re.IGNORECASE)
+            
+            # 4. 과도한 <br> 태그 정리
+            intro = re.sub(r'(<br\s*/?>\s*){2,}', '', intro, flags=re.IGNORECASE)
+            intro = re.sub(r'^<br\s*/?>', '', intro, flags=re.IGNORECASE)
+            intro = re.sub(r'<br\s*/?>$', '', intro, flags=re.IGNORECASE)
+            
+            # 5. 빈 문단이나 의미없는 내용 제거
+            intro_lines = intro.split('\n')
+            cleaned_lines = []
+            for line in intro_lines:
+                clean_line = line.strip()
+                if (clean_line and 
+                    len(clean_line) > 10 and 
+                    not clean_line.startswith('#') and
+                    not clean_line.lower().startswith(keyword.lower())):
+                    cleaned_lines.append(line)
+            
+            intro = '\n'.join(cleaned_lines).strip()
+        
+        return title, intro
+
+    def is_valid_title_format(self, title, keyword):
+        """제목이 올바른 형식({keyword} | 후킹문구)인지 검증 - 매우 엄격"""
+        if not title:
+            return False
+        
+        # 1. 금지된 패턴 체크 (하이픈 형식 완전 거부)
+        forbidden_patterns = [
+            r'-\s*완벽\s*가이드',
+            r'-\s*완벽\s*설명', 
+            r'-\s*완벽\s*방법',
+            r'-\s*노하우',
+            r'-\s*팁',
+            r'-\s*정리',
+            r'-.*가이드$',
+            r'-.*방법$',
+            r'-.*설명$'
+        ]
+        
+        for forbidden in forbidden_patterns:
+            if re.search(forbidden, title, re.IGNORECASE):
+                return False
+        
+        # 2. 필수 패턴 체크: {keyword} | 숫자포함 후킹문구
+        required_pattern = rf'{re.escape(keyword)}\s*\|\s*.+'
+        if not re.search(required_pattern, title, re.IGNORECASE):
+            return False
+        
+        # 3. 파이프(|) 기호가 있는지 확인
+        if '|' not in title:
+            return False
+        
+        # 4. 숫자가 포함되어 있는지 확인
+        if not re.search(r'\d+', title):
+            return False
+        
+        # 5. 길이 체크 (20-80자)
+        if len(title) < 20 or len(title) > 80:
+            return False
+        
+        # 6. 키워드가 제목 시작 부분에 있는지 확인
+        if not title.lower().strip().startswith(keyword.lower()):
+            return False
+        
+        return True
+
+    def similarity_ratio(self, str1, str2):
+        """두 문자열의 유사도 계산 (0.0 ~ 1.0)"""
+        try:
+            from difflib import SequenceMatcher
+            return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+        except:
+            # difflib를 사용할 수 없는 경우 간단한 비교
+            words1 = set(str1.lower().split())
+            words2 = set(str2.lower().split())
+            if not words1 or not words2:
+                return 0.0
+            intersection = words1.intersection(words2)
+            union = words1.union(words2)
+            return len(intersection) / len(union) if union else 0.0
+
+    def validate_and_fix_title(self, title, keyword):
+        """제목이 '{keyword} | 숫자가 들어간 후킹문구' 형식인지 검증하고 수정"""
+        try:
+            # 제목이 '{keyword} |' 로 시작하는지 확인
+            expected_start = f"{keyword} |"
+            
+            # 1차 검증: 정확한 형식 확인
+            if not title.startswith(expected_start):
+                self.log(f"⚠️ 제목이 지침에 맞지 않음: {title}")
+                
+                # 제목 수정 시도
+                if "|" in title:
+                    # | 이후 부분을 후킹문구로 사용
+                    parts = title.split("|", 1)
+                    hook_part = parts[1].strip()
+                    
+                    # 키워드가 앞부분에 없거나 다른 경우 교체
+                    if not parts[0].strip() == keyword:
+                        # 숫자가 포함되어 있는지 확인
+                        if any(char.isdigit() for char in hook_part):
+                            fixed_title = f"{keyword} | {hook_part}"
+                            self.log(f"✅ 제목을 지침에 맞게 수정: {fixed_title}")
+                            return fixed_title
+                
+                # 기본 후킹문구 생성 (항상 숫자 포함)
+                fixed_title = self.generate_hook_title(keyword)
+                self.log(f"🔧 기본 제목 생성: {fixed_title}")
+                return fixed_title
+            
+            # 2차 검증: 올바른 형식이지만 숫자 포함 여부 확인
+            if "|" in title:
+                hook_part = title.split("|", 1)[1].strip()
+                if not any(char.isdigit() for char in hook_part):
+                    # 숫자가 없으면 추가
+                    enhanced_hook = self.add_number_to_hook(hook_part)
+                    fixed_title = f"{keyword} | {enhanced_hook}"
+                    self.log(f"� 제목에 숫자 추가: {fixed_title}")
+                    return fixed_title
+            
+            return title
+            
+        except Exception as e:
+            self.log(f"제목 검증 중 오류: {e}")
+            # 오류 발생 시 안전한 기본 제목 반환
+            return self.generate_hook_title(keyword)
+    
+    def generate_hook_title(self, keyword):
+        """숫자가 포함된 기본 후킹 제목 생성"""
+        import random
+        hook_phrases = [
+            f"{random.randint(3, 10)}가지 핵심 정보",
+            f"{random.randint(5, 15)}분만에 완벽 이해",
+            f"{random.randint(3, 7)}단계 완벽 가이드",
+            f"{random.randint(10, 30)}초만에 알아보는 방법",
+            f"2024년 최신 {random.randint(5, 20)}가지 팁",
+            f"{random.randint(7, 15)}가지 필수 노하우",
+            f"{random.randint(3, 8)}분 완벽 정리",
+            f"{random.randint(5, 12)}가지 실용 정보"
+        ]
+        
+        selected_hook = random.choice(hook_phrases)
+        return f"{keyword} | {selected_hook}"
+    
+    def add_number_to_hook(self, hook_text):
+        """후킹문구에 숫자 추가"""
+        import random
+        numbers = [random.randint(3, 10), random.randint(5, 15), random.randint(7, 20)]
+        selected_number = random.choice(numbers)
+        
+        # 기존 후킹문구에 자연스럽게 숫자 추가
+        if "가지" not in hook_text and "단계" not in hook_text and "분" not in hook_text:
+            return f"{selected_number}가지 {hook_text}"
+        else:
+            return f"{selected_number}분만에 알아보는 {hook_text}"
+
+    def extract_approval_title_and_intro(self, content, keyword):
+        """승인용 콘텐츠에서 제목과 서론 추출"""
+        return self.extract_title_and_intro(content, keyword)
+
+    def replace_prompt_variables(self, prompt_content, keyword, urls, anchor_links, context):
+        """프롬프트 변수들을 실제 값으로 치환 - 모든 변수 처리"""
+        prompt = prompt_content.replace("{keyword}", keyword)
+        prompt = prompt.replace("{context}", context)
+        
+        # 기본 URL 변수들 치환
+        search_url = f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
+        prompt = prompt.replace("{url}", search_url)
+        # href="url" 패턴만 치환 (다른 URL은 건드리지 않음)
+        prompt = re.sub(r'href=["\']?\s*url\s*["\']?', f'href="{search_url}"', prompt, flags=re.IGNORECASE)
+        
+        # 모든 링크 변수들 치환
+        prompt = prompt.replace("{naver_search_link}", f'<a href="{search_url}" target="_self">{keyword} 관련 정보</a>')
+        prompt = prompt.replace("{youtube_link}", f'<a href="https://tv.naver.com/search?query={keyword.replace(" ", "+")}" target="_self">{keyword} 관련 영상</a>')
+        prompt = prompt.replace("{primary_link}", f'<a href="{search_url}" target="_self">{keyword} 상세 정보</a>')
+        
+        # 정부 및 공공기관 링크들
+        prompt = prompt.replace("{hometax_link}", '<a href="https://www.hometax.go.kr" target="_self">홈택스 바로가기</a>')
+        prompt = prompt.replace("{lh_link}", '<a href="https://www.lh.or.kr" target="_self">LH 한국토지주택공사</a>')
+        prompt = prompt.replace("{efine_link}", '<a href="https://www.efine.go.kr" target="_self">교통민원24</a>')
+        prompt = prompt.replace("{gov24_link}", '<a href="https://www.gov.kr" target="_self">정부24</a>')
+        prompt = prompt.replace("{wetax_link}", '<a href="https://www.wetax.go.kr" target="_self">위택스</a>')
+        prompt = prompt.replace("{kepco_link}", '<a href="https://cyber.kepco.co.kr" target="_self">한국전력 사이버지점</a>')
+        prompt = prompt.replace("{car365_link}", '<a href="https://www.car365.go.kr" target="_self">자동차365</a>')
+        prompt = prompt.replace("{apply_lh_link}", '<a href="https://apply.lh.or.kr" target="_self">LH청약플러스</a>')
+        prompt = prompt.replace("{bokjiro_link}", '<a href="https://www.bokjiro.go.kr" target="_self">복지로</a>')
+        
+        # 금융기관 링크들
+        prompt = prompt.replace("{kbstar_link}", '<a href="https://www.kbstar.com" target="_self">KB국민은행</a>')
+        prompt = prompt.replace("{shinhan_link}", '<a href="https://www.shinhan.com" target="_self">신한은행</a>')
+        prompt = prompt.replace("{hanabank_link}", '<a href="https://www.hanabank.com" target="_self">하나은행</a>')
+        prompt = prompt.replace("{wooribank_link}", '<a href="https://www.wooribank.com" target="_self">우리은행</a>')
+        prompt = prompt.replace("{ibk_link}", '<a href="https://www.ibk.co.kr" target="_self">IBK기업은행</a>')
+        prompt = prompt.replace("{kdb_link}", '<a href="https://www.kdb.co.kr" target="_self">KDB산업은행</a>')
+        prompt = prompt.replace("{bok_link}", '<a href="https://www.bok.or.kr" target="_self">한국은행</a>')
+        prompt = prompt.replace("{fss_link}", '<a href="https://www.fss.or.kr" target="_self">금융감독원</a>')
+        prompt = prompt.replace("{toss_link}", '<a href="https://toss.im" target="_self">토스</a>')
+        prompt = prompt.replace("{kakaopay_link}", '<a href="https://www.kakaopay.com" target="_self">카카오페이</a>')
+        
+        # 부동산 및 기타 링크들
+        prompt = prompt.replace("{naver_land_link}", '<a href="https://land.naver.com" target="_self">네이버 부동산</a>')
+        prompt = prompt.replace("{naver_map_link}", '<a href="https://map.naver.com" target="_self">네이버 지도</a>')
+        prompt = prompt.replace("{zigbang_link}", '<a href="https://www.zigbang.com" target="_self">직방</a>')
+        prompt = prompt.replace("{dabang_link}", '<a href="https://www.dabangapp.com" target="_self">다방</a>')
+        
+        # 통신 및 유틸리티 링크들
+        prompt = prompt.replace("{tworld_link}", '<a href="https://www.tworld.co.kr" target="_self">T월드</a>')
+        prompt = prompt.replace("{kt_link}", '<a href="https://www.kt.com" target="_self">KT</a>')
+        prompt = prompt.replace("{uplus_link}", '<a href="https://www.uplus.co.kr" target="_self">LG U+</a>')
+        
+        # 자동차 관련 링크들
+        prompt = prompt.replace("{bobaedream_link}", '<a href="https://www.bobaedream.co.kr" target="_self">보배드림</a>')
+        prompt = prompt.replace("{encar_link}", '<a href="https://www.encar.com" target="_self">엔카</a>')
+        
+        return prompt
+
+    def get_approval_system_prompt(self, step, keyword):
+        """승인용 시스템 프롬프트 생성 - 최소화 (API 토큰 대폭 절약)"""
+        
+        # approval 프롬프트 파일에 이미 상세 규칙이 있으므로 최소한만 전달
+        return f"""너는 SEO 콘텐츠 전문가야. {keyword}에 대한 글을 작성해.
+
+규칙:
+- HTML만 사용 (마크다운 금지)
+- '~해요'체 사용
+- prompts/approval{step}.txt 파일의 지침을 정확히 따르기"""
+
+    def get_revenue_system_prompt(self, step_num, keyword):
+        """수익용 시스템 프롬프트 생성 - prompt 파일 읽어서 사용"""
+        try:
+            # prompt 파일 경로
+            prompt_file = f"prompts/prompt{step_num}.txt"
+            
+            # 파일 읽기
+            with open(prompt_file, 'r', encoding='utf-8') as f:
+                prompt_content = f.read()
+            
+            # {keyword} 치환 (고정 접두부 모드에서는 키워드를 사용자 메시지로 이동)
+            if self.use_stable_prompt_prefix():
+                return build_stable_prompt(prompt_content)
+            prompt_content = prompt_content.replace('{keyword}', keyword)
+            
+            # 프롬프트 파일에 이미 규칙이 있으므로 추가 규칙 없음 (API 토큰 절약)
+            return prompt_content
+            
+        except Exception as e:
+            self.log(f"프롬프트 파일 읽기 오류: {e}")
+            # 기본 프롬프트
+            return f"""너는 SEO 콘텐츠 작가다. {keyword}에 대한 고품질 콘텐츠를 '~해요'체로 작성해라.
+            
+규칙:
+- AI 역할 언급 절대 금지
+- '클릭' 단어 사용 금지 (대신: 선택, 확인, 눌러보기, 터치, 접속, 방문)
+- 마크다운 문법 사용 금지
+- 순수 HTML만 사용
+- {keyword}에 대한 유용한 정보 제공"""
+
+    def extract_approval_title_and_intro(self, content, keyword):
+        """승인용 콘텐츠에서 제목과 서론 추출"""
+        return self.extract_title_and_intro(content, keyword)
+
+        return base_prompt
+
+                
+# WordPress 인증 방법 목록 (이름, 도메인 포함 사용자명 여부, 비밀번호 공백 제거 여부)
+WP_AUTH_METHODS = [
+    ("Application Password (공백포함)", False, False),
+    ("Application Password (공백제거)", False, True),
+    ("Basic Auth", False, False),
+    ("도메인 포함 인증", True, False),
+    ("도메인 포함 + 공백제거", True, True),
+]
+
+def build_auth_credentials(method_name, username, password, site_url=""):
+    """인증 방법 이름에 맞는 (사용자명, 비밀번호) 반환 - 알 수 없는 방법이면 None"""
+    for name, with_domain, strip_spaces in WP_AUTH_METHODS:
+        if name != method_name:
+            continue
+        user = username
+        if with_domain:
+            if '@' in username or not site_url:
+                return None
+            domain = site_url.replace('https://', '').replace('http://', '').split('/')[0]
+            user = f"{username}@{domain}"
+        pwd = password.replace(" ", "") if strip_spaces else password
+        return user, pwd
+    return None
+
+class AuthCacheStore:
+    """성공한 인증 방법을 사이트별로 저장하는 영구 캐시 (auth_cache.json)
+
+    보안을 위해 인증 헤더/비밀번호는 저장하지 않고 인증 방법 이름만 저장합니다.
+    """
+
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file or os.path.join(get_base_path(), "auth_cache.json")
+        self._lock = threading.Lock()
+        self.data = self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 인증 캐시 로드 오류: {e}")
+        return {}
+
+    def save(self, key, entry):
+        """사이트 1개 항목만 파일에 병합 저장 (entry가 None이면 삭제) - 다른 프로세스가 저장한 항목 유지"""
+        def apply(data):
+            if entry is None:
+                data.pop(key, None)
+            else:
+                data[key] = entry
+        try:
+            self.data = merge_json_file(self.cache_file, apply)
+        except Exception as e:
+            print(f"⚠️ 인증 캐시 저장 오류: {e}")
+
+    @staticmethod
+    def _key(site_url):
+        return (site_url or "").rstrip('/')
+
+    def get_method(self, site_url):
+        with self._lock:
+            entry = self.data.get(self._key(site_url))
+            return entry.get('method') if entry else None
+
+    def remember(self, site_url, method_name, **extra):
+        with self._lock:
+            entry = {'method': method_name, 'updated_at': datetime.now().isoformat()}
+            entry.update(extra)
+            self.data[self._key(site_url)] = entry
+            self.save(self._key(site_url), entry)
+
+    def forget(self, site_url):
+        with self._lock:
+            if self.data.pop(self._key(site_url), None) is not None:
+                self.save(self._key(site_url), None)
+
+_auth_cache_store = None
+_auth_cache_store_lock = threading.Lock()
+
+def get_auth_cache_store():
+    """프로세스 전역 인증 캐시 저장소"""
+    global _auth_cache_store
+    with _auth_cache_store_lock:
+        if _auth_cache_store is None:
+            _auth_cache_store = AuthCacheStore()
+        return _auth_cache_store
+
+class PublishedContentIndex:
+    """발행 글 중복 검사 인덱스 (published_index.db, SQLite + 메모리 색인)
+
+    본문은 문자 5-gram, 제목은 문자 3-gram shingle로 MinHash 서명(one-permutation, 64칸)을 만들고
+    LSH 밴드(16개 x 4칸)로 색인합니다. SQLite는 영구 저장용이고, 밴드 버킷/서명/정규화 제목은
+    메모리에 올려 두어 조회 시에는 DB를 읽지 않습니다 (다른 프로세스가 추가한 글만 증분 로드).
+    """
+
+    NUM_BINS = 64
+    BAND_ROWS = 4
+    SIG_VERSION = 2  # 서명 방식 버전 - 바뀌면 output/*.html로 색인 재생성
+    EMPTY_BIN = 1 << 26  # 비어 있는 칸 (해시 값은 26비트라 도달 불가)
+    MAX_CANDIDATES = 50  # 서명 비교할 최대 후보 수 (템플릿형 제목이 많아도 조회 시간 일정)
+
+    def __init__(self, db_path=None):
+        import sqlite3
+
+        self.db_path = db_path or os.path.join(get_base_path(), "published_index.db")
+        self._lock = threading.Lock()
+        is_new = not os.path.exists(self.db_path)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                site TEXT, title TEXT, keyword TEXT, post_id INTEGER, url TEXT,
+                created_at TEXT, title_norm TEXT, content_sig BLOB, title_sig BLOB
+            );
+            CREATE TABLE IF NOT EXISTS bands (kind TEXT, band_key INTEGER, doc_id INTEGER);
+            CREATE INDEX IF NOT EXISTS idx_bands ON bands (kind, band_key);
+            CREATE INDEX IF NOT EXISTS idx_title_norm ON posts (title_norm);
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+        """)
+        version = self._conn.execute("SELECT value FROM meta WHERE name = 'sig_version'").fetchone()
+        if not is_new and (not version or int(version[0]) != self.SIG_VERSION):
+            # 이전 방식 서명은 새 서명과 비교할 수 없으므로 비우고 발행 기록으로 다시 색인
+            self._conn.executescript("DELETE FROM posts; DELETE FROM bands;")
+            is_new = True
+        self._conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('sig_version', ?)",
+                           (str(self.SIG_VERSION),))
+        self._conn.commit()
+
+        # 메모리 색인 - {(kind, band_key): doc_id 또는 [doc_id, ...]}, {doc_id: (본문 서명, 제목 서명, 글 정보)}
+        self._bands = {}
+        self._docs = {}
+        self._titles = {}
+        self._loaded_id = 0
+        if is_new:
+            # 기존 output/*.html 발행 기록으로 초기 색인
+            self.rebuild_from_output(os.path.join(get_base_path(), "output"))
+        with self._lock:
+            self._load_new_rows()
+
+    @staticmethod
+    def normalize(text):
+        """HTML 태그/엔티티 제거, 소문자, 공백 정리"""
+        import html
+        text = re.sub(r'<[^>]+>', ' ', text or '')
+        text = html.unescape(text).lower()
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def signature(self, normalized, shingle_size):
+        """one-permutation MinHash 서명 (shingle당 CRC32 1회 - 하위 6비트로 칸, 상위 26비트가 값)"""
+        from array import array
+        import zlib
+
+        if len(normalized) <= shingle_size:
+            shingles = {normalized} if normalized else set()
+        else:
+            shingles = {normalized[i:i + shingle_size] for i in range(len(normalized) - shingle_size + 1)}
+
+        crc32 = zlib.crc32
+        mask = self.NUM_BINS - 1
+        sig = [self.EMPTY_BIN] * self.NUM_BINS
+        for shingle in shingles:
+            h = crc32(shingle.encode('utf-8'))
+            value = h >> 6
+            if value < sig[h & mask]:
+                sig[h & mask] = value
+        return array('I', sig)
+
+    def band_keys(self, sig):
+        """LSH 밴드 키 목록 (모두 빈 칸인 밴드는 제외)"""
+        import hashlib
+
+        keys = []
+        for band in range(self.NUM_BINS // self.BAND_ROWS):
+            rows = sig[band * self.BAND_ROWS:(band + 1) * self.BAND_ROWS]
+            if all(value == self.EMPTY_BIN for value in rows):
+                continue
+            raw = f"{band}:" + ",".join(str(value) for value in rows)
+            keys.append(int.from_bytes(hashlib.blake2b(raw.encode('ascii'), digest_size=8).digest(), 'big', signed=True))
+        return keys
+
+    def estimate(self, sig_a, sig_b):
+        """서명 일치율로 Jaccard 유사도 추정 (0.0 ~ 1.0)"""
+        import operator
+
+        agree = sum(map(operator.eq, sig_a, sig_b))
+        both_empty = 0
+        if self.EMPTY_BIN in sig_a and self.EMPTY_BIN in sig_b:
+            both_empty = sum(1 for a, b in zip(sig_a, sig_b) if a == b == self.EMPTY_BIN)
+        filled = len(sig_a) - both_empty
+        return (agree - both_empty) / filled if filled else 0.0
+
+    @staticmethod
+    def _pack(sig):
+        return sig.tobytes()
+
+    @staticmethod
+    def _unpack(blob):
+        from array import array
+        sig = array('I')
+        sig.frombytes(blob)
+        return sig
+
+    def _index_doc(self, doc_id, title_norm, content_sig, title_sig, info):
+        """메모리 색인에 글 1개 추가 (버킷 대부분이 글 1개라 단일 ID는 리스트 없이 저장)"""
+        self._docs[doc_id] = (content_sig, title_sig, info)
+        if title_norm:
+            self._titles.setdefault(title_norm, doc_id)
+        for kind, sig in (('c', content_sig), ('t', title_sig)):
+            for key in self.band_keys(sig):
+                bucket = self._bands.get((kind, key))
+                if bucket is None:
+                    self._bands[(kind, key)] = doc_id
+                elif isinstance(bucket, list):
+                    bucket.append(doc_id)
+                else:
+                    self._bands[(kind, key)] = [bucket, doc_id]
+        self._loaded_id = max(self._loaded_id, doc_id)
+
+    def _load_new_rows(self):
+        """DB에서 아직 메모리에 없는 글(다른 프로세스가 추가한 글 포함)만 로드"""
+        rows = self._conn.execute(
+            "SELECT id, site, title, post_id, url, created_at, title_norm, content_sig, title_sig "
+            "FROM posts WHERE id > ? ORDER BY id", (self._loaded_id,)
+        ).fetchall()
+        for doc_id, site, title, post_id, url, created_at, title_norm, content_blob, title_blob in rows:
+            info = {'site': site, 'title': title, 'post_id': post_id, 'url': url, 'created_at': created_at}
+            self._index_doc(doc_id, title_norm, self._unpack(content_blob), self._unpack(title_blob), info)
+
+    def _candidates(self, kind, keys):
+        """겹치는 밴드가 많은 순으로 후보 문서 ID (상위 MAX_CANDIDATES개)"""
+        counts = {}
+        for key in keys:
+            bucket = self._bands.get((kind, key))
+            if bucket is None:
+                continue
+            for doc_id in (bucket if isinstance(bucket, list) else (bucket,)):
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+        if len(counts) <= self.MAX_CANDIDATES:
+            return list(counts)
+        return sorted(counts, key=counts.get, reverse=True)[:self.MAX_CANDIDATES]
+
+    def find_duplicate(self, title, content, threshold=0.7, title_threshold=0.9):
+        """가장 유사한 기존 발행 글 반환 - 기준 이하면 None
+
+        Returns:
+            dict: kind(content/title), similarity, site, title, post_id, url, created_at
+        """
+        title_norm = self.normalize(title)
+        content_sig = self.signature(self.normalize(content), 5)
+
+        with self._lock:
+            # 다른 프로세스(분산 실행 워커)가 새로 색인한 글 반영 - 최대 ID 조회 1회
+            if (self._conn.execute("SELECT MAX(id) FROM posts").fetchone()[0] or 0) > self._loaded_id:
+                self._load_new_rows()
+
+            doc_id = self._titles.get(title_norm) if title_norm else None
+            if doc_id is not None:
+                best = {'kind': 'title', 'similarity': 1.0}
+                best.update(self._docs[doc_id][2])
+                return best
+
+            best = self._best_match('content', 0, content_sig, threshold)
+            if best is None:
+                # 본문이 중복이 아닐 때만 제목 서명 계산/비교
+                best = self._best_match('title', 1, self.signature(title_norm, 3), title_threshold)
+            return best
+
+    def _best_match(self, kind, slot, sig, limit):
+        """메모리 후보 중 기준 이상으로 가장 유사한 글"""
+        best = None
+        for doc_id in self._candidates(kind[0], self.band_keys(sig)):
+            doc = self._docs[doc_id]
+            similarity = self.estimate(sig, doc[slot])
+            if similarity >= limit and (best is None or similarity > best['similarity']):
+                best = dict(doc[2], kind=kind, similarity=similarity)
+        return best
+
+    def add(self, site_name, title, content, keyword="", post_id=None, url="", created_at=None):
+        """발행 글 색인 추가"""
+        title_norm = self.normalize(title)
+        content_sig = self.signature(self.normalize(content), 5)
+        title_sig = self.signature(title_norm, 3)
+        created_at = created_at or datetime.now().isoformat()
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO posts (site, title, keyword, post_id, url, created_at, title_norm, content_sig, title_sig) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (site_name, title, keyword, post_id, url, created_at,
+                 title_norm, self._pack(content_sig), self._pack(title_sig))
+            )
+            doc_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO bands (kind, band_key, doc_id) VALUES (?, ?, ?)",
+                [('c', key, doc_id) for key in self.band_keys(content_sig)] +
+                [('t', key, doc_id) for key in self.band_keys(title_sig)]
+            )
+            self._conn.commit()
+            # 사이에 다른 프로세스가 추가한 글이 있으면 먼저 로드 (ID 순서 유지)
+            if doc_id > self._loaded_id + 1:
+                self._load_new_rows()
+            else:
+                info = {'site': site_name, 'title': title, 'post_id': post_id, 'url': url, 'created_at': created_at}
+                self._index_doc(doc_id, title_norm, content_sig, title_sig, info)
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def rebuild_from_output(self, output_dir):
+        """output 폴더의 발행 HTML({사이트}_{시각}_post_{ID}.html)로 색인 생성"""
+        if not os.path.isdir(output_dir):
+            return 0
+        added = 0
+        for filename in sorted(os.listdir(output_dir)):
+            match = re.match(r'(.+)_(\d{8}_\d{6})_post_(\d+)\.html$', filename)
+            if not match:
+                continue
+            try:
+                with open(os.path.join(output_dir, filename), 'r', encoding='utf-8') as f:
+                    html_text = f.read()
+                title_match = re.search(r'<title>(.*?)</title>', html_text, flags=re.DOTALL)
+                body_match = re.search(r'<body>(.*)</body>', html_text, flags=re.DOTALL)
+                title = title_match.group(1).strip() if title_match else ""
+                body = body_match.group(1) if body_match else html_text
+                body = re.sub(r'^\s*<h1>.*?</h1>', '', body, count=1, flags=re.DOTALL)
+                created_at = datetime.strptime(match.group(2), "%Y%m%d_%H%M%S").isoformat()
+                self.add(match.group(1), title, body, post_id=int(match.group(3)), created_at=created_at)
+                added += 1
+            except Exception as e:
+                print(f"⚠️ 발행 글 색인 실패 ({filename}): {e}")
+        return added
+
+_published_index = None
+_published_index_lock = threading.Lock()
+
+def get_published_index():
+    """프로세스 전역 발행 글 중복 검사 인덱스"""
+    global _published_index
+    with _published_index_lock:
+        if _published_index is None:
+            _published_index = PublishedContentIndex()
+        return _published_index
+
+# 제공자별 기본 요청 제한 (global_settings.rate_limits 로 재정의)
+DEFAULT_RATE_LIMITS = {
+    "gemini": {"per_minute": 15, "per_day": 1500},
+    "openai": {"per_minute": 60, "per_day": 10000},
+}
+
+class ApiRateLimiter:
+    """AI API 요청 제한기 - 제공자/API 키별 토큰 버킷 + 1분 슬라이딩 윈도우 + 일일 할당량
+
+    모든 ContentGenerator가 공유하며 일일 사용량은 rate_limits.json에 저장되어 재시작 후에도 유지됩니다.
+    API 키는 해시 앞 8자리로만 구분하고 키 자체는 저장하지 않습니다.
+    분산 실행(enable_shared_mode)에서는 분당 제한도 rate_limits.json의 최근 요청 시각으로 판단해
+    여러 워커 프로세스가 키 할당량을 나눠 씁니다.
+    """
+
+    def __init__(self, state_file=None):
+        from collections import deque
+
+        self._deque = deque
+        self.state_file = state_file or os.path.join(get_base_path(), "rate_limits.json")
+        self._lock = threading.Lock()
+        self.buckets = {}  # {bucket_id: {'tokens', 'updated', 'window'}}
+        self.daily = self.load()  # {bucket_id: {'date', 'count'(, 'recent')}}
+        self.shared = False
+
+    def enable_shared_mode(self):
+        """분산 실행 - 분당/일일 사용량을 파일 잠금으로 워커 프로세스 간 공유"""
+        self.shared = True
+
+    def load(self):
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                today = datetime.now().date().isoformat()
+                return {key: value for key, value in data.items() if value.get('date') == today}
+        except Exception as e:
+            print(f"⚠️ 요청 제한 상태 로드 오류: {e}")
+        return {}
+
+    def save(self, apply):
+        """apply(data)로 이번 변경분만 rate_limits.json에 병합 (다른 프로세스의 사용량 유지) - 오늘 항목만 보관"""
+        today = datetime.now().date().isoformat()
+
+        def merge(data):
+            for key in [key for key, value in data.items() if value.get('date') != today]:
+                del data[key]
+            apply(data)
+        try:
+            self.daily = merge_json_file(self.state_file, merge)
+        except Exception as e:
+            print(f"⚠️ 요청 제한 상태 저장 오류: {e}")
+
+    @staticmethod
+    def _file_entry(data, bucket_id, now):
+        """파일 데이터의 오늘 항목 (1분 지난 요청 시각 제거)"""
+        today = datetime.now().date().isoformat()
+        entry = data.get(bucket_id)
+        if not entry or entry.get('date') != today:
+            entry = {'date': today, 'count': 0}
+            data[bucket_id] = entry
+        entry['recent'] = [t for t in entry.get('recent', []) if now - t < 60]
+        return entry
+
+    def _shared_acquire(self, bucket_id, per_minute, per_day, force=False):
+        """분산 실행용 차감 - 잠근 파일 기준으로 일일/분당 제한 확인 후 요청 시각 기록"""
+        outcome = {}
+
+        def apply(data):
+            now = time.time()
+            entry = self._file_entry(data, bucket_id, now)
+            if not force and per_day and entry['count'] >= per_day:
+                outcome['value'] = (False, None, 'daily')
+            elif not force and len(entry['recent']) >= per_minute:
+                outcome['value'] = (False, 60 - (now - entry['recent'][0]), 'minute')
+            else:
+                entry['recent'].append(now)
+                entry['count'] += 1
+                outcome['value'] = (True, 0.0, None)
+        self.save(apply)
+        return outcome.get('value', (False, 1.0, 'minute'))
+
+    @staticmethod
+    def bucket_id(provider, api_key):
+        import hashlib
+        digest = hashlib.sha256((api_key or "").encode('utf-8')).hexdigest()[:8]
+        return f"{provider}:{digest}"
+
+    def _bucket(self, bucket_id, per_minute, now):
+        """버킷 조회 + 토큰 보충 + 1분 지난 요청 제거"""
+        bucket = self.buckets.get(bucket_id)
+        if bucket is None:
+            bucket = {'tokens': float(per_minute), 'updated': now, 'window': self._deque()}
+            self.buckets[bucket_id] = bucket
+        bucket['tokens'] = min(float(per_minute), bucket['tokens'] + (now - bucket['updated']) * per_minute / 60.0)
+        bucket['updated'] = now
+        window = bucket['window']
+        while window and now - window[0] >= 60:
+            window.popleft()
+        return bucket
+
+    def _daily_entry(self, bucket_id):
+        today = datetime.now().date().isoformat()
+        entry = self.daily.get(bucket_id)
+        if not entry or entry.get('date') != today:
+            entry = {'date': today, 'count': 0}
+            self.daily[bucket_id] = entry
+        return entry
+
+    @staticmethod
+    def _wait_seconds(bucket, per_minute, now):
+        """다음 요청까지 남은 시간 (0이면 즉시 가능)"""
+        wait = 0.0
+        if bucket['tokens'] < 1:
+            wait = (1 - bucket['tokens']) * 60.0 / per_minute
+        if len(bucket['window']) >= per_minute:
+            wait = max(wait, 60 - (now - bucket['window'][0]))
+        return wait
+
+    def _consume(self, bucket_id, bucket, now):
+        bucket['tokens'] -= 1
+        bucket['window'].append(now)
+        self._daily_entry(bucket_id)['count'] += 1
+
+        def apply(data):
+            entry = self._file_entry(data, bucket_id, time.time())
+            entry['count'] += 1
+        self.save(apply)
+
+    def try_acquire(self, provider, api_key, per_minute, per_day):
+        """즉시 요청 가능하면 1회 차감
+
+        Returns:
+            tuple: (성공 여부, 대기 시간(초), 실패 사유 'minute' | 'daily' | None)
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket_id = self.bucket_id(provider, api_key)
+            if self.shared:
+                return self._shared_acquire(bucket_id, per_minute, per_day)
+            bucket = self._bucket(bucket_id, per_minute, now)
+            if per_day and self._daily_entry(bucket_id)['count'] >= per_day:
+                return False, None, 'daily'
+            wait = self._wait_seconds(bucket, per_minute, now)
+            if wait > 0:
+                return False, wait, 'minute'
+            self._consume(bucket_id, bucket, now)
+            return True, 0.0, None
+
+    def record(self, provider, api_key, per_minute):
+        """제한과 무관하게 이미 보낸 요청 1회 기록"""
+        with self._lock:
+            now = time.monotonic()
+            bucket_id = self.bucket_id(provider, api_key)
+            if self.shared:
+                self._shared_acquire(bucket_id, per_minute, 0, force=True)
+                return
+            self._consume(bucket_id, self._bucket(bucket_id, per_minute, now), now)
+
+    def acquire(self, provider, api_key, per_minute, per_day, should_stop=None, log=None, cancel_token=None):
+        """요청 가능할 때까지 대기 후 1회 차감 - 일일 할당량 초과 또는 중지 시 False
+
+        다음 요청 가능 시각까지 한 번에 대기하며, cancel_token이 취소되면 즉시 깨어나 False를 반환합니다.
+        """
+        cancel_token = cancel_token or CancellationToken()
+        notified = False
+        while True:
+            ok, wait, reason = self.try_acquire(provider, api_key, per_minute, per_day)
+            if ok:
+                return True
+            if reason == 'daily':
+                if log:
+                    log(f"⛔ {provider.upper()} 일일 요청 할당량({per_day}회) 소진 - 내일 다시 시도됩니다")
+                return False
+            if should_stop and should_stop():
+                return False
+            if log and not notified:
+                log(f"⏳ {provider.upper()} 분당 요청 제한({per_minute}회) - {wait:.0f}초 대기")
+                notified = True
+            if cancel_token.wait(wait):
+                return False
+
+    def status(self, provider, api_key, per_minute, per_day):
+        """할당량 상태 (모니터링 표시용)"""
+        with self._lock:
+            now = time.monotonic()
+            bucket_id = self.bucket_id(provider, api_key)
+            if self.shared:
+                # 다른 워커의 사용량까지 반영된 파일 기준
+                self.daily = self.load()
+                entry = self._file_entry(self.daily, bucket_id, time.time())
+                minute_count, daily_count = len(entry['recent']), entry['count']
+                return {
+                    'minute_count': minute_count,
+                    'minute_limit': per_minute,
+                    'daily_count': daily_count,
+                    'daily_limit': per_day,
+                    'minute_ok': minute_count < per_minute,
+                    'daily_ok': not per_day or daily_count < per_day,
+                }
+            bucket = self._bucket(bucket_id, per_minute, now)
+            minute_count = len(bucket['window'])
+            daily_count = self._daily_entry(bucket_id)['count']
+            return {
+                'minute_count': minute_count,
+                'minute_limit': per_minute,
+                'daily_count': daily_count,
+                'daily_limit': per_day,
+                'minute_ok': self._wait_seconds(bucket, per_minute, now) <= 0,
+                'daily_ok': not per_day or daily_count < per_day,
+            }
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    """프로세스 전역 AI API 요청 제한기"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = ApiRateLimiter()
+        return _rate_limiter
+
+class EmptyResponseError(Exception):
+    """AI 응답이 비어 있거나 차단됨 (재시도/서킷 집계 대상 아님)"""
+
+# 상태 코드 없이 끊긴 네트워크 오류 (OpenAI APITimeoutError/APIConnectionError, requests 예외 등 - 이름으로 판별해 SDK 임포트 불필요)
+TRANSIENT_ERROR_NAMES = ("APITimeoutError", "APIConnectionError", "Timeout", "ConnectTimeout", "ReadTimeout",
+                         "ConnectionError", "ServiceUnavailable", "DeadlineExceeded", "InternalServerError")
+
+def api_error_status(error):
+    """API 예외의 HTTP 상태 코드 (없으면 None)
+
+    OpenAI APIStatusError.status_code, google api_core 예외의 code, requests HTTPError.response.status_code 순으로 확인하고,
+    문자열만 있으면 "429 Resource exhausted"처럼 맨 앞에 오거나 "status 503"/"Error code: 401"처럼 명시된 코드만 인정합니다
+    (요청 ID/토큰 수/모델명 속 숫자는 무시).
+    """
+    if not isinstance(error, str):
+        for status in (getattr(error, 'status_code', None), getattr(error, 'code', None),
+                       getattr(getattr(error, 'response', None), 'status_code', None)):
+            if isinstance(status, int) and 100 <= status <= 599:
+                return status
+        error = str(error)
+    match = (re.match(r'\s*(\d{3})\b', error) or
+             re.search(r'(?:status(?: code)?|error code|http)\s*[:=]?\s*(\d{3})\b', error, flags=re.IGNORECASE))
+    return int(match.group(1)) if match else None
+
+def is_transient_network_error(error):
+    """상태 코드 없는 일시적 네트워크 오류(타임아웃/연결 끊김)인지 - 예외 타입 기준"""
+    if isinstance(error, (TimeoutError, ConnectionError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    return any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+class CircuitBreaker:
+    """제공자별 서킷 브레이커
+
+    연속 실패가 기준 횟수에 도달하면 서킷을 열어 cooldown 동안 호출을 차단하고,
+    cooldown이 지나면 시험 호출 1회(half-open)를 허용해 성공 시 다시 닫습니다.
+    """
+
+    def __init__(self, name, failure_threshold=3, cooldown=60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            return "half-open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+    def remaining(self):
+        """서킷이 다시 시험 호출을 허용하기까지 남은 시간(초)"""
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def allow_request(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                print(f"🚧 {self.name} 서킷 열림 - 연속 실패 {self.failures}회, {self.cooldown:.0f}초간 차단")
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(provider):
+    """프로세스 전역 제공자별 서킷 브레이커"""
+    with _circuit_breakers_lock:
+        if provider not in _circuit_breakers:
+            _circuit_breakers[provider] = CircuitBreaker(provider.upper())
+        return _circuit_breakers[provider]
+
+class HedgingPolicy:
+    """제공자 간 헤지 요청 정책 - 단계별 응답 시간 분포와 헤지 예산 관리
+
+    (제공자, 단계)별 최근 응답 시간에서 백분위 지연을 계산하고, 주 요청이 그 시간을 넘기면
+    보조 제공자로 같은 프롬프트를 보냅니다. 헤지 예산은 주 요청 1회당 budget_ratio만큼 쌓이고
+    헤지 1회에 1을 쓰므로 추가 토큰 사용량이 전체의 budget_ratio 이하로 제한됩니다.
+    """
+
+    WINDOW = 50        # 단계별 보관할 최근 응답 시간 수
+    MAX_BUDGET = 5.0   # 몰아서 쓸 수 있는 최대 헤지 횟수
+
+    def __init__(self):
+        from collections import deque
+
+        self._deque = deque
+        self._lock = threading.Lock()
+        self.latencies = {}  # {(provider, step_name): deque}
+        self.budget = 1.0
+        self.hedged = 0
+        self.wins = 0
+
+    def record_latency(self, provider, step_name, seconds):
+        with self._lock:
+            window = self.latencies.get((provider, step_name))
+            if window is None:
+                window = self._deque(maxlen=self.WINDOW)
+                self.latencies[(provider, step_name)] = window
+            window.append(seconds)
+
+    def hedge_delay(self, provider, step_name, percentile=90, min_samples=10, min_delay=3.0):
+        """헤지 요청을 보낼 대기 시간 (표본이 부족하면 None)"""
+        with self._lock:
+            window = self.latencies.get((provider, step_name))
+            if not window or len(window) < min_samples:
+                return None
+            ordered = sorted(window)
+        rank = min(len(ordered) - 1, max(0, int(round(percentile / 100.0 * len(ordered))) - 1))
+        return max(min_delay, ordered[rank])
+
+    def earn(self, ratio):
+        with self._lock:
+            self.budget = min(self.MAX_BUDGET, self.budget + ratio)
+
+    def try_spend(self):
+        with self._lock:
+            if self.budget < 1.0:
+                return False
+            self.budget -= 1.0
+            self.hedged += 1
+            return True
+
+    def record_win(self):
+        with self._lock:
+            self.wins += 1
+
+_hedging_policy = None
+_hedging_policy_lock = threading.Lock()
+
+def get_hedging_policy():
+    """프로세스 전역 헤지 요청 정책"""
+    global _hedging_policy
+    with _hedging_policy_lock:
+        if _hedging_policy is None:
+            _hedging_policy = HedgingPolicy()
+        return _hedging_policy
+
+class ApiKeyPool:
+    """제공자별 API 키 풀 - 가중 라운드로빈 선택, 오류 키 격리, 키별 클라이언트 캐시
+
+    할당량 소진/권한 오류를 낸 키는 일정 시간 격리하고 다른 키로 요청을 돌립니다.
+    분당 제한(429) 격리 키는 다른 키가 모두 막혔을 때만 다시 사용합니다.
+    """
+
+    QUARANTINE_SECONDS = {
+        'rate': 60,       # 분당 요청 제한
+        'quota': 3600,    # 일일/결제 할당량 소진
+        'auth': 86400,    # 잘못된 키, 권한 없음
+    }
+
+    def __init__(self, provider):
+        self.provider = provider
+        self._lock = threading.Lock()
+        self.keys = []         # [{'key', 'weight', 'current'}]
+        self.quarantine = {}   # {key: (해제 시각, 사유)}
+        self.clients = {}      # {(key, 변형): 클라이언트}
+
+    @staticmethod
+    def mask(api_key):
+        return f"{api_key[:4]}…{api_key[-4:]}" if len(api_key) > 10 else "****"
+
+    def configure(self, entries):
+        """키 목록 갱신 [(key, weight)] - 기존 가중치 진행 상태와 격리 정보는 유지"""
+        with self._lock:
+            if [(k['key'], k['weight']) for k in self.keys] == list(entries):
+                return
+            previous = {k['key']: k['current'] for k in self.keys}
+            self.keys = [{'key': key, 'weight': weight, 'current': previous.get(key, 0)} for key, weight in entries]
+            active = {key for key, _ in entries}
+            self.clients = {cache_key: client for cache_key, client in self.clients.items() if cache_key[0] in active}
+
+    def _available(self, now, exclude, is_usable):
+        candidates = []
+        for entry in self.keys:
+            key = entry['key']
+            if key in exclude or (is_usable and not is_usable(key)):
+                continue
+            until, _ = self.quarantine.get(key, (0, None))
+            if until <= now:
+                candidates.append(entry)
+        return candidates
+
+    def select(self, exclude=(), is_usable=None):
+        """다음 사용할 키 (smooth weighted round-robin) - 사용 가능한 키가 없으면 None"""
+        with self._lock:
+            now = time.time()
+            candidates = self._available(now, exclude, is_usable)
+            if not candidates:
+                # 분당 제한으로만 격리된 키는 가장 먼저 풀리는 키를 대신 사용
+                rate_limited = [(until, key) for key, (until, reason) in self.quarantine.items()
+                                if reason == 'rate' and key not in exclude and any(k['key'] == key for k in self.keys)]
+                return min(rate_limited)[1] if rate_limited else None
+
+            total = sum(entry['weight'] for entry in candidates)
+            for entry in candidates:
+                entry['current'] += entry['weight']
+            chosen = max(candidates, key=lambda entry: entry['current'])
+            chosen['current'] -= total
+            return chosen['key']
+
+    def has_alternative(self, api_key, is_usable=None):
+        """해당 키 외에 즉시 사용할 수 있는 키가 있는지"""
+        with self._lock:
+            return bool(self._available(time.time(), (api_key,), is_usable))
+
+    @staticmethod
+    def classify_error(error):
+        """격리 사유 분류 ('auth' | 'quota' | 'rate' | None) - HTTP 상태 코드 우선, 코드가 없으면 메시지 문구로 판단"""
+        status = api_error_status(error)
+        error_lower = str(error).lower()
+        if status in (401, 403) or any(pattern in error_lower for pattern in (
+                'api_key_invalid', 'invalid api key', 'incorrect api key', 'permission_denied', 'permission denied')):
+            return 'auth'
+        if status in (None, 429) and any(pattern in error_lower for pattern in (
+                'insufficient_quota', 'quota_exceeded', 'exceeded your current quota', 'billing', 'per day')):
+            return 'quota'
+        if status == 429 or (status is None and any(pattern in error_lower for pattern in (
+                'resource_exhausted', 'resource has been exhausted', 'rate limit'))):
+            return 'rate'
+        return None
+
+    def report_error(self, api_key, error):
+        """오류 보고 (예외 또는 메시지) - 격리 대상이면 키를 격리하고 사유 반환"""
+        reason = self.classify_error(error)
+        if reason:
+            with self._lock:
+                self.quarantine[api_key] = (time.time() + self.QUARANTINE_SECONDS[reason], reason)
+        return reason
+
+    def report_success(self, api_key):
+        with self._lock:
+            self.quarantine.pop(api_key, None)
+
+    def get_client(self, api_key, factory, variant=None):
+        """키별 클라이언트 (최초 요청 시 factory(api_key)로 생성 후 재사용)"""
+        cache_key = (api_key, variant)
+        with self._lock:
+            client = self.clients.get(cache_key)
+        if client is None:
+            client = factory(api_key)
+            with self._lock:
+                client = self.clients.setdefault(cache_key, client)
+        return client
+
+    def snapshot(self):
+        """키별 상태 (모니터링 표시용, 키는 마스킹)"""
+        with self._lock:
+            now = time.time()
+            result = []
+            for entry in self.keys:
+                until, reason = self.quarantine.get(entry['key'], (0, None))
+                result.append({
+                    'key': self.mask(entry['key']),
+                    'weight': entry['weight'],
+                    'quarantined': until > now,
+                    'reason': reason if until > now else None,
+                    'remaining': max(0.0, until - now),
+                })
+            return result
+
+_api_key_pools = {}
+_api_key_pools_lock = threading.Lock()
+
+def get_api_key_pool(provider):
+    """프로세스 전역 제공자별 API 키 풀"""
+    with _api_key_pools_lock:
+        if provider not in _api_key_pools:
+            _api_key_pools[provider] = ApiKeyPool(provider)
+        return _api_key_pools[provider]
+
+# 모델별 토큰 단가 (USD / 1M 토큰: 입력, 출력) - global_settings.model_prices 로 재정의
+DEFAULT_MODEL_PRICES = {
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+}
+
+def estimate_api_cost(model, input_tokens, output_tokens, prices=None):
+    """토큰 수로 예상 비용(USD) 계산 - 단가를 모르는 모델은 0"""
+    price = (prices or {}).get(model) or DEFAULT_MODEL_PRICES.get(model)
+    if not price:
+        return 0.0
+    return (input_tokens * float(price[0]) + output_tokens * float(price[1])) / 1_000_000
+
+class RouteStats:
+    """단계별 모델 라우팅 통계 (route_stats.json) - 라우트(단계|제공자|모델)별 호출 수, 실패, 지연, 토큰, 비용"""
+
+    def __init__(self, stats_file=None):
+        self.stats_file = stats_file or os.path.join(get_base_path(), "route_stats.json")
+        self._lock = threading.Lock()
+        self.data = self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.stats_file):
+                with open(self.stats_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 라우팅 통계 로드 오류: {e}")
+        return {}
+
+    def save(self, key, delta):
+        """라우트 1개의 증가분만 파일에 병합 (다른 프로세스가 기록한 통계 유지)"""
+        def apply(data):
+            self._apply(data, key, delta)
+        try:
+            self.data = merge_json_file(self.stats_file, apply)
+        except Exception as e:
+            self._apply(self.data, key, delta)
+            print(f"⚠️ 라우팅 통계 저장 오류: {e}")
+
+    @staticmethod
+    def _apply(data, key, delta):
+        entry = data.get(key)
+        if entry is None:
+            entry = {'calls': 0, 'failures': 0, 'total_latency': 0.0,
+                     'input_tokens': 0, 'output_tokens': 0, 'cached_tokens': 0, 'cost_usd': 0.0}
+            data[key] = entry
+        for field, value in delta.items():
+            if field == 'last_used':
+                entry[field] = value
+            elif isinstance(value, float):
+                entry[field] = round(entry.get(field, 0.0) + value, 6)
+            else:
+                entry[field] = entry.get(field, 0) + value
+
+    def record(self, route, provider, model, latency, input_tokens=0, output_tokens=0, cost=0.0, cached_tokens=0):
+        with self._lock:
+            self.save(f"{route}|{provider}|{model}", {
+                'calls': 1,
+                'cached_tokens': int(cached_tokens or 0),
+                'total_latency': float(latency),
+                'input_tokens': int(input_tokens or 0),
+                'output_tokens': int(output_tokens or 0),
+                'cost_usd': float(cost),
+                'last_used': datetime.now().isoformat(),
+            })
+
+    def record_failure(self, route, provider, model):
+        with self._lock:
+            self.save(f"{route}|{provider}|{model}", {'failures': 1})
+
+    def summary(self):
+        """라우트별 요약 [{route, provider, model, calls, failures, avg_latency, avg_cost_usd, cached_ratio, ...}]"""
+        with self._lock:
+            rows = []
+            for key, entry in self.data.items():
+                route, provider, model = key.split("|", 2)
+                calls = entry.get('calls', 0)
+                rows.append(dict(entry, route=route, provider=provider, model=model,
+                                 avg_latency=entry.get('total_latency', 0.0) / calls if calls else 0.0,
+                                 avg_cost_usd=entry.get('cost_usd', 0.0) / calls if calls else 0.0,
+                                 cached_ratio=entry.get('cached_tokens', 0) / entry['input_tokens'] if entry.get('input_tokens') else 0.0))
+            return sorted(rows, key=lambda row: (row['route'], row['avg_latency']))
+
+_route_stats = None
+_route_stats_lock = threading.Lock()
+
+def get_route_stats():
+    """프로세스 전역 모델 라우팅 통계"""
+    global _route_stats
+    with _route_stats_lock:
+        if _route_stats is None:
+            _route_stats = RouteStats()
+        return _route_stats
+
+# 고정 프롬프트 접두부 모드: 프롬프트 파일의 {keyword} 자리에 넣는 고정 표시 (키워드는 사용자 메시지 끝으로 이동)
+STABLE_KEYWORD_PLACEHOLDER = "[키워드]"
+STABLE_PROMPT_NOTICE = f"\n\n※ 위 지침의 {STABLE_KEYWORD_PLACEHOLDER} 자리에는 사용자 메시지 마지막 줄의 키워드를 넣어 작성하세요."
+
+def build_stable_prompt(template):
+    """키워드와 무관하게 항상 같은 바이트가 되는 지침 블록 (제공자 프롬프트 캐시 적중용)"""
+    return template.replace("{keyword}", STABLE_KEYWORD_PLACEHOLDER) + STABLE_PROMPT_NOTICE
+
+# Gemini 명시적 컨텍스트 캐시 {(모델, 지침 해시): (캐시된 모델, 만료 시각)}
+_gemini_context_caches = {}
+_gemini_context_caches_lock = threading.Lock()
+
+class AIResponse(str):
+    """AI 응답 텍스트 + 메타데이터 (출력 토큰 수, max_tokens에서 잘렸는지)
+
+    일반 문자열처럼 쓰이며 strip() 등 문자열 연산 후에는 메타데이터 없는 str이 됩니다.
+    """
+
+    def __new__(cls, text, output_tokens=0, truncated=False):
+        obj = super().__new__(cls, text)
+        obj.output_tokens = int(output_tokens or 0)
+        obj.truncated = bool(truncated)
+        return obj
+
+def route_prompt_key(route):
+    """라우트 키 → 출력 길이 통계 키 (프롬프트 파일 이름)"""
+    match = re.match(r'^(revenue|approval)_(\d+)$', route or "")
+    if match:
+        return f"prompt{match.group(2)}.txt" if match.group(1) == "revenue" else f"approval{match.group(2)}.txt"
+    return route or "default"
+
+class OutputLengthStats:
+    """프롬프트별 출력 토큰 수 분포와 잘림 비율 (output_lengths.json)
+
+    최근 출력 길이의 높은 백분위 + 여유분으로 max_tokens를 정하고, 잘림 비율이 목표를 넘으면
+    여유분을 늘립니다.
+    """
+
+    WINDOW = 200
+
+    def __init__(self, stats_file=None):
+        self.stats_file = stats_file or os.path.join(get_base_path(), "output_lengths.json")
+        self._lock = threading.Lock()
+        self.data = self.load()  # {key: {'tokens': [...], 'truncated': [0/1, ...]}}
+
+    def load(self):
+        try:
+            if os.path.exists(self.stats_file):
+                with open(self.stats_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 출력 길이 통계 로드 오류: {e}")
+        return {}
+
+    def _append(self, data, key, output_tokens, truncated):
+        entry = data.setdefault(key, {'tokens': [], 'truncated': []})
+        entry['tokens'] = (entry['tokens'] + [int(output_tokens)])[-self.WINDOW:]
+        entry['truncated'] = (entry['truncated'] + [1 if truncated else 0])[-self.WINDOW:]
+
+    def record(self, key, output_tokens, truncated):
+        """표본 1개를 파일에 병합 저장 (다른 프로세스가 기록한 표본 유지)"""
+        with self._lock:
+            try:
+                self.data = merge_json_file(
+                    self.stats_file, lambda data: self._append(data, key, output_tokens, truncated), indent=None)
+            except Exception as e:
+                self._append(self.data, key, output_tokens, truncated)
+                print(f"⚠️ 출력 길이 통계 저장 오류: {e}")
+
+    def truncation_rate(self, key):
+        with self._lock:
+            flags = self.data.get(key, {}).get('truncated', [])
+            return sum(flags) / len(flags) if flags else 0.0
+
+    def suggest_max_tokens(self, key, default, percentile=95, headroom=1.25, min_samples=20,
+                           ceiling=4096, target_truncation_rate=0.02, floor=64):
+        """관측된 출력 길이 기반 max_tokens (표본이 부족하면 default)"""
+        with self._lock:
+            entry = self.data.get(key, {})
+            tokens = sorted(entry.get('tokens', []))
+            flags = entry.get('truncated', [])
+        if len(tokens) < min_samples:
+            return default
+
+        rank = min(len(tokens) - 1, max(0, int(round(percentile / 100.0 * len(tokens))) - 1))
+        rate = sum(flags) / len(flags) if flags else 0.0
+        # 잘림 비율이 목표를 넘은 만큼 여유분 확대
+        headroom *= 1 + max(0.0, rate - target_truncation_rate) * 5
+        return int(min(ceiling, max(floor, tokens[rank] * headroom)))
+
+_output_length_stats = None
+_output_length_stats_lock = threading.Lock()
+
+def get_output_length_stats():
+    """프로세스 전역 출력 길이 통계"""
+    global _output_length_stats
+    with _output_length_stats_lock:
+        if _output_length_stats is None:
+            _output_length_stats = OutputLengthStats()
+        return _output_length_stats
+
+def site_keyword_filename(site, keyword):
+    """사이트+키워드 저장 파일 이름 (초안/체크포인트 공용)"""
+    import hashlib
+    site_key = str(site.get('id') or site.get('url') or site.get('name') or 'site')
+    safe_site = "".join(c for c in site_key if c.isalnum() or c in ('-', '_')) or "site"
+    digest = hashlib.sha1(f"{site.get('url', '')}|{keyword}".encode('utf-8')).hexdigest()[:12]
+    return f"{safe_site}_{digest}.json"
+
+class DraftStore:
+    """발행 실패 글 초안 저장소 (drafts/*.json) - 사이트+키워드별 완성 글/썸네일/생성 정보
+
+    워드프레스 업로드가 실패해도 다음 시도에서 AI 재생성 없이 초안으로 바로 업로드합니다.
+    """
+
+    def __init__(self, drafts_dir=None):
+        self.drafts_dir = drafts_dir or os.path.join(get_base_path(), "drafts")
+        self._lock = threading.Lock()
+
+    def _path(self, site, keyword):
+        return os.path.join(self.drafts_dir, site_keyword_filename(site, keyword))
+
+    def save(self, site, keyword, title, content, thumbnail_path=None, **metadata):
+        """초안 저장 (같은 사이트+키워드 초안은 덮어씀)"""
+        draft = {
+            'site_id': site.get('id'),
+            'site_name': site.get('name', ''),
+            'site_url': site.get('url', ''),
+            'keyword': keyword,
+            'title': title,
+            'content': content,
+            'thumbnail_path': thumbnail_path,
+            'created_at': datetime.now().isoformat(),
+            'attempts': 0,
+            'last_error': None,
+            'metadata': metadata,
+        }
+        with self._lock:
+            try:
+                os.makedirs(self.drafts_dir, exist_ok=True)
+                path = self._path(site, keyword)
+                with open(path + ".tmp", 'w', encoding='utf-8') as f:
+                    json.dump(draft, f, ensure_ascii=False, indent=2)
+                os.replace(path + ".tmp", path)
+            except Exception as e:
+                print(f"⚠️ 초안 저장 오류: {e}")
+        return draft
+
+    def load(self, site, keyword, max_age_hours=72, max_attempts=5):
+        """유효한 초안 반환 - 없거나 만료/재시도 초과면 삭제 후 None"""
+        path = self._path(site, keyword)
+        with self._lock:
+            try:
+                if not os.path.exists(path):
+                    return None
+                with open(path, 'r', encoding='utf-8') as f:
+                    draft = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 초안 로드 오류: {e}")
+                return None
+            try:
+                created_at = datetime.fromisoformat(draft['created_at'])
+            except (KeyError, TypeError, ValueError):
+                created_at = None  # 생성 시각이 없거나 잘못된 초안(이전 버전/부분 기록)은 만료로 처리
+
+        if created_at is None:
+            reason = "생성 시각 손상"
+        elif datetime.now() - created_at > timedelta(hours=max_age_hours):
+            reason = "만료"
+        elif draft.get('keyword') != keyword:
+            reason = "키워드 불일치"
+        elif draft.get('attempts', 0) >= max_attempts:
+            reason = "재시도 한도 초과"
+        else:
+            return draft
+        print(f"🗑️ 초안 폐기 ({reason}): {draft.get('site_name')} - {keyword}")
+        self.delete(site, keyword)
+        return None
+
+    def record_failure(self, site, keyword, error):
+        """업로드 실패 기록 (시도 횟수 증가)"""
+        path = self._path(site, keyword)
+        with self._lock:
+            try:
+                if not os.path.exists(path):
+                    return
+                with open(path, 'r', encoding='utf-8') as f:
+                    draft = json.load(f)
+                draft['attempts'] = draft.get('attempts', 0) + 1
+                draft['last_error'] = str(error)
+                draft['last_attempt_at'] = datetime.now().isoformat()
+                with open(path + ".tmp", 'w', encoding='utf-8') as f:
+                    json.dump(draft, f, ensure_ascii=False, indent=2)
+                os.replace(path + ".tmp", path)
+            except Exception as e:
+                print(f"⚠️ 초안 실패 기록 오류: {e}")
+
+    def delete(self, site, keyword):
+        with self._lock:
+            try:
+                path = self._path(site, keyword)
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception as e:
+                print(f"⚠️ 초안 삭제 오류: {e}")
+
+_draft_store = None
+_draft_store_lock = threading.Lock()
+
+def get_draft_store():
+    """프로세스 전역 초안 저장소"""
+    global _draft_store
+    with _draft_store_lock:
+        if _draft_store is None:
+            _draft_store = DraftStore()
+        return _draft_store
+
+class StepCheckpointStore:
+    """생성 단계별 체크포인트 (checkpoints/*.json) - 완료된 단계의 정리된 출력 저장
+
+    앱이 중간에 종료돼도 재시작 시 같은 키워드의 첫 미완료 단계부터 이어서 생성합니다.
+    """
+
+    def __init__(self, checkpoints_dir=None):
+        self.checkpoints_dir = checkpoints_dir or os.path.join(get_base_path(), "checkpoints")
+        self._lock = threading.Lock()
+
+    def _path(self, site, keyword):
+        return os.path.join(self.checkpoints_dir, site_keyword_filename(site, keyword))
+
+    def _read(self, path):
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load(self, site, keyword, content_type, max_age_hours=72):
+        """완료 단계 {단계 번호(str): {'content', 'title'}} - 없거나 만료/다른 모드면 {}"""
+        path = self._path(site, keyword)
+        with self._lock:
+            try:
+                checkpoint = self._read(path)
+            except Exception as e:
+                print(f"⚠️ 체크포인트 로드 오류: {e}")
+                return {}
+        if not checkpoint:
+            return {}
+        try:
+            updated_at = datetime.fromisoformat(checkpoint['updated_at'])
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"⚠️ 체크포인트 손상 (삭제): {e}")
+            self.clear(site, keyword)
+            return {}
+        if (checkpoint.get('keyword') != keyword or checkpoint.get('content_type') != content_type
+                or datetime.now() - updated_at > timedelta(hours=max_age_hours)):
+            self.clear(site, keyword)
+            return {}
+        return checkpoint.get('steps', {})
+
+    def save_step(self, site, keyword, content_type, step_num, content, title=None):
+        """완료 단계 출력 저장"""
+        path = self._path(site, keyword)
+        with self._lock:
+            try:
+                checkpoint = self._read(path)
+                if not checkpoint or checkpoint.get('content_type') != content_type:
+                    checkpoint = {'site_name': site.get('name', ''), 'site_url': site.get('url', ''),
+                                  'keyword': keyword, 'content_type': content_type, 'steps': {}}
+                checkpoint['steps'][str(step_num)] = {'content': content, 'title': title}
+                checkpoint['updated_at'] = datetime.now().isoformat()
+                os.makedirs(self.checkpoints_dir, exist_ok=True)
+                with open(path + ".tmp", 'w', encoding='utf-8') as f:
+                    json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+                os.replace(path + ".tmp", path)
+            except Exception as e:
+                print(f"⚠️ 체크포인트 저장 오류: {e}")
+
+    def clear(self, site, keyword):
+        with self._lock:
+            try:
+                path = self._path(site, keyword)
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception as e:
+                print(f"⚠️ 체크포인트 삭제 오류: {e}")
+
+_checkpoint_store = None
+_checkpoint_store_lock = threading.Lock()
+
+def get_checkpoint_store():
+    """프로세스 전역 단계 체크포인트 저장소"""
+    global _checkpoint_store
+    with _checkpoint_store_lock:
+        if _checkpoint_store is None:
+            _checkpoint_store = StepCheckpointStore()
+        return _checkpoint_store
+
+class ArticleArchive:
+    """오프라인 생성 글 보관소 (archive/<사이트>/<항목>/) - 발행 없이 생성만 한 글
+
+    항목마다 article.json(제목/본문/메타데이터/상태), article.html(미리보기), 썸네일 사본을 저장하며
+    발행 단계(PostingEngine.publish_archive)가 status='ready' 항목을 꺼내 업로드합니다.
+    """
+
+    def __init__(self, archive_dir=None):
+        self.archive_dir = archive_dir or os.path.join(get_base_path(), "archive")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _safe_name(value):
+        return "".join(c for c in str(value) if c.isalnum() or c in ('-', '_', '.')).rstrip() or "site"
+
+    def add(self, site, keyword, title, content, thumbnail_path=None, **metadata):
+        """생성 글 보관 - 항목 경로 반환"""
+        import hashlib
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        digest = hashlib.sha1(f"{site.get('url', '')}|{keyword}".encode('utf-8')).hexdigest()[:8]
+        entry_dir = os.path.join(self.archive_dir, self._safe_name(site.get('id') or site.get('name')),
+                                 f"{stamp}_{digest}")
+        os.makedirs(entry_dir, exist_ok=True)
+
+        thumbnail_name = None
+        if thumbnail_path and os.path.exists(thumbnail_path):
+            thumbnail_name = "thumbnail" + os.path.splitext(thumbnail_path)[1]
+            shutil.copy2(thumbnail_path, os.path.join(entry_dir, thumbnail_name))
+
+        with open(os.path.join(entry_dir, "article.html"), 'w', encoding='utf-8') as f:
+            f.write(f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+</head>
+<body>
+    <h1>{title}</h1>
+    {content}
+</body>
+</html>""")
+
+        article = {
+            'site_id': site.get('id'),
+            'site_name': site.get('name', ''),
+            'site_url': site.get('url', ''),
+            'keyword': keyword,
+            'title': title,
+            'content': content,
+            'thumbnail': thumbnail_name,
+            'created_at': datetime.now().isoformat(),
+            'status': 'ready',
+            'metadata': metadata,
+        }
+        self._write(entry_dir, article)
+        return entry_dir
+
+    def _write(self, entry_dir, article):
+        path = os.path.join(entry_dir, "article.json")
+        with self._lock:
+            with open(path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(article, f, ensure_ascii=False, indent=2)
+            os.replace(path + ".tmp", path)
+
+    def list_ready(self, site_id=None):
+        """발행 대기 항목 [(항목 경로, article)] - 생성 순"""
+        entries = []
+        if not os.path.isdir(self.archive_dir):
+            return entries
+        for site_dir in sorted(os.listdir(self.archive_dir)):
+            site_path = os.path.join(self.archive_dir, site_dir)
+            if not os.path.isdir(site_path):
+                continue
+            for entry in sorted(os.listdir(site_path)):
+                path = os.path.join(site_path, entry, "article.json")
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        article = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if article.get('status') != 'ready':
+                    continue
+                if site_id is not None and str(article.get('site_id')) != str(site_id):
+                    continue
+                entries.append((os.path.dirname(path), article))
+        entries.sort(key=lambda item: item[1].get('created_at', ''))
+        return entries
+
+    def ready_keywords(self, site_id):
+        """사이트의 발행 대기 키워드 (같은 키워드 재생성 방지용)"""
+        return {article.get('keyword') for _, article in self.list_ready(site_id)}
+
+    def thumbnail_path(self, entry_dir, article):
+        if not article.get('thumbnail'):
+            return None
+        path = os.path.join(entry_dir, article['thumbnail'])
+        return path if os.path.exists(path) else None
+
+    def mark(self, entry_dir, article, status, **fields):
+        """항목 상태 변경 (published/failed)"""
+        article = dict(article, status=status, updated_at=datetime.now().isoformat(), **fields)
+        self._write(entry_dir, article)
+        return article
+
+_article_archive = None
+_article_archive_lock = threading.Lock()
+
+def get_article_archive():
+    """프로세스 전역 오프라인 생성 글 보관소"""
+    global _article_archive
+    with _article_archive_lock:
+        if _article_archive is None:
+            _article_archive = ArticleArchive()
+        return _article_archive
+
+def parse_wait_seconds(value, default=50):
+    """포스팅 간격 문자열("47~50", "47-50", "50") 중 이번 대기 시간(초)"""
+    try:
+        value = str(value).strip()
+        if "~" in value or "-" in value:
+            separator = "~" if "~" in value else "-"
+            min_time, max_time = map(int, value.split(separator))
+            return random.randint(min_time, max_time)
+        return int(value) if value.isdigit() else default
+    except ValueError:
+        return default
+
+class SiteSchedule:
+    """사이트별 발행 일정 - 간격(wait_time), 일일 한도(daily_limit), 허용 시간대(posting_hours), 시간대(timezone)
+
+    사이트 항목에 값이 없으면 global_settings["site_schedule"]의 기본값을 사용합니다.
+    posting_hours는 "9-23"처럼 [시작, 종료) 시각이며 "22-6"처럼 자정을 넘겨도 됩니다.
+    """
+
+    def __init__(self, site, defaults=None, default_wait_time="47~50"):
+        defaults = defaults or {}
+        self.wait_time = site.get('wait_time') or default_wait_time
+        self.daily_limit = int(site.get('daily_limit', defaults.get('daily_limit', 0)) or 0)
+        self.hours = self._parse_hours(site.get('posting_hours', defaults.get('posting_hours', '')))
+        self.tz = self._load_timezone(site.get('timezone', defaults.get('timezone', '')))
+
+    @staticmethod
+    def _parse_hours(value):
+        try:
+            start, end = (int(part) for part in str(value).split('-'))
+            if 0 <= start <= 23 and 0 <= end <= 24 and start != end:
+                return start, end
+        except ValueError:
+            pass
+        return None
+
+    @staticmethod
+    def _load_timezone(name):
+        if not name:
+            return None
+        try:
+            from zoneinfo import ZoneInfo
+            return ZoneInfo(name)
+        except Exception as e:
+            print(f"⚠️ 알 수 없는 시간대 '{name}' - 로컬 시간 사용: {e}")
+            return None
+
+    def interval(self):
+        return parse_wait_seconds(self.wait_time)
+
+    def in_window(self, local_dt):
+        if not self.hours:
+            return True
+        start, end = self.hours
+        if start < end:
+            return start <= local_dt.hour < end
+        return local_dt.hour >= start or local_dt.hour < end
+
+    def local_day(self, timestamp):
+        return datetime.fromtimestamp(timestamp, self.tz).date().isoformat()
+
+    def next_run_at(self, timestamp, state=None):
+        """timestamp 이후 첫 발행 가능 시각(epoch) - 허용 시간대와 일일 한도 반영"""
+        state = state or {}
+        local = datetime.fromtimestamp(timestamp, self.tz)
+        for _ in range(31):
+            count = state.get('count', 0) if state.get('day') == local.date().isoformat() else 0
+            if self.daily_limit and count >= self.daily_limit:
+                local = (local + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+                continue
+            if not self.in_window(local):
+                candidate = local.replace(hour=self.hours[0], minute=0, second=0, microsecond=0)
+                if candidate <= local:
+                    candidate += timedelta(days=1)
+                local = candidate
+                continue
+            return local.timestamp()
+        return timestamp
+
+    def record_run(self, state, timestamp):
+        """발행 1회 기록 - 사이트 시간대 기준 날짜별 카운트"""
+        day = self.local_day(timestamp)
+        count = state.get('count', 0) + 1 if state.get('day') == day else 1
+        return dict(state, day=day, count=count, last_run_at=timestamp)
+
+def plan_publish_slots(count, after, posts_per_day=10, start_hour=8, end_hour=23, jitter_minutes=0):
+    """예약 발행 시각 목록 - 하루 발행 구간(start_hour~end_hour)을 posts_per_day개로 나눈 슬롯 중 after 이후 슬롯
+
+    Returns:
+        list[datetime]: 오름차순 로컬 시각 count개
+    """
+    posts_per_day = max(1, int(posts_per_day))
+    window = max(1, int(end_hour) - int(start_hour)) * 3600
+    interval = window / posts_per_day
+    jitter = min(int(jitter_minutes) * 60, interval / 3)
+
+    slots = []
+    day = after.replace(hour=0, minute=0, second=0, microsecond=0)
+    while len(slots) < count:
+        day_start = day + timedelta(hours=int(start_hour))
+        for i in range(posts_per_day):
+            slot = day_start + timedelta(seconds=interval * (i + 0.5) + random.uniform(-jitter, jitter))
+            if slot > after and len(slots) < count:
+                slots.append(slot.replace(microsecond=0))
+        day += timedelta(days=1)
+    return slots
+
+CRASH_LOG_LIMIT = 200
+
+def record_crash(cause, trace, uptime=0.0):
+    """엔진 오류 원인을 crash_log.jsonl에 한 줄씩 기록 (최근 CRASH_LOG_LIMIT건만 유지)"""
+    try:
+        path = os.path.join(get_base_path(), "crash_log.jsonl")
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "pid": os.getpid(),
+            "uptime": round(uptime, 1),
+            "cause": cause,
+            "traceback": trace,
+        }
+        lines = []
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()[-(CRASH_LOG_LIMIT - 1):]
+        lines.append(json.dumps(entry, ensure_ascii=False))
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+        log_to_file(f"[CRASH] {cause}\n{trace}")
+    except Exception as e:
+        print(f"[ERROR] 오류 기록 실패: {e}")
+
+class ConfigSnapshot:
+    """설정 스냅샷 - 버전 번호 + 설정 사본 (ConfigManager는 발행한 스냅샷을 절대 수정하지 않음)"""
+
+    __slots__ = ("version", "data")
+
+    def __init__(self, version, data):
+        self.version = version
+        self.data = data
+
+class ConfigView:
+    """작업 스레드용 설정 뷰 - 고정된 스냅샷을 읽고 안전 지점(refresh)에서만 새 버전으로 교체
+
+    설정값 조회(data, SNAPSHOT_METHODS)는 스냅샷 기준이라 GUI가 설정을 바꾸는 중에도 읽기가 찢어지지 않고,
+    포스팅 상태 저장/키워드 파일 등 나머지 기능은 ConfigManager에 그대로 위임합니다.
+    """
+
+    SNAPSHOT_METHODS = ("get_api_keys", "get_model_route", "get_rate_limit")
+
+    def __init__(self, manager):
+        self._manager = manager
+        self._snapshot = manager.snapshot()
+
+    @property
+    def data(self):
+        return self._snapshot.data
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    def refresh(self):
+        """최신 스냅샷으로 교체 - 버전이 바뀌었으면 True"""
+        latest = self._manager.snapshot()
+        changed = latest.version != self._snapshot.version
+        self._snapshot = latest
+        return changed
+
+    def __getattr__(self, name):
+        if name in self.SNAPSHOT_METHODS:
+            import types
+            return types.MethodType(getattr(type(self._manager), name), self)
+        return getattr(self._manager, name)
+
+class SiteLeaseStore:
+    """사이트 임대(lease) 저장소 (leases.db, SQLite) - 여러 프로세스/머신이 사이트를 나눠 맡도록 조정
+
+    워커는 사이트를 처리하기 전에 임대를 획득하고 하트비트로 만료 시각을 연장합니다.
+    워커가 죽어 하트비트가 끊기면 lease_ttl 후 만료되어 다른 워커가 이어받습니다.
+    여러 머신에서 공유할 때는 lease_db를 공용 경로로 지정합니다 (머신 간 시계가 맞아야 함).
+    """
+
+    def __init__(self, db_path=None):
+        import sqlite3
+
+        self.db_path = db_path or os.path.join(get_base_path(), "leases.db")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS leases (
+                site_id TEXT PRIMARY KEY, owner TEXT, expires_at REAL, heartbeat_at REAL
+            );
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def make_owner_id():
+        """워커 식별자 - 호스트:PID:임의값"""
+        import socket
+        import uuid
+        return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+    def acquire(self, site_id, owner, ttl=120):
+        """임대 획득/연장 - 비어 있거나 만료됐거나 이미 내 것이면 True"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO leases (site_id, owner, expires_at, heartbeat_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(site_id) DO UPDATE SET
+                    owner = excluded.owner, expires_at = excluded.expires_at, heartbeat_at = excluded.heartbeat_at
+                WHERE leases.owner = excluded.owner OR leases.expires_at < ?
+            """, (str(site_id), owner, now + ttl, now, now))
+            self._conn.commit()
+            row = self._conn.execute("SELECT owner FROM leases WHERE site_id = ?", (str(site_id),)).fetchone()
+        return bool(row) and row[0] == owner
+
+    def renew(self, owner, ttl=120):
+        """내 임대 전체 연장 (하트비트) - 아직 보유 중인 사이트 ID 집합 반환"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE leases SET expires_at = ?, heartbeat_at = ? WHERE owner = ? AND expires_at >= ?",
+                               (now + ttl, now, owner, now))
+            self._conn.commit()
+            rows = self._conn.execute("SELECT site_id FROM leases WHERE owner = ? AND expires_at >= ?",
+                                      (owner, now)).fetchall()
+        return {row[0] for row in rows}
+
+    def release(self, owner, site_id=None):
+        """임대 반납 (site_id가 없으면 전체)"""
+        with self._lock:
+            if site_id is None:
+                self._conn.execute("DELETE FROM leases WHERE owner = ?", (owner,))
+            else:
+                self._conn.execute("DELETE FROM leases WHERE owner = ? AND site_id = ?", (owner, str(site_id)))
+            self._conn.commit()
+
+    def snapshot(self):
+        """현재 임대 현황 [{site_id, owner, expires_in}]"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute("SELECT site_id, owner, expires_at FROM leases ORDER BY site_id").fetchall()
+        return [{'site_id': r[0], 'owner': r[1], 'expires_in': round(r[2] - now, 1)} for r in rows]
+
+class ConfigManager:
+    """단일 JSON 구조 설정 관리 클래스 (setting.json)"""
+
+    # 분산 실행 시 사이트별로 나눠 쓰는 상태 키 - 저장 시 다른 워커의 항목을 덮어쓰지 않도록 병합
+    # (posting_state는 "sites" 하위 맵이 사이트별 상태)
+    SHARED_STATE_KEYS = ("site_schedule_state", "publish_ahead_state")
+    # 설정이 아닌 진행 기록 키 - 바뀌어도 스냅샷 버전을 올리지 않음 (작업 스레드는 ConfigManager 메서드로 직접 읽음)
+    STATE_KEYS = SHARED_STATE_KEYS + ("posting_state",)
+
+    def __init__(self):
+        self.setting_file = os.path.join(get_base_path(), "setting.json")
+        self.data = self.load_setting()
+        self.shared = False  # 분산 실행 모드 (enable_shared_mode)
+        # 마지막 저장 이후 이 프로세스가 바꾼 항목 (분산 실행 병합 시 이 항목만 덮어씀)
+        self._touched_state = {key: set() for key in self.STATE_KEYS}
+        self._touched_keys = set()
+        # 작업 스레드가 읽는 버전별 스냅샷 - 저장할 때마다 새 버전 발행
+        self._lock = threading.RLock()
+        self._snapshot = ConfigSnapshot(0, copy.deepcopy(self.data))
+
+    def snapshot(self):
+        """현재 설정 스냅샷 (ConfigSnapshot) - 발행 후 변경되지 않으므로 잠금 없이 읽어도 안전"""
+        return self._snapshot
+
+    def _publish_snapshot(self):
+        with self._lock:
+            self._snapshot = ConfigSnapshot(self._snapshot.version + 1, copy.deepcopy(self.data))
+
+    def update(self, mutator, state_key=None):
+        """copy-on-write 설정 변경 - 사본을 mutator(data)로 수정해 통째로 교체한 뒤 저장
+
+        기존 data/스냅샷을 읽던 쪽은 변경 도중의 값을 보지 않습니다.
+        state_key(STATE_KEYS 중 하나)를 지정하면 진행 기록 변경으로 보고 그 키만 복사하며,
+        설정 변경이 아니므로 새 스냅샷 버전을 발행하지 않습니다 (변경 사이트는 호출부가 _touched_state에 기록).
+
+        Returns:
+            mutator의 반환값 (None이면 저장 성공 여부)
+        """
+        with self._lock:
+            if state_key:
+                new_data = dict(self.data)
+                new_data[state_key] = copy.deepcopy(self.data.get(state_key, {}))
+                result = mutator(new_data)
+                self.data = new_data
+                saved = self._write_setting()
+            else:
+                new_data = copy.deepcopy(self.data)
+                result = mutator(new_data)
+                self._touched_keys.update(key for key in set(new_data) | set(self.data)
+                                          if new_data.get(key) != self.data.get(key))
+                self.data = new_data
+                saved = self.save_setting()
+            return saved if result is None else result
+
+    # property 완전 제거 - 직접 접근 방식
+    
+    def load_setting(self):
+        """단일 JSON 파일에서 모든 설정 로드"""
+        default_data = {
+            "api_keys": {
+                "openai": "",
+                "gemini": ""
+            },
+            # 추가 API 키 (키 문자열 또는 {"key": ..., "weight": ...}) - api_keys의 기본 키와 함께 순환 사용
+            "api_key_pools": {
+                "openai": [],
+                "gemini": []
+            },
+            "global_settings": {
+                "default_ai": "gemini",
+                "default_wait_time": "47~50",
+                "posting_mode": "수익용",
+                "ai_model": "gemini-2.5-flash-lite",
+                "common_username": "",
+                "common_password": "",
+                "font_path": "fonts/timon.ttf",
+                "max_sites": 20,
+                "auto_save": True,
+                "duplicate_check": True,
+                "duplicate_threshold": 0.7,
+                "duplicate_title_threshold": 0.9,
+                "duplicate_action": "regenerate",
+                "duplicate_max_retries": 1,
+                "api_max_retries": 3,
+                "api_retry_base_delay": 2.0,
+                "api_retry_max_delay": 30.0,
+                "api_request_timeout": 60,
+                "draft_expiry_hours": 72,
+                "draft_max_attempts": 5,
+                "stable_prompt_prefix": False,
+                "gemini_context_cache": False,
+                "gemini_context_cache_ttl": 3600,
+                "adaptive_max_tokens": {
+                    "enabled": True,
+                    "percentile": 95,
+                    "headroom": 1.25,
+                    "min_samples": 20,
+                    "ceiling": 4096,
+                    "target_truncation_rate": 0.02,
+                    "truncation_retries": 1
+                },
+                # 단계별 모델 라우팅 (예: "title": {"provider": "gemini", "model": "gemini-2.5-flash-lite", "max_tokens": 100})
+                "model_routes": {},
+                "model_prices": {},
+                "hedging": {
+                    "enabled": False,
+                    "percentile": 90,
+                    "min_samples": 10,
+                    "min_delay": 3.0,
+                    "budget_ratio": 0.1
+                },
+                # 분산 실행 - 여러 프로세스/머신이 사이트 임대(lease)로 사이트를 나눠 처리 (max_sites 0 = 제한 없음)
+                "shard": {
+                    "enabled": False,
+                    "lease_ttl": 120,
+                    "max_sites": 0,
+                    "lease_db": ""
+                },
+                # 오류 재시작 - 지수 백오프(backoff_base*2^n, 최대 backoff_max초), reset_after초 이상 정상 동작하면 횟수 초기화 (max_restarts 0 = 무제한)
+                "supervisor": {
+                    "max_restarts": 10,
+                    "backoff_base": 10,
+                    "backoff_max": 600,
+                    "reset_after": 600
+                },
+                # 사이트별 일정 - 사이트의 wait_time/daily_limit/posting_hours/timezone 값이 없을 때의 기본값
+                "site_schedule": {
+                    "enabled": False,
+                    "daily_limit": 0,
+                    "posting_hours": "",
+                    "timezone": ""
+                },
+                # 예약 발행 배치 - 사이트별 하루치 글을 생성해 status=future로 업로드 (발행은 워드프레스가 담당)
+                "publish_ahead": {
+                    "enabled": False,
+                    "posts_per_day": 10,
+                    "start_hour": 8,
+                    "end_hour": 23,
+                    "jitter_minutes": 10
+                },
+                # 대기 시간 동안 다음 글을 미리 생성 (사이트별 buffer_size개까지 초안으로 보관)
+                "pregeneration": {
+                    "enabled": False,
+                    "buffer_size": 1
+                },
+                "rate_limits": {
+                    "gemini": dict(DEFAULT_RATE_LIMITS["gemini"]),
+                    "openai": dict(DEFAULT_RATE_LIMITS["openai"])
+                }
+            },
+            "posting_state": {
+                "last_site_id": None,
+                "last_site_url": "",
+                "posting_in_progress": False,
+                "next_site_id": None,
+                "sites": {}
+            },
+            # 사이트 ID별 예약 발행/일정 상태 (load_setting은 기본값에 있는 키만 읽으므로 여기 선언)
+            "publish_ahead_state": {},
+            "site_schedule_state": {},
+            "version": "multi-site",
+            "sites": []
+        }
+
+        try:
+            if os.path.exists(self.setting_file):
+                with open(self.setting_file, 'r', encoding='utf-8') as f:
+                    loaded_data = json.load(f)
+                    # 기본값과 병합
+                    for key in default_data:
+                        if key in loaded_data:
+                            if isinstance(default_data[key], dict):
+                                default_data[key].update(loaded_data[key])
+                            else:
+                                default_data[key] = loaded_data[key]
+                    return default_data
+            return default_data
+        except Exception as e:
+            print(f"설정 로드 오류: {e}")
+            return default_data
+
+    def enable_shared_mode(self):
+        """분산 실행 모드 - 여러 프로세스가 setting.json을 함께 쓰므로 잠금 + 사이트별 상태 병합 저장"""
+        self.shared = True
+
+    def _merge_shared_state(self):
+        """디스크의 setting.json을 기준으로 이 프로세스가 마지막 저장 이후 바꾼 항목만 덮어써 병합
+
+        - update()로 바꾼 최상위 키만 이 프로세스 값, 나머지(sites/api_keys/global_settings 등)는 디스크 값 (GUI/다른 워커 변경 유지)
+        - 사이트별 상태(SHARED_STATE_KEYS, posting_state.sites)는 이 프로세스가 바꾼 사이트만 덮어씀
+        """
+        try:
+            with open(self.setting_file, 'r', encoding='utf-8') as f:
+                on_disk = json.load(f)
+        except (OSError, ValueError):
+            return
+        merged = dict(self.data)
+        merged.update(on_disk)
+        for key in self._touched_keys:
+            if key in self.data:
+                merged[key] = self.data[key]
+        for key in self.SHARED_STATE_KEYS:
+            if key in self._touched_keys:
+                continue
+            states = dict(on_disk.get(key, {}))
+            current = self.data.get(key, {})
+            for site_id in self._touched_state[key]:
+                if site_id in current:
+                    states[site_id] = current[site_id]
+            merged[key] = states
+
+        if "posting_state" not in self._touched_keys:
+            disk_state = on_disk.get("posting_state", {})
+            current = self.data.get("posting_state", {})
+            touched = self._touched_state["posting_state"]
+            # 마지막 사이트/다음 시작 사이트는 마지막으로 기록한 워커 기준, 사이트별 진행 상태는 병합
+            posting_state = dict(current if touched else disk_state)
+            site_states = dict(disk_state.get("sites", {}))
+            for site_id in touched:
+                if site_id in current.get("sites", {}):
+                    site_states[site_id] = current["sites"][site_id]
+            posting_state["sites"] = site_states
+            merged["posting_state"] = posting_state
+        self.data = merged
+
+    def save_setting(self):
+        """단일 JSON 파일에 모든 설정 저장 - 저장 후 새 스냅샷 버전 발행"""
+        with self._lock:
+            saved = self._write_setting()
+            self._publish_snapshot()
+            return saved
+
+    def _write_setting(self):
+        lock_path = None
+        try:
+            if self.shared:
+                lock_path = acquire_file_lock(self.setting_file)
+                self._merge_shared_state()
+            # 임시 파일에 쓴 뒤 교체 (쓰는 도중 종료돼도 설정 파일이 깨지지 않음)
+            with open(self.setting_file + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(self.setting_file + ".tmp", self.setting_file)
+            # 저장 완료 - 이후 병합은 디스크 값을 기준으로 새 변경분만 덮어씀
+            for touched in self._touched_state.values():
+                touched.clear()
+            self._touched_keys.clear()
+            return True
+        except Exception as e:
+            print(f"❌ 설정 저장 오류: {e}")
+            return False
+        finally:
+            release_file_lock(lock_path)
+
+    def load_config(self):
+        """기존 호환성을 위한 메서드 - 직접 데이터 반환"""
+        return self.data
+
+    def reload_config(self):
+        """설정 파일을 다시 로드하여 메모리 데이터 갱신"""
+        try:
+            print("🔄 설정 파일 다시 로드 중...")
+            with self._lock:
+                self.data = self.load_setting()
+                self._publish_snapshot()
+            print("✅ 설정 파일 로드 완료")
+            return True
+        except Exception as e:
+            print(f"❌ 설정 파일 다시 로드 실패: {e}")
+            return False
+
+    def save_config(self):
+        """기존 호환성을 위한 메서드"""
+        return self.save_setting()
+
+    def load_sites(self):
+        """기존 호환성을 위한 메서드 - 직접 사이트 데이터 반환"""
+        return {"sites": self.data.get("sites", [])}
+
+    def save_sites(self):
+        """기존 호환성을 위한 메서드"""
+        return self.save_setting()
+
+    def save_posting_state(self, site_id, site_url, in_progress=False, keyword=None):
+        """현재 포스팅 상태 저장 (진행 중이면 처리 중인 키워드도 기록)"""
+        with self._lock:
+            self._save_posting_state(site_id, site_url, in_progress, keyword)
+
+    def _save_posting_state(self, site_id, site_url, in_progress, keyword):
+        try:
+            # 같은 사이트를 계속 진행 중이면 기존 키워드 유지
+            previous = self.data.get("posting_state", {})
+            site_states = dict(previous.get("sites", {}))
+            previous_site = site_states.get(str(site_id), {})
+            if in_progress and keyword is None and previous_site.get("in_progress"):
+                keyword = previous_site.get("keyword")
+
+            # 포스팅이 완료된 경우(in_progress=False), 다음 사이트로 이동할 수 있도록 next_site_id 설정
+            next_site_id = None
+            if not in_progress:
+                next_site_id = self.get_next_site_id(site_id)
+                print(f"🔄 포스팅 완료: {site_id} → 다음 시작 사이트: {next_site_id}")
+            
+            site_states[str(site_id)] = {
+                "site_url": site_url,
+                "in_progress": in_progress,
+                "keyword": keyword if in_progress else None
+            }
+            posting_state = {
+                "last_site_id": site_id,
+                "last_site_url": site_url,
+                "posting_in_progress": in_progress,
+                "next_site_id": next_site_id,
+                "keyword": keyword if in_progress else None,
+                # 사이트별 진행 상태 - 분산 실행 시 워커마다 자기 사이트 항목만 병합 저장
+                "sites": site_states
+            }
+            self._touched_state["posting_state"].add(str(site_id))
+            self.update(lambda data: data.__setitem__("posting_state", posting_state), state_key="posting_state")
+        except Exception as e:
+            print(f"포스팅 상태 저장 오류: {e}")
+
+    def get_api_keys(self, provider):
+        """제공자의 전체 API 키 [(key, weight)] - 기본 키 + api_key_pools (중복/빈 값 제외)"""
+        entries = [self.data.get("api_keys", {}).get(provider, "")]
+        entries += self.data.get("api_key_pools", {}).get(provider, []) or []
+
+        keys = []
+        seen = set()
+        for entry in entries:
+            if isinstance(entry, dict):
+                key, weight = entry.get("key", ""), entry.get("weight", 1)
+            else:
+                key, weight = entry, 1
+            key = (key or "").strip()
+            if not key or key in seen or key.startswith("your_"):
+                continue
+            try:
+                weight = max(1, int(weight))
+            except (TypeError, ValueError):
+                weight = 1
+            seen.add(key)
+            keys.append((key, weight))
+        return keys
+
+    def get_model_route(self, route):
+        """단계별 모델 라우팅 설정 {'provider', 'model', 'max_tokens', 'temperature'} - 없는 항목은 호출부 기본값 사용
+
+        route 키: title, approval_title, revenue_1 ~ revenue_5, approval_1 ~ approval_N
+        """
+        entry = self.data.get("global_settings", {}).get("model_routes", {}).get(route) or {}
+        route_config = {}
+        provider = str(entry.get("provider") or "").strip().lower()
+        if provider in ("gemini", "openai", "gpt"):
+            route_config["provider"] = "openai" if provider == "gpt" else provider
+        if str(entry.get("model") or "").strip():
+            route_config["model"] = str(entry["model"]).strip()
+        try:
+            if entry.get("max_tokens") is not None:
+                route_config["max_tokens"] = max(16, int(entry["max_tokens"]))
+            if entry.get("temperature") is not None:
+                route_config["temperature"] = min(2.0, max(0.0, float(entry["temperature"])))
+        except (TypeError, ValueError):
+            print(f"⚠️ 잘못된 모델 라우팅 설정 ({route}): {entry}")
+        return route_config
+
+    def get_rate_limit(self, provider):
+        """제공자별 요청 제한 {'per_minute', 'per_day'} (global_settings.rate_limits > 기본값)"""
+        limits = dict(DEFAULT_RATE_LIMITS.get(provider, DEFAULT_RATE_LIMITS['gemini']))
+        configured = self.data.get("global_settings", {}).get("rate_limits", {}).get(provider, {})
+        for name in ('per_minute', 'per_day'):
+            try:
+                if configured.get(name) is not None:
+                    limits[name] = max(0, int(configured[name]))
+            except (TypeError, ValueError):
+                pass
+        limits['per_minute'] = max(1, limits['per_minute'])
+        return limits
+
+    def _read_shared(self, key):
+        """최상위 상태 값 - 분산 실행이면 다른 워커가 방금 저장한 값까지 보도록 setting.json에서 다시 읽음"""
+        if self.shared:
+            try:
+                with open(self.setting_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get(key, {})
+            except (OSError, ValueError):
+                pass
+        return self.data.get(key, {})
+
+    def get_site_schedule_state(self, site_id):
+        """사이트 일정 상태 {next_run_at(epoch), day, count, last_run_at}"""
+        return dict(self._read_shared("site_schedule_state").get(str(site_id), {}))
+
+    def save_site_schedule_state(self, site_id, state):
+        """사이트 일정 상태 저장 - 재시작 후에도 다음 실행 시각/일일 카운트 유지"""
+        try:
+            with self._lock:
+                self._touched_state["site_schedule_state"].add(str(site_id))
+                self.update(lambda data: data["site_schedule_state"].__setitem__(str(site_id), state),
+                            state_key="site_schedule_state")
+        except Exception as e:
+            print(f"사이트 일정 상태 저장 오류: {e}")
+
+    def get_scheduled_until(self, site_id):
+        """사이트의 마지막 예약 발행 시각 (없으면 None)"""
+        value = self._read_shared("publish_ahead_state").get(str(site_id))
+        try:
+            return datetime.fromisoformat(value) if value else None
+        except ValueError:
+            return None
+
+    def save_scheduled_until(self, site_id, publish_at):
+        """사이트의 마지막 예약 발행 시각 저장 - 다음 배치는 이 시각 이후 슬롯부터 채움"""
+        try:
+            with self._lock:
+                self._touched_state["publish_ahead_state"].add(str(site_id))
+                self.update(lambda data: data["publish_ahead_state"].__setitem__(str(site_id), publish_at.isoformat()),
+                            state_key="publish_ahead_state")
+        except Exception as e:
+            print(f"예약 발행 상태 저장 오류: {e}")
+
+    def get_posting_state(self):
+        """마지막 포스팅 상태 반환"""
+        return self.data.get("posting_state", {
+            "last_site_id": None,
+            "last_site_url": "",
+            "posting_in_progress": False,
+            "next_site_id": None
+        })
+
+    def get_next_site_id(self, current_site_id):
+        """현재 사이트 다음의 사이트 ID 반환"""
+        try:
+            sites = self.data.get("sites", [])
+            if not sites:
+                return None
+            
+            # 현재 사이트의 인덱스 찾기
+            current_index = -1
+            for i, site in enumerate(sites):
+                if site.get("id") == current_site_id:
+                    current_index = i
+                    break
+            
+            if current_index == -1:
+                # 현재 사이트를 찾지 못한 경우 첫 번째 사이트 반환
+                return sites[0].get("id") if sites else None
+            
+            # 다음 사이트 반환 (마지막 사이트면 첫 번째로)
+            next_index = (current_index + 1) % len(sites)
+            return sites[next_index].get("id")
+            
+        except Exception as e:
+            print(f"다음 사이트 ID 조회 오류: {e}")
+            return None
+
+    def get_resume_keyword(self, site_id):
+        """중단된 포스팅의 키워드 (해당 사이트가 진행 중이었을 때만)"""
+        posting_state = self._read_shared("posting_state")
+        site_state = posting_state.get("sites", {}).get(str(site_id))
+        if site_state is not None:
+            return site_state.get("keyword") if site_state.get("in_progress") else None
+        if posting_state.get("posting_in_progress") and posting_state.get("last_site_id") == site_id:
+            return posting_state.get("keyword")
+        return None
+
+    def get_start_site_id(self):
+        """시작할 사이트 ID 반환 - 마지막 상태에 따라 결정"""
+        try:
+            posting_state = self.get_posting_state()
+            
+            # 포스팅이 진행 중이었다면 같은 사이트에서 재시작 (키워드는 완료 단계 체크포인트부터 이어서)
+            if posting_state.get("posting_in_progress", False):
+                last_site_id = posting_state.get("last_site_id")
+                resume_keyword = posting_state.get("keyword")
+                print(f"🔄 포스팅 재시작: {last_site_id}에서 계속" + (f" (키워드 '{resume_keyword}')" if resume_keyword else ""))
+                return last_site_id
+            
+            # 포스팅이 완료되었다면 다음 사이트부터 시작
+            next_site_id = posting_state.get("next_site_id")
+            if next_site_id:
+                print(f"🔄 다음 사이트부터 시작: {next_site_id}")
+                return next_site_id
+            
+            # 저장된 상태가 없다면 첫 번째 사이트
+            sites = self.data.get("sites", [])
+            first_site_id = sites[0].get("id") if sites else None
+            print(f"🔄 첫 번째 사이트부터 시작: {first_site_id}")
+            return first_site_id
+            
+        except Exception as e:
+            print(f"시작 사이트 ID 조회 오류: {e}")
+            # 오류 발생 시 첫 번째 사이트 반환
+            sites = self.data.get("sites", [])
+            return sites[0].get("id") if sites else None
+
+    def add_site(self, site_data):
+        """새 사이트 추가"""
+        def add(data):
+            # sites 데이터 구조 확인 및 보정
+            if "sites" not in data:
+                print("data에 sites 키가 없음, 초기화")
+                data["sites"] = []
+
+            # 안전한 ID 생성
+            existing_ids = [site.get("id", 0) for site in data["sites"] if isinstance(site, dict)]
+            site_id = max(existing_ids) + 1 if existing_ids else 1
+
+            site_data["id"] = site_id
+            site_data["created_at"] = datetime.now().isoformat()
+            site_data["active"] = True
+            data["sites"].append(site_data)
+            return site_id
+
+        site_id = self.update(add)
+
+        # 키워드 파일과 썸네일 이미지 파일 자동 생성
+        self.create_site_resources(site_data)
+        return site_id
+
+    def create_site_resources(self, site_data):
+        """사이트별 리소스 파일 생성"""
+        try:
+            # 키워드 파일 생성
+            keyword_file = site_data.get("keyword_file", "")
+            if keyword_file:
+                keyword_path = os.path.join(get_base_path(), "keywords", keyword_file)
+                if not os.path.exists(keyword_path):
+                    # 기본 키워드 템플릿 생성
+                    default_keywords = [
+                        "# 사이트별 키워드 파일",
+                        f"# 사이트: {site_data.get('name', '')}",
+                        f"# URL: {site_data.get('url', '')}",
+                        "",
+                        "# 키워드를 한 줄에 하나씩 작성.",
+                        "# 예시:",
+                        "인공지능",
+                        "AI 뉴스",
+                        "머신러닝",
+                        "딥러닝",
+                        "기술 동향"
+                    ]
+
+                    with open(keyword_path, 'w', encoding='utf-8') as f:
+                        f.write('\n'.join(default_keywords))
+
+                    print(f"키워드 파일 생성됨: {keyword_path}")
+
+            # 썸네일 이미지 파일 확인 (존재하지 않으면 경고 메시지만)
+            thumbnail_image = site_data.get("thumbnail_image", "")
+            if thumbnail_image:
+                thumbnail_path = os.path.join(get_base_path(), "images", thumbnail_image)
+                if not os.path.exists(thumbnail_path):
+                    print(f"경고: 썸네일 이미지가 없습니다. 다음 경로에 이미지를 추가해주세요: {thumbnail_path}")
+
+        except Exception as e:
+            print(f"사이트 리소스 생성 오류: {e}")
+
+    def get_site(self, site_id):
+        """사이트 정보 조회"""
+        for site in self.data.get("sites", []):
+            if site["id"] == site_id:
+                return site
+        return None
+
+    def update_site(self, site_id, site_data):
+        """사이트 정보 업데이트"""
+        def replace(data):
+            for i, site in enumerate(data.get("sites", [])):
+                if site["id"] == site_id:
+                    site_data["id"] = site_id
+                    site_data["updated_at"] = datetime.now().isoformat()
+                    data["sites"][i] = site_data
+                    return True
+            return False
+
+        if not any(site["id"] == site_id for site in self.data.get("sites", [])):
+            return False
+        return self.update(replace)
+
+    def delete_site(self, site_id):
+        """사이트 삭제"""
+        try:
+            log_to_file(f"[MAIN] 사이트 삭제 시작 - ID: {site_id} (타입: {type(site_id)})")
+            
+            original_count = len(self.data.get("sites", []))
+            log_to_file(f"[MAIN] 삭제 전 사이트 수: {original_count}")
+            
+            # 기존 사이트들의 ID와 타입 확인
+            for i, site in enumerate(self.data["sites"]):
+                log_to_file(f"[MAIN] 사이트 {i}: ID={site['id']} (타입: {type(site['id'])}), 이름={site.get('name', 'Unknown')}")
+            
+            # 타입 통일해서 삭제 (문자열과 숫자 모두 고려) - 사본 수정 후 교체(copy-on-write) + 저장
+            def remove(data):
+                data["sites"] = [s for s in data.get("sites", []) if str(s["id"]) != str(site_id)]
+            self.update(remove)
+            
+            log_to_file(f"[MAIN] 삭제 후 사이트 수: {len(self.data['sites'])}")
+            log_to_file(f"[MAIN] 설정 파일 저장 완료")
+            
+            # 실제로 삭제되었는지 확인
+            result = len(self.data["sites"]) < original_count
+            log_to_file(f"[MAIN] 삭제 결과: {result}")
+            return result
+        except Exception as e:
+            print(f"사이트 삭제 오류: {e}")
+            log_to_file(f"[MAIN] 사이트 삭제 오류: {e}")
+            return False
+
+    def update_site_active(self, site_id, active_status):
+        """사이트 활성화 상태 업데이트"""
+        try:
+            if not any(site["id"] == site_id for site in self.data["sites"]):
+                return False
+
+            def set_active(data):
+                for site in data["sites"]:
+                    if site["id"] == site_id:
+                        site["active"] = active_status
+                        site["updated_at"] = datetime.now().isoformat()
+            self.update(set_active)
+            return True
+        except Exception as e:
+            print(f"사이트 활성화 상태 업데이트 오류: {e}")
+            return False
+
+    def get_site_keywords(self, site_data):
+        """사이트별 키워드 파일에서 키워드 로드 - used 키워드 제외"""
+        try:
+            keyword_file = site_data.get("keyword_file", "")
+            if not keyword_file:
+                return []
+
+            base_path = get_base_path()
+            keyword_path = os.path.join(base_path, "keywords", keyword_file)
+            if not os.path.exists(keyword_path):
+                print(f"❌ 키워드 파일이 존재하지 않습니다: {keyword_path}")
+                return []
+
+            # 원본 키워드 파일 읽기
+            with open(keyword_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+
+            # 주석 제거하고 빈 줄 제거
+            available_keywords = []
+            for line in lines:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    available_keywords.append(line)
+
+            # used 키워드 파일이 있다면 이미 사용된 키워드들을 확인
+            used_filename = f"used_{keyword_file}"
+            used_path = os.path.join(base_path, "keywords", used_filename)
+            used_keywords = set()
+            
+            if os.path.exists(used_path):
+                try:
+                    with open(used_path, 'r', encoding='utf-8') as f:
+                        used_lines = f.readlines()
+                    for line in used_lines:
+                        line = line.strip()
+                        if line:
+                            used_keywords.add(line)
+                except Exception as used_error:
+                    print(f"⚠️ used 파일 읽기 오류: {used_error}")
+
+            # 사용되지 않은 키워드만 반환
+            final_keywords = [keyword for keyword in available_keywords if keyword not in used_keywords]
+            
+            if not final_keywords:
+                print(f"⚠️ 사용 가능한 키워드가 없습니다. used 파일을 확인.")
+                
+            return final_keywords
+
+        except Exception as e:
+            print(f"❌ 키워드 파일 로드 오류: {e}")
+            return []
+
+    def get_site_thumbnail_path(self, site_data):
+        """사이트별 썸네일 이미지 경로 반환"""
+        thumbnail_image = site_data.get("thumbnail_image", "")
+        if thumbnail_image:
+            thumbnail_path = os.path.join(get_base_path(), "images", thumbnail_image)
+            if os.path.exists(thumbnail_path):
+                return thumbnail_path
+        return None
+
+class PostingScheduler:
+    """이벤트 기반 대기 제어 - 중지/일시정지/재개 시 Condition으로 즉시 깨어남 (1초 폴링 없음)
+
+    대기는 절대 시각(next_run_at) 기준이며, 일시정지 동안은 남은 시간이 멈췄다가 재개 시 이어집니다.
+    """
+
+    def __init__(self, on_next_run=None):
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._paused = False
+        self.next_run_at = {}  # 사이트 ID -> 다음 실행 시각(epoch)
+        self.on_next_run = on_next_run  # (epoch, 사이트 이름) - 0이면 예정 없음/일시정지
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def _announce(self, timestamp, label=""):
+        if self.on_next_run:
+            try:
+                self.on_next_run(float(timestamp), label)
+            except Exception as e:
+                print(f"[ERROR] 다음 실행 알림 실패: {e}")
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def pause(self):
+        with self._cond:
+            self._paused = True
+            self._cond.notify_all()
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def wait_if_paused(self):
+        """일시정지 중이면 재개/중지까지 대기 - 계속 진행 가능하면 True"""
+        with self._cond:
+            while self._paused and not self._stopped:
+                self._cond.wait()
+            return not self._stopped
+
+    def sleep_until(self, deadline, key=None, label=""):
+        """절대 시각까지 대기 - 중지되면 즉시 False, 일시정지 시간만큼 마감이 뒤로 밀림"""
+        if key is not None:
+            self.next_run_at[key] = deadline
+        self._announce(deadline, label)
+        with self._cond:
+            while not self._stopped:
+                if self._paused:
+                    remaining = deadline - time.time()
+                    self._announce(0)
+                    while self._paused and not self._stopped:
+                        self._cond.wait()
+                    deadline = time.time() + max(0.0, remaining)
+                    if key is not None:
+                        self.next_run_at[key] = deadline
+                    if not self._stopped:
+                        self._announce(deadline, label)
+                    continue
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        if key is not None:
+            self.next_run_at.pop(key, None)
+        self._announce(0)
+        return not self._stopped
+
+    def sleep(self, seconds, key=None, label=""):
+        return self.sleep_until(time.time() + seconds, key=key, label=label)
+
+    def wait_stopped(self, timeout):
+        """중지될 때까지 최대 timeout초 대기 (일시정지와 무관, 알림 없음) - 중지됐으면 True"""
+        with self._cond:
+            if not self._stopped:
+                self._cond.wait(timeout)
+            return self._stopped
+
+class PostingEngine:
+    """포스팅 엔진 - Qt 없이 동작하는 라운드 순회 루프
+
+    GUI(PostingWorker)와 헤드리스 실행(--headless)이 같은 엔진을 사용합니다.
+    상태 변화는 생성자에 전달된 콜백으로 알립니다.
+    """
+
+    def __init__(self, config_manager, sites_data, start_site_id="all",
+                 on_status=None, on_complete=None, on_single_complete=None,
+                 on_keyword_used=None, on_error=None, echo_console=True, publish_ahead=None,
+                 on_next_run=None, shard=None):
+        # 설정은 스냅샷 뷰로 읽고 글 사이(안전 지점)에서만 새 버전 반영
+        self.config_manager = config_manager if isinstance(config_manager, ConfigView) else ConfigView(config_manager)
+        self.sites_data = sites_data
+        self.start_site_id = start_site_id
+        self.is_running = True
+        self.is_paused = False
+        self._force_stop = False  # 강제 중지 플래그 추가
+        self.echo_console = echo_console  # 헤드리스 모드에서는 logging으로만 출력
+        self.publish_ahead = publish_ahead  # None이면 설정(publish_ahead.enabled)을 따름
+        self.on_status = on_status
+        self.on_complete = on_complete
+        self.on_single_complete = on_single_complete
+        self.on_keyword_used = on_keyword_used
+        self.on_error = on_error
+        self.scheduler = PostingScheduler(on_next_run=on_next_run)
+        # 중지 시 진행 중인 AI/HTTP 호출까지 중단시키는 취소 토큰 (ContentGenerator와 공유)
+        self.cancel_token = CancellationToken()
+        # 분산 실행 (사이트 임대) - None이면 설정(shard.enabled)을 따름
+        self.shard = shard
+        self.lease_store = None
+        self.lease_owner = None
+        self.lease_ttl = 120
+        self.max_leased_sites = 0
+        self._held_sites = set()
+        self._lease_lock = threading.Lock()  # _held_sites 보호 (하트비트 스레드/포스팅 스레드/선생성 스레드)
+        self._heartbeat_thread = None
+        # 선생성 파이프라인 상태 - (사이트, 키워드)별 생성 중 표시로 발행 단계와 중복 생성 방지
+        self._generation_cond = threading.Condition()
+        self._generating = set()
+        self._pregeneration_thread = None
+        self._pregeneration_failed = set()
+    
+    def stop(self):
+        """포스팅 중지 요청 - 진행 중인 AI/HTTP 호출도 취소 토큰으로 즉시 중단"""
+        self.is_running = False
+        self._force_stop = True
+        self.scheduler.stop()
+        self.cancel_token.cancel("포스팅 중지")
+        with self._generation_cond:
+            self._generation_cond.notify_all()
+
+    def _notify(self, callback, *args):
+        """콜백 호출 - 콜백 오류가 포스팅 루프를 멈추지 않도록 보호"""
+        if callback:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"[ERROR] 콜백 호출 실패: {e}")
+
+    def emit_status(self, message):
+        """상태 메시지 전달"""
+        self._notify(self.on_status, message)
+
+    def safe_emit_status(self, message):
+        """안전한 상태 업데이트 발송 - 터미널과 GUI 동시 출력"""
+        try:
+            # 터미널과 GUI에 동일한 메시지 출력
+            if self.echo_console:
+                print(message, flush=True)
+            self.emit_status(message)
+                
+        except Exception as e:
+            print(f"[ERROR] 신호 발송 실패: {e}")
+            sys.stdout.flush()
+    
+    def log(self, message):
+        """로그 메시지 출력 - safe_emit_status의 별칭"""
+        self.safe_emit_status(message)
+        
+    def next_wait_seconds(self):
+        """포스팅 간격(default_wait_time, 예: "47~50") 중 이번 대기 시간(초)"""
+        return parse_wait_seconds(self.config_manager.data.get("global_settings", {}).get("default_wait_time", "47~50"))
+
+    def run(self):
+        """포스팅 작업 실행 - 분산 실행이면 사이트 임대를 잡고/반납하며 supervise 실행"""
+        self.start_sharding()
+        try:
+            self.supervise()
+        finally:
+            self.stop_sharding()
+
+    def supervise(self):
+        """run_loop 감독 - 예상치 못한 오류로 끝나면 원인을 기록하고 지수 백오프 후 새 반복으로 재시작
+
+        재귀 호출 대신 반복문으로 재시작하므로 오래 실행해도 스택 깊이와 메모리가 늘지 않습니다.
+        """
+        settings = self.config_manager.data.get("global_settings", {}).get("supervisor", {})
+        max_restarts = int(settings.get("max_restarts", 10))
+        backoff_base = float(settings.get("backoff_base", 10))
+        backoff_max = float(settings.get("backoff_max", 600))
+        reset_after = float(settings.get("reset_after", 600))
+
+        restarts = 0
+        while True:
+            started_at = time.time()
+            try:
+                self.run_loop()
+                return
+            except Exception as e:
+                cause = f"{type(e).__name__}: {e}"
+                record_crash(cause, traceback.format_exc(), uptime=time.time() - started_at)
+            # 예외 객체(프레임/제너레이터 참조)는 여기서 해제 - 재시작 후에는 원인 문자열만 유지
+            print(f"❌ PostingEngine 중요 오류 발생: {cause}")
+
+            if time.time() - started_at >= reset_after:
+                restarts = 0  # 충분히 오래 정상 동작했으면 연속 오류가 아님
+            restarts += 1
+            if max_restarts and restarts > max_restarts:
+                self.safe_emit_status(f"❌ 연속 오류 {max_restarts}회 초과 - 포스팅을 종료합니다 ({cause})")
+                self._notify(self.on_error, cause)
+                return
+
+            delay = min(backoff_max, backoff_base * (2 ** (restarts - 1)))
+            limit = f"/{max_restarts}" if max_restarts else ""
+            self.safe_emit_status(f"❌ 시스템 오류 ({cause}) - {delay:.0f}초 후 재시작 ({restarts}{limit})")
+            if not self.scheduler.sleep(delay, label="재시작") or not self.is_running:
+                return
+            self.safe_emit_status("🔄 재시작 중")
+
+    def start_sharding(self):
+        """분산 실행 시작 - 임대 저장소 연결, setting.json 공유 모드, 하트비트 스레드"""
+        settings = self.config_manager.data.get("global_settings", {}).get("shard", {})
+        enabled = self.shard if self.shard is not None else settings.get("enabled")
+        if not enabled or self.lease_store:
+            return
+        self.lease_ttl = float(settings.get("lease_ttl", 120))
+        self.max_leased_sites = int(settings.get("max_sites", 0))
+        self.lease_store = SiteLeaseStore(settings.get("lease_db") or None)
+        self.lease_owner = SiteLeaseStore.make_owner_id()
+        self.config_manager.enable_shared_mode()
+        get_rate_limiter().enable_shared_mode()
+        self._heartbeat_thread = threading.Thread(target=self.heartbeat_loop, daemon=True)
+        self._heartbeat_thread.start()
+        self.safe_emit_status(f"🧩 분산 실행 - 워커 {self.lease_owner}, 임대 {self.lease_ttl:.0f}초")
+
+    def stop_sharding(self):
+        """보유 임대 반납 - 다른 워커가 만료를 기다리지 않고 바로 이어받음"""
+        if not self.lease_store:
+            return
+        try:
+            self.lease_store.release(self.lease_owner)
+        except Exception as e:
+            print(f"⚠️ 임대 반납 오류: {e}")
+        with self._lease_lock:
+            self._held_sites = set()
+
+    def heartbeat_loop(self):
+        """임대 하트비트 - lease_ttl/3마다 보유 임대 연장, 잃은 임대는 보유 목록에서 제거"""
+        interval = max(1.0, self.lease_ttl / 3)
+        while not self.scheduler.wait_stopped(interval):
+            try:
+                with self._lease_lock:
+                    held = self.lease_store.renew(self.lease_owner, self.lease_ttl)
+                    lost = self._held_sites - held
+                    self._held_sites = set(held)
+                if lost:
+                    self.safe_emit_status(f"⚠️ 사이트 임대 상실: {', '.join(sorted(lost))} - 다른 워커가 처리")
+            except Exception as e:
+                print(f"⚠️ 임대 하트비트 오류: {e}")
+
+    def holds_site(self, site):
+        """이 워커가 사이트를 처리해도 되는지 - 임대를 보유 중이거나 새로 획득하면 True (분산 실행이 아니면 항상 True)"""
+        if not self.lease_store:
+            return True
+        site_id = str(site.get('id'))
+        with self._lease_lock:
+            newly_held = site_id not in self._held_sites
+            if newly_held and self.max_leased_sites and len(self._held_sites) >= self.max_leased_sites:
+                return False
+            try:
+                acquired = self.lease_store.acquire(site_id, self.lease_owner, self.lease_ttl)
+            except Exception as e:
+                print(f"⚠️ 임대 획득 오류: {e}")
+                acquired = False
+            if acquired:
+                self._held_sites.add(site_id)
+            else:
+                self._held_sites.discard(site_id)
+        if acquired and newly_held:
+            self.safe_emit_status(f"🔐 {site.get('name', 'Unknown')} 임대 획득")
+        return acquired
+
+    def release_site(self, site):
+        """글 1개 처리 후 사이트 임대 반납 - 쉬는 워커가 다음 글을 가져가 부하가 고르게 재분배됨
+
+        선생성 단계가 이 사이트 글을 만드는 중이면 생성이 끝날 때까지 유지합니다.
+        """
+        if not self.lease_store:
+            return
+        site_key = site.get('id') or site.get('url')
+        with self._generation_cond:
+            if any(key[0] == site_key for key in self._generating):
+                return
+        site_id = str(site.get('id'))
+        with self._lease_lock:
+            try:
+                self.lease_store.release(self.lease_owner, site_id)
+            except Exception as e:
+                print(f"⚠️ 임대 반납 오류: {e}")
+                return
+            self._held_sites.discard(site_id)
+
+    def run_loop(self):
+        """포스팅 작업 실행 - 모든 키워드가 소진될 때까지 반복 (예상치 못한 오류는 supervise()가 기록 후 재시작)"""
+        try:
+            # 전체 라운드 카운터
+            round_count = 0
+
+            # 예약 발행 배치 모드 - 대기 없이 하루치를 생성해 워드프레스 예약 발행으로 업로드
+            publish_ahead = self.publish_ahead
+            if publish_ahead is None:
+                publish_ahead = self.config_manager.data.get("global_settings", {}).get("publish_ahead", {}).get("enabled")
+            if publish_ahead:
+                self.run_publish_ahead()
+                if self.is_running:
+                    self._notify(self.on_complete)
+                return
+
+            # 선생성 단계 시작 (발행 간 대기 시간 동안 다음 글 생성)
+            self.start_pregeneration()
+
+            # 사이트별 일정 모드 - 라운드 순회 대신 다음 실행 시각이 가장 이른 사이트부터
+            if self.config_manager.data.get("global_settings", {}).get("site_schedule", {}).get("enabled"):
+                self.run_site_schedules()
+                return
+            
+            # 시작 사이트 결정
+            start_index = 0
+            if self.start_site_id != "all":
+                # 특정 사이트부터 시작
+                for idx, site in enumerate(self.sites_data):
+                    if site.get("id") == self.start_site_id or str(idx) == str(self.start_site_id):
+                        start_index = idx
+                        self.safe_emit_status(f"▶️ {site.get('name', 'Unknown')} 시작")
+                        break
+            
+            # 무한 반복: 모든 사이트의 키워드가 소진될 때까지 계속
+            # (사이트별 오류는 아래에서 처리, 그 밖의 예상치 못한 오류는 supervise()가 기록 후 백오프 재시작)
+            while self.is_running and not self._force_stop:
+                round_count += 1
+                self.safe_emit_status(f"🔄 라운드 {round_count} 시작 - 모든 사이트 순회")
+                
+                # 강제 중지 체크
+                if self._force_stop:
+                    self.safe_emit_status("⏹️ 강제 중지")
+                    return
+                
+                # 이번 라운드에서 포스팅된 사이트 카운터 (다른 워커가 임대 중이라 건너뛴 사이트 수 별도)
+                posted_sites_count = 0
+                leased_elsewhere_count = 0
+                
+                # 시작 사이트부터 순회 (라운드 1에서만 적용)
+                sites_to_process = self.sites_data[start_index:] + self.sites_data[:start_index] if round_count == 1 else self.sites_data
+                
+                # 모든 사이트 순회
+                for i, site in enumerate(sites_to_process):
+                    if not self.is_running or self._force_stop:
+                        print("⏹️ 포스팅 중지")
+                        self.safe_emit_status("⏹️ 포스팅 중지")
+                        return
+                        
+                    # 일시정지 확인 (재개/중지 시 즉시 깨어남)
+                    if self.is_paused:
+                        print("⏸️ 일시정지")
+                        self.safe_emit_status("⏸️ 일시정지")
+                        self.scheduler.wait_if_paused()
+                        
+                    if not self.is_running:
+                        print("⏹️ 포스팅 중지")
+                        self.safe_emit_status("⏹️ 포스팅 중지")
+                        return
+                    
+                    site_name = site.get('name', 'Unknown')
+
+                    # 분산 실행: 다른 워커가 임대 중인 사이트는 건너뜀 (키워드가 남은 사이트만 대기 대상)
+                    if not self.holds_site(site):
+                        try:
+                            if self.get_live_keywords(site):
+                                leased_elsewhere_count += 1
+                        except Exception:
+                            pass
+                        continue
+
+                    self.safe_emit_status(f"📍 라운드 {round_count} - {site_name} ({i+1}/{len(self.sites_data)}) 포스팅 시작")
+                    self.safe_emit_status("=====================================================================================")
+                    
+                    # 이 사이트에 사용 가능한 키워드가 있는지 확인
+                    try:
+                        available_keywords = self.get_live_keywords(site)
+                        if not available_keywords:
+                            self.safe_emit_status(f"⚠️ {site_name}: 사용 가능한 키워드 없음 - 스킵")
+                            continue
+                    except Exception as keyword_error:
+                        self.safe_emit_status(f"❌ {site_name}: 키워드 조회 오류 - 다음 사이트로 계속")
+                        continue
+                    
+                    # 실제 포스팅 작업 수행
+                    try:
+                        try:
+                            self.process_site_posting(site)
+                        finally:
+                            self.release_site(site)
+                        posted_sites_count += 1
+                        self.safe_emit_status(f"✅ {site_name} 포스팅 완료")
+                        self.safe_emit_status("=====================================================================================")
+                    except Exception as site_error:
+                        error_msg = f"❌ {site_name}: 포스팅 오류 - {str(site_error)}"
+                        self.safe_emit_status(error_msg)
+                        continue
+                    
+                    # 사이트 간 대기 (마지막 사이트가 아닌 경우) - 다음 사이트 실행 시각까지 이벤트 대기
+                    if i < len(self.sites_data) - 1:
+                        next_site = sites_to_process[i + 1] if i + 1 < len(sites_to_process) else None
+                        next_name = next_site.get('name', '') if next_site else ''
+                        if not self.scheduler.sleep(self.next_wait_seconds(),
+                                                    key=next_site.get('id') if next_site else None,
+                                                    label=next_name):
+                            return
+                
+                # 이번 라운드 완료 후 체크
+                if posted_sites_count == 0 and leased_elsewhere_count:
+                    # 맡을 사이트가 없음 - 다른 워커의 임대가 만료되면 이어받도록 대기 후 재시도
+                    self.safe_emit_status(f"🧩 처리 가능한 사이트 없음 ({leased_elsewhere_count}개 다른 워커 임대 중) - {self.lease_ttl:.0f}초 후 재확인")
+                    if not self.scheduler.sleep(self.lease_ttl):
+                        return
+                    continue
+                if posted_sites_count == 0:
+                    # 어떤 사이트도 포스팅하지 못했으면 모든 키워드가 소진됨
+                    self.safe_emit_status("🎉 모든 사이트의 키워드가 소진되었습니다!")
+                    self.safe_emit_status(f"📊 총 {round_count}라운드 완료! 포스팅 작업 종료")
+                    break
+                else:
+                    self.safe_emit_status(f"🏁 라운드 {round_count} 완료 - {posted_sites_count}개 사이트 포스팅 성공")
+                    
+                    # 다음 라운드를 위한 일반 대기 (라운드 간에도 일반 포스팅 간격 사용)
+                    first_site = self.sites_data[0] if self.sites_data else {}
+                    if not self.scheduler.sleep(self.next_wait_seconds(), key=first_site.get('id'),
+                                                label=first_site.get('name', '')):
+                        return
+                    
+                        
+            if self.is_running:
+                self.safe_emit_status("🎉 모든 키워드 사용 완료!")
+                self._notify(self.on_complete)
+                
+        except KeyboardInterrupt:
+            print("⏹️ 사용자에 의해 중단되었습니다.")
+            self.safe_emit_status("⏹️ 사용자 중단")
+            return
+            
+    def generate_to_archive(self, sites, count=10, workers=2, keywords=None):
+        """오프라인 일괄 생성 - 발행하지 않고 archive/에 저장, 처리량 보고
+
+        Args:
+            sites: 대상 사이트 목록
+            count: 사이트별 생성 개수
+            workers: 동시 생성 수 (API 할당량은 공용 rate limiter가 조절)
+            keywords: 사이트 키워드 대신 사용할 키워드 목록 (키워드 파일 지정 시)
+
+        Returns:
+            dict: {'generated', 'failed', 'elapsed', 'per_minute'}
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        archive = get_article_archive()
+        posting_mode = self.config_manager.data["global_settings"].get("posting_mode", "수익용")
+        ai_provider = self.config_manager.data["global_settings"].get("default_ai", "gemini")
+        content_type = "approval" if posting_mode == "승인용" else "revenue"
+
+        jobs = []
+        for site in sites:
+            pending = archive.ready_keywords(site.get('id'))
+            site_keywords = keywords if keywords is not None else self.config_manager.get_site_keywords(site)
+            site_jobs = [kw for kw in site_keywords if kw not in pending][:count]
+            if len(site_jobs) < count:
+                self.safe_emit_status(f"⚠️ {site.get('name', 'Unknown')}: 생성 가능한 키워드 {len(site_jobs)}개")
+            jobs.extend((site, kw) for kw in site_jobs)
+
+        self.safe_emit_status(f"🏭 오프라인 생성 시작 - {len(jobs)}개, 동시 {workers}개")
+        started = time.time()
+        stats = {'generated': 0, 'failed': 0}
+
+        def generate(site, keyword):
+            if not self.is_running:
+                return False
+            content_generator = self.create_content_generator(site, log_prefix=f"[{keyword}] ")
+            content_generator.initialize_apis()
+            generated = self.generate_post_content(content_generator, site.get('name', 'Unknown'), keyword, content_type)
+            if not generated:
+                return False
+            title, content, thumbnail_path, post_status = generated
+            archive.add(site, keyword, title, content, thumbnail_path, post_status=post_status,
+                        content_type=content_type, ai_provider=ai_provider, posting_mode=posting_mode)
+            get_checkpoint_store().clear(site, keyword)
+            return True
+
+        with ThreadPoolExecutor(max_workers=max(1, int(workers))) as executor:
+            futures = {executor.submit(generate, site, kw): (site, kw) for site, kw in jobs}
+            for future in as_completed(futures):
+                site, keyword = futures[future]
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    self.safe_emit_status(f"❌ '{keyword}' 생성 오류: {e}")
+                    ok = False
+                stats['generated' if ok else 'failed'] += 1
+                done = stats['generated'] + stats['failed']
+                elapsed = time.time() - started
+                self.safe_emit_status(f"📦 {done}/{len(jobs)} 완료 - {site.get('name', 'Unknown')}: '{keyword}' "
+                                      f"{'보관' if ok else '실패'} ({stats['generated'] / elapsed * 60:.1f}개/분)")
+
+        stats['elapsed'] = time.time() - started
+        stats['per_minute'] = stats['generated'] / stats['elapsed'] * 60 if stats['elapsed'] else 0.0
+        self.safe_emit_status(f"🏁 오프라인 생성 완료 - 성공 {stats['generated']}개, 실패 {stats['failed']}개, "
+                              f"{stats['elapsed']:.0f}초 ({stats['per_minute']:.1f}개/분)")
+        return stats
+
+    def publish_archive(self, limit=None, wait_seconds=0):
+        """보관된 글 일괄 발행 - AI 호출 없이 업로드만 수행
+
+        Returns:
+            int: 발행 성공 개수
+        """
+        archive = get_article_archive()
+        sites_by_id = {str(site.get('id')): site for site in self.sites_data}
+        entries = [(path, article) for path, article in archive.list_ready()
+                   if str(article.get('site_id')) in sites_by_id]
+        if limit:
+            entries = entries[:int(limit)]
+        self.safe_emit_status(f"🚀 보관 글 발행 시작 - {len(entries)}개")
+
+        published = 0
+        for index, (entry_dir, article) in enumerate(entries):
+            if not self.is_running or self._force_stop:
+                break
+            site = sites_by_id[str(article.get('site_id'))]
+            keyword = article.get('keyword', '')
+            content_generator = self.create_content_generator(site)
+            result = content_generator.post_to_wordpress(
+                site, article['title'], article['content'], archive.thumbnail_path(entry_dir, article),
+                status=article.get('metadata', {}).get('post_status', 'publish'), keyword=keyword
+            )
+            if result and result.get('success'):
+                archive.mark(entry_dir, article, 'published', post_id=result.get('post_id'))
+                if keyword in self.config_manager.get_site_keywords(site):
+                    self.move_keyword_to_used(keyword, site)
+                published += 1
+                self._notify(self.on_single_complete)
+            else:
+                archive.mark(entry_dir, article, 'ready', last_error=(result or {}).get('error'))
+                self.safe_emit_status(f"❌ {site.get('name', 'Unknown')}: '{keyword}' 발행 실패 - 보관 유지")
+            if wait_seconds and index < len(entries) - 1:
+                if not self.scheduler.sleep(wait_seconds):
+                    break
+
+        self.safe_emit_status(f"🏁 보관 글 발행 완료 - {published}/{len(entries)}개")
+        return published
+
+    def run_site_schedules(self):
+        """사이트별 일정 실행 - next_run_at 기준 우선순위 큐로 가장 먼저 도래한 사이트를 처리
+
+        사이트마다 간격/일일 한도/허용 시간대가 달라도 고정 순서 없이 서로 끼워 넣어지며,
+        next_run_at과 일일 카운트는 setting.json에 저장되어 재시작 후에도 이어집니다.
+        """
+        import heapq
+
+        settings = self.config_manager.data.get("global_settings", {})
+        defaults = settings.get("site_schedule", {})
+        default_wait_time = settings.get("default_wait_time", "47~50")
+
+        queue = []
+        now = time.time()
+        for order, site in enumerate(self.sites_data):
+            schedule = SiteSchedule(site, defaults, default_wait_time)
+            state = self.config_manager.get_site_schedule_state(site.get('id'))
+            due = schedule.next_run_at(max(now, state.get('next_run_at') or now), state)
+            heapq.heappush(queue, (due, order, site, schedule))
+        self.safe_emit_status(f"🗓️ 사이트별 일정 모드 시작 - {len(queue)}개 사이트")
+
+        posted_count = 0
+        while queue and self.is_running and not self._force_stop:
+            due, order, site, schedule = heapq.heappop(queue)
+            site_id = site.get('id')
+            site_name = site.get('name', 'Unknown')
+            if due - time.time() > 1:
+                self.safe_emit_status(f"⏰ 다음 실행: {site_name} - {datetime.fromtimestamp(due).strftime('%m/%d %H:%M:%S')}")
+            if not self.scheduler.sleep_until(due, key=site_id, label=site_name):
+                return
+            if not self.scheduler.wait_if_paused():
+                return
+
+            try:
+                if not self.get_live_keywords(site):
+                    self.safe_emit_status(f"⚠️ {site_name}: 사용 가능한 키워드 없음 - 일정에서 제외")
+                    continue
+            except Exception:
+                self.safe_emit_status(f"❌ {site_name}: 키워드 조회 오류 - 일정에서 제외")
+                continue
+
+            if not self.holds_site(site):
+                # 다른 워커가 임대 중 - 임대 만료 시점에 다시 확인
+                heapq.heappush(queue, (time.time() + self.lease_ttl, order, site, schedule))
+                continue
+
+            state = self.config_manager.get_site_schedule_state(site_id)
+            if self.lease_store:
+                # 분산 실행: 다른 워커가 방금 이 사이트를 처리했으면 갱신된 다음 실행 시각까지 미룸
+                fresh_due = schedule.next_run_at(max(time.time(), state.get('next_run_at') or 0), state)
+                if fresh_due - time.time() > 1:
+                    self.release_site(site)
+                    heapq.heappush(queue, (fresh_due, order, site, schedule))
+                    continue
+
+            self.safe_emit_status(f"📍 {site_name} 포스팅 시작")
+            self.safe_emit_status("=====================================================================================")
+            finished = time.time()
+            if self.process_site_posting(site):
+                finished = time.time()
+                state = schedule.record_run(state, finished)
+                posted_count += 1
+                self.safe_emit_status(f"✅ {site_name} 포스팅 완료 (오늘 {state['count']}회)")
+
+            next_due = schedule.next_run_at(finished + schedule.interval(), state)
+            state['next_run_at'] = next_due
+            self.config_manager.save_site_schedule_state(site_id, state)
+            self.release_site(site)  # 상태 저장 후 반납 - 다음 실행은 먼저 임대하는 워커가 맡음
+            heapq.heappush(queue, (next_due, order, site, schedule))
+
+        if self.is_running and not self._force_stop:
+            self.safe_emit_status(f"🎉 모든 사이트의 키워드가 소진되었습니다! (이번 실행 {posted_count}개 포스팅)")
+            self._notify(self.on_complete)
+
+    def run_publish_ahead(self):
+        """예약 발행 배치 - 사이트별 하루치 글을 할당량이 허용하는 만큼 빠르게 생성해 status=future로 업로드
+
+        사이트를 번갈아 한 편씩 처리해 API 할당량을 고르게 나누고, 사이트 간 대기는 하지 않습니다.
+        각 글의 발행 시각은 plan_publish_slots로 하루 발행 구간에 분산됩니다.
+        """
+        settings = self.config_manager.data.get("global_settings", {}).get("publish_ahead", {})
+        posts_per_day = int(settings.get("posts_per_day", 10))
+        slot_args = dict(
+            posts_per_day=posts_per_day,
+            start_hour=int(settings.get("start_hour", 8)),
+            end_hour=int(settings.get("end_hour", 23)),
+            jitter_minutes=int(settings.get("jitter_minutes", 10))
+        )
+        self.safe_emit_status(f"⏰ 예약 발행 배치 시작 - 사이트별 {posts_per_day}개")
+
+        # 사이트별 예약 시각 - 마지막 예약 이후의 슬롯부터 하루치
+        # (설정 반영 시 sites_data의 사이트 dict가 새 객체로 바뀌므로 사이트 ID로 관리)
+        pending_slots = {}
+        for site in self.sites_data:
+            after = max(datetime.now() + timedelta(minutes=5),
+                        self.config_manager.get_scheduled_until(site.get('id')) or datetime.min)
+            pending_slots[site.get('id')] = plan_publish_slots(posts_per_day, after, **slot_args)
+        scheduled_total = 0
+        while self.is_running and not self._force_stop:
+            progressed = False
+            for site_id in list(pending_slots):
+                if not self.is_running or self._force_stop:
+                    break
+                if not self.scheduler.wait_if_paused():
+                    break
+                if not pending_slots[site_id]:
+                    continue
+                site = self.latest_site({'id': site_id})
+                if site is None:
+                    # 배치 중 삭제/비활성화된 사이트
+                    pending_slots[site_id] = []
+                    continue
+
+                site_name = site.get('name', 'Unknown')
+                if not self.holds_site(site):
+                    pending_slots[site_id] = []
+                    continue
+                try:
+                    if not self.get_live_keywords(site):
+                        self.safe_emit_status(f"⚠️ {site_name}: 사용 가능한 키워드 없음 - 예약 중단")
+                        pending_slots[site_id] = []
+                        continue
+                except Exception:
+                    pending_slots[site_id] = []
+                    continue
+
+                publish_at = pending_slots[site_id][0]
+                self.safe_emit_status(f"📍 {site_name} - {publish_at.strftime('%m/%d %H:%M')} 예약분 생성 ({posts_per_day - len(pending_slots[site_id]) + 1}/{posts_per_day})")
+
+                if self.process_site_posting(site, publish_at=publish_at):
+                    self.config_manager.save_scheduled_until(site_id, publish_at)
+                    pending_slots[site_id].pop(0)
+                    scheduled_total += 1
+                    progressed = True
+                else:
+                    # 실패한 사이트는 이번 배치에서 제외 (키워드/초안은 보존되어 다음 배치에서 재시도)
+                    self.safe_emit_status(f"⚠️ {site_name}: 예약 업로드 실패 - 이번 배치에서 제외")
+                    pending_slots[site_id] = []
+
+            if not progressed:
+                break
+
+        self.safe_emit_status(f"🏁 예약 발행 배치 완료 - 총 {scheduled_total}개 예약")
+
+    def refresh_config(self):
+        """안전 지점(글 사이)에서 최신 설정 스냅샷 반영 - 사이트 목록도 새 버전으로 교체 (삭제/비활성 사이트 제외)"""
+        if not self.config_manager.refresh():
+            return
+        latest_sites = {site.get('id'): site for site in self.config_manager.data.get('sites', [])}
+        refreshed = []
+        for site in self.sites_data:
+            latest = latest_sites.get(site.get('id'))
+            if latest is not None and latest.get('active', True):
+                refreshed.append(latest)
+        self.sites_data = refreshed
+        self.safe_emit_status(f"🔄 변경된 설정 반영 (버전 {self.config_manager.version})")
+
+    def get_live_keywords(self, site):
+        """실시간 포스팅/선생성용 키워드 - 오프라인 생성 보관소에 발행 대기 중인 키워드 제외 (publish_archive와 중복 발행 방지)"""
+        keywords = self.config_manager.get_site_keywords(site)
+        if not keywords:
+            return keywords
+        ready = get_article_archive().ready_keywords(site.get('id'))
+        return [keyword for keyword in keywords if keyword not in ready] if ready else keywords
+
+    def latest_site(self, site):
+        """현재 스냅샷 기준 사이트 정보 (삭제/비활성화됐으면 None)"""
+        for latest in self.sites_data:
+            if latest.get('id') == site.get('id'):
+                return latest
+        return None
+
+    def process_site_posting(self, site, publish_at=None):
+        """개별 사이트 포스팅 처리 - 새로운 워크플로우 적용
+
+        publish_at을 지정하면 해당 시각으로 예약 발행합니다.
+
+        Returns:
+            bool: 업로드 성공 여부
+        """
+        # 안전 지점: 글 사이에서만 최신 설정 스냅샷 반영
+        self.refresh_config()
+        latest = self.latest_site(site)
+        if latest is None:
+            self.emit_status(f"⚠️ {site.get('name', 'Unknown')}: 삭제/비활성화된 사이트 - 건너뜀")
+            return False
+        site = latest
+        try:
+            site_name = site.get('name', 'Unknown')
+            site_id = site.get('id')
+            site_url = site.get('url', '')
+
+            # 중단된 포스팅이 있었다면 그 키워드부터 이어서 진행
+            resume_keyword = self.config_manager.get_resume_keyword(site_id)
+            
+            # 🔒 포스팅 시작 상태 저장 (진행 중으로 표시)
+            self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
+            
+            # 키워드 가져오기 (사용 가능한 키워드만)
+            keywords = self.get_live_keywords(site)
+            if not keywords:
+                self.emit_status(f"⚠️ {site_name}: 키워드 없음")
+                # 포스팅 실패 상태 저장 (완료됨으로 표시하여 다음 사이트로 이동)
+                self.config_manager.save_posting_state(site_id, site_url, in_progress=False)
+                return
+                
+            keyword = keywords[0]  # 첫 번째 키워드 선택
+            if resume_keyword and resume_keyword in keywords:
+                keyword = resume_keyword
+                self.emit_status(f"♻️ 중단된 키워드 이어서 진행: '{keyword}'")
+            else:
+                self.emit_status(f"🔑 선택된 키워드: '{keyword}'")
+            self.config_manager.save_posting_state(site_id, site_url, in_progress=True, keyword=keyword)
+            
+            # 🔒 중요: 키워드 선택 후 바로 백업 정보 저장
+            keyword_file = site.get('keyword_file')
+            if keyword_file:
+                print(f"📋 {site_name}: 키워드 파일 '{keyword_file}' 확인")
+            else:
+                print(f"⚠️ {site_name}: 키워드 파일 설정이 없습니다.")
+                self.emit_status(f"⚠️ {site_name}: 키워드 파일 미설정")
+                return
+            
+            # AI 설정 가져오기
+            ai_provider = self.config_manager.data["global_settings"].get("default_ai", "gemini")
+            posting_mode = self.config_manager.data["global_settings"].get("posting_mode", "수익용")
+
+            content_generator = self.create_content_generator(site)
+
+            # 포스팅 모드에 따라 콘텐츠 타입 결정
+            content_type = "approval" if posting_mode == "승인용" else "revenue"
+
+            # 선생성 단계가 같은 키워드를 만들고 있으면 완료될 때까지 대기 후 그 초안 사용
+            self.claim_generation(site, keyword)
+            try:
+                prepared = self.prepare_post(site, keyword, content_generator, content_type, ai_provider, posting_mode)
+            finally:
+                self.release_generation(site, keyword)
+            if not prepared:
+                return
+            title, content, thumbnail_path, post_status = prepared
+            draft_store = get_draft_store()
+            
+            # 워드프레스에 포스팅
+            result = content_generator.post_to_wordpress(
+                site, title, content, thumbnail_path, status=post_status, keyword=keyword,
+                publish_at=publish_at
+            )
+            
+            if result and result.get('success'):
+                draft_store.delete(site, keyword)
+
+                # 🔥 중요: 포스팅 성공 후에만 키워드를 used 파일로 이동
+                try:
+                    self.emit_status(f"🔄 키워드 '{keyword}' 처리 완료 파일로 이동")
+                    keyword_moved = self.move_keyword_to_used(keyword, site)
+                    if not keyword_moved:
+                        self.emit_status(f"⚠️ 포스팅 완료, 키워드 이동 실패")
+                except Exception as keyword_error:
+                    self.emit_status(f"⚠️ 포스팅 완료, 키워드 처리 오류")
+                
+                # 🔒 포스팅 성공 시 완료 상태 저장 (다음 사이트로 이동)
+                self.config_manager.save_posting_state(site_id, site_url, in_progress=False)
+                self.emit_status(f"✅ 다음 프로그램 실행 시 {site_name} 다음 사이트부터 시작됩니다")
+                
+                # 개별 포스팅 완료 신호 발송 (카운트다운 시작용)
+                self._notify(self.on_single_complete)
+                
+                # 🔥 포스팅 완료 후 키워드 개수 체크 (300개 미만 경고)
+                self.check_low_keywords_after_posting(site)
+                return True
+                    
+            else:
+                self.emit_status(f"❌ {site_name}: 워드프레스 포스팅 실패 - 키워드/초안 보존")
+                draft_store.record_failure(site, keyword, (result or {}).get('error', '알 수 없는 오류'))
+                # 🔒 포스팅 실패 시 진행 중 상태 유지 (재시작 시 같은 사이트에서 재시작)
+                self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
+                self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
+            
+        except Exception as e:
+            self.log(f"❌ {site_name} 예외 발생: {str(e)}")
+            import traceback
+            self.log(f"🔍 상세 오류:\n{traceback.format_exc()}")
+            self.emit_status(f"❌ {site_name} 예외 발생 - 키워드 보존됨")
+            # 🔒 예외 발생 시 진행 중 상태 유지 (재시작 시 같은 사이트에서 재시작)
+            self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
+            # 예외가 발생해도 키워드를 보존하고 다음 사이트로 진행
+
+    def create_content_generator(self, site, log_prefix=""):
+        """사이트용 ContentGenerator 생성 (발행 단계/선생성 단계 공용)"""
+        from datetime import datetime
+        ai_provider = self.config_manager.data["global_settings"].get("default_ai", "gemini")
+        config_data = {
+            'openai_api_key': self.config_manager.data.get("api_keys", {}).get("openai", ""),
+            'gemini_api_key': self.config_manager.data.get("api_keys", {}).get("gemini", "")
+        }
+        
+        def log_func(message):
+            """로그 함수"""
+            try:
+                message = f"{log_prefix}{message}"
+                if self.echo_console:
+                    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+                    sys.stdout.flush()  # 즉시 콘솔 출력
+                self.emit_status(message)
+            except Exception as log_error:
+                print(f"[LOG ERROR] {log_error}")
+                # 로그 함수 오류가 발생해도 계속 진행
+                pass
+        
+        # MainWindow 인스턴스를 auto_wp_instance로 전달 (config_manager 접근용)
+        class MockAutoWP:
+            def __init__(self, config_manager, worker_thread):
+                self.config_manager = config_manager
+                self.current_ai_provider = config_manager.data.get("global_settings", {}).get("default_ai", "gemini")
+                self.posting_mode = config_manager.data.get("global_settings", {}).get("posting_mode", "수익용")
+                # Worker Thread 참조 저장
+                self.worker_thread = worker_thread
+            
+            @property
+            def is_posting(self):
+                # Worker Thread의 상태를 실시간으로 반환
+                return self.worker_thread.is_running and not self.worker_thread._force_stop
+            
+            @property
+            def is_paused(self):
+                return self.worker_thread.is_paused
+        
+        mock_auto_wp = MockAutoWP(self.config_manager, self)
+        content_generator = ContentGenerator(config_data, log_func, mock_auto_wp)
+        
+        # ContentGenerator가 worker thread 상태를 실시간으로 체크할 수 있게 설정
+        content_generator.worker_thread = self
+        content_generator.cancel_token = self.cancel_token
+        # ContentGenerator의 포스팅 상태를 True로 설정
+        content_generator.is_posting = True
+        # AI 제공자 설정 추가 (명시적으로 설정)
+        content_generator.current_ai_provider = ai_provider
+        
+        # config_manager 연결 (Worker Thread에서 설정 접근)
+        content_generator.config_manager = self.config_manager
+        
+        # 현재 처리 중인 사이트 정보를 전달
+        content_generator.set_current_site(site)
+
+        return content_generator
+
+    def claim_generation(self, site, keyword, wait=True):
+        """(사이트, 키워드) 생성 권한 획득 - 다른 단계가 생성 중이면 대기(wait=False면 즉시 False)"""
+        key = (site.get('id') or site.get('url'), keyword)
+        with self._generation_cond:
+            while key in self._generating:
+                if not wait or not self.is_running:
+                    return False
+                self._generation_cond.wait(1)
+            self._generating.add(key)
+            return True
+
+    def release_generation(self, site, keyword):
+        key = (site.get('id') or site.get('url'), keyword)
+        with self._generation_cond:
+            self._generating.discard(key)
+            self._generation_cond.notify_all()
+
+    def prepare_post(self, site, keyword, content_generator, content_type, ai_provider, posting_mode, pregenerated=False):
+        """발행할 글 준비 - 유효한 초안이 있으면 재사용하고, 없으면 생성 후 초안으로 저장
+
+        Returns:
+            tuple | None: (title, content, thumbnail_path, post_status) - 실패/중지 시 None
+        """
+        site_name = site.get('name', 'Unknown')
+        settings = self.config_manager.data.get("global_settings", {})
+        draft_store = get_draft_store()
+        draft = draft_store.load(
+            site, keyword,
+            max_age_hours=float(settings.get("draft_expiry_hours", 72)),
+            max_attempts=int(settings.get("draft_max_attempts", 5))
+        )
+        if draft:
+            title, content = draft['title'], draft['content']
+            thumbnail_path = draft.get('thumbnail_path')
+            post_status = draft.get('metadata', {}).get('post_status', 'publish')
+            if pregenerated:
+                return title, content, thumbnail_path, post_status
+            if draft.get('metadata', {}).get('pregenerated') and not draft.get('attempts'):
+                self.log(f"📦 미리 생성된 글 사용 (생성: {draft['created_at'][:16]}) - AI 생성 대기 없음")
+            else:
+                self.log(f"📦 저장된 초안으로 업로드 재시도 (생성: {draft['created_at'][:16]}, 실패 {draft.get('attempts', 0)}회)")
+            if thumbnail_path and not os.path.exists(thumbnail_path):
+                self.log("⚠️ 초안 썸네일 파일 없음 - 썸네일 없이 업로드")
+                thumbnail_path = None
+            return title, content, thumbnail_path, post_status
+
+        # API 재초기화 강제 실행 (Worker Thread에서 config_manager 접근)
+        content_generator.initialize_apis()
+
+        generated = self.generate_post_content(content_generator, site_name, keyword, content_type)
+        if not generated:
+            return None
+        title, content, thumbnail_path, post_status = generated
+
+        # 업로드 전에 초안 저장 (업로드 실패/중단 시 다음 시도에서 재사용) - 단계 체크포인트는 초안으로 대체
+        draft_store.save(site, keyword, title, content, thumbnail_path,
+                         post_status=post_status, content_type=content_type,
+                         ai_provider=ai_provider, posting_mode=posting_mode,
+                         pregenerated=pregenerated)
+        get_checkpoint_store().clear(site, keyword)
+        return generated
+
+    def start_pregeneration(self):
+        """선생성 단계 시작 (설정에서 켠 경우에만) - 발행 단계는 기존 간격대로 초안을 꺼내 발행"""
+        settings = self.config_manager.data.get("global_settings", {}).get("pregeneration", {})
+        if not settings.get("enabled"):
+            return
+        if self._pregeneration_thread and self._pregeneration_thread.is_alive():
+            return
+        self._pregeneration_thread = threading.Thread(target=self.pregeneration_loop, daemon=True)
+        self._pregeneration_thread.start()
+        self.safe_emit_status(f"⚡ 선생성 시작 - 사이트별 최대 {int(settings.get('buffer_size', 1))}개 미리 생성")
+
+    def next_pregeneration_job(self):
+        """다음에 미리 만들 (사이트, 키워드) - 발행 순서가 가까운 키워드부터, 버퍼가 찬 사이트는 제외"""
+        settings = self.config_manager.data.get("global_settings", {})
+        buffer_size = max(1, int(settings.get("pregeneration", {}).get("buffer_size", 1)))
+        draft_store = get_draft_store()
+        for depth in range(buffer_size):
+            for site in self.sites_data:
+                try:
+                    keywords = self.get_live_keywords(site)
+                except Exception:
+                    continue
+                if len(keywords) <= depth or not site.get('keyword_file'):
+                    continue
+                keyword = keywords[depth]
+                if (site.get('id'), keyword) in self._pregeneration_failed:
+                    continue
+                if draft_store.load(site, keyword,
+                                    max_age_hours=float(settings.get("draft_expiry_hours", 72)),
+                                    max_attempts=int(settings.get("draft_max_attempts", 5))):
+                    continue
+                if not self.holds_site(site):
+                    continue  # 분산 실행: 다른 워커가 임대 중인 사이트는 미리 생성하지 않음
+                return site, keyword
+        return None
+
+    def pregeneration_loop(self):
+        """선생성 단계 - 버퍼가 빌 때마다 다음 글을 생성해 초안으로 저장"""
+        while self.is_running and not self._force_stop:
+            if not self.scheduler.wait_if_paused():
+                break
+            try:
+                job = self.next_pregeneration_job()
+            except Exception as e:
+                print(f"⚠️ 선생성 대상 조회 오류: {e}")
+                job = None
+            if not job:
+                # 버퍼가 가득 참 - 발행되어 자리가 날 때까지 대기
+                with self._generation_cond:
+                    self._generation_cond.wait(10)
+                continue
+
+            site, keyword = job
+            if not self.claim_generation(site, keyword, wait=False):
+                # 발행 단계가 생성 중 - 해제 알림까지 대기
+                with self._generation_cond:
+                    self._generation_cond.wait(10)
+                continue
+            try:
+                posting_mode = self.config_manager.data["global_settings"].get("posting_mode", "수익용")
+                ai_provider = self.config_manager.data["global_settings"].get("default_ai", "gemini")
+                content_type = "approval" if posting_mode == "승인용" else "revenue"
+                self.safe_emit_status(f"⚡ [선생성] {site.get('name', 'Unknown')} - '{keyword}' 미리 생성 시작")
+                content_generator = self.create_content_generator(site, log_prefix="[선생성] ")
+                prepared = self.prepare_post(site, keyword, content_generator, content_type,
+                                             ai_provider, posting_mode, pregenerated=True)
+                if prepared:
+                    self.safe_emit_status(f"⚡ [선생성] {site.get('name', 'Unknown')} - '{keyword}' 준비 완료")
+                elif self.is_running:
+                    self._pregeneration_failed.add((site.get('id'), keyword))
+                    self.safe_emit_status(f"⚠️ [선생성] '{keyword}' 생성 실패 - 발행 시점에 다시 시도")
+            except Exception as e:
+                self._pregeneration_failed.add((site.get('id'), keyword))
+                self.safe_emit_status(f"⚠️ [선생성] '{keyword}' 오류: {e}")
+            finally:
+                self.release_generation(site, keyword)
+
+    def generate_post_content(self, content_generator, site_name, keyword, content_type):
+        """AI 콘텐츠 생성 + 검증 + 중복 검사
+
+        Returns:
+            tuple | None: (title, content, thumbnail_path, post_status) - 실패/중지 시 None
+        """
+        # 콘텐츠 생성
+        title, content, thumbnail_path = content_generator.generate_simple_content(
+            keyword,
+            content_type=content_type
+        )
+        
+        if not self.is_running:
+            print(f"⏹️ {site_name}: 포스팅이 중지되었습니다. 키워드 '{keyword}' 보존됨")
+            return None
+            
+        # 🔥 콘텐츠 생성 결과 검증 강화 (빈 문자열 체크 포함)
+        if not title or not title.strip():
+            self.log(f"❌ 콘텐츠 생성 실패 - 제목이 비어있음. 키워드 '{keyword}' 보존")
+            return None
+        
+        if not content or not content.strip():
+            self.log(f"❌ 콘텐츠 생성 실패 - 본문이 비어있음. 키워드 '{keyword}' 보존")
+            return None
+        
+        # 최소 길이 검증
+        if len(title.strip()) < 5:
+            self.log(f"❌ 콘텐츠 생성 실패 - 제목이 너무 짧음 ({len(title.strip())}자). 키워드 '{keyword}' 보존")
+            return None
+        
+        if len(content.strip()) < 100:
+            self.log(f"❌ 콘텐츠 생성 실패 - 본문이 너무 짧음 ({len(content.strip())}자). 키워드 '{keyword}' 보존")
+            return None
+            
+        self.log(f"✅ 콘텐츠 생성 성공 (제목: {len(title)}자, 본문: {len(content)}자), 워드프레스 업로드 시작")
+
+        # 🔍 발행 전 중복 검사 (다른 사이트/이전 발행 글과 비교)
+        title, content, thumbnail_path, post_status = self.guard_duplicate_content(
+            content_generator, keyword, content_type, title, content, thumbnail_path
+        )
+        if not self.is_running:
+            print(f"⏹️ {site_name}: 포스팅이 중지되었습니다. 키워드 '{keyword}' 보존됨")
+            return None
+
+        return title, content, thumbnail_path, post_status
+        
+
+    def guard_duplicate_content(self, content_generator, keyword, content_type, title, content, thumbnail_path):
+        """발행 전 중복 검사 - 중복이면 재생성하고, 그래도 중복이면 임시글(draft)로 업로드
+
+        Returns:
+            tuple: (title, content, thumbnail_path, post_status)
+        """
+        settings = self.config_manager.data.get("global_settings", {})
+        if not settings.get("duplicate_check", True):
+            return title, content, thumbnail_path, 'publish'
+
+        try:
+            index = get_published_index()
+            threshold = float(settings.get("duplicate_threshold", 0.7))
+            title_threshold = float(settings.get("duplicate_title_threshold", 0.9))
+            action = settings.get("duplicate_action", "regenerate")
+            max_retries = int(settings.get("duplicate_max_retries", 1))
+
+            attempt = 0
+            while True:
+                match = index.find_duplicate(title, content, threshold, title_threshold)
+                if not match:
+                    return title, content, thumbnail_path, 'publish'
+
+                kind = "제목" if match['kind'] == 'title' else "본문"
+                self.log(f"⚠️ 중복 의심: {match['site']}의 '{match['title']}' 글과 {kind} 유사도 {match['similarity']:.0%}")
+
+                if action != "regenerate" or attempt >= max_retries or not self.is_running:
+                    break
+
+                attempt += 1
+                self.log(f"🔄 중복 회피를 위해 콘텐츠 재생성 ({attempt}/{max_retries})")
+                # 체크포인트가 남아 있으면 같은 (중복) 단계 출력이 그대로 복원되므로 먼저 삭제
+                content_generator.clear_step_checkpoint(keyword)
+                new_title, new_content, new_thumbnail = content_generator.generate_simple_content(
+                    keyword,
+                    content_type=content_type
+                )
+                if not new_title or not new_content or len(new_content.strip()) < 100:
+                    self.log("⚠️ 재생성 실패 - 기존 콘텐츠 사용")
+                    break
+                title, content, thumbnail_path = new_title, new_content, new_thumbnail
+
+            self.log("📝 중복 의심 글은 임시글(draft)로 업로드합니다 - 관리자 확인 필요")
+            return title, content, thumbnail_path, 'draft'
+
+        except Exception as e:
+            self.log(f"⚠️ 중복 검사 오류 (검사 생략): {e}")
+            return title, content, thumbnail_path, 'publish'
+
+    def check_low_keywords_after_posting(self, site):
+        """포스팅 완료 후 해당 사이트의 키워드가 300개 미만이면 알림"""
+        try:
+            site_name = site.get('name', 'Unknown')
+            keyword_file = site.get('keyword_file', '')
+            
+            if not keyword_file:
+                return
+            
+            base_path = get_base_path()
+            keyword_path = os.path.join(base_path, "keywords", keyword_file)
+            
+            if not os.path.exists(keyword_path):
+                return
+            
+            # 현재 남은 키워드 개수 확인
+            with open(keyword_path, 'r', encoding='utf-8') as f:
+                lines = [line.strip() for line in f.readlines() if line.strip() and not line.strip().startswith('#')]
+                keyword_count = len(lines)
+            
+            # 300개 미만이면 경고 신호 발생
+            if keyword_count < 300:
+                warning_msg = f"⚠️ {site_name}의 키워드가 {keyword_count}개로 부족합니다! (최소 300개 권장)"
+                self.emit_status(warning_msg)
+                
+                # 메인 스레드에서 알림창 표시 (error_occurred 신호 사용)
+                self._notify(self.on_error, f"키워드 부족|{site_name}|{keyword_count}")
+                
+        except Exception as e:
+            print(f"키워드 체크 오류: {e}")
+
+    def move_keyword_to_used(self, keyword, site):
+        """사용한 키워드를 used 파일로 이동 - 'used_' 접두사 붙인 파일로 이동"""
+        try:
+            keyword_file = site.get('keyword_file')
+            if not keyword_file:
+                return False
+                
+            base_path = get_base_path()
+            keywords_path = os.path.join(base_path, "keywords", keyword_file)
+            
+            # 'used_' 접두사가 붙은 파일명 생성 (예: ai-news_keywords.txt -> used_ai-news_keywords.txt)
+            used_filename = f"used_{keyword_file}"
+            used_path = os.path.join(base_path, "keywords", used_filename)
+            
+            # 원본 파일이 존재하는지 확인
+            if not os.path.exists(keywords_path):
+                return False
+            
+            # 원본 파일에서 키워드 제거
+            with open(keywords_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            
+            # 키워드 제거 (정확히 일치하는 라인만)
+            updated_lines = []
+            keyword_found = False
+            for line in lines:
+                if line.strip() == keyword.strip():
+                    keyword_found = True
+                    print(f"🔍 키워드 '{keyword}' 발견하여 제거 준비")
+                    continue
+                updated_lines.append(line)
+            
+            if keyword_found:
+                # 원본 파일 업데이트 (백업 후 진행)
+                backup_path = keywords_path + ".backup"
+                import shutil
+                shutil.copy2(keywords_path, backup_path)
+                
+                try:
+                    with open(keywords_path, 'w', encoding='utf-8') as f:
+                        f.writelines(updated_lines)
+                    
+                    # used 파일에 키워드 추가 (파일이 없으면 생성)
+                    with open(used_path, 'a', encoding='utf-8') as f:
+                        f.write(f"{keyword.strip()}\n")
+                    
+                    # 백업 파일 삭제 (성공시)
+                    if os.path.exists(backup_path):
+                        os.remove(backup_path)
+                    
+                    print(f"✅ 키워드 '{keyword}' 이동 완료: {keyword_file} -> {used_filename}")
+                    
+                    # UI 업데이트 알림
+                    self._notify(self.on_keyword_used)
+                    
+                    return True
+                    
+                except Exception as file_error:
+                    # 복원 시도
+                    if os.path.exists(backup_path):
+                        shutil.copy2(backup_path, keywords_path)
+                        os.remove(backup_path)
+                        print(f"👏 키워드 파일 복원 완료")
+                    
+                    print(f"❌ 파일 쓰기 오류로 키워드 이동 실패: {file_error}")
+                    return False
+            else:
+                print(f"⚠️ 키워드 '{keyword}'를 {keyword_file}에서 찾을 수 없습니다.")
+                return False
+                
+        except Exception as e:
+            print(f"❌ 키워드 이동 중 예외 발생: {e}")
+            return False
+            
+    def pause(self):
+        """일시정지"""
+        self.is_paused = True
+        self.scheduler.pause()
+        
+    def resume(self):
+        """재개"""
+        self.is_paused = False
+        self.scheduler.resume()
+
+def run_shard_processes(count, argv):
+    """분산 실행 워커 프로세스 count개 실행 - 각 워커는 --shard로 사이트 임대를 나눠 잡음
+
+    SIGTERM/SIGINT는 모든 워커에 전달되며, 워커가 모두 끝나면 종료합니다.
+    """
+    import signal
+
+    child_args = []
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg == "--processes":
+            skip_next = True
+            continue
+        if arg.startswith("--processes="):
+            continue
+        child_args.append(arg)
+    if "--shard" not in child_args:
+        child_args.append("--shard")
+    if "--headless" not in child_args:
+        child_args.insert(0, "--headless")
+
+    script = os.path.abspath(sys.argv[0])
+    children = [subprocess.Popen([sys.executable, script] + child_args) for _ in range(count)]
+    print(f"🧩 분산 실행 워커 {count}개 시작 (PID: {', '.join(str(c.pid) for c in children)})")
+
+    def forward_signal(signum, frame):
+        for child in children:
+            if child.poll() is None:
+                child.send_signal(signum)
+
+    signal.signal(signal.SIGTERM, forward_signal)
+    signal.signal(signal.SIGINT, forward_signal)
+    return max(child.wait() for child in children)
+
+def run_headless(argv=None):
+    """헤드리스 실행 진입점 (서버/systemd/컨테이너용) - Qt를 로드하지 않음
+
+    SIGTERM/SIGINT 수신 시 진행 중인 단계를 마친 뒤 상태를 저장하고 종료합니다.
+    """
+    import argparse
+    import logging
+    import signal
+
+    parser = argparse.ArgumentParser(
+        prog="auto_wp_multi-site.py --headless",
+        description="Auto WP multi-site 헤드리스 포스팅"
+    )
+    parser.add_argument("--headless", action="store_true", help="GUI 없이 실행")
+    parser.add_argument("--start-site", default=None, help="시작 사이트 ID (기본: 마지막 포스팅 상태 기준)")
+    parser.add_argument("--log-file", default=None, help="로그 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="로그 레벨")
+    parser.add_argument("--publish-ahead", action="store_true",
+                        help="하루치 글을 생성해 워드프레스 예약 발행(status=future)으로 업로드 후 종료")
+    parser.add_argument("--generate-only", action="store_true",
+                        help="발행 없이 글을 생성해 archive/에 보관 (--site, --keyword-file, --count, --workers)")
+    parser.add_argument("--publish-archive", action="store_true", help="archive/에 보관된 글을 일괄 발행")
+    parser.add_argument("--site", default=None, help="오프라인 생성/발행 대상 사이트 ID (기본: 모든 활성 사이트)")
+    parser.add_argument("--keyword-file", default=None, help="사이트 키워드 대신 사용할 키워드 파일 경로")
+    parser.add_argument("--count", type=int, default=None, help="사이트별 생성 개수(기본 10) / 발행 최대 개수(기본 전체)")
+    parser.add_argument("--workers", type=int, default=2, help="동시 생성 수")
+    parser.add_argument("--shard", action="store_true",
+                        help="분산 실행 - 사이트 임대(leases.db)를 잡은 사이트만 처리 (여러 프로세스/머신 동시 실행)")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="분산 실행 워커 프로세스 수 - 지정하면 --shard 하위 프로세스를 띄우고 감독")
+    args = parser.parse_args(argv)
+
+    if args.processes > 1:
+        return run_shard_processes(args.processes, argv if argv is not None else sys.argv[1:])
+
+    if args.log_file:
+        handler = logging.FileHandler(args.log_file, encoding="utf-8")
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[handler]
+    )
+    logger = logging.getLogger("auto_wp")
+
+    ensure_base_directories()
+    config_manager = ConfigManager()
+    sites_data = config_manager.data.get("sites", [])
+    active_sites = [site for site in sites_data if site.get("active", True)]
+    if not active_sites:
+        logger.error("⚠️ 활성화된 사이트가 없습니다.")
+        return 1
+
+    api_keys = config_manager.data.get("api_keys", {})
+    if not api_keys.get("openai") and not api_keys.get("gemini"):
+        logger.error("⚠️ API 키가 설정되지 않았습니다.")
+        return 1
+
+    # 시작 사이트 결정 (GUI의 start_posting과 동일한 규칙)
+    start_site_id = args.start_site or config_manager.get_start_site_id()
+    if isinstance(start_site_id, str) and start_site_id.isdigit():
+        start_site_id = int(start_site_id)
+    if not any(site.get("id") == start_site_id for site in active_sites):
+        start_site_id = active_sites[0].get("id", "all")
+
+    exit_code = {'value': 0}
+
+    def on_error(message):
+        if message.startswith("키워드 부족|"):
+            _, site_name, count = message.split("|", 2)
+            logger.warning(f"⚠️ {site_name}의 키워드가 {count}개로 부족합니다! (최소 300개 권장)")
+        else:
+            logger.error(f"❌ 포스팅 오류: {message}")
+            exit_code['value'] = 1
+
+    engine = PostingEngine(
+        config_manager, active_sites, start_site_id,
+        on_status=logger.info,
+        on_complete=lambda: logger.info("🎉 포스팅 작업 완료"),
+        on_error=on_error,
+        echo_console=False,
+        publish_ahead=True if args.publish_ahead else None,
+        shard=True if args.shard else None
+    )
+
+    def handle_signal(signum, frame):
+        logger.info(f"🛑 종료 신호 수신 ({signal.Signals(signum).name}) - 현재 단계 완료 후 종료합니다")
+        engine.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    if args.generate_only or args.publish_archive:
+        if args.site:
+            engine.sites_data = [site for site in active_sites if str(site.get("id")) == str(args.site)]
+            if not engine.sites_data:
+                logger.error(f"⚠️ 사이트를 찾을 수 없습니다: {args.site}")
+                return 1
+        if args.generate_only:
+            keywords = None
+            if args.keyword_file:
+                with open(args.keyword_file, 'r', encoding='utf-8') as f:
+                    keywords = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+            stats = engine.generate_to_archive(engine.sites_data, count=args.count or 10,
+                                               workers=args.workers, keywords=keywords)
+            return 0 if not stats['failed'] else 1
+        engine.publish_archive(limit=args.count)
+        return exit_code['value']
+
+    logger.info(f"🚀 헤드리스 포스팅 시작 - 활성 사이트 {len(active_sites)}개, 시작 사이트 ID: {start_site_id}")
+    engine.run()
+    logger.info("👋 헤드리스 포스팅 종료")
+    return exit_code['value']
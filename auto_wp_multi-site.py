@@ -6,14 +6,14 @@ Auto WP multi-site - 워드프레스 자동 포스팅 by 데이비
 
 import sys
 import os
-import json
 import time
 import random
 import threading
-import traceback
-from datetime import datetime, timedelta
-from pathlib import Path
-import shutil
+
+# 헤드리스 모드 (--headless): Qt를 로드하지 않고 엔진만 실행
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    from auto_wp_engine import run_headless
+    sys.exit(run_headless(sys.argv[1:]))
 
 # GUI 라이브러리
 from PyQt6.QtWidgets import (
@@ -22,630 +22,79 @@ from PyQt6.QtWidgets import (
     QGroupBox, QGridLayout, QSpinBox, QComboBox, QCheckBox, QListWidget,
     QFileDialog, QMessageBox, QProgressBar, QSplitter, QFrame,
     QListWidgetItem, QDialog, QDialogButtonBox, QFormLayout, QProgressDialog,
-    QSizePolicy
+    QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize, QObject, QRunnable, QThreadPool
 from PyQt6.QtGui import QFont, QPixmap, QIcon, QPalette, QColor
 
+# 기존 라이브러리들
+import requests
+
+# 포스팅 엔진 (Qt 비의존)
+from auto_wp_engine import (
+    get_genai, ensure_base_directories, get_base_path, get_resource_path, log_to_file,
+    ResourceScanner, ConfigManager, PostingEngine,
+    WP_AUTH_METHODS, build_auth_credentials, get_auth_cache_store, get_rate_limiter,
+    get_api_key_pool
+)
+
 class PostingWorker(QThread):
-    """포스팅 작업 스레드"""
+    """포스팅 작업 스레드 - PostingEngine을 QThread에서 실행하고 콜백을 시그널로 전달"""
     status_update = pyqtSignal(str)
     posting_complete = pyqtSignal()
     single_posting_complete = pyqtSignal()  # 개별 포스팅 완료 신호 추가
     keyword_used = pyqtSignal()  # 키워드 사용 완료 신호 추가
     error_occurred = pyqtSignal(str)
+    next_run_scheduled = pyqtSignal(float, str)  # 다음 실행 시각(epoch, 0이면 예정 없음), 사이트 이름
     
     def __init__(self, config_manager, sites_data, start_site_id="all"):
         super().__init__()
         self.config_manager = config_manager
-        self.sites_data = sites_data
-        self.start_site_id = start_site_id
-        self.is_running = True
-        self.is_paused = False
-        self._force_stop = False  # 강제 중지 플래그 추가
+        self.engine = PostingEngine(
+            config_manager, sites_data, start_site_id,
+            on_status=self._emit_status,
+            on_complete=self.posting_complete.emit,
+            on_single_complete=self.single_posting_complete.emit,
+            on_keyword_used=self.keyword_used.emit,
+            on_error=self.error_occurred.emit,
+            on_next_run=self.next_run_scheduled.emit
+        )
+
+    @property
+    def is_running(self):
+        return self.engine.is_running
+
+    @property
+    def is_paused(self):
+        return self.engine.is_paused
+
+    @property
+    def _force_stop(self):
+        return self.engine._force_stop
+
+    def _emit_status(self, message):
+        self.status_update.emit(message)
+        self.msleep(10)  # 10ms 대기 (GUI 갱신 여유)
     
     def stop(self):
         """포스팅 강제 중지"""
         print("🛑 [WORKER] 포스팅 워커 중지 요청됨")
-        self.is_running = False
-        self._force_stop = True
+        self.engine.stop()
         # 스레드가 종료될 때까지 기다림
         self.wait(5000)  # 최대 5초 대기
         print("🛑 [WORKER] 포스팅 워커 중지 완료")
-    
-    def safe_emit_status(self, message):
-        """안전한 상태 업데이트 발송 - 터미널과 GUI 동시 출력"""
-        try:
-            # 터미널과 GUI에 동일한 메시지 출력
-            print(message, flush=True)
-            self.status_update.emit(message)
-            self.msleep(10)  # 10ms 대기
-                
-        except Exception as e:
-            print(f"[ERROR] 신호 발송 실패: {e}")
-            sys.stdout.flush()
-    
-    def log(self, message):
-        """로그 메시지 출력 - safe_emit_status의 별칭"""
-        self.safe_emit_status(message)
-        
+
     def run(self):
         """포스팅 작업 실행 - 모든 키워드가 소진될 때까지 반복"""
-        try:
-            # 전체 라운드 카운터
-            round_count = 0
-            
-            # 시작 사이트 결정
-            start_index = 0
-            if self.start_site_id != "all":
-                # 특정 사이트부터 시작
-                for idx, site in enumerate(self.sites_data):
-                    if site.get("id") == self.start_site_id or str(idx) == str(self.start_site_id):
-                        start_index = idx
-                        self.safe_emit_status(f"▶️ {site.get('name', 'Unknown')} 시작")
-                        break
-            
-            # 무한 반복: 모든 사이트의 키워드가 소진될 때까지 계속
-            while self.is_running and not self._force_stop:
-                try:
-                    round_count += 1
-                    self.safe_emit_status(f"🔄 라운드 {round_count} 시작 - 모든 사이트 순회")
-                    
-                    # 강제 중지 체크
-                    if self._force_stop:
-                        self.safe_emit_status("⏹️ 강제 중지")
-                        return
-                    
-                    # 이번 라운드에서 포스팅된 사이트 카운터
-                    posted_sites_count = 0
-                    
-                    # 시작 사이트부터 순회 (라운드 1에서만 적용)
-                    sites_to_process = self.sites_data[start_index:] + self.sites_data[:start_index] if round_count == 1 else self.sites_data
-                    
-                    # 모든 사이트 순회
-                    for i, site in enumerate(sites_to_process):
-                        if not self.is_running or self._force_stop:
-                            print("⏹️ 포스팅 중지")
-                            self.safe_emit_status("⏹️ 포스팅 중지")
-                            return
-                            
-                        # 일시정지 확인
-                        while self.is_paused and self.is_running and not self._force_stop:
-                            print("⏸️ 일시정지")
-                            self.safe_emit_status("⏸️ 일시정지")
-                            self.msleep(1000)  # 1초 대기
-                            
-                        if not self.is_running:
-                            print("⏹️ 포스팅 중지")
-                            self.safe_emit_status("⏹️ 포스팅 중지")
-                            return
-                        
-                        site_name = site.get('name', 'Unknown')
-                        self.safe_emit_status(f"📍 라운드 {round_count} - {site_name} ({i+1}/{len(self.sites_data)}) 포스팅 시작")
-                        self.safe_emit_status("=====================================================================================")
-                        
-                        # 이 사이트에 사용 가능한 키워드가 있는지 확인
-                        try:
-                            available_keywords = self.config_manager.get_site_keywords(site)
-                            if not available_keywords:
-                                self.safe_emit_status(f"⚠️ {site_name}: 사용 가능한 키워드 없음 - 스킵")
-                                continue
-                        except Exception as keyword_error:
-                            self.safe_emit_status(f"❌ {site_name}: 키워드 조회 오류 - 다음 사이트로 계속")
-                            continue
-                        
-                        # 실제 포스팅 작업 수행
-                        try:
-                            self.process_site_posting(site)
-                            posted_sites_count += 1
-                            self.safe_emit_status(f"✅ {site_name} 포스팅 완료")
-                            self.safe_emit_status("=====================================================================================")
-                        except Exception as site_error:
-                            error_msg = f"❌ {site_name}: 포스팅 오류 - {str(site_error)}"
-                            self.safe_emit_status(error_msg)
-                            continue
-                        
-                        # 사이트 간 대기 (마지막 사이트가 아닌 경우)
-                        if i < len(self.sites_data) - 1:
-                            try:
-                                wait_time = self.config_manager.data["global_settings"].get("default_wait_time", "47~50")
-                                if "~" in wait_time:
-                                    import random
-                                    min_time, max_time = map(int, wait_time.split("~"))
-                                    delay = random.randint(min_time, max_time)
-                                else:
-                                    delay = int(wait_time) if wait_time.isdigit() else 50
-                            except:
-                                delay = 50  # 기본값
-                                
-                            # 대기 중에도 중지/일시정지 체크
-                            for j in range(delay):
-                                if not self.is_running:
-                                    return
-                                while self.is_paused and self.is_running:
-                                    self.msleep(1000)
-                                if not self.is_running:
-                                    return
-                                    
-                                self.msleep(1000)
-                    
-                    # 이번 라운드 완료 후 체크
-                    if posted_sites_count == 0:
-                        # 어떤 사이트도 포스팅하지 못했으면 모든 키워드가 소진됨
-                        self.safe_emit_status("🎉 모든 사이트의 키워드가 소진되었습니다!")
-                        self.safe_emit_status(f"📊 총 {round_count}라운드 완료! 포스팅 작업 종료")
-                        break
-                    else:
-                        self.safe_emit_status(f"🏁 라운드 {round_count} 완료 - {posted_sites_count}개 사이트 포스팅 성공")
-                        
-                        # 다음 라운드를 위한 일반 대기 (사이트 간 간격과 동일)
-                        try:
-                            wait_time = self.config_manager.data["global_settings"].get("default_wait_time", "47~50")
-                            
-                            # 범위 형태 처리 (예: "47~50")
-                            if "~" in wait_time or "-" in wait_time:
-                                try:
-                                    separator = "~" if "~" in wait_time else "-"
-                                    min_time, max_time = map(int, wait_time.split(separator))
-                                    delay = random.randint(min_time, max_time)
-                                except ValueError:
-                                    delay = 50  # 기본값
-                            else:
-                                delay = int(wait_time) if wait_time.isdigit() else 50
-                        except:
-                            delay = 50  # 기본값
-                        
-                        # 대기 (라운드 간에도 일반 포스팅 간격 사용)
-                        for j in range(delay):
-                            if not self.is_running:
-                                return
-                            while self.is_paused and self.is_running:
-                                self.msleep(1000)
-                            if not self.is_running:
-                                return
-                                
-                            self.msleep(1000)
-                        
-                except Exception as round_error:
-                    self.safe_emit_status(f"❌ 라운드 {round_count} 오류 - 다음 라운드 진행")
-                    # 라운드 오류가 발생해도 계속 진행
-                    import time
-                    time.sleep(5)  # 5초 대기 후 다음 라운드 진행
-                        
-            if self.is_running:
-                self.safe_emit_status("🎉 모든 키워드 사용 완료!")
-                self.posting_complete.emit()
-                
-        except KeyboardInterrupt:
-            print("⏹️ 사용자에 의해 중단되었습니다.")
-            self.safe_emit_status("⏹️ 사용자 중단")
-            return
-        except Exception as e:
-            print(f"❌ PostingWorker 중요 오류 발생: {str(e)}")
-            print(f"� 10초 후 자동 재시작을 시도합니다")
-            self.safe_emit_status("❌ 시스템 오류 - 10초 후 재시작 시도")
-            
-            # 10초 대기 후 재시작 시도
-            for i in range(10, 0, -1):
-                if not self.is_running:
-                    return
-                self.safe_emit_status(f"🔄 재시작까지 {i}초 남음")
-                import time
-                time.sleep(1)
-            
-            # 재시작 시도
-            if self.is_running:
-                self.safe_emit_status("🔄 재시작 중")
-                try:
-                    self.run()  # 재귀적으로 재시작
-                except:
-                    print("❌ 재시작 실패 - 포스팅을 종료합니다.")
-                    self.safe_emit_status("❌ 재시작 실패")
-                    self.error_occurred.emit(str(e))
-            
-    def process_site_posting(self, site):
-        """개별 사이트 포스팅 처리 - 새로운 워크플로우 적용"""
-        try:
-            site_name = site.get('name', 'Unknown')
-            site_id = site.get('id')
-            site_url = site.get('url', '')
-            
-            # 🔒 포스팅 시작 상태 저장 (진행 중으로 표시)
-            self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
-            
-            # 키워드 가져오기 (사용 가능한 키워드만)
-            keywords = self.config_manager.get_site_keywords(site)
-            if not keywords:
-                self.status_update.emit(f"⚠️ {site_name}: 키워드 없음")
-                # 포스팅 실패 상태 저장 (완료됨으로 표시하여 다음 사이트로 이동)
-                self.config_manager.save_posting_state(site_id, site_url, in_progress=False)
-                return
-                
-            keyword = keywords[0]  # 첫 번째 키워드 선택
-            self.status_update.emit(f"🔑 선택된 키워드: '{keyword}'")
-            
-            # 🔒 중요: 키워드 선택 후 바로 백업 정보 저장
-            keyword_file = site.get('keyword_file')
-            if keyword_file:
-                print(f"📋 {site_name}: 키워드 파일 '{keyword_file}' 확인")
-            else:
-                print(f"⚠️ {site_name}: 키워드 파일 설정이 없습니다.")
-                self.status_update.emit(f"⚠️ {site_name}: 키워드 파일 미설정")
-                return
-            
-            # AI 설정 가져오기
-            ai_provider = self.config_manager.data["global_settings"].get("default_ai", "gemini")
-            posting_mode = self.config_manager.data["global_settings"].get("posting_mode", "수익용")
-            
-            # ContentGenerator 인스턴스 생성
-            from datetime import datetime
-            config_data = {
-                'openai_api_key': self.config_manager.data.get("api_keys", {}).get("openai", ""),
-                'gemini_api_key': self.config_manager.data.get("api_keys", {}).get("gemini", "")
-            }
-            
-            def log_func(message):
-                """로그 함수"""
-                try:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-                    sys.stdout.flush()  # 즉시 콘솔 출력
-                    self.status_update.emit(message)
-                except Exception as log_error:
-                    print(f"[LOG ERROR] {log_error}")
-                    # 로그 함수 오류가 발생해도 계속 진행
-                    pass
-            
-            # MainWindow 인스턴스를 auto_wp_instance로 전달 (config_manager 접근용)
-            class MockAutoWP:
-                def __init__(self, config_manager, worker_thread):
-                    self.config_manager = config_manager
-                    self.current_ai_provider = config_manager.data.get("global_settings", {}).get("default_ai", "gemini")
-                    self.posting_mode = config_manager.data.get("global_settings", {}).get("posting_mode", "수익용")
-                    # Worker Thread 참조 저장
-                    self.worker_thread = worker_thread
-                
-                @property
-                def is_posting(self):
-                    # Worker Thread의 상태를 실시간으로 반환
-                    return self.worker_thread.is_running and not self.worker_thread._force_stop
-                
-                @property
-                def is_paused(self):
-                    return self.worker_thread.is_paused
-            
-            mock_auto_wp = MockAutoWP(self.config_manager, self)
-            content_generator = ContentGenerator(config_data, log_func, mock_auto_wp)
-            
-            # ContentGenerator가 worker thread 상태를 실시간으로 체크할 수 있게 설정
-            content_generator.worker_thread = self
-            # ContentGenerator의 포스팅 상태를 True로 설정
-            content_generator.is_posting = True
-            # AI 제공자 설정 추가 (명시적으로 설정)
-            content_generator.current_ai_provider = ai_provider
-            
-            # API 재초기화 강제 실행 (Worker Thread에서 config_manager 접근)
-            content_generator.config_manager = self.config_manager
-            content_generator.initialize_apis()
-            
-            # 현재 처리 중인 사이트 정보를 전달
-            content_generator.set_current_site(site)
-
-            # 포스팅 모드에 따라 콘텐츠 타입 결정
-            content_type = "approval" if posting_mode == "승인용" else "revenue"
-
-            # 콘텐츠 생성
-            title, content, thumbnail_path = content_generator.generate_simple_content(
-                keyword,
-                content_type=content_type
-            )
-            
-            if not self.is_running:
-                print(f"⏹️ {site_name}: 포스팅이 중지되었습니다. 키워드 '{keyword}' 보존됨")
-                return
-                
-            # 🔥 콘텐츠 생성 결과 검증 강화 (빈 문자열 체크 포함)
-            if not title or not title.strip():
-                self.log(f"❌ 콘텐츠 생성 실패 - 제목이 비어있음. 키워드 '{keyword}' 보존")
-                return
-            
-            if not content or not content.strip():
-                self.log(f"❌ 콘텐츠 생성 실패 - 본문이 비어있음. 키워드 '{keyword}' 보존")
-                return
-            
-            # 최소 길이 검증
-            if len(title.strip()) < 5:
-                self.log(f"❌ 콘텐츠 생성 실패 - 제목이 너무 짧음 ({len(title.strip())}자). 키워드 '{keyword}' 보존")
-                return
-            
-            if len(content.strip()) < 100:
-                self.log(f"❌ 콘텐츠 생성 실패 - 본문이 너무 짧음 ({len(content.strip())}자). 키워드 '{keyword}' 보존")
-                return
-                
-            self.log(f"✅ 콘텐츠 생성 성공 (제목: {len(title)}자, 본문: {len(content)}자), 워드프레스 업로드 시작")
-            
-            # 워드프레스에 포스팅
-            result = content_generator.post_to_wordpress(site, title, content, thumbnail_path)
-            
-            if result and result.get('success'):
-                # 🔥 중요: 포스팅 성공 후에만 키워드를 used 파일로 이동
-                try:
-                    self.status_update.emit(f"🔄 키워드 '{keyword}' 처리 완료 파일로 이동")
-                    keyword_moved = self.move_keyword_to_used(keyword, site)
-                    if not keyword_moved:
-                        self.status_update.emit(f"⚠️ 포스팅 완료, 키워드 이동 실패")
-                except Exception as keyword_error:
-                    self.status_update.emit(f"⚠️ 포스팅 완료, 키워드 처리 오류")
-                
-                # 🔒 포스팅 성공 시 완료 상태 저장 (다음 사이트로 이동)
-                self.config_manager.save_posting_state(site_id, site_url, in_progress=False)
-                self.status_update.emit(f"✅ 다음 프로그램 실행 시 {site_name} 다음 사이트부터 시작됩니다")
-                
-                # 개별 포스팅 완료 신호 발송 (카운트다운 시작용)
-                self.single_posting_complete.emit()
-                
-                # 🔥 포스팅 완료 후 키워드 개수 체크 (300개 미만 경고)
-                self.check_low_keywords_after_posting(site)
-                    
-            else:
-                self.status_update.emit(f"❌ {site_name}: 워드프레스 포스팅 실패 - 키워드 보존")
-                # 🔒 포스팅 실패 시 진행 중 상태 유지 (재시작 시 같은 사이트에서 재시작)
-                self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
-                self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
-            
-        except Exception as e:
-            self.log(f"❌ {site_name} 예외 발생: {str(e)}")
-            import traceback
-            self.log(f"🔍 상세 오류:\n{traceback.format_exc()}")
-            self.status_update.emit(f"❌ {site_name} 예외 발생 - 키워드 보존됨")
-            # 🔒 예외 발생 시 진행 중 상태 유지 (재시작 시 같은 사이트에서 재시작)
-            self.config_manager.save_posting_state(site_id, site_url, in_progress=True)
-            # 예외가 발생해도 키워드를 보존하고 다음 사이트로 진행
-
-    def check_low_keywords_after_posting(self, site):
-        """포스팅 완료 후 해당 사이트의 키워드가 300개 미만이면 알림"""
-        try:
-            site_name = site.get('name', 'Unknown')
-            keyword_file = site.get('keyword_file', '')
-            
-            if not keyword_file:
-                return
-            
-            base_path = get_base_path()
-            keyword_path = os.path.join(base_path, "keywords", keyword_file)
-            
-            if not os.path.exists(keyword_path):
-                return
-            
-            # 현재 남은 키워드 개수 확인
-            with open(keyword_path, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip() and not line.strip().startswith('#')]
-                keyword_count = len(lines)
-            
-            # 300개 미만이면 경고 신호 발생
-            if keyword_count < 300:
-                warning_msg = f"⚠️ {site_name}의 키워드가 {keyword_count}개로 부족합니다! (최소 300개 권장)"
-                self.status_update.emit(warning_msg)
-                
-                # 메인 스레드에서 알림창 표시 (error_occurred 신호 사용)
-                self.error_occurred.emit(f"키워드 부족|{site_name}|{keyword_count}")
-                
-        except Exception as e:
-            print(f"키워드 체크 오류: {e}")
+        self.engine.run()
 
-    def move_keyword_to_used(self, keyword, site):
-        """사용한 키워드를 used 파일로 이동 - 'used_' 접두사 붙인 파일로 이동"""
-        try:
-            keyword_file = site.get('keyword_file')
-            if not keyword_file:
-                return False
-                
-            base_path = get_base_path()
-            keywords_path = os.path.join(base_path, "keywords", keyword_file)
-            
-            # 'used_' 접두사가 붙은 파일명 생성 (예: ai-news_keywords.txt -> used_ai-news_keywords.txt)
-            used_filename = f"used_{keyword_file}"
-            used_path = os.path.join(base_path, "keywords", used_filename)
-            
-            # 원본 파일이 존재하는지 확인
-            if not os.path.exists(keywords_path):
-                return False
-            
-            # 원본 파일에서 키워드 제거
-            with open(keywords_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # 키워드 제거 (정확히 일치하는 라인만)
-            updated_lines = []
-            keyword_found = False
-            for line in lines:
-                if line.strip() == keyword.strip():
-                    keyword_found = True
-                    print(f"🔍 키워드 '{keyword}' 발견하여 제거 준비")
-                    continue
-                updated_lines.append(line)
-            
-            if keyword_found:
-                # 원본 파일 업데이트 (백업 후 진행)
-                backup_path = keywords_path + ".backup"
-                import shutil
-                shutil.copy2(keywords_path, backup_path)
-                
-                try:
-                    with open(keywords_path, 'w', encoding='utf-8') as f:
-                        f.writelines(updated_lines)
-                    
-                    # used 파일에 키워드 추가 (파일이 없으면 생성)
-                    with open(used_path, 'a', encoding='utf-8') as f:
-                        f.write(f"{keyword.strip()}\n")
-                    
-                    # 백업 파일 삭제 (성공시)
-                    if os.path.exists(backup_path):
-                        os.remove(backup_path)
-                    
-                    print(f"✅ 키워드 '{keyword}' 이동 완료: {keyword_file} -> {used_filename}")
-                    
-                    # UI 업데이트 신호 발생
-                    if hasattr(self, 'keyword_used'):
-                        self.keyword_used.emit()
-                    
-                    return True
-                    
-                except Exception as file_error:
-                    # 복원 시도
-                    if os.path.exists(backup_path):
-                        shutil.copy2(backup_path, keywords_path)
-                        os.remove(backup_path)
-                        print(f"👏 키워드 파일 복원 완료")
-                    
-                    print(f"❌ 파일 쓰기 오류로 키워드 이동 실패: {file_error}")
-                    return False
-            else:
-                print(f"⚠️ 키워드 '{keyword}'를 {keyword_file}에서 찾을 수 없습니다.")
-                return False
-                
-        except Exception as e:
-            print(f"❌ 키워드 이동 중 예외 발생: {e}")
-            return False
-            
     def pause(self):
         """일시정지"""
-        self.is_paused = True
+        self.engine.pause()
         
     def resume(self):
         """재개"""
-        self.is_paused = False
-
-# 기존 라이브러리들
-import requests
-import urllib.parse
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
-import re
-import subprocess
-
-# AI API 라이브러리들
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    OpenAI = None
-
-def install_package(package_name):
-    """패키지 동적 설치"""
-    try:
-        # 먼저 패키지가 이미 설치되어 있는지 확인
-        try:
-            __import__(package_name.split('==')[0].replace('-', '_'))
-            print(f"📦 {package_name} 이미 설치되어 있음")
-            return True
-        except ImportError:
-            pass
-        
-        import subprocess
-        import sys
-        print(f"📦 {package_name} 설치 시도 중")
-        
-        result = subprocess.run([
-            sys.executable, "-m", "pip", "install", package_name, "--user", "--quiet"
-        ], capture_output=True, text=True, timeout=120, check=False)
-        
-        if result.returncode == 0:
-            print(f"✅ {package_name} 설치 성공!")
-            return True
-        else:
-            print(f"❌ {package_name} 설치 실패: {result.stderr}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ {package_name} 설치 중 오류: {e}")
-        return False
-
-def try_import_gemini():
-    """Gemini API 동적 import 시도"""
-    try:
-        import google.generativeai as genai
-        print("✅ google-generativeai 라이브러리 로드 성공")
-        return True, genai
-    except ImportError as e:
-        print(f"❌ google-generativeai 라이브러리 없음: {e}")
-        
-        # 동적 설치 시도
-        if install_package("google-generativeai"):
-            try:
-                # 설치 후 다시 import 시도
-                import importlib
-                import google.generativeai as genai
-                print("✅ google-generativeai 설치 후 로드 성공!")
-                return True, genai
-            except Exception as reload_error:
-                print(f"❌ 설치 후 로드 실패: {reload_error}")
-                return False, None
-        else:
-            return False, None
-    except Exception as e:
-        print(f"❌ google-generativeai 라이브러리 예상치 못한 오류: {e}")
-        return False, None
-
-# Gemini API 동적 로드
-GEMINI_AVAILABLE, genai = try_import_gemini()
-
-# WordPress API
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
-
-def get_base_path():
-    """실행 파일의 기본 경로 반환 (EXE/PY 모두 지원)"""
-    if getattr(sys, 'frozen', False):  # PyInstaller로 빌드된 EXE인 경우
-        # _MEIPASS는 PyInstaller가 리소스를 압축 해제한 임시 폴더
-        # sys.executable은 실제 exe 파일 위치
-        # 설정 파일 등은 exe 위치, 리소스 파일은 _MEIPASS 사용
-        return os.path.dirname(sys.executable)
-    else:  # 일반 Python 스크립트인 경우
-        return os.path.dirname(os.path.abspath(__file__))
-
-def get_resource_path(relative_path):
-    """리소스 파일의 절대 경로 반환 (PyInstaller 호환)"""
-    if getattr(sys, 'frozen', False):  # PyInstaller로 빌드된 EXE인 경우
-        # _MEIPASS: PyInstaller가 리소스를 압축 해제한 임시 폴더
-        base_path = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
-    else:  # 일반 Python 스크립트인 경우
-        base_path = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_path, relative_path)
-
-def log_to_file(message):
-    """EXE 실행 시 로그 파일에 기록"""
-    try:
-        if getattr(sys, 'frozen', False):  # EXE 실행 시에만
-            log_file = os.path.join(get_base_path(), "debug.log")
-            with open(log_file, "a", encoding="utf-8") as f:
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"[{timestamp}] {message}\n")
-                f.flush()
-    except Exception:
-        pass  # 로그 실패 시 무시
-
-def get_requests_session():
-    """최적화된 requests 세션 생성"""
-    session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(pool_connections=3, pool_maxsize=5, max_retries=0)
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-    session.headers.update({
-        'User-Agent': 'Auto-WP/1.0',
-        'Connection': 'keep-alive',
-    })
-    return session
-
-# 설정 파일 경로
-SETTING_FILE = os.path.join(get_base_path(), "setting.json")
-
-# 기본 디렉토리 생성
-for directory in ['keywords', 'thumbnails', 'fonts', 'prompts', 'output']:
-    dir_path = os.path.join(get_base_path(), directory)
-    os.makedirs(dir_path, exist_ok=True)
+        self.engine.resume()
 
 # 다크 모드 색상 테마 (Nord Theme 기반)
 COLORS = {
@@ -810,4090 +259,578 @@ class WordPressButton(QPushButton):
         self.button_type = button_type
         self.updateStyle()
 
-class ResourceScanner:
-    """리소스 파일 스캔 및 자동 묶음 클래스"""
-
-    def __init__(self, base_path):
-        self.base_path = base_path
-        self.fonts = []
-        self.images = []
-        self.keyword_files = []
-        self.prompt_files = {}
-
-    def scan_all_resources(self):
-        """모든 리소스 파일 스캔"""
-        self.scan_fonts()
-        self.scan_images()
-        self.scan_keywords()
-        self.scan_prompts()
-
-    def scan_fonts(self):
-        """폰트 파일 스캔"""
-        fonts_dir = os.path.join(self.base_path, "fonts")
-        self.fonts = []
-
-        if os.path.exists(fonts_dir):
-            try:
-                for file in os.listdir(fonts_dir):
-                    if file.lower().endswith(('.ttf', '.otf', '.woff', '.woff2')):
-                        file_path = os.path.join(fonts_dir, file)
-                        if os.path.isfile(file_path):  # 파일 존재 확인
-                            self.fonts.append({
-                                'name': file,
-                                'path': file_path,
-                                'relative_path': f"fonts/{file}",
-                                'size': self.get_file_size(file_path)
-                            })
-            except (OSError, IOError) as e:
-                print(f"⚠️ 폰트 디렉토리 스캔 오류: {e}")
-
-    def scan_images(self):
-        """이미지 파일 스캔 (썸네일 템플릿)"""
-        images_dir = os.path.join(self.base_path, "images")
-        self.images = []
-
-        if os.path.exists(images_dir):
-            try:
-                for file in os.listdir(images_dir):
-                    if file.lower().endswith(('.jpg', '.jpeg', '.png', '.webp', '.bmp')):
-                        file_path = os.path.join(images_dir, file)
-                        if os.path.isfile(file_path):  # 파일 존재 확인
-                            self.images.append({
-                                'name': file,
-                                'path': file_path,
-                                'relative_path': f"images/{file}",
-                                'size': self.get_file_size(file_path)
-                            })
-            except (OSError, IOError) as e:
-                print(f"⚠️ 이미지 디렉토리 스캔 오류: {e}")
-
-    def scan_keywords(self):
-        """키워드 파일 스캔"""
-        self.keyword_files = []
-
-        # 루트 디렉토리의 txt 파일들
-        try:
-            for file in os.listdir(self.base_path):
-                if file.lower().endswith('.txt') and 'keyword' in file.lower():
-                    file_path = os.path.join(self.base_path, file)
-                    if os.path.isfile(file_path):  # 파일 존재 확인
-                        keywords_count = self.count_keywords_in_file(file_path)
-                        self.keyword_files.append({
-                            'name': file,
-                            'path': file_path,
-                            'relative_path': file,
-                            'keywords_count': keywords_count,
-                            'suggested_for': self.suggest_site_for_keywords(file)
-                        })
-
-            # keywords 서브 디렉토리의 txt 파일들도 스캔
-            keywords_dir = os.path.join(self.base_path, "keywords")
-            if os.path.exists(keywords_dir):
-                for file in os.listdir(keywords_dir):
-                    if file.lower().endswith('.txt') and not file.startswith('used_'):
-                        file_path = os.path.join(keywords_dir, file)
-                        if os.path.isfile(file_path):  # 파일 존재 확인
-                            keywords_count = self.count_keywords_in_file(file_path)
-                            self.keyword_files.append({
-                                'name': file,
-                                'path': file_path,
-                                'relative_path': f"keywords/{file}",
-                                'keywords_count': keywords_count,
-                                'suggested_for': self.suggest_site_for_keywords(file)
-                            })
-        except (OSError, IOError) as e:
-            print(f"⚠️ 키워드 파일 스캔 오류: {e}")
-
-    def scan_prompts(self):
-        """프롬프트 파일 스캔"""
-        prompts_dir = os.path.join(self.base_path, "prompts")
-        self.prompt_files = {'gpt': [], 'gemini': []}
-
-        for ai_type in ['gpt', 'gemini']:
-            ai_dir = os.path.join(prompts_dir, ai_type)
-            if os.path.exists(ai_dir):
-                for file in os.listdir(ai_dir):
-                    if file.lower().endswith('.txt'):
-                        self.prompt_files[ai_type].append({
-                            'name': file,
-                            'path': os.path.join(ai_dir, file),
-                            'relative_path': f"prompts/{ai_type}/{file}",
-                            'size': self.get_file_size(os.path.join(ai_dir, file))
-                        })
-
-    def get_file_size(self, file_path):
-        """파일 크기 반환 (KB)"""
-        try:
-            size = os.path.getsize(file_path)
-            return round(size / 1024, 2)
-        except:
-            return 0
+class TaskSignals(QObject):
+    """백그라운드 작업 시그널 (QRunnable은 QObject가 아니므로 별도 정의)"""
+    progress = pyqtSignal(int, str)   # 진행률, 진행 메시지
+    finished = pyqtSignal(object)     # 작업 결과
+    error = pyqtSignal(str)           # 예외 메시지
+    done = pyqtSignal()               # 종료 (완료/오류/취소 모두)
 
-    def count_keywords_in_file(self, file_path):
-        """파일의 키워드 개수 세기"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip() and not line.startswith('#')]
-                return len(lines)
-        except:
-            return 0
+class BackgroundTask(QRunnable):
+    """QThreadPool에서 실행되는 범용 백그라운드 작업
 
-    def suggest_site_for_keywords(self, filename):
-        """파일명 기반 사이트 추천"""
-        filename_lower = filename.lower()
-        if 'tech' in filename_lower or '기술' in filename_lower:
-            return "기술 관련 사이트"
-        elif 'news' in filename_lower or '뉴스' in filename_lower:
-            return "뉴스 사이트"
-        elif 'blog' in filename_lower or '블로그' in filename_lower:
-            return "개인 블로그"
-        elif 'business' in filename_lower or '비즈니스' in filename_lower:
-            return "비즈니스 사이트"
-        else:
-            return "범용"
+    func(task, *args, **kwargs) 형태로 호출되며, func 내부에서
+    task.report_progress()로 진행 상황을 알리고 task.is_cancelled()로 취소 여부를 확인합니다.
+    결과는 signals.finished로 GUI 스레드에 전달되며, 취소된 경우에도 signals.done은 항상 발생합니다.
+    """
 
-    def get_resource_summary(self):
-        """리소스 요약 정보"""
-        return {
-            'fonts_count': len(self.fonts),
-            'images_count': len(self.images),
-            'keyword_files_count': len(self.keyword_files),
-            'total_keywords': sum(kf['keywords_count'] for kf in self.keyword_files),
-            'gpt_prompts': len(self.prompt_files['gpt']),
-            'gemini_prompts': len(self.prompt_files['gemini'])
-        }
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self._cancelled = threading.Event()
 
-class ContentGenerator:
-    """콘텐츠 생성기 - GPT와 Gemini API 지원"""
-    def __init__(self, config_data, log_func, auto_wp_instance=None):
-        self.config_data = config_data
-        self.log = log_func
-        self.auto_wp = auto_wp_instance
-        self.openai_client = None
-        self.gemini_model = None
-
-        # API 상태 추적
-        self.api_status = {
-            'openai': False,
-            'gemini': False
-        }
+    def cancel(self):
+        """작업 취소 요청"""
+        self._cancelled.set()
 
-        # 포스팅 상태 관리
-        self.is_posting = False
-        self.worker_thread = None  # Worker Thread 참조
-        
-        # 인증 캐시 (성공한 인증 방법 저장)
-        self.auth_cache = {}  # {site_url: (headers, method_name)}
+    def is_cancelled(self):
+        return self._cancelled.is_set()
 
-        # config_manager 속성 추가
-        if self.auto_wp and hasattr(self.auto_wp, 'config_manager'):
-            self.config_manager = self.auto_wp.config_manager
-        else:
-            self.config_manager = None
+    def report_progress(self, value, message=""):
+        if not self.is_cancelled():
+            self.signals.progress.emit(int(value), str(message))
 
-    def should_stop_posting(self):
-        """포스팅 중지 여부를 확인하는 헬퍼 메서드"""
+    def run(self):
         try:
-            # Worker Thread 상태 우선 체크 (가장 정확함)
-            if hasattr(self, 'worker_thread') and self.worker_thread:
-                is_running = getattr(self.worker_thread, 'is_running', True)
-                force_stop = getattr(self.worker_thread, '_force_stop', False)
-                if not is_running or force_stop:
-                    return True
-            
-            # Auto WP 인스턴스의 is_posting 상태 체크
-            if hasattr(self.auto_wp, 'is_posting'):
-                if not self.auto_wp.is_posting:
-                    return True
-            
-            # 모든 체크를 통과하면 계속 진행
-            return False
-        except Exception:
-            # 오류 발생 시 안전하게 계속 진행 (중지하지 않음)
-            return False
-
-        # GUI에서 선택한 AI 모델 (기본값 먼저 설정)
-        self.current_ai_provider = "gemini"  # 기본값
-        
-        # config_manager에서 설정 가져오기
-        if self.config_manager:
-            try:
-                global_settings = self.config_manager.data.get("global_settings", {})
-                self.current_ai_provider = global_settings.get("default_ai", "gemini")
-            except Exception:
-                self.current_ai_provider = "gemini"
-            
-        # auto_wp_instance에서 직접 가져오기 (우선순위 높음)
-        if hasattr(auto_wp_instance, 'current_ai_provider'):
             try:
-                self.current_ai_provider = auto_wp_instance.current_ai_provider
-            except Exception:
-                pass  # 기본값 유지
+                result = self.func(self, *self.args, **self.kwargs)
+            except Exception as e:
+                if not self.is_cancelled():
+                    self.signals.error.emit(str(e))
+                return
+            if not self.is_cancelled():
+                self.signals.finished.emit(result)
+        finally:
+            self.signals.done.emit()
+
+def start_background_task(owner, func, *args, on_finished=None, on_error=None, on_progress=None, pool=None, **kwargs):
+    """백그라운드 작업 시작 - owner에 참조를 보관해 작업 중 GC되지 않도록 함"""
+    task = BackgroundTask(func, *args, **kwargs)
+    if not hasattr(owner, '_background_tasks'):
+        owner._background_tasks = set()
+    owner._background_tasks.add(task)
+
+    def _release(*_):
+        owner._background_tasks.discard(task)
+
+    if on_progress:
+        task.signals.progress.connect(on_progress)
+    if on_finished:
+        task.signals.finished.connect(on_finished)
+    if on_error:
+        task.signals.error.connect(on_error)
+    task.signals.done.connect(_release)
+
+    (pool or QThreadPool.globalInstance()).start(task)
+    return task
+
+def check_wordpress_connection(task, url, username, password, category_id=None):
+    """WordPress 연결 진단 (백그라운드 스레드에서 실행, GUI 객체 접근 금지)
+
+    Returns:
+        dict: ok, level(info/warning/critical), title, message 및 진단 세부 정보
+    """
+    import base64
+
+    result = {'ok': False, 'level': 'critical', 'title': '오류', 'message': ''}
+    base_url = url.rstrip('/')
+    session = requests.Session()
 
-        # API 초기화
-        self.initialize_apis()
-        
-        # 현재 처리 중인 사이트 정보
-        self.current_site = None
+    try:
+        # 1. 기본 사이트 접근 테스트
+        task.report_progress(10, "사이트 접근성 확인 중")
+        try:
+            site_response = session.get(url, timeout=10)
+            if site_response.status_code != 200:
+                result.update(level='warning', title="사이트 접근 경고",
+                              message=f"사이트 접근 시 HTTP {site_response.status_code} 응답")
+                return result
+        except Exception as e:
+            result.update(title="사이트 접근 실패", message=f"사이트에 접근할 수 없습니다:\n{str(e)}")
+            return result
 
-    def set_current_site(self, site):
-        """현재 처리 중인 사이트 정보 설정"""
-        self.current_site = site
-    
-    def get_thumbnail_file(self):
-        """현재 사이트의 썸네일 파일 또는 기본 썸네일 반환"""
-        import random
-        
-        # 현재 사이트의 썸네일 이미지 사용
-        if self.current_site and self.current_site.get('thumbnail_image'):
-            thumbnail_filename = self.current_site.get('thumbnail_image')
-            thumbnail_path = os.path.join(get_base_path(), 'images', thumbnail_filename)
-            if os.path.exists(thumbnail_path):
-                return thumbnail_filename
-        
-        # 기본 썸네일 목록에서 랜덤 선택 (정확한 파일명 사용)
-        available_thumbnails = ['썸네일 (1).jpg', '썸네일 (2).jpg', '썸네일 (3).jpg',
-                              '썸네일 (4).jpg', '썸네일 (5).jpg', '썸네일 (6).jpg', 
-                              '썸네일 (7).jpg']
-        
-        # 존재하는 파일 중에서만 선택
-        existing_thumbnails = []
-        for thumb in available_thumbnails:
-            thumb_path = os.path.join(get_base_path(), 'images', thumb)
-            if os.path.exists(thumb_path):
-                existing_thumbnails.append(thumb)
-        
-        if existing_thumbnails:
-            return random.choice(existing_thumbnails)
-        else:
-            return '썸네일 (1).jpg'  # 최후 기본값
+        # 2. WordPress REST API 확인
+        if task.is_cancelled():
+            return None
+        task.report_progress(30, "WordPress REST API 확인 중")
+        try:
+            api_response = session.get(f"{base_url}/wp-json/wp/v2/", timeout=10)
+            if api_response.status_code != 200:
+                result.update(level='warning', title="REST API 오류",
+                              message=f"WordPress REST API 접근 불가 (HTTP {api_response.status_code})")
+                return result
+            wp_description = api_response.json().get('description', 'WordPress Site')
+        except Exception as e:
+            result.update(title="REST API 오류", message=f"WordPress REST API 확인 실패:\n{str(e)}")
+            return result
 
-    def initialize_apis(self):
-        """사용 가능한 모든 API 초기화"""
-        
-        # API 상태 초기화
-        self.api_status = {'openai': False, 'gemini': False}
+        # 3. 다중 인증 방법 테스트
+        user_url = f"{base_url}/wp-json/wp/v2/users/me"
+        auth_methods = [
+            ("Application Password (공백 포함)", username, password),
+            ("Application Password (공백 제거)", username, password.replace(" ", "")),
+            ("Basic Authentication", username, password)
+        ]
 
-        # OpenAI 초기화
-        if self.config_manager:
-            openai_api_key = self.config_manager.data.get("api_keys", {}).get("openai", "")
-        else:
-            openai_api_key = self.config_data.get('openai_api_key', '')
-        
-        if openai_api_key and openai_api_key not in ["your_openai_api_key", ""]:
+        user_info = None
+        headers = None
+        successful_method = ""
+        for i, (method_name, user, pwd) in enumerate(auth_methods):
+            if task.is_cancelled():
+                return None
+            task.report_progress(50 + (i * 10), f"{method_name} 테스트 중")
             try:
-                self.openai_client = OpenAI(api_key=openai_api_key)
-                self.api_status['openai'] = True
-            except Exception as e:
-                self.log(f"🔥 OpenAI 클라이언트 초기화 실패: {e}")
-                self.openai_client = None
-                self.api_status['openai'] = False
-        else:
-            self.log("⚠️ OpenAI API 키가 설정되지 않았거나 유효하지 않습니다.")
-
-        # Gemini 초기화
-        if self.config_manager:
-            gemini_api_key = self.config_manager.data.get("api_keys", {}).get("gemini", "")
-        else:
-            gemini_api_key = self.config_data.get('gemini_api_key', '')
+                token = base64.b64encode(f"{user}:{pwd}".encode('utf-8')).decode('ascii')
+                headers = {
+                    'Authorization': f'Basic {token}',
+                    'User-Agent': 'Auto-WP/1.0'
+                }
+                auth_response = session.get(user_url, headers=headers, timeout=15)
+                if auth_response.status_code == 200:
+                    user_info = auth_response.json()
+                    successful_method = method_name
+                    break
+            except Exception:
+                continue
+
+        if not user_info:
+            error_msg = "❌ 모든 인증 방법 실패!\n\n"
+            error_msg += "📋 Application Password 설정 가이드:\n"
+            error_msg += "1. WordPress 관리자 로그인\n"
+            error_msg += "2. 사용자 > 프로필 메뉴로 이동\n"
+            error_msg += "3. 'Application Passwords' 섹션 찾기\n"
+            error_msg += "4. 앱 이름 입력 (예: Auto-WP)\n"
+            error_msg += "5. '새 Application Password 추가' 클릭\n"
+            error_msg += "6. 생성된 패스워드를 복사\n"
+            error_msg += "7. 전역 설정의 패스워드 필드에 붙여넣기\n\n"
+            error_msg += "⚠️ 주의사항:\n"
+            error_msg += "• Application Password는 일반 로그인 패스워드와 다릅니다\n"
+            error_msg += "• 생성된 패스워드는 한 번만 표시됩니다\n"
+            error_msg += "• 사용자는 '편집자' 이상의 권한이 필요합니다"
+            result.update(level='warning', title="인증 실패", message=error_msg)
+            return result
 
-        if GEMINI_AVAILABLE and gemini_api_key and gemini_api_key not in ["your_gemini_api_key", ""]:
+        # 4. 카테고리 확인
+        category_name = None
+        if category_id is not None:
+            if task.is_cancelled():
+                return None
+            task.report_progress(85, "카테고리 확인 중")
+            category_name = "알 수 없음"
             try:
-                # API 키 설정
-                genai.configure(api_key=gemini_api_key)
-                # 안전 설정 구성 - 콘텐츠 차단 최소화
-                safety_settings = [
-                    {
-                        "category": "HARM_CATEGORY_HARASSMENT",
-                        "threshold": "BLOCK_ONLY_HIGH"
-                    },
-                    {
-                        "category": "HARM_CATEGORY_HATE_SPEECH",
-                        "threshold": "BLOCK_ONLY_HIGH"
-                    },
-                    {
-                        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                        "threshold": "BLOCK_ONLY_HIGH"
-                    },
-                    {
-                        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                        "threshold": "BLOCK_ONLY_HIGH"
-                    }
-                ]
-
-                # 모델 초기화 시 사용 가능한 모델 확인 (gemini-2.5-flash-lite만 사용)
-                model_priority = [
-                    'gemini-2.5-flash-lite',     # 2.5 lite 모델
-                ]
-                model_initialized = False
-                last_error = None
-                
-                for model_name in model_priority:
-                    try:
-                        self.log(f"🔍 Gemini 모델 시도: {model_name}")
-                        self.gemini_model = genai.GenerativeModel(
-                            model_name,
-                            safety_settings=safety_settings
-                        )
-                        
-                        # 간단한 테스트 호출로 API 작동 확인
-                        test_response = self.gemini_model.generate_content(
-                            "안녕",
-                            generation_config=genai.types.GenerationConfig(
-                                max_output_tokens=10,
-                                temperature=0.7
-                            ),
-                            request_options={'timeout': 10}
-                        )
-                        
-                        if hasattr(test_response, 'text') and test_response.text:
-                            model_initialized = True
-                            self.log(f"✅ Gemini 모델 초기화 성공: {model_name}")
-                            break
-                        else:
-                            last_error = "응답에 텍스트가 없음"
-                            continue
-                        
-                    except Exception as model_error:
-                        last_error = str(model_error)
-                        self.log(f"❌ {model_name} 실패: {last_error}")
-                        continue
-                
-                if not model_initialized:
-                    error_msg = f"모든 Gemini 모델 초기화 실패. 마지막 오류: {last_error}"
-                    self.log(f"❌ {error_msg}")
-                    raise Exception(error_msg)
-
-                self.api_status['gemini'] = True
-                
-            except Exception as e:
-                self.log(f"❌ Gemini 초기화 실패: {e}")
-                self.gemini_model = None
-                self.api_status['gemini'] = False
-        elif not GEMINI_AVAILABLE:
-            self.log("❌ google-generativeai 라이브러리가 설치되지 않았습니다.")
-            self.log("💡 pip install google-generativeai 명령으로 설치해주세요.")
-            self.gemini_model = None
-            self.api_status['gemini'] = False
-        elif not gemini_api_key or gemini_api_key in ["your_gemini_api_key", ""]:
-            self.log("⚠️ Gemini API 키가 설정되지 않았거나 기본값입니다.")
-            self.log("💡 설정 탭에서 올바른 Gemini API 키를 입력해주세요.")
-            self.gemini_model = None
-            self.api_status['gemini'] = False
-        else:
-            self.log(f"❓ Gemini 초기화 조건 불만족: AVAILABLE={GEMINI_AVAILABLE}, KEY_LENGTH={len(gemini_api_key) if gemini_api_key else 0}")
-            self.gemini_model = None
-            self.api_status['gemini'] = False
-
-        # 최종 상태 요약
-        self.log(f"🤖 API 초기화 완료: OpenAI={'✅' if self.api_status['openai'] else '❌'}, Gemini={'✅' if self.api_status['gemini'] else '❌'}")
-
-    def call_ai_api(self, prompt, step_name, max_tokens=1500, temperature=0.7, system_content=None):
-        """통합 AI API 호출"""
-        # 중지 체크
-        if hasattr(self, 'auto_wp') and hasattr(self.auto_wp, 'posting_worker') and not self.auto_wp.posting_worker.is_running:
-            return None
-        
-        ai_provider = self.current_ai_provider
+                cat_response = session.get(f"{base_url}/wp-json/wp/v2/categories/{category_id}",
+                                           headers=headers, timeout=10)
+                if cat_response.status_code == 200:
+                    category_name = cat_response.json().get('name', f'ID {category_id}')
+            except Exception:
+                pass
 
-        # 현재 설정된 API 키 확인 (config_manager 우선)
-        if self.config_manager:
-            gemini_key = self.config_manager.data.get("api_keys", {}).get("gemini", "").strip()
-            openai_key = self.config_manager.data.get("api_keys", {}).get("openai", "").strip()
-        else:
-            gemini_key = self.config_data.get('gemini_api_key', '').strip()
-            openai_key = self.config_data.get('openai_api_key', '').strip()
-
-        def gemini_ready():
-            """Gemini 사용 가능 여부 확인 및 필요 시 재초기화"""
-            if not gemini_key:
-                return False
-            if not self.api_status.get('gemini') or not self.gemini_model:
-                self.initialize_apis()
-            return bool(self.api_status.get('gemini') and self.gemini_model)
-
-        def openai_ready():
-            """OpenAI 사용 가능 여부 확인 및 필요 시 재초기화"""
-            if not openai_key:
-                return False
-            if not self.api_status.get('openai') or not self.openai_client:
-                self.initialize_apis()
-            return bool(self.api_status.get('openai') and self.openai_client)
-        
-        # Gemini API 사용 시 검증
-        if ai_provider == 'gemini':
-            if gemini_ready():
-                return self.call_gemini_api(prompt, step_name, max_tokens, temperature, system_content)
-            # Gemini가 없으면 OpenAI로 자동 전환
-            if openai_ready():
-                self.log("⚠️ Gemini 사용 불가 - OpenAI로 자동 전환")
-                self.current_ai_provider = 'openai'
-                return self.call_openai_api(prompt, step_name, max_tokens, temperature, system_content)
-            self.log("❌ 사용 가능한 AI 제공자가 없습니다.")
-            return None
-            
-        elif ai_provider in ['gpt', 'openai']:
-            if openai_ready():
-                return self.call_openai_api(prompt, step_name, max_tokens, temperature, system_content)
-            # OpenAI가 없으면 Gemini로 자동 전환
-            if gemini_ready():
-                self.log("⚠️ OpenAI 사용 불가 - Gemini로 자동 전환")
-                self.current_ai_provider = 'gemini'
-                return self.call_gemini_api(prompt, step_name, max_tokens, temperature, system_content)
-            self.log("❌ 사용 가능한 AI 제공자가 없습니다.")
-            return None
-        else:
-            # 알 수 없는 제공자일 경우 사용 가능한 모델을 자동 선택
-            if gemini_ready():
-                self.log("⚠️ 알 수 없는 AI 제공자 - Gemini로 자동 선택")
-                self.current_ai_provider = 'gemini'
-                return self.call_gemini_api(prompt, step_name, max_tokens, temperature, system_content)
-            if openai_ready():
-                self.log("⚠️ 알 수 없는 AI 제공자 - OpenAI로 자동 선택")
-                self.current_ai_provider = 'openai'
-                return self.call_openai_api(prompt, step_name, max_tokens, temperature, system_content)
-            self.log(f"❌ 알 수 없는 AI 제공자: {ai_provider}. 설정을 확인.")
+        task.report_progress(100, "완료")
+
+        capabilities = user_info.get('capabilities', {})
+        can_publish = capabilities.get('publish_posts', False)
+        can_edit = capabilities.get('edit_posts', False)
+        can_upload = capabilities.get('upload_files', False)
+
+        message = f"✅ 연결 성공!\n\n"
+        message += f"WordPress: {wp_description}\n"
+        message += f"인증 방법: {successful_method}\n\n"
+        message += f"사용자 정보:\n"
+        message += f"  이름: {user_info.get('name', 'Unknown')}\n"
+        message += f"  역할: {', '.join(user_info.get('roles', []))}\n\n"
+        message += f"권한 확인:\n"
+        message += f"  포스트 작성: {'✅' if can_edit else '❌'}\n"
+        message += f"  포스트 발행: {'✅' if can_publish else '❌'}\n"
+        message += f"  파일 업로드: {'✅' if can_upload else '❌'}"
+        if category_name is not None:
+            message += f"\n\n포스팅 카테고리: {category_name} (ID: {category_id})"
+        if not (can_edit and can_publish):
+            message += f"\n\n⚠️ 경고: 포스트 작성/발행 권한이 부족합니다.\n사용자를 '편집자' 이상 권한으로 설정해주세요."
+
+        result.update(ok=True, level='info', title="연결 테스트 결과", message=message,
+                      auth_method=successful_method, category_name=category_name)
+        return result
+
+    except requests.exceptions.ConnectTimeout:
+        result.update(title="연결 오류", message="❌ 연결 시간 초과\n\nURL을 확인해주세요.")
+    except requests.exceptions.ConnectionError:
+        result.update(title="연결 오류", message="❌ 서버에 연결할 수 없습니다\n\nURL과 네트워크 연결을 확인해주세요.")
+    except Exception as e:
+        result.update(title="오류", message=f"❌ 연결 테스트 중 오류:\n{str(e)}")
+    return result
+
+def show_connection_test_result(parent, result):
+    """check_wordpress_connection 결과를 메시지 박스로 표시 (GUI 스레드)"""
+    if not result:
+        return
+    if result['level'] == 'info':
+        QMessageBox.information(parent, result['title'], result['message'])
+    elif result['level'] == 'warning':
+        QMessageBox.warning(parent, result['title'], result['message'])
+    else:
+        QMessageBox.critical(parent, result['title'], result['message'])
+
+def run_connection_test_with_progress(parent, title, url, username, password, category_id=None):
+    """진행 다이얼로그와 함께 WordPress 연결 테스트를 백그라운드로 실행"""
+    progress_dialog = QProgressDialog(title, "취소", 0, 100, parent)
+    progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    progress_dialog.setAutoClose(False)
+    progress_dialog.setAutoReset(False)
+    progress_dialog.setMinimumDuration(0)
+
+    def on_progress(value, message):
+        progress_dialog.setValue(value)
+        progress_dialog.setLabelText(message)
+
+    def on_finished(result):
+        progress_dialog.close()
+        show_connection_test_result(parent, result)
+
+    def on_error(message):
+        progress_dialog.close()
+        QMessageBox.critical(parent, "오류", f"❌ 연결 테스트 중 오류:\n{message}")
+
+    task = start_background_task(
+        parent, check_wordpress_connection, url, username, password, category_id,
+        on_finished=on_finished, on_error=on_error, on_progress=on_progress
+    )
+    progress_dialog.canceled.connect(task.cancel)
+    progress_dialog.show()
+    return task
+
+def check_openai_key(task, api_key):
+    """OpenAI API 키 확인 (백그라운드 스레드)"""
+    from openai import OpenAI
+    client = OpenAI(api_key=api_key)
+    client.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "안녕"}],
+        max_tokens=10,
+        timeout=10
+    )
+    return {'provider': 'openai', 'ok': True, 'message': "✅ OpenAI API 연결 성공!"}
+
+def check_gemini_key(task, api_key):
+    """Gemini API 키 확인 - 사용 가능한 모델을 순서대로 시도 (백그라운드 스레드)"""
+    genai = get_genai()
+    if genai is None:
+        return {'provider': 'gemini', 'ok': False, 'missing_library': True,
+                'message': "❌ google-generativeai 라이브러리가 설치되지 않음"}
+
+    genai.configure(api_key=api_key)
+
+    # 최신 Gemini 모델들 순서대로 시도 (2025년 최신 모델 포함)
+    models_to_try = [
+        'gemini-2.0-flash-exp',      # 2025년 최신 실험 모델
+        'gemini-2.5-flash-lite',     # 2.5 lite 모델
+        'gemini-1.5-flash-latest',   # 최신 Flash
+        'gemini-1.5-flash',
+        'gemini-1.5-pro-latest',     # 최신 Pro
+        'gemini-1.5-pro',
+        'gemini-pro'                 # Fallback
+    ]
+
+    last_error = None
+    for model_name in models_to_try:
+        if task.is_cancelled():
             return None
-
-    def call_openai_api(self, prompt, step_name, max_tokens, temperature, system_content):
-        """OpenAI API 호출"""
-        try:
-            messages = [{"role": "system", "content": system_content}, {"role": "user", "content": prompt}] if system_content else [{"role": "user", "content": prompt}]
-            
-            # 현재 모델 설정 가져오기
-            if self.config_manager:
-                current_model = self.config_manager.data.get("global_settings", {}).get("openai_model", "gpt-3.5-turbo")
-            else:
-                current_model = "gpt-3.5-turbo"
-            
-            response = self.openai_client.chat.completions.create(
-                model=current_model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                timeout=60
-            )
-            
-            # 🔥 응답 검증 추가
-            if not response.choices or len(response.choices) == 0:
-                self.log(f"❌ {step_name} OpenAI 응답이 비어있음 (choices 없음)")
-                return None
-            
-            content = response.choices[0].message.content
-            if not content or not content.strip():
-                self.log(f"❌ {step_name} OpenAI 응답 내용이 비어있음")
-                return None
-            
-            self.log(f"✅ {step_name} OpenAI 응답 성공 ({len(content)}자)")
-            return content
-            
-        except Exception as api_error:
-            self.log(f"❌ {step_name} OpenAI API 오류: {api_error}")
-            return None
-
-    def call_gemini_api(self, prompt, step_name, max_tokens, temperature, system_content):
-        """Gemini API 호출"""
-        try:
-            # API 키 재확인
-            gemini_key = self.config_manager.data.get("api_keys", {}).get("gemini", "").strip()
-            if not gemini_key:
-                raise Exception("Gemini API 키가 설정되지 않았습니다.")
-            
-            # 모델 상태 재확인
-            if not self.gemini_model:
-                raise Exception("Gemini 모델이 초기화되지 않았습니다.")
-            
-            full_prompt = f"{system_content}\n\n---\n\n{prompt}" if system_content else prompt
-            generation_config = genai.types.GenerationConfig(
-                max_output_tokens=max_tokens, 
-                temperature=temperature
-            )
-            
-            # 타임아웃과 함께 API 호출
-            import time
-            start_time = time.time()
-            
-            try:
-                response = self.gemini_model.generate_content(full_prompt, generation_config=generation_config)
-                elapsed_time = time.time() - start_time
-                
-                # 🔥 응답 검증 강화
-                if hasattr(response, 'text') and response.text:
-                    response_text = response.text.strip()
-                    if not response_text:
-                        raise Exception("응답 텍스트가 공백만 포함되어 있습니다.")
-                    
-                    self.log(f"✅ {step_name} Gemini 응답 성공 ({len(response_text)}자, {elapsed_time:.1f}초)")
-                    return response_text
-                else:
-                    # 빈 응답에 대한 상세 정보
-                    if hasattr(response, 'prompt_feedback'):
-                        feedback = response.prompt_feedback
-                        if feedback and hasattr(feedback, 'block_reason'):
-                            raise Exception(f"Gemini가 콘텐츠를 차단했습니다: {feedback.block_reason}")
-                    raise Exception("응답 텍스트가 비어있습니다.")
-            except Exception as gen_error:
-                elapsed_time = time.time() - start_time
-                self.log(f"❌ API 호출 실패 ({elapsed_time:.1f}초 후): {gen_error}")
-                raise
-                
-        except Exception as api_error:
-            error_msg = str(api_error)
-            self.log(f"❌ {step_name} Gemini API 오류: {error_msg}")
-            
-            # 구체적인 오류 유형별 안내
-            if "API_KEY_INVALID" in error_msg or "Invalid API key" in error_msg:
-                self.log("💡 해결방법: 설정 탭에서 올바른 Gemini API 키를 입력해주세요.")
-            elif "QUOTA_EXCEEDED" in error_msg or "quota" in error_msg.lower():
-                self.log("💡 해결방법: API 할당량을 확인하고, 잠시 후 다시 시도해주세요.")
-            elif "PERMISSION_DENIED" in error_msg:
-                self.log("💡 해결방법: Google AI Studio에서 API 권한을 확인해주세요.")
-            elif "RESOURCE_EXHAUSTED" in error_msg:
-                self.log("💡 해결방법: 요청량이 많습니다. 잠시 후 다시 시도해주세요.")
-            elif "UNAVAILABLE" in error_msg or "network" in error_msg.lower():
-                self.log("💡 해결방법: 네트워크 연결을 확인하거나 잠시 후 다시 시도해주세요.")
-            else:
-                self.log(f"💡 예상치 못한 오류입니다. 자세한 정보: {error_msg}")
-                
-            return None
-
-    def check_rate_limit(self, provider):
-        """분당 및 일일 요청 제한 확인"""
-        current_time = time.time()
-        tracker = self.request_tracker[provider]
-
-        # 분당 요청 확인
-        requests = tracker['requests']
-        max_requests = tracker['max_per_minute']
-
-        # 1분 이전의 요청들 제거
-        requests[:] = [req_time for req_time in requests if current_time - req_time < 60]
-
-        minute_limit_ok = len(requests) < max_requests
-
-        # 일일 요청 확인
-        daily_limit_ok = True
-        if tracker['daily_reset_time'] is None:
-            # 첫 요청일 경우 오늘 자정으로 설정
-            from datetime import datetime, timedelta
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            tracker['daily_reset_time'] = today.timestamp()
-
-        # 하루가 지났는지 확인 (UTC 기준 24시간)
-        if current_time - tracker['daily_reset_time'] >= 86400:  # 24시간
-            tracker['daily_requests'] = 0
-            tracker['daily_reset_time'] = current_time
-
-        daily_limit_ok = tracker['daily_requests'] < tracker['max_per_day']
-
-        return minute_limit_ok and daily_limit_ok
-
-    def add_request(self, provider):
-        """요청 추가"""
-        current_time = time.time()
-        tracker = self.request_tracker[provider]
-
-        # 분당 추적
-        tracker['requests'].append(current_time)
-
-        # 일일 추적
-        tracker['daily_requests'] += 1
-
-        # 현재 요청 수 로깅
-        minute_count = len(tracker['requests'])
-        daily_count = tracker['daily_requests']
-        self.log(f"📊 {provider.upper()} 요청 추가 - 분당: {minute_count}/{tracker['max_per_minute']}, 일일: {daily_count}/{tracker['max_per_day']}")
-
-    def get_quota_status(self, provider):
-        """할당량 상태 반환"""
-        tracker = self.request_tracker[provider]
-        current_time = time.time()
-
-        # 분당 요청 수
-        requests = [req for req in tracker['requests'] if current_time - req < 60]
-        minute_count = len(requests)
-
-        # 일일 요청 수
-        daily_count = tracker['daily_requests']
-
-        return {
-            'minute_count': minute_count,
-            'minute_limit': tracker['max_per_minute'],
-            'daily_count': daily_count,
-            'daily_limit': tracker['max_per_day'],
-            'minute_ok': minute_count < tracker['max_per_minute'],
-            'daily_ok': daily_count < tracker['max_per_day'],
-        }
-
-    def wait_for_rate_limit(self, provider):
-        """할당량 대기"""
-        while not self.check_rate_limit(provider):
-            current_time = time.time()
-            requests = self.request_tracker[provider]['requests']
-            oldest_request = min(requests) if requests else current_time
-            wait_time = 60 - (current_time - oldest_request) + 1  # 1초 여유
-
-            self.log(f"⏳ {provider.upper()} 할당량 대기 중 ({wait_time:.0f}초 남음)")
-            time.sleep(min(wait_time, 10))  # 최대 10초씩 대기
-
-    def analyze_api_error(self, error_str, provider):
-        """API 오류 분석 및 처리 방법 결정 - 할당량 체크 제거"""
-        error_lower = error_str.lower()
-
-        # 일시적 오류 패턴 (재시도 가능)
-        temporary_patterns = [
-            'connection error' in error_lower,
-            'timeout' in error_lower,
-            'internal server error' in error_lower,
-            '500' in error_str,
-            '502' in error_str,
-            '503' in error_str,
-            'service unavailable' in error_lower
-        ]
-
-        if any(temporary_patterns):
-            return 'TEMPORARY_ERROR'
-        else:
-            return 'OTHER_ERROR'
-
-    def generate_ai_title(self, keyword):
-        """AI를 사용해 prompt1.txt 제목 지침에 따른 제목 생성"""
-        try:
-            title_prompt = f"""너는 SEO 전문가야. 아래 제목 지침에 따라 '{keyword}'에 대한 제목을 정확히 생성해.
-
-제목 지침:
-- 제목 형식: '{keyword} | 숫자가 들어간 후킹문구' 형식
-- 글자수: 50~60자, 숫자 필수 포함
-- 후킹 요소: 혜택 강조, 고통 해결, 구체적 수치 활용
-- 중요: 반드시 '{keyword} |' 로 시작해야 함!
-- 중요: 큰따옴표, #, *, 백틱 같은 특수문자는 절대 사용하지 마!
-
-제목 예시:
-인덕션 청소 | 10분만에 완벽하게 끝내는 3가지 방법
-스마트폰 배터리 | 2배 오래 쓰는 5가지 비밀 설정
-냉장고 정리 | 30분으로 1주일이 편해지는 수납법
-
-키워드: {keyword}
-
-위 지침에 맞는 제목 1개만 출력해. 설명이나 다른 내용은 일체 포함하지 마. 특수문자 없이 순수한 텍스트만 출력해."""
-
-            system_prompt = "너는 SEO 제목 전문가야. 주어진 지침에 따라 정확한 제목만 생성해. 큰따옴표나 특수문자 없이 순수한 텍스트로만 출력해."
-            
-            result = self.call_ai_api(title_prompt, "제목 생성", max_tokens=100, temperature=0.7, system_content=system_prompt)
-            
-            if result and result.strip():
-                generated_title = result.strip()
-                
-                # 제목에서 불필요한 문자 강제 제거
-                generated_title = generated_title.replace('"', '').replace("'", '').replace('`', '')
-                generated_title = generated_title.replace('#', '').replace('*', '').replace('**', '')
-                generated_title = re.sub(r'^[\s\-_=]+', '', generated_title)
-                generated_title = re.sub(r'[\s\-_=]+$', '', generated_title)
-                generated_title = generated_title.strip()
-                
-                # 제목 형식 검증
-                if generated_title.startswith(f"{keyword} |") and any(char.isdigit() for char in generated_title):
-                    self.log(f"🎯 AI 생성 제목: {generated_title}")
-                    return generated_title
-                else:
-                    self.log(f"❌ AI 제목 형식 불일치: {generated_title}")
-                    return None
-            else:
-                self.log("❌ AI 제목 생성 실패: 빈 응답")
-                return None
-                
-        except Exception as e:
-            self.log(f"❌ AI 제목 생성 중 오류: {e}")
-            return None
-
-    def clean_step1_content(self, content):
-        """1단계 콘텐츠 정리 - 제목+간단한 서론+링크버튼만 남기기"""
-        try:
-            import re
-            
-            # AI 역할 언급 완전 제거
-            role_patterns = [
-                r'제가\s*\d+년\s*경력의?\s*SEO\s*작가로서',
-                r'저는\s*\d+년\s*경력의?\s*SEO\s*작가로서',
-                r'\d+년\s*경력의?\s*SEO\s*작가로서',
-                r'\d+년\s*경력의?\s*전문가로서',
-                r'SEO\s*전문가로서',
-                r'콘텐츠\s*작가로서',
-                r'전문\s*작가로서'
-            ]
-            
-            for pattern in role_patterns:
-                content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-            
-            # 첫 번째 링크버튼만 보호
-            first_link = ""
-            def preserve_first_link(match):
-                nonlocal first_link
-                if not first_link:
-                    first_link = match.group(0)
-                    return "__FIRST_LINK__"
-                return ""  # 두 번째 이후 링크 제거
-            
-            # 모든 링크 패턴 처리
-            link_patterns = [
-                r'<div><center><p><a[^>]*class="링크버튼"[^>]*>.*?</a></p></center></div>',
-                r'<div><center><a[^>]*class="blink"[^>]*>.*?</a></center></div>',
-                r'<center><a[^>]*class="blink"[^>]*>.*?</a></center>',
-                r'<p[^>]*center[^>]*>.*?<a[^>]*class="링크버튼"[^>]*>.*?</a>.*?</p>'
-            ]
-            
-            for pattern in link_patterns:
-                content = re.sub(pattern, preserve_first_link, content, flags=re.DOTALL)
-            
-            # HTML을 줄 단위로 분리
-            lines = content.split('\n')
-            result_lines = []
-            h1_found = False
-            paragraph_count = 0
-            max_paragraphs = 2  # 서론은 최대 2개 문단만
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # h1 태그는 유지
-                if '<h1>' in line:
-                    result_lines.append(line)
-                    h1_found = True
-                    continue
-                
-                # h1 이후에만 처리
-                if not h1_found:
-                    continue
-                
-                # h2, h3 이하 소제목 발견 시 중단
-                if re.search(r'<h[2-6]', line, re.IGNORECASE):
-                    break
-                
-                # li, ul 태그 제거 (1단계에는 리스트 없어야 함)
-                if re.search(r'<[ul|li]', line, re.IGNORECASE):
-                    continue
-                
-                # p 태그만 허용하되 최대 개수 제한
-                if '<p>' in line and paragraph_count < max_paragraphs:
-                    result_lines.append(line)
-                    paragraph_count += 1
-                elif line == "__FIRST_LINK__":
-                    # 링크버튼 위치 표시
-                    result_lines.append(line)
-            
-            # 결과 조합
-            content = '\n'.join(result_lines)
-            
-            # 링크버튼 복원
-            if first_link:
-                content = content.replace("__FIRST_LINK__", first_link)
-            
-            # 최종 정리
-            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-            
-            return content.strip()
-            
-        except Exception as e:
-            self.log(f"1단계 콘텐츠 정리 중 오류: {e}")
-            return content
-
-    def clean_step5_content(self, content):
-        """5단계 콘텐츠 정리 - 마무리 구조 확인"""
-        try:
-            import re
-            
-            # 기본적인 HTML 구조 확인
-            has_basic_structure = '<h2>' in content or '<h3>' in content or '<p>' in content
-            
-            # 로그 출력
-            if not has_basic_structure:
-                self.log("🚨 5단계: 기본 HTML 구조 누락 - 제목이나 내용이 없습니다!")
-                
-            return content
-            
-        except Exception as e:
-            self.log(f"5단계 콘텐츠 정리 중 오류: {e}")
-            return content
-
-    def remove_prompt_meta_terms(self, content):
-        """프롬프트 메타 용어 및 지시사항 제거 - SEO 내용 제거 강화"""
-        try:
-            import re
-            # 제거할 메타 용어들
-            meta_terms = [
-                r'행동\s*유도\s*문구\s*텍스트',
-                r'문구\s*텍스트',
-                r'메타\s*텍스트',
-                r'프롬프트\s*지시사항',
-                r'시스템\s*프롬프트',
-                r'AI\s*지침',
-                r'콘텐츠\s*생성\s*지침',
-                r'작성\s*가이드라인',
-                r'HTML\s*태그\s*가이드',
-                r'서론\s*\d+자',
-                r'본문\s*\d+자',
-                r'제목\s*\d+자',
-                r'\d+자\s*내외',
-                r'\d+자\s*분량',
-                r'총\s*\d+-?\d*자',
-                r'😊.*?:',        # 이모지 + 콜론 패턴
-                r'👍.*?:',
-                r'✅.*?:',
-                r'💡.*?:',
-                r'📌.*?:',
-                r'🔍.*?:',
-                r'➡️.*?:',
-                r'단계별\s*목표',
-                r'핵심\s*키워드',
-                r'타겟\s*독자',
-                r'```[a-z]*',     # 마크다운 코드 블록 시작
-                r'```',           # 마크다운 코드 블록 끝
-                r'\*\*[^*]*\*\*:',  # 볼드 마크다운 + 콜론
-                r'#+\s*[^#]*:',     # 마크다운 헤더 + 콜론
-                # AI 역할 언급 제거 패턴 추가
-                r'\d+년\s*경력의?\s*SEO\s*작가로서',
-                r'\d+년\s*경력의?\s*SEO\s*콘텐츠\s*작가로서',
-                r'\d+년\s*경력의?\s*전문가로서',
-                r'SEO\s*전문가로서',
-                r'콘텐츠\s*작가로서',
-                r'전문\s*작가로서',
-                r'경험\s*많은\s*작가로서',
-                r'숙련된\s*작가로서',
-                # SEO 관련 내용 제거 패턴 추가
-                r'SEO.*?본질.*?콘텐츠\s*자산',
-                r'SEO.*?본질.*?콘텐츠\s*자산',
-                r'짧은\s*것들을\s*차근차근\s*시작하기',
-                r'완벽한\s*SEO란\s*없음',
-                r'오늘\s*하나의\s*제목.*?구체적인\s*정보.*?가볍게\s*시작하면\s*됩니다',
-                r'이번\s*주\s*목표.*?제목에\s*검색\s*키워드\s*포함하기',
-                r'다음\s*주\s*목표.*?본문에\s*소제목\s*구조\s*만들기',
-                r'다\s*음\s*주\s*목표.*?외부\s*링크\s*연결하기',
-                r'구글은\s*단기간에\s*결과가\s*나오는\s*것이\s*아니다',
-                r'한\s*달에\s*10개보다는\s*매주\s*2개씩\s*꾸준히',
-                r'블루투스\s*이어폰\s*연결\s*안될\s*때\s*비교\s*정보',
-                r'구분.*?특징.*?장점.*?\s*형태'
-            ]
-
-            # 각 메타 용어 제거
-            for term in meta_terms:
-                content = re.sub(term, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-
-            # HTML 관련 마크업 문구 제거 강화
-            html_markup_patterns = [
-                r'```html.*?```',     # ```html...``` 코드블록 전체
-                r'```html',           # ```html 시작
-                r'```',              # ``` 마크다운 코드블록
-                r'`html.*?`',         # `html...` 인라인 코드
-                r'`html',            # `html
-                r'"html',            # "html 
-                r'html\s*코드',       # html 코드
-                r'HTML\s*구조',       # HTML 구조  
-                r'html\s*태그',       # html 태그
-                r'HTML\s*태그',       # HTML 태그
-                r'<\/\*.*?\*\/>',     # /* */ 주석
-                r'<!--.*?-->',        # HTML 주석
-                # 마크다운 문법 제거 강화
-                r'#{1,6}\s+',         # ### 마크다운 헤더
-                r'\*\*([^*]+)\*\*',   # **bold** 마크다운
-                r'\*([^*]+)\*',       # *italic* 마크다운  
-                r'!\[.*?\]\(.*?\)',   # ![이미지](링크) 마크다운
-                r'\[([^\]]+)\]\([^)]+\)', # [텍스트](링크) 마크다운
-                # HTML 문서 구조 태그 완전 제거
-                r'<!DOCTYPE[^>]*>',   # DOCTYPE
-                r'<html[^>]*>',       # <html> 태그
-                r'</html>',           # </html> 태그
-                r'<head[^>]*>.*?</head>', # <head> 섹션 전체
-                r'<body[^>]*>',       # <body> 태그
-                r'</body>',           # </body> 태그
-                r'<meta[^>]*>',       # <meta> 태그
-                r'<title[^>]*>.*?</title>', # <title> 태그
-            ]
-            
-            for pattern in html_markup_patterns:
-                content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-
-            # <h1> 태그 완전 제거 (시스템에서 사용하지 않음)
-            content = re.sub(r'<h1[^>]*>.*?</h1>', '', content, flags=re.IGNORECASE | re.DOTALL)
-            content = re.sub(r'<h1[^>]*>', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'</h1>', '', content, flags=re.IGNORECASE)
-
-            # prompt1.txt에서 나와서는 안 되는 h2 태그 제거 (1단계는 제목+서론+링크버튼만)
-            content = re.sub(r'<h2[^>]*>.*?</h2>', '', content, flags=re.IGNORECASE | re.DOTALL)
-            content = re.sub(r'<h2[^>]*>', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'</h2>', '', content, flags=re.IGNORECASE)
-
-            # 특정 패턴들 추가 제거
-            content = re.sub(r'서론\s*\d+자', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'본문\s*\d+자', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'제목\s*\d+자', '', content, flags=re.IGNORECASE)
-
-            # 마크다운 관련 지시문 제거
-            content = re.sub(r'마크다운\s*문법\s*절대\s*사용\s*금지', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'HTML\s*태그만\s*사용', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'코드\s*블록\s*사용\s*금지', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'html\s*같은\s*마크다운\s*코드\s*블록', '', content, flags=re.IGNORECASE)
-
-            # SEO 관련 표나 구조화된 내용 제거
-            content = re.sub(r'<table>.*?</table>', '', content, flags=re.IGNORECASE | re.DOTALL)
-            content = re.sub(r'구분.*?특징.*?장점', '', content, flags=re.IGNORECASE | re.DOTALL)
-
-            # 단독으로 나오는 숫자+점 패턴 제거
-            content = re.sub(r'^\s*\d+\.\s*$', '', content, flags=re.MULTILINE)
-            content = re.sub(r'<p>\s*\d+\.\s*</p>', '', content, flags=re.IGNORECASE)
-
-            # 빈 태그나 의미없는 구문 정리
-            content = re.sub(r'<p>\s*</p>', '', content)
-            content = re.sub(r'<div>\s*</div>', '', content)
-            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)  # 과도한 줄바꿈 정리
-
-            return content.strip()
-
-        except Exception as e:
-            self.log(f"메타 용어 제거 중 오류: {e}")
-            return content
-
-    def remove_approval_meta_terms(self, content):
-        """승인용 콘텐츠의 메타 용어 제거 - <h2>, <p> 태그는 보존"""
-        try:
-            import re
-            # 제거할 메타 용어들 (승인용 글에서는 HTML 태그 보존)
-            meta_terms = [
-                r'행동\s*유도\s*문구\s*텍스트',
-                r'문구\s*텍스트',
-                r'메타\s*텍스트',
-                r'프롬프트\s*지시사항',
-                r'시스템\s*프롬프트',
-                r'AI\s*지침',
-                r'콘텐츠\s*생성\s*지침',
-                r'작성\s*가이드라인',
-                r'HTML\s*태그\s*가이드',
-                r'서론\s*\d+자',
-                r'본문\s*\d+자',
-                r'제목\s*\d+자',
-                r'\d+자\s*내외',
-                r'\d+자\s*분량',
-                r'총\s*\d+-?\d*자',
-                r'😊.*?:',
-                r'👍.*?:',
-                r'✅.*?:',
-                r'💡.*?:',
-                r'📌.*?:',
-                r'🔍.*?:',
-                r'구체적이고\s*설명적인',
-                r'단계별\s*목표',
-                r'핵심\s*키워드',
-                r'타겟\s*독자',
-                r'```[a-z]*',
-                r'```',
-                r'\*\*[^*]*\*\*:',
-                r'#+\s*[^#]*:',
-                r'AI\s*역할\s*언급',
-                r'\d+년\s*경력의?\s*전문가로서',
-                r'SEO\s*전문가로서',
-                r'콘텐츠\s*작가로서',
-                r'마크다운\s*문법\s*절대\s*사용\s*금지',
-                r'HTML\s*태그만\s*사용',
-                r'코드\s*블록\s*사용\s*금지'
-            ]
-
-            # HTML 관련 마크업 문구 제거 (승인용에서는 실제 HTML 태그는 보존)
-            html_markup_patterns = [
-                r'```html.*?```',
-                r'```html',
-                r'`html.*?`',
-                r'`html',
-                r'"html',
-                r'<!DOCTYPE[^>]*>',
-                r'<html[^>]*>',
-                r'</html>',
-                r'<head[^>]*>.*?</head>',
-                r'<body[^>]*>',
-                r'</body>',
-                r'<meta[^>]*>',
-                r'<title[^>]*>.*?</title>',
-            ]
-
-            # 각 메타 용어 제거
-            for term in meta_terms:
-                content = re.sub(term, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-
-            # HTML 관련 마크업 문구 제거
-            for pattern in html_markup_patterns:
-                content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
-
-            # 마크다운을 HTML로 강제 변환 (승인용 글 전용)
-            content = self.convert_approval_markdown_to_html(content)
-
-            # <h1> 태그만 제거 (승인용에서는 사용하지 않음)
-            content = re.sub(r'<h1[^>]*>.*?</h1>', '', content, flags=re.IGNORECASE | re.DOTALL)
-            content = re.sub(r'<h1[^>]*>', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'</h1>', '', content, flags=re.IGNORECASE)
-
-            # 승인용에서는 <h2>, <p> 태그는 보존 (제거하지 않음)
-
-            # 특정 패턴들 추가 제거
-            content = re.sub(r'서론\s*\d+자', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'본문\s*\d+자', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'제목\s*\d+자', '', content, flags=re.IGNORECASE)
-
-            # 단독으로 나오는 숫자+점 패턴 제거
-            content = re.sub(r'^\s*\d+\.\s*$', '', content, flags=re.MULTILINE)
-            content = re.sub(r'<p>\s*\d+\.\s*</p>', '', content, flags=re.IGNORECASE)
-
-            # 빈 태그나 의미없는 구문 정리
-            content = re.sub(r'<p>\s*</p>', '', content)
-            content = re.sub(r'<div>\s*</div>', '', content)
-            content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-
-            return content.strip()
-
-        except Exception as e:
-            self.log(f"승인용 메타 용어 제거 중 오류: {e}")
-            return content
-
-    def convert_approval_markdown_to_html(self, content):
-        """승인용 글의 마크다운을 HTML로 변환 - <h2>, <p> 태그 강제 적용"""
-        try:
-            import re
-            
-            # 마크다운 헤더를 HTML로 변환
-            content = re.sub(r'^### (.*?)$', r'<h3><strong>\1</strong></h3>', content, flags=re.MULTILINE)
-            content = re.sub(r'^## (.*?)$', r'<h2><strong>\1</strong></h2>', content, flags=re.MULTILINE)
-            content = re.sub(r'^# (.*?)$', '', content, flags=re.MULTILINE)  # h1은 제거
-            
-            # 마크다운 볼드를 HTML로 변환
-            content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-            content = re.sub(r'__(.*?)__', r'<strong>\1</strong>', content)
-            
-            # 마크다운 이탤릭을 HTML로 변환
-            content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
-            content = re.sub(r'_(.*?)_', r'<em>\1</em>', content)
-            
-            # 줄바꿈을 <p> 태그로 변환 (빈 줄로 구분된 단락들)
-            paragraphs = re.split(r'\n\s*\n', content.strip())
-            html_paragraphs = []
-            
-            for paragraph in paragraphs:
-                paragraph = paragraph.strip()
-                if paragraph:
-                    # 이미 HTML 태그로 감싸져 있는지 확인
-                    if paragraph.startswith('<h') or paragraph.startswith('<div') or paragraph.startswith('<table'):
-                        html_paragraphs.append(paragraph)
-                    elif paragraph.startswith('<p>') and paragraph.endswith('</p>'):
-                        html_paragraphs.append(paragraph)
-                    else:
-                        # 단순 텍스트는 <p> 태그로 감싸기
-                        html_paragraphs.append(f'<p>{paragraph}</p>')
-            
-            content = '\n\n'.join(html_paragraphs)
-            
-            # 중복 <p> 태그 제거
-            content = re.sub(r'<p>\s*<p>(.*?)</p>\s*</p>', r'<p>\1</p>', content, flags=re.DOTALL)
-            
-            return content.strip()
-            
-        except Exception as e:
-            self.log(f"승인용 마크다운 변환 중 오류: {e}")
-            return content
-
-    def final_approval_validation(self, content, keyword):
-        """승인용 글 최종 검증 및 강제 HTML 변환"""
-        try:
-            import re
-            
-            self.log("🔍 승인용 글 최종 검증 시작...")
-            
-            # 마크다운 문법 검사
-            markdown_found = False
-            markdown_patterns = [
-                (r'##\s+', '## 헤딩'),
-                (r'\*\*.*?\*\*', '**볼드**'),
-                (r'\*.*?\*(?!\*)', '*이탤릭*'),
-                (r'```', '코드 블록'),
-                (r'---', '구분선'),
-                (r'`.*?`', '인라인 코드')
-            ]
-            
-            for pattern, name in markdown_patterns:
-                if re.search(pattern, content):
-                    self.log(f"⚠️ 마크다운 발견: {name}")
-                    markdown_found = True
-            
-            if markdown_found:
-                self.log("🔧 마크다운을 HTML로 강제 변환 중...")
-                content = self.convert_approval_markdown_to_html(content)
-                
-                # 변환 후 재검사
-                for pattern, name in markdown_patterns:
-                    if re.search(pattern, content):
-                        self.log(f"⚠️ 변환 후에도 마크다운 남음: {name}")
-                        # 더 강력한 변환 수행
-                        content = re.sub(r'##\s+(.*?)(?=\n|$)', r'<h2><strong>\1</strong></h2>', content)
-                        content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-                        content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
-                        content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-                        content = re.sub(r'`(.*?)`', r'\1', content)
-                        content = re.sub(r'---+', '', content)
-            
-            # HTML 구조 검증
-            h2_count = len(re.findall(r'<h2[^>]*>.*?</h2>', content, re.IGNORECASE | re.DOTALL))
-            p_count = len(re.findall(r'<p[^>]*>.*?</p>', content, re.IGNORECASE | re.DOTALL))
-            
-            self.log(f"📊 HTML 구조 검증: <h2> {h2_count}개, <p> {p_count}개")
-            
-            if h2_count == 0:
-                self.log("⚠️ <h2> 태그가 없음 - 소제목 강제 생성")
-                # 간단한 소제목 추가
-                subtitles = ["활용법", "주요 특징", "실무 팁"]
-                for i, subtitle in enumerate(subtitles):
-                    if f"<h2>" not in content:
-                        content = f"<h2><strong>{keyword} {subtitle}</strong></h2>\n" + content
-                        break
-            
-            if p_count == 0:
-                self.log("⚠️ <p> 태그가 없음 - 텍스트를 <p>로 감싸기")
-                # 텍스트를 <p> 태그로 감싸기
-                lines = content.split('\n')
-                processed_lines = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith('<'):
-                        processed_lines.append(f"<p>{line}</p>")
-                    elif line:
-                        processed_lines.append(line)
-                content = '\n'.join(processed_lines)
-            
-            self.log("✅ 승인용 글 최종 검증 완료")
-            return content
-            
-        except Exception as e:
-            self.log(f"승인용 글 최종 검증 중 오류: {e}")
-            return content
-
-    def extract_approval_title(self, raw_content, keyword):
-        """승인용 글에서 제목만 추출 (원본 AI 응답에서)"""
-        try:
-            import re
-            
-            self.log("🔍 원본 응답에서 제목 추출 시작...")
-            
-            lines = raw_content.split('\n')
-            for i, line in enumerate(lines[:5]):  # 처음 5줄만 확인
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # HTML 태그 완전 제거
-                clean_line = re.sub(r'<[^>]+>', '', line).strip()
-                
-                # 불필요한 문자 제거 (큰따옴표, #, *, 백틱 등)
-                clean_line = clean_line.replace('"', '').replace("'", '').replace('`', '')
-                clean_line = clean_line.replace('#', '').replace('*', '').replace('**', '')
-                clean_line = re.sub(r'^[\s\-_=]+', '', clean_line)
-                clean_line = re.sub(r'[\s\-_=]+$', '', clean_line)
-                clean_line = clean_line.strip()
-                
-                # 제목 패턴 확인: 콜론이 있고, 적절한 길이이고, HTML 태그로 시작하지 않음
-                if ':' in clean_line and 15 <= len(clean_line) <= 70 and not line.startswith('<'):
-                    # 추가 검증: 콜론 뒤에 콤마가 있어야 함 (승인용 제목 형식)
-                    parts = clean_line.split(':', 1)
-                    if len(parts) == 2 and ',' in parts[1]:
-                        self.log(f"📌 제목 추출 성공: {clean_line}")
-                        return clean_line
-            
-            # 제목을 찾지 못한 경우 키워드 기반 생성
-            fallback_title = f"{keyword}: 활용법, 주요 특징, 실무 팁"
-            self.log(f"⚠️ 제목 추출 실패, 자동 생성: {fallback_title}")
-            return fallback_title
-            
-        except Exception as e:
-            self.log(f"제목 추출 중 오류: {e}")
-            return f"{keyword}: 활용법, 주요 특징, 실무 팁"
-
-    def process_approval_step_content(self, raw_content, step_number, keyword):
-        """승인용 글 단계별 정밀 처리 - 제목 분리, HTML 구조 강제 적용"""
-        try:
-            import re
-            
-            self.log(f"🔧 승인용 {step_number}단계 정밀 처리 시작...")
-            
-            # 1단계: 기본 메타 용어 제거
-            content = self.remove_approval_meta_terms(raw_content)
-            
-            # 2단계: 단계별 맞춤 처리
-            if step_number == 1:
-                # 1단계: 제목 + 서론 + 첫 번째 소제목 + 본문
-                content = self.process_approval_step1(content, keyword)
-            elif step_number == 2:
-                # 2단계: 두 번째 소제목 + 본문
-                content = self.process_approval_step2(content, keyword)
-            elif step_number == 3:
-                # 3단계: 세 번째 소제목 + 본문
-                content = self.process_approval_step3(content, keyword)
-            
-            self.log(f"✅ 승인용 {step_number}단계 처리 완료")
-            return content
-            
-        except Exception as e:
-            self.log(f"승인용 {step_number}단계 처리 중 오류: {e}")
-            return self.remove_approval_meta_terms(raw_content)
-
-    def process_approval_step1(self, content, keyword):
-        """승인용 1단계 처리: 제목은 완전히 제외하고 서론+소제목1+본문1만 반환"""
-        try:
-            import re
-            
-            self.log("🔧 1단계: 제목 완전 제외, 서론+소제목1+본문1 처리")
-            
-            lines = content.split('\n')
-            processed_lines = []
-            title_lines_removed = 0
-            intro_content = []
-            subtitle_content = []
-            body_content = []
-            current_section = 'intro'
-            
-            # 먼저 제목으로 보이는 모든 라인을 식별하고 제거
-            filtered_lines = []
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # HTML 태그 제거한 순수 텍스트
-                clean_line = re.sub(r'<[^>]+>', '', line).strip()
-                
-                # 제목 패턴 감지 및 완전 제거
-                is_title = False
-                
-                # 패턴 1: 콜론이 있고 콤마가 있는 제목 형식
-                if ':' in clean_line and ',' in clean_line and 15 <= len(clean_line) <= 70:
-                    parts = clean_line.split(':', 1)
-                    if len(parts) == 2 and len(parts[1].split(',')) >= 2:
-                        is_title = True
-                        self.log(f"📌 제목 패턴1 감지하여 제거: {clean_line[:40]}...")
-                
-                # 패턴 2: 키워드가 포함되고 콜론이 있는 경우
-                if keyword in clean_line and ':' in clean_line and len(clean_line) <= 60:
-                    is_title = True
-                    self.log(f"📌 제목 패턴2 감지하여 제거: {clean_line[:40]}...")
-                
-                # 패턴 3: 첫 5줄 중에서 콜론만 있는 경우도 제목으로 간주
-                if i < 5 and ':' in clean_line and not line.startswith('<') and len(clean_line) >= 10:
-                    is_title = True
-                    self.log(f"📌 제목 패턴3 감지하여 제거: {clean_line[:40]}...")
-                
-                if is_title:
-                    title_lines_removed += 1
-                    continue  # 제목 라인은 완전히 스킵
-                
-                filtered_lines.append(line)
-            
-            self.log(f"📊 제목 라인 {title_lines_removed}개 제거됨")
-            
-            # 필터링된 라인들을 다시 처리
-            for line in filtered_lines:
-                # 마크다운 헤더를 HTML로 강제 변환
-                if re.match(r'^##\s+', line):
-                    subtitle_text = re.sub(r'^##\s+', '', line).strip()
-                    subtitle_text = re.sub(r'\*\*(.*?)\*\*', r'\1', subtitle_text)  # ** 제거
-                    subtitle_content.append(f"<h2><strong>{subtitle_text}</strong></h2>")
-                    current_section = 'body'
-                    self.log(f"📌 마크다운 소제목 변환: {subtitle_text}")
-                    continue
-                
-                # HTML h2 태그가 이미 있는 경우
-                if re.match(r'<h2[^>]*>', line, re.IGNORECASE):
-                    current_section = 'body'
-                    # <strong> 태그가 없으면 추가
-                    if '<strong>' not in line.lower():
-                        line = re.sub(r'<h2[^>]*>(.*?)</h2>', r'<h2><strong>\1</strong></h2>', line, flags=re.IGNORECASE)
-                    subtitle_content.append(line)
-                    self.log(f"📌 HTML 소제목 발견: {line}")
-                    continue
-                
-                # 볼드 마크다운 제거
-                line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
-                
-                # 본문 내용 처리
-                if current_section == 'intro':
-                    intro_content.append(line)
-                elif current_section == 'body':
-                    body_content.append(line)
-                else:
-                    intro_content.append(line)
-            
-            # 서론을 <p> 태그로 강제 처리 (h태그 사용하지 않음)
-            if intro_content:
-                intro_text = ' '.join(intro_content).strip()
-                # HTML 태그 제거 후 순수 텍스트만 추출
-                intro_text = re.sub(r'<[^>]+>', '', intro_text)
-                
-                # 서론에서도 제목 패턴이 남아있는지 한번 더 확인
-                if ':' in intro_text and ',' in intro_text:
-                    # 콜론 이후 부분만 사용 (제목 앞부분 제거)
-                    parts = intro_text.split(':', 1)
-                    if len(parts) == 2:
-                        intro_text = parts[1].strip()
-                        # 첫 번째 콤마 이후 부분부터 사용
-                        comma_parts = intro_text.split(',', 1)
-                        if len(comma_parts) == 2:
-                            intro_text = comma_parts[1].strip()
-                        self.log("📌 서론에서 제목 잔여 부분 제거")
-                
-                if intro_text and len(intro_text) > 10:  # 의미있는 서론이 있을 때만
-                    processed_lines.append(f"<p>{intro_text}</p>")
-                    self.log(f"📌 서론 생성 (p태그): {intro_text[:50]}...")
-            
-            # 소제목이 없으면 강제 생성
-            if not subtitle_content:
-                processed_lines.append(f"<h2><strong>{keyword} 기본 활용법</strong></h2>")
-                self.log(f"📌 소제목 강제 생성: {keyword} 기본 활용법")
-            else:
-                processed_lines.extend(subtitle_content)
-            
-            # 본문을 <p> 태그로 강제 처리
-            if body_content:
-                body_text = ' '.join(body_content).strip()
-                # HTML 태그 제거 후 순수 텍스트만 추출
-                body_text = re.sub(r'<[^>]+>', '', body_text)
-                if body_text and len(body_text) > 10:  # 의미있는 본문이 있을 때만
-                    processed_lines.append(f"<p>{body_text}</p>")
-                    self.log(f"📌 본문 생성: {body_text[:50]}...")
-            
-            result = '\n\n'.join(processed_lines)
-            self.log("✅ 1단계 제목 완전 제거 및 HTML 구조 강제 적용 완료")
-            return result
-            
-        except Exception as e:
-            self.log(f"1단계 처리 중 오류: {e}")
-            return content
-
-    def process_approval_step2(self, content, keyword):
-        """승인용 2단계 처리: 소제목2 + 본문2"""
-        try:
-            import re
-            
-            self.log("🔧 2단계: 소제목2+본문2 처리")
-            
-            lines = content.split('\n')
-            processed_lines = []
-            subtitle_content = []
-            body_content = []
-            current_section = 'subtitle'
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # 마크다운 헤더를 HTML로 강제 변환
-                if re.match(r'^##\s+', line):
-                    subtitle_text = re.sub(r'^##\s+', '', line).strip()
-                    subtitle_text = re.sub(r'\*\*(.*?)\*\*', r'\1', subtitle_text)  # ** 제거
-                    subtitle_content.append(f"<h2><strong>{subtitle_text}</strong></h2>")
-                    current_section = 'body'
-                    self.log(f"📌 2단계 마크다운 소제목 변환: {subtitle_text}")
-                    continue
-                
-                # HTML h2 태그가 이미 있는 경우
-                if re.match(r'<h2[^>]*>', line, re.IGNORECASE):
-                    current_section = 'body'
-                    # <strong> 태그가 없으면 추가
-                    if '<strong>' not in line.lower():
-                        line = re.sub(r'<h2[^>]*>(.*?)</h2>', r'<h2><strong>\1</strong></h2>', line, flags=re.IGNORECASE)
-                    subtitle_content.append(line)
-                    self.log(f"📌 2단계 HTML 소제목 발견: {line}")
-                    continue
-                
-                # 볼드 마크다운 제거
-                line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
-                
-                # 본문 내용 수집
-                if current_section == 'body':
-                    body_content.append(line)
-                else:
-                    # 소제목이 없으면 이 내용으로 소제목 생성
-                    if not subtitle_content and current_section == 'subtitle':
-                        first_words = ' '.join(line.split()[:3])
-                        subtitle_content.append(f"<h2><strong>{keyword} {first_words} 특징</strong></h2>")
-                        current_section = 'body'
-                        self.log(f"📌 2단계 소제목 자동 생성: {keyword} {first_words} 특징")
-                    body_content.append(line)
-            
-            # 소제목이 없으면 강제 생성
-            if not subtitle_content:
-                processed_lines.append(f"<h2><strong>{keyword} 주요 특징</strong></h2>")
-                self.log(f"📌 2단계 소제목 강제 생성: {keyword} 주요 특징")
-            else:
-                processed_lines.extend(subtitle_content)
-            
-            # 본문을 <p> 태그로 강제 처리
-            if body_content:
-                body_text = ' '.join(body_content).strip()
-                # HTML 태그 제거 후 순수 텍스트만 추출
-                body_text = re.sub(r'<[^>]+>', '', body_text)
-                if body_text:
-                    processed_lines.append(f"<p>{body_text}</p>")
-                    self.log(f"📌 2단계 본문 생성: {body_text[:50]}...")
-            
-            result = '\n\n'.join(processed_lines)
-            self.log("✅ 2단계 HTML 구조 강제 적용 완료")
-            return result
-            
-        except Exception as e:
-            self.log(f"2단계 처리 중 오류: {e}")
-            return content
-
-    def process_approval_step3(self, content, keyword):
-        """승인용 3단계 처리: 소제목3 + 본문3"""
-        try:
-            import re
-            
-            self.log("🔧 3단계: 소제목3+본문3 처리")
-            
-            lines = content.split('\n')
-            processed_lines = []
-            subtitle_content = []
-            body_content = []
-            current_section = 'subtitle'
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # 마크다운 헤더를 HTML로 강제 변환
-                if re.match(r'^##\s+', line):
-                    subtitle_text = re.sub(r'^##\s+', '', line).strip()
-                    subtitle_text = re.sub(r'\*\*(.*?)\*\*', r'\1', subtitle_text)  # ** 제거
-                    subtitle_content.append(f"<h2><strong>{subtitle_text}</strong></h2>")
-                    current_section = 'body'
-                    self.log(f"📌 3단계 마크다운 소제목 변환: {subtitle_text}")
-                    continue
-                
-                # HTML h2 태그가 이미 있는 경우
-                if re.match(r'<h2[^>]*>', line, re.IGNORECASE):
-                    current_section = 'body'
-                    # <strong> 태그가 없으면 추가
-                    if '<strong>' not in line.lower():
-                        line = re.sub(r'<h2[^>]*>(.*?)</h2>', r'<h2><strong>\1</strong></h2>', line, flags=re.IGNORECASE)
-                    subtitle_content.append(line)
-                    self.log(f"📌 3단계 HTML 소제목 발견: {line}")
-                    continue
-                
-                # 볼드 마크다운 제거
-                line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
-                
-                # 본문 내용 수집
-                if current_section == 'body':
-                    body_content.append(line)
-                else:
-                    # 소제목이 없으면 이 내용으로 소제목 생성
-                    if not subtitle_content and current_section == 'subtitle':
-                        first_words = ' '.join(line.split()[:3])
-                        subtitle_content.append(f"<h2><strong>{keyword} {first_words} 활용 팁</strong></h2>")
-                        current_section = 'body'
-                        self.log(f"📌 3단계 소제목 자동 생성: {keyword} {first_words} 활용 팁")
-                    body_content.append(line)
-            
-            # 소제목이 없으면 강제 생성
-            if not subtitle_content:
-                processed_lines.append(f"<h2><strong>{keyword} 실무 활용 팁</strong></h2>")
-                self.log(f"📌 3단계 소제목 강제 생성: {keyword} 실무 활용 팁")
-            else:
-                processed_lines.extend(subtitle_content)
-            
-            # 본문을 <p> 태그로 강제 처리
-            if body_content:
-                body_text = ' '.join(body_content).strip()
-                # HTML 태그 제거 후 순수 텍스트만 추출
-                body_text = re.sub(r'<[^>]+>', '', body_text)
-                if body_text:
-                    processed_lines.append(f"<p>{body_text}</p>")
-                    self.log(f"📌 3단계 본문 생성: {body_text[:50]}...")
-            
-            result = '\n\n'.join(processed_lines)
-            self.log("✅ 3단계 HTML 구조 강제 적용 완료")
-            return result
-            
-        except Exception as e:
-            self.log(f"3단계 처리 중 오류: {e}")
-            return content
-
-    def generate_approval_content(self, keyword):
-        """승인용 콘텐츠 생성 - approval1.txt, approval2.txt, approval3.txt만 사용"""
-        try:
-            # 승인용 프롬프트 파일 로드 (3개만)
-            approval_files = [
-                "approval1.txt", "approval2.txt", "approval3.txt"
-            ]
-
-            all_content_parts = []
-            title = ""
-
-            # 3개 승인용 프롬프트 파일을 순차적으로 적용
-            for i, approval_file in enumerate(approval_files, 1):
-                prompt_path = os.path.join(get_base_path(), "prompts", approval_file)
-
-                if os.path.exists(prompt_path):
-                    # UTF-8 BOM 처리를 위해 utf-8-sig 사용
-                    try:
-                        with open(prompt_path, 'r', encoding='utf-8-sig') as f:
-                            prompt_template = f.read()
-                    except UnicodeDecodeError:
-                        # BOM이 없는 경우 일반 utf-8로 재시도
-                        with open(prompt_path, 'r', encoding='utf-8') as f:
-                            prompt_template = f.read()
-
-                    # 키워드 대체
-                    prompt = prompt_template.replace("{keyword}", keyword)
-                    
-                    # 승인용 글 전용: 프롬프트 파일에 이미 규칙이 있으므로 추가하지 않음
-
-                    print(f"승인용 {i}단계 생성 중", end=" ")
-
-                    # 통합 AI API 호출
-                    try:
-                        response_text = self.call_ai_api(prompt, f"승인용 {i}단계", max_tokens=1500, temperature=0.7)
-
-                        if response_text and response_text.strip():
-                            # 첫 번째 단계에서 승인용 제목 추출 (처리 전 원본에서)
-                            if i == 1:
-                                title = self.extract_approval_title(response_text.strip(), keyword)
-                            
-                            # AI 출력 검증 및 자동 수정 (프롬프트 '중요 주의사항' 규칙 적용)
-                            response_text = self.validate_ai_output(response_text.strip(), keyword)
-                            
-                            # 승인용 글 전용 정밀 처리 (제목 완전 제거)
-                            step_content = self.process_approval_step_content(response_text, i, keyword)
-                            
-                            all_content_parts.append(step_content)
-
-                        # 다음 단계로 계속 진행
-
-                    except Exception as step_error:
-                        self.log(f"❌ 승인용 {i}단계 오류: {str(step_error)}")
-                        # 단계별 오류 시에도 계속 진행
-                else:
-                    self.log(f"❌ 승인용 프롬프트 파일 없음: {approval_file}")
-
-            if not all_content_parts:
-                self.log(f"🔥 승인용 콘텐츠 생성 실패 - 모든 단계 실패")
-                return None, None, None
-
-            # 3단계의 콘텐츠를 결합
-            full_content = "\n\n".join(all_content_parts)
-            
-            # 승인용 글 최종 검증 및 강제 HTML 변환
-            full_content = self.final_approval_validation(full_content, keyword)
-            
-            self.log(f"📝 승인용 본문 생성 완료 - 3단계 ({len(full_content)}자)")
-            print()  # 승인용 콘텐츠 생성 완료 후 개행
-
-            if not title:
-                # 승인용 전용 fallback 제목 생성
-                self.log("⚠️ 승인용 제목 추출 실패, fallback 제목 생성")
-                title = self.generate_approval_fallback_title(keyword)
-                if not title:
-                    # 최후 fallback - 승인용 형식에 맞게 생성
-                    approval_subtitles = ["활용법", "주요 특징", "실무 팁"]
-                    title = f"{keyword}: {approval_subtitles[0]}, {approval_subtitles[1]}, {approval_subtitles[2]}"
-                self.log(f"📝 자동 생성된 제목: {title}")
-
-            # 썸네일 이미지 선택 및 제목 추가
-            thumbnail_filename = self.get_thumbnail_file()
-            base_thumbnail_path = os.path.join(get_base_path(), 'images', thumbnail_filename)
-
-            # 제목이 있으면 썸네일에 제목 추가
-            thumbnail_path = self.create_thumbnail_with_title(title, keyword)
-
-            return title, full_content, thumbnail_path
-
-        except Exception as e:
-            self.log(f"🔥 승인용 콘텐츠 생성 오류: {str(e)}")
-            import traceback
-            self.log(f"🔍 상세 오류:\n{traceback.format_exc()}")
-            return None, None, None
-
-    def convert_markdown_to_html(self, content):
-        """마크다운을 HTML로 변환"""
-        try:
-            # 먼저 링크 버튼 및 다운로드 버튼 HTML을 모두 보호
-            link_patterns = []
-            def preserve_link_html(match):
-                link_patterns.append(match.group(0))
-                return f"__LINK_PLACEHOLDER_{len(link_patterns)-1}__"
-
-            # 다운로드 버튼 전체 container 보호 (class="button-container")
-            content = re.sub(r'<div\s+class="button-container">.*?</div>', preserve_link_html, content, flags=re.DOTALL)
-            
-            # 개별 다운로드 버튼 <a> 태그 보호 (class="custom-download-btn")
-            content = re.sub(r'<a[^>]*class="custom-download-btn"[^>]*>.*?</a>', preserve_link_html, content, flags=re.DOTALL)
-            
-            # <div><center><a class="blink"  패턴 보호
-            content = re.sub(r'<div><center><a[^>]*class="blink"[^>]*>.*?</a></center></div>', preserve_link_html, content, flags=re.DOTALL)
-            # <center><a class="blink"  패턴도 보호
-            content = re.sub(r'<center><a[^>]*class="blink"[^>]*>.*?</a></center>', preserve_link_html, content, flags=re.DOTALL)
-            # 단순 <a class="blink"  패턴도 보호
-            content = re.sub(r'<a[^>]*class="blink"[^>]*>.*?</a>', preserve_link_html, content, flags=re.DOTALL)
-            
-            # link1, link2, link3 클래스 보호 - prompt2.txt, prompt3.txt, prompt4.txt에서 사용
-            content = re.sub(r'<div><center><p><a[^>]*class="link[123]"[^>]*>.*?</a></p></center></div>', preserve_link_html, content, flags=re.DOTALL)
-            content = re.sub(r'<a[^>]*class="link[123]"[^>]*>.*?</a>', preserve_link_html, content, flags=re.DOTALL)
-
-            # 마크다운 코드 블록 제거 (```html, ```python 등)
-            content = re.sub(r'```[a-z]*\n?', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'```', '', content)
-
-            # 제목 처리 - h1은 제거 (제목은 별도 필드로 처리)
-            content = re.sub(r'^# (.*?)$', '', content, flags=re.MULTILINE)
-            content = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
-            content = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
-
-            # 굵은 글씨 처리
-            content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-            content = re.sub(r'__(.*?)__', r'<strong>\1</strong>', content)
-
-            # 기울임 처리
-            content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
-            content = re.sub(r'_(.*?)_', r'<em>\1</em>', content)
-
-            # 리스트 처리
-            content = re.sub(r'^- (.*?)$', r'<li>\1</li>', content, flags=re.MULTILINE)
-            content = re.sub(r'^\* (.*?)$', r'<li>\1</li>', content, flags=re.MULTILINE)
-            content = re.sub(r'^(\d+)\. (.*?)$', r'<li>\2</li>', content, flags=re.MULTILINE)
-
-            # 연속된 <li> 태그를 <ul>로 감싸기
-            content = re.sub(r'(<li>.*?</li>\s*)+', lambda m: f'<ul>{m.group(0)}</ul>', content, flags=re.DOTALL)
-
-            # 수평선 처리
-            content = re.sub(r'^---+$', r'<hr>', content, flags=re.MULTILINE)
-            content = re.sub(r'^\*\*\*+$', r'<hr>', content, flags=re.MULTILINE)
-
-            # 블록 인용 처리
-            content = re.sub(r'^> (.*?)$', r'<blockquote>\1</blockquote>', content, flags=re.MULTILINE)
-
-            # 단락 처리 (빈 줄로 구분된 텍스트를 <p> 태그로)
-            paragraphs = content.split('\n\n')
-            html_paragraphs = []
-
-            for para in paragraphs:
-                para = para.strip()
-                if para and not para.startswith('<') and '__LINK_PLACEHOLDER_' not in para:
-                    para = f'<p>{para}</p>'
-                html_paragraphs.append(para)
-
-            content = '\n\n'.join(html_paragraphs)
-
-            # 줄바꿈 처리 - <br> 태그 남용 방지
-            # 링크 버튼 내부의 <br>은 보호하되, 일반 텍스트의 줄바꿈은 공백으로 처리
-            content = re.sub(r'(?<!>)\n(?!<)', ' ', content)
-            
-            # 과도한 공백 정리
-            content = re.sub(r'\s+', ' ', content)
-            content = re.sub(r'>\s+<', '><', content)  # 태그 사이 불필요한 공백 제거
-
-            # 보호한 링크 부분 복원
-            for i, link in enumerate(link_patterns):
-                content = content.replace(f"__LINK_PLACEHOLDER_{i}__", link)
-
-            return content
-
-        except Exception as e:
-            self.log(f"마크다운 변환 중 오류: {e}")
-            return content
-
-    def validate_ai_output(self, content, keyword):
-        """
-        AI 출력 검증 - 프롬프트의 '중요 주의사항' 규칙들을 자동으로 검사하고 수정
-        프롬프트 파일에 적힌 주의사항들을 Python 로직으로 처리
-        """
-        try:
-            import re
-            
-            issues_found = []
-            fixes_applied = []
-            
-            # 규칙 1: 플레이스홀더 텍스트 검증
-            placeholder_patterns = [
-                (r'<p>본문\d+-?\d?\s*\d+자</p>', '실제 본문 내용이 없고 플레이스홀더만 있음'),
-                (r'<h[2-4]><strong>소제목\d+</strong></h[2-4]>', '소제목이 구체적이지 않고 플레이스홀더만 있음'),
-                (r'\[실제 유용한 URL\]', '[실제 유용한 URL] 플레이스홀더가 그대로 남아있음'),
-                (r'\[구체적인 앵커 텍스트\]', '[구체적인 앵커 텍스트] 플레이스홀더가 그대로 남아있음'),
-                (r'href="\s*url\s*입력\s*"', 'href="url 입력" 플레이스홀더가 그대로 남아있음'),
-                (r'href="\s*\[.*?\]\s*"', 'href에 대괄호 플레이스홀더가 남아있음'),
-                (r'>\s*앵커\s*텍스트\s*<', '"앵커 텍스트" 플레이스홀더가 그대로 남아있음'),
-                (r'\[\{keyword\}.*?\]', '[{keyword}...] 형태의 플레이스홀더가 남아있음'),
-                (r'\[.*?대상\s*\d+.*?\]', '[대상 1], [대상 2] 같은 플레이스홀더가 남아있음'),
-                (r'\[.*?항목\s*\d+.*?\]', '[항목 1], [비교 항목] 같은 플레이스홀더가 남아있음'),
-                (r'\[.*?표\s*주제.*?\]', '[표 주제] 플레이스홀더가 남아있음'),
-                (r'\[사용자의 실제 고민 질문\]', 'FAQ 질문이 구체적이지 않고 플레이스홀더만 있음'),
-                (r'\[상세한 답변 내용\]', 'FAQ 답변이 구체적이지 않고 플레이스홀더만 있음'),
-                (r'\[.*?\d+자.*?\]', '[300자], [200-300자] 같은 분량 플레이스홀더가 남아있음'),
-            ]
-            
-            for pattern, issue_msg in placeholder_patterns:
-                matches = re.findall(pattern, content, flags=re.IGNORECASE)
-                if matches:
-                    issues_found.append(f"❌ {issue_msg} (발견: {len(matches)}개)")
-                    self.log(f"⚠️ AI 출력 검증 실패: {issue_msg}")
-                    # 실제 내용으로 교체 시도
-                    if 'href="url 입력"' in content or 'href=" url 입력 "' in content:
-                        search_url = f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
-                        content = re.sub(r'href="\s*url\s*입력\s*"', f'href="{search_url}"', content, flags=re.IGNORECASE)
-                        fixes_applied.append("✅ 'href=\"url 입력\"'을 실제 검색 URL로 교체")
-            
-            # 규칙 2: 형식 지시자 검증 (출력에 포함되면 안 되는 것들)
-            format_indicators = [
-                r'【형식\d+】',
-                r'▼▼▼.*?▼▼▼',
-                r'출력\s*형식',
-                r'출력\s*예시',
-                r'절대\s*지켜야\s*할\s*규칙',
-                r'중요\s*주의사항',
-                r'\(아래\s*형식을.*?출력해\)',
-            ]
-            
-            for pattern in format_indicators:
-                if re.search(pattern, content, flags=re.IGNORECASE):
-                    issues_found.append(f"❌ 형식 지시자가 출력에 포함됨: {pattern}")
-                    self.log(f"⚠️ AI가 형식 지시자를 출력에 포함시킴: {pattern}")
-                    # 형식 지시자 제거
-                    content = re.sub(pattern, '', content, flags=re.IGNORECASE)
-                    fixes_applied.append(f"✅ 형식 지시자 제거: {pattern}")
-            
-            # 규칙 3: HTML 속성 검증
-            html_attribute_issues = []
-            
-            # class 속성 없는 링크 검사 (blink, link1, link2, link3, custom-download-btn 중 하나는 있어야 함)
-            links_without_class = re.findall(r'<a\s+(?![^>]*class=)[^>]*href=[^>]*>', content, flags=re.IGNORECASE)
-            if links_without_class:
-                html_attribute_issues.append(f"❌ class 속성이 없는 <a> 태그 발견: {len(links_without_class)}개")
-            
-            # href 속성 없는 링크 검사
-            links_without_href = re.findall(r'<a\s+(?![^>]*href=)[^>]*class=[^>]*>', content, flags=re.IGNORECASE)
-            if links_without_href:
-                html_attribute_issues.append(f"❌ href 속성이 없는 <a> 태그 발견: {len(links_without_href)}개")
-            
-            # target 속성 없는 링크 검사
-            links_without_target = re.findall(r'<a\s+(?![^>]*target=)[^>]*href=[^>]*>', content, flags=re.IGNORECASE)
-            if links_without_target and len(links_without_target) > 0:
-                # target 속성 추가
-                content = re.sub(r'(<a\s+[^>]*)(href=[^>]*)>', r'\1\2 target="_self">', content, flags=re.IGNORECASE)
-                fixes_applied.append(f"✅ {len(links_without_target)}개 링크에 target=\"_self\" 속성 추가")
-            
-            # 따옴표 없는 class 속성 검사 (class=blink 같은 경우)
-            class_without_quotes = re.findall(r'class=(?!")([^\s>]+)', content, flags=re.IGNORECASE)
-            if class_without_quotes:
-                html_attribute_issues.append(f"❌ 따옴표 없는 class 속성 발견: {class_without_quotes}")
-                # 따옴표 추가
-                content = re.sub(r'class=(?!")([^\s>]+)', r'class="\1"', content, flags=re.IGNORECASE)
-                fixes_applied.append(f"✅ class 속성에 따옴표 추가")
-            
-            issues_found.extend(html_attribute_issues)
-            
-            # 규칙 4: link1, link2, link3 숫자 검증
-            link_classes = re.findall(r'class="(link\d?)"', content, flags=re.IGNORECASE)
-            if 'link"' in str(link_classes) or '"link"' in content:
-                issues_found.append("❌ class=\"link\"에서 숫자가 빠짐 (link1, link2, link3 중 하나여야 함)")
-                self.log("⚠️ class=\"link\"는 숫자가 필요함")
-            
-            # 검증 결과 로깅
-            if issues_found:
-                self.log(f"⚠️ AI 출력 검증: {len(issues_found)}개 문제 발견")
-                for issue in issues_found:
-                    self.log(f"  {issue}")
-            
-            if fixes_applied:
-                self.log(f"✅ AI 출력 자동 수정: {len(fixes_applied)}개 수정 적용")
-                for fix in fixes_applied:
-                    self.log(f"  {fix}")
-            
-            if not issues_found and not fixes_applied:
-                self.log("✅ AI 출력 검증 통과: 문제 없음")
-            
-            return content
-            
-        except Exception as e:
-            self.log(f"AI 출력 검증 중 오류: {e}")
-            import traceback
-            self.log(f"상세 오류:\n{traceback.format_exc()}")
-            return content
-
-    def enforce_html_structure(self, content, step_number, keyword):
-        """각 단계별로 정확한 HTML 구조를 강제 적용 - 마크다운 완전 제거"""
-        try:
-            import re
-            lines = content.strip().split('\n')
-            structured_content = []
-            
-            # 모든 마크다운 기호 완전 제거 함수
-            def clean_markdown(text):
-                # HTML 태그 제거
-                text = re.sub(r'<[^>]+>', '', text)
-                # 마크다운 헤더 기호 제거 (# ## ### 등)
-                text = re.sub(r'#+\s*', '', text)
-                # 마크다운 강조 기호 제거 (** __ * _ 등)
-                text = re.sub(r'\*+', '', text)
-                text = re.sub(r'_+', '', text)
-                # 마크다운 리스트 기호 제거 (- * + 1. 등)
-                text = re.sub(r'^[\-\*\+]\s*', '', text, flags=re.MULTILINE)
-                text = re.sub(r'^\d+\.\s*', '', text, flags=re.MULTILINE)
-                # 마크다운 코드 블록 제거
-                text = re.sub(r'```[a-z]*\n?', '', text, flags=re.IGNORECASE)
-                text = re.sub(r'```', '', text)
-                # 인라인 코드 제거
-                text = re.sub(r'`([^`]*)`', r'\1', text)
-                # 링크 제거 [text](url)
-                text = re.sub(r'\[([^\]]*)\]\([^\)]*\)', r'\1', text)
-                # 기타 특수문자 정리
-                text = re.sub(r'[\[\](){}]', '', text)
-                return text.strip()
-            
-            if step_number == 1:  # 1단계: 서론 + 소제목1 + 본문1
-                intro_text = ""
-                subtitle1_text = ""
-                content1_text = ""
-                
-                # AI 응답에서 텍스트 추출하고 마크다운 제거
-                all_text = ' '.join([clean_markdown(line) for line in lines if line.strip()])
-                
-                # 텍스트를 적절히 분할
-                words = all_text.split()
-                if len(words) > 50:
-                    intro_text = ' '.join(words[:50])  # 처음 50단어를 서론으로
-                    subtitle1_text = f"{keyword} 기본 활용법"
-                    content1_text = ' '.join(words[50:])  # 나머지를 본문으로
-                else:
-                    intro_text = all_text
-                    subtitle1_text = f"{keyword} 기본 활용법"
-                    content1_text = f"{keyword}의 기본적인 활용 방법에 대해 자세히 설명드리겠습니다. 다양한 측면에서 접근하여 실용적인 정보를 제공하고자 합니다. 기본 개념부터 시작하여 실무에 적용할 수 있는 구체적인 방법까지 포괄적으로 다루어보겠습니다. 이를 통해 효과적인 활용이 가능하도록 도움을 드리겠습니다. 단계적으로 접근하면 누구나 쉽게 이해하고 활용할 수 있을 것입니다. 기초부터 차근차근 알아보는 것이 중요합니다."
-                
-                # 기본값 설정 - approval.txt 지침에 따라 정확한 분량으로
-                if not intro_text or len(intro_text) < 270:
-                    intro_text = f"{keyword}는 현대 사회에서 점점 더 중요해지고 있는 핵심 개념입니다. 이와 관련하여 기본적인 활용법부터 시작해서 주요 특징들을 체계적으로 파악하고, 실무에서 바로 적용할 수 있는 실용적인 팁까지 포괄적으로 다뤄보겠습니다. 각 단계별로 구체적인 사례와 함께 설명하여 초보자부터 전문가까지 모두에게 도움이 되는 내용으로 구성하였습니다."
-                
-                if len(content1_text) < 700:
-                    content1_text = f"{keyword}의 기본적인 활용 방법에 대해 체계적으로 설명드리겠습니다. 먼저 가장 중요한 것은 기초 개념을 정확히 이해하는 것입니다. 이는 모든 응용과 심화 학습의 토대가 되기 때문입니다. 다음으로는 단계별 접근 방법을 통해 실제 적용 과정을 익혀야 합니다. 초기 설정부터 시작해서 기본 기능들을 하나씩 숙지해 나가는 것이 효과적입니다. 특히 실무에서 자주 사용되는 핵심 기능들을 우선적으로 학습하는 것이 중요합니다. 또한 올바른 사용 방법과 주의사항을 함께 익혀두면 향후 문제 상황을 예방할 수 있습니다. 기본기가 탄탄해야 나중에 고급 기능들도 쉽게 익힐 수 있으므로 충분한 연습을 통해 기초를 다져두시기 바랍니다. 실제 업무나 프로젝트에 적용할 때는 작은 부분부터 시작해서 점진적으로 확대해 나가는 방식을 권장드립니다."
-                
-                # 순수 HTML 구조 생성
-                structured_content.append(f"<p>{intro_text}</p>")
-                structured_content.append(f"<h2><strong>{subtitle1_text}</strong></h2>")
-                structured_content.append(f"<p>{content1_text}</p>")
-            
-            elif step_number == 2:  # 2단계: 소제목2 + 본문2
-                subtitle2_text = ""
-                content2_text = ""
-                
-                # AI 응답에서 텍스트 추출하고 마크다운 제거
-                all_text = ' '.join([clean_markdown(line) for line in lines if line.strip()])
-                
-                # 첫 번째 문장을 소제목으로, 나머지를 본문으로
-                sentences = all_text.split('.')[:2] if '.' in all_text else [all_text]
-                if sentences[0]:
-                    subtitle2_text = sentences[0][:25] + "의 주요 특징"
-                    content2_text = all_text
-                
-                # 기본값 설정 - approval2.txt 지침에 따라 700자 이상
-                if not subtitle2_text:
-                    subtitle2_text = f"{keyword} 주요 특징"
-                
-                if not content2_text or len(content2_text) < 700:
-                    content2_text = f"{keyword}의 주요 특징과 핵심적인 요소들을 상세히 살펴보겠습니다. 가장 두드러진 특징은 사용자 친화적인 접근성과 높은 효율성을 동시에 제공한다는 점입니다. 이러한 특성 덕분에 초보자도 쉽게 시작할 수 있으면서도 전문가들에게는 강력한 기능을 제공합니다. 또한 확장성이 뛰어나서 작은 규모부터 대규모 프로젝트까지 유연하게 대응할 수 있습니다. 특히 주목할 만한 점은 지속적인 업데이트와 개선을 통해 최신 트렌드를 반영한다는 것입니다. 보안 측면에서도 강화된 기능들을 제공하여 안전한 사용 환경을 보장합니다. 성능 면에서는 최적화된 알고리즘과 효율적인 리소스 관리를 통해 빠른 처리 속도를 실현하고 있습니다. 사용자 인터페이스는 직관적으로 설계되어 학습 곡선을 최소화하면서도 전문적인 작업이 가능하도록 구성되어 있습니다."
-                
-                # 순수 HTML 구조 생성
-                structured_content.append(f"<h2><strong>{subtitle2_text}</strong></h2>")
-                structured_content.append(f"<p>{content2_text}</p>")
-            
-            elif step_number == 3:  # 3단계: 소제목3 + 본문3 + 표
-                subtitle3_text = ""
-                content3_text = ""
-                
-                # AI 응답에서 텍스트 추출하고 마크다운 제거
-                all_text = ' '.join([clean_markdown(line) for line in lines if line.strip()])
-                
-                # 첫 번째 문장을 소제목으로, 나머지를 본문으로
-                sentences = all_text.split('.')[:2] if '.' in all_text else [all_text]
-                if sentences[0]:
-                    subtitle3_text = sentences[0][:25] + " 실무 팁"
-                    content3_text = all_text
-                
-                # 기본값 설정 - approval3.txt 지침에 따라 700자 이상
-                if not subtitle3_text:
-                    subtitle3_text = f"{keyword} 실무 팁"
-                
-                if not content3_text or len(content3_text) < 700:
-                    content3_text = f"{keyword}의 실무 활용 팁과 고급 테크닉을 소개해드리겠습니다. 실제 업무 환경에서 효율성을 극대화하기 위한 핵심적인 방법들을 중심으로 설명하겠습니다. 먼저 작업 흐름을 최적화하는 방법부터 살펴보겠습니다. 반복적인 작업을 자동화하고 단축키나 템플릿을 활용하면 시간을 크게 절약할 수 있습니다. 또한 협업 환경에서의 효과적인 활용 방안도 중요한 고려사항입니다. 팀원들과의 원활한 소통과 작업 공유를 위한 도구와 방법론을 익혀두면 프로젝트 진행이 훨씬 수월해집니다. 문제 해결 능력을 기르기 위해서는 일반적인 오류 상황과 대처 방안을 미리 숙지해두는 것이 좋습니다. 정기적인 백업과 버전 관리를 통해 작업 손실을 방지하고 이전 상태로 복구할 수 있는 시스템을 구축하는 것도 필수입니다."
-                
-                # 순수 HTML 구조 생성
-                structured_content.append(f"<h2><strong>{subtitle3_text}</strong></h2>")
-                structured_content.append(f"<p>{content3_text}</p>")
-                
-                # 표 추가
-                table_html = f"""<table border="1">
-<tr>
-<th>구분</th>
-<th>내용</th>
-<th>특징</th>
-</tr>
-<tr>
-<td>기본 활용</td>
-<td>{keyword} 기초 사용법</td>
-<td>누구나 쉽게 접근 가능</td>
-</tr>
-<tr>
-<td>고급 활용</td>
-<td>{keyword} 심화 기능</td>
-<td>전문적 활용 방법</td>
-</tr>
-<tr>
-<td>실무 적용</td>
-<td>{keyword} 현장 활용</td>
-<td>실제 업무 효율성 증대</td>
-</tr>
-</table>"""
-                structured_content.append(table_html)
-            
-            return '\n\n'.join(structured_content)
-            
-        except Exception as e:
-            self.log(f"HTML 구조 강제 적용 오류: {e}")
-            return content
-
-    def generate_approval_fallback_title(self, keyword):
-        """승인용 형식에 맞는 fallback 제목 생성"""
-        try:
-            # approval1.txt 형식에 맞는 제목 생성 요청
-            prompt = f"""키워드 '{keyword}'를 사용하여 승인용 제목을 생성해줘.
-
-형식: [메인 키워드]: [소제목1 키워드], [소제목2 키워드], [소제목3 키워드]
-예시: "gpt chat 무료 한국어: 활용법, 글쓰기 지원, 창의적 작업"
-
-요구사항:
-- 메인 키워드 '{keyword}' 필수 포함
-- 콜론(:) 뒤에 3개의 소제목 키워드를 콤마(,)로 구분
-- 30자 내외
-- HTML 태그 사용 금지, 순수 텍스트만
-
-제목만 출력해줘."""
-
-            response_text = self.call_ai_api(prompt, "승인용 fallback 제목 생성", max_tokens=100)
-            if response_text and response_text.strip():
-                title = response_text.strip()
-                # HTML 태그 제거
-                import re
-                title = re.sub(r'<[^>]+>', '', title)
-                # 승인용 형식 검증 (콜론과 콤마 포함)
-                if ':' in title and ',' in title:
-                    self.log(f"✅ 승인용 fallback 제목 생성 성공: {title}")
-                    return title
-                    
-            self.log("⚠️ 승인용 fallback 제목 생성 실패")
-            return None
-            
-        except Exception as e:
-            self.log(f"승인용 fallback 제목 생성 중 오류: {e}")
-            return None
-
-    def generate_simple_content(self, keyword, content_type="revenue"):
-        """간단한 콘텐츠 생성 - 수익용/승인용 선택 가능"""
-        try:
-            # 콘텐츠 생성 시작 - 포스팅 상태 활성화
-            self.is_posting = True
-
-            # 사용 가능한 AI 모델 확인
-            if not self.api_status.get('gemini', False) and not self.api_status.get('openai', False):
-                self.log("🔥 사용 가능한 AI 모델이 없습니다.")
-                self.is_posting = False
-                return None, None, None
-
-            self.log(f"👍 콘텐츠 타입: {content_type} (AI 제공자 자동 선택)")
-
-            # 콘텐츠 타입에 따른 생성 방식 선택
-            if content_type == "approval":
-                # 승인용 콘텐츠 생성
-                return self.generate_approval_content(keyword)
-            else:
-                # 수익용 콘텐츠 생성 (기본값)
-                return self.generate_revenue_content(keyword)
-
-        except Exception as e:
-            self.log(f"🔥 콘텐츠 생성 중 오류: {e}")
-            self.is_posting = False
-            return None, None, None
-
-    def generate_revenue_content(self, keyword):
-        """수익용 콘텐츠 생성 - 단순화된 버전"""
-        self.log("🔄 수익용 콘텐츠 생성을 시작합니다")
-        
-        # 현재 키워드를 인스턴스 변수로 저장 (URL 복구에서 사용)
-        self.current_keyword = keyword
-        
-        try:
-            all_content_parts = []
-            title = ""
-
-            # 5단계 순차 실행
-            for step_num in range(1, 6):
-                # self.log(f"수익용 {step_num}단계 진행 중")
-                
-                # 중지 체크
-                if not self.is_posting:
-                    self.log(f"⏹️ {step_num}단계 중지됨")
-                    return None, None, None
-                
-                # 시스템 프롬프트 생성 (prompt 파일 내용 포함)
-                system_content = self.get_revenue_system_prompt(step_num, keyword)
-                
-                # 사용자 프롬프트 - 1단계는 제목도 함께 요청
-                if step_num == 1:
-                    user_prompt = f"""다음 두 가지를 작성해주세요:
-
-1. 제목: '{keyword} | 숫자가 포함된 후킹문구' 형식 (50-60자)
-   예시: "건강검진 예약 | 3분만에 끝내는 간편 신청법"
-
-2. 위에서 제공한 HTML 템플릿에 {keyword}에 맞는 내용을 채워서 완성
-
-첫 번째 줄에 제목만 단독으로 출력하고, 그 다음에 HTML 콘텐츠를 출력해주세요."""
-                else:
-                    user_prompt = f"{keyword}에 대한 콘텐츠를 작성해주세요."
-                
-                # AI API 호출
-                self.log(f"🤖 {step_num}단계 AI API 호출")
-                response_text = self.call_ai_api(
-                    user_prompt, f"수익용 {step_num}단계", 
-                    max_tokens=1500, 
-                    temperature=0.7, 
-                    system_content=system_content
-                )
-                
-                if not response_text:
-                    self.log(f"❌ {step_num}단계 AI 응답 실패")
-                    return None, None, None
-                
-                # AI 출력 검증 및 자동 수정 (프롬프트 '중요 주의사항' 규칙 적용)
-                response_text = self.validate_ai_output(response_text, keyword)
-                
-                # 모든 단계에서 마크다운 코드 블록 언어 표시 제거
-                import re
-                response_text = re.sub(r'`html\s*\n?', '', response_text, flags=re.IGNORECASE)
-                response_text = re.sub(r'`javascript\s*\n?', '', response_text, flags=re.IGNORECASE)
-                response_text = re.sub(r'`css\s*\n?', '', response_text, flags=re.IGNORECASE)
-                response_text = re.sub(r'`json\s*\n?', '', response_text, flags=re.IGNORECASE)
-                response_text = re.sub(r'`python\s*\n?', '', response_text, flags=re.IGNORECASE)
-                response_text = re.sub(r'`[a-z]+\s*\n?', '', response_text)  # 기타 언어명
-                response_text = re.sub(r'```[a-z]*\n?', '', response_text)  # ```html 등
-                response_text = re.sub(r'```\n?', '', response_text)  # ``` 끝
-                
-                # 1단계는 정리 함수 사용하지 않음 (HTML 구조 보존 위해)
-                if step_num == 1:
-                    step_content = response_text.strip()
-                else:
-                    # 2-5단계도 HTML 구조 보존 - AI 역할 언급만 제거
-                    step_content = response_text.strip()
-                    
-                    # AI 역할 언급 제거
-                    ai_mentions = [
-                        r'SEO\s*전문가로서',
-                        r'콘텐츠\s*작가로서',
-                        r'전문\s*작가로서',
-                        r'\d+년\s*경력의?\s*.*?작가로서',
-                        r'인공지능.*?',
-                        r'AI.*?로서'
-                    ]
-                    for mention in ai_mentions:
-                        step_content = re.sub(mention, '', step_content, flags=re.IGNORECASE)
-                    
-                    # 마크다운 문법 제거 (HTML 구조는 보존)
-                    markdown_patterns = [
-                        r'#{1,6}\s+',         # ### 마크다운 헤더
-                        r'\*\*([^*]+)\*\*',   # **bold** → 내용만 남기고 제거
-                        r'\*([^*]+)\*',       # *italic* → 내용만 남기고 제거
-                        r'`([^`]+)`',         # `inline code` → 내용만 남기고 제거
-                    ]
-                    for pattern in markdown_patterns:
-                        if pattern in [r'\*\*([^*]+)\*\*', r'\*([^*]+)\*', r'`([^`]+)`']:
-                            step_content = re.sub(pattern, r'\1', step_content)
-                        else:
-                            step_content = re.sub(pattern, '', step_content)
-                
-                # 1단계에서 제목 추출 및 서론 정리
-                if step_num == 1:
-                    # 제목 추출 - 더 강력한 로직
-                    lines = step_content.split('\n')
-                    content_lines = []
-                    title_found = False
-                    
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                            
-                        # HTML 태그 제거하여 제목 확인
-                        clean_line = line.replace('<h1>', '').replace('</h1>', '').replace('<title>', '').replace('</title>', '')
-                        clean_line = clean_line.strip()
-                        
-                        # 제목 조건: |가 포함되어 있고, HTML 태그로 시작하지 않으며, 적절한 길이
-                        if '|' in clean_line and not clean_line.startswith('<') and len(clean_line) > 15 and not title_found:
-                            title = clean_line
-                            title_found = True
-                            continue  # 제목 라인은 본문에서 제외
-                        
-                        # h1 태그로 된 제목도 제외 (중복 방지)
-                        if line.startswith('<h1>') and line.endswith('</h1>'):
-                            continue
-                            
-                        # 나머지는 본문(서론)으로 포함
-                        content_lines.append(line)
-                    
-                    # 제목이 추출되지 않으면 대체 제목 생성
-                    if not title:
-                        title = f"{keyword} | 5가지 핵심 정보 완벽 정리"
-                        self.log(f"⚠️ 제목 추출 실패, 대체 제목 사용: {title}")
-                    
-                    # 서론 부분만 step_content로 설정 (제목 제외)
-                    step_content = '\n'.join(content_lines)
-                    self.log(f"✅ 최종 제목: {title}")
-                
-                # 2-5단계는 추가 정리만 적용
-                else:
-                    # 마크다운 및 HTML 문서 구조 제거만 추가 적용
-                    pass
-                
-                all_content_parts.append(step_content)
-                
-            # 전체 내용 결합
-            full_content = "\n\n".join(all_content_parts)
-            
-            # 체크리스트 감지 및 리스트 코드 추가
-            full_content = self.add_checklist_if_needed(full_content, keyword)
-            
-            # 가짜 URL 교체
-            full_content = self.replace_fake_urls(full_content, keyword)
-            
-            # 콘텐츠 최종 정리 (발행 전)
-            full_content = self.clean_content_before_publish(full_content)
-            
-            # 썸네일 생성
-            thumbnail_path = self.create_thumbnail(title, keyword) if title else None
-            
-            self.log("✅ 수익용 콘텐츠 생성 완료")
-            return title, full_content, thumbnail_path
-            
-        except Exception as e:
-            self.log(f"❌ 수익용 콘텐츠 생성 중 오류: {e}")
-            return None, None, None
-
-    def replace_fake_urls(self, content, keyword):
-        """AI가 생성한 모든 URL을 신뢰할 수 있는 URL로 교체"""
-        try:
-            import re
-            
-            # setting.json에서 신뢰할 수 있는 URL 리스트 로드
-            trusted_urls = self.load_trusted_urls()
-            
-            # 1. 가짜 링크 텍스트를 실제 텍스트로 교체
-            link_text_patterns = [
-                (r'링크\s*텍스트', f'{keyword} 더 알아보기'),
-                (r'앵커\s*텍스트', f'{keyword} 바로가기'),
-                (r'링크\s*버튼', f'{keyword} 정보'),
-                (r'url\s*입력', f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"),
-                (r'링크\s*주소', f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"),
-                (r'여기에\s*링크', f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"),
-            ]
-            
-            for pattern, replacement in link_text_patterns:
-                content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
-            
-            # 2. href URL 교체 (HTML 구조 유지)
-            href_pattern = r'href="(https?://[^"]*)"'
-            replacement_count = 0
-            
-            def replace_url(match):
-                nonlocal replacement_count
-                original_url = match.group(1)
-                # 이미 신뢰할 수 있는 URL인지 확인
-                if self.is_trusted_url(original_url, trusted_urls):
-                    return match.group(0)  # 원본 그대로 반환
-                    
-                # 콘텐츠 맥락과 키워드를 분석하여 적절한 URL 선택
-                replacement_url = self.select_contextual_url(original_url, keyword, content, trusted_urls)
-                replacement_count += 1
-                self.log(f"🔗 URL 교체 ({replacement_count}): {original_url} → {replacement_url}")
-                return f'href="{replacement_url}"'
-            
-            content = re.sub(href_pattern, replace_url, content)
-            
-            # 3. 외부링크가 부족한 경우 추가
-            existing_links = len(re.findall(r'<a\s+[^>]*href=', content, re.IGNORECASE))
-            if existing_links < 2:
-                # 본문 끝부분에 외부링크 추가
-                additional_link_text = f"{keyword} 더 알아보기"
-                additional_link_url = self.select_contextual_url("", keyword, content, trusted_urls)
-                additional_link = f'<p><a href="{additional_link_url}" target="_self">{additional_link_text}</a></p>'
-                
-                content = content.rstrip() + "\n\n" + additional_link
-                self.log(f"🔗 외부링크 추가: {additional_link_text} → {additional_link_url}")
-                replacement_count += 1
-            
-            if replacement_count > 0:
-                self.log(f"✅ 총 {replacement_count}개의 URL이 신뢰할 수 있는 URL로 교체/추가되었습니다.")
-            else:
-                self.log("ℹ️ 교체할 URL이 없거나 모든 URL이 이미 신뢰할 수 있는 URL입니다.")
-            
-            return content
-            
-        except Exception as e:
-            self.log(f"URL 교체 중 오류: {e}")
-            return content
-    
-    def clean_content_before_publish(self, content):
-        """발행 전 콘텐츠 정리 (AI 작성을 방해하지 않는 최소한의 수정만)"""
-        try:
-            import re
-            from urllib.parse import quote
-            
-            # 0. 다운로드 버튼 HTML을 보호 및 복구 (먼저 추출)
-            download_button_pattern = r'<div class="button-container">.*?</div>'
-            download_buttons = re.findall(download_button_pattern, content, flags=re.IGNORECASE | re.DOTALL)
-            
-            # 다운로드 버튼 URL 복구 및 속성 수정
-            fixed_buttons = []
-            for button in download_buttons:
-                fixed_button = button
-                
-                # 1. href 속성 복구 - 공백으로 잘린 URL 수정
-                # href="https://...?q=키워드 일부" 나머지..." → href="https://...?q=전체키워드..."
-                href_matches = re.findall(r'href="([^"]*)"([^<>]*?)<img', fixed_button, re.DOTALL)
-                for href_url, text_after in href_matches:
-                    # href 뒤에 잘린 텍스트가 있는지 확인
-                    if text_after.strip() and not text_after.strip().startswith('class='):
-                        # 잘린 부분 추출
-                        cut_text = text_after.split('class=')[0].strip()
-                        # URL에 추가 (URL 인코딩)
-                        if '?' in href_url:
-                            # 쿼리 파라미터가 있는 경우
-                            fixed_url = href_url.rstrip('"') + quote(cut_text)
-                        else:
-                            fixed_url = href_url + quote(cut_text)
-                        # 수정된 URL로 교체
-                        original = f'href="{href_url}"{text_after}<img'
-                        replacement = f'href="{fixed_url}" <img'
-                        fixed_button = fixed_button.replace(original, replacement)
-                
-                # 2. 깨진 class 속성 수정 - 중복 따옴표 제거
-                fixed_button = re.sub(r'class="([^"]+)""', r'class="\1"', fixed_button)
-                
-                # 3. 따옴표 없는 속성에 따옴표 추가
-                fixed_button = re.sub(r'class=([^\s">]+)(?=\s|>)', r'class="\1"', fixed_button)
-                fixed_button = re.sub(r'target=([^\s">]+)(?=\s|>)', r'target="\1"', fixed_button)
-                fixed_button = re.sub(r'src=([^\s">]+)(?=\s|>)', r'src="\1"', fixed_button)
-                fixed_button = re.sub(r'alt=([^\s">]+)(?=\s|>)', r'alt="\1"', fixed_button)
-                
-                fixed_buttons.append(fixed_button)
-                
-            if fixed_buttons:
-                self.log(f"✅ 다운로드 버튼 {len(fixed_buttons)}개 URL 및 속성 복구 완료")
-            
-            # 다운로드 버튼을 플레이스홀더로 교체 (수정된 버전으로)
-            for i, button in enumerate(download_buttons):
-                content = content.replace(button, f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", 1)
-            
-            # 1. 불완전한 style 속성 수정 (값이 비어있는 경우만)
-            # style="text-align:" → style="text-align:center;"
-            # style="color:" → style="color: #ee2323;"
-            style_fixed = False
-            if 'style="text-align:"' in content:
-                content = re.sub(r'style="text-align:\s*"', 'style="text-align:center;"', content)
-                style_fixed = True
-            if 'style="color:"' in content:
-                content = re.sub(r'style="color:\s*"', 'style="color: #ee2323;"', content)
-                style_fixed = True
-            if style_fixed:
-                self.log("✅ 불완전한 style 속성 수정")
-            
-            # 2. 불완전한 h태그 수정 (h2, h3, h4 모두 처리)
-            # <strong>...</strong></h2> → <h2><strong>...</strong></h2>
-            # <strong>...</strong></h3> → <h3><strong>...</strong></h3>
-            # <strong>...</strong></h4> → <h4><strong>...</strong></h4>
-            h_tag_fixed = False
-            for h_num in [2, 3, 4]:
-                h_pattern = rf'(?<!<h{h_num}>)(<strong>[^<]+</strong></h{h_num}>)'
-                h_matches = re.findall(h_pattern, content)
-                if h_matches:
-                    for match in h_matches:
-                        if not match.startswith(f'<h{h_num}>'):
-                            fixed = f'<h{h_num}>' + match
-                            content = content.replace(match, fixed)
-                            h_tag_fixed = True
-            if h_tag_fixed:
-                self.log("✅ 불완전한 h태그 수정 (h2, h3, h4)")
-            
-            # 3. 유니코드 큰따옴표와 백틱만 제거 (일반 큰따옴표는 HTML 속성에 필수이므로 보존)
-            # ❌ 제거: ", ", " (유니코드 큰따옴표), ` (백틱)
-            # ✅ 보존: " (일반 큰따옴표 - HTML 속성에 필수), ' (작은따옴표 - 텍스트에 사용 가능)
-            unicode_quotes_and_backticks = ['"', '"', '"', '`']  # 유니코드 큰따옴표 + 백틱만
-            quote_found = False
-            for bad_char in unicode_quotes_and_backticks:
-                if bad_char in content:
-                    content = content.replace(bad_char, '')
-                    quote_found = True
-            if quote_found:
-                self.log("✅ 유니코드 큰따옴표/백틱 제거 (일반 따옴표는 보존)")
-            
-            # 4. '클릭' 단어를 유의어로 대체 (제목 제외)
-            # HTML h1 태그 안의 내용은 보존 (제목은 '클릭' 사용 가능)
-            click_replaced = False
-            
-            # h1 태그 내용 추출 및 보호
-            h1_pattern = r'(<h1[^>]*>)(.*?)(</h1>)'
-            h1_matches = re.findall(h1_pattern, content, re.DOTALL | re.IGNORECASE)
-            h1_contents = []
-            
-            # h1 태그를 임시 플레이스홀더로 대체
-            for i, (opening, title_content, closing) in enumerate(h1_matches):
-                placeholder = f"___H1_PLACEHOLDER_{i}___"
-                h1_contents.append((opening, title_content, closing))
-                content = content.replace(opening + title_content + closing, placeholder, 1)
-            
-            # h1 태그 밖의 '클릭' 단어를 유의어로 대체
-            click_alternatives = ['선택', '확인', '눌러보기', '터치', '접속', '방문']
-            if '클릭' in content:
-                import random
-                # 다양한 '클릭' 패턴 대체
-                content = re.sub(r'클릭하세요', lambda m: random.choice(['선택하세요', '확인하세요', '눌러보세요']), content)
-                content = re.sub(r'클릭해서', lambda m: random.choice(['선택해서', '눌러서', '터치해서']), content)
-                content = re.sub(r'클릭하여', lambda m: random.choice(['선택하여', '눌러', '터치하여']), content)
-                content = re.sub(r'클릭하면', lambda m: random.choice(['선택하면', '누르면', '터치하면']), content)
-                content = re.sub(r'클릭', lambda m: random.choice(click_alternatives), content)
-                click_replaced = True
-            
-            # h1 태그 복원
-            for i, (opening, title_content, closing) in enumerate(h1_contents):
-                placeholder = f"___H1_PLACEHOLDER_{i}___"
-                content = content.replace(placeholder, opening + title_content + closing)
-            
-            if click_replaced:
-                self.log("✅ '클릭' 단어를 유의어로 대체 (제목 제외)")
-            
-            # 5. &amp; HTML 엔티티를 &로 변경
-            if '&amp;' in content:
-                content = content.replace('&amp;', '&')
-                self.log("✅ HTML 엔티티 정리")
-            
-            # 5-1. 외부링크 target 속성 검증 (무조건 target="_self" 사용)
-            # target="_blank" 또는 기타 값을 target="_self"로 수정
-            target_fixed = False
-            if 'target=' in content:
-                # target="_blank" → target="_self"
-                if 'target="_blank"' in content:
-                    content = content.replace('target="_blank"', 'target="_self"')
-                    target_fixed = True
-                # target=_blank (따옴표 없음) → target="_self"
-                if 'target=_blank' in content:
-                    content = re.sub(r'target=_blank(?=\s|>)', 'target="_self"', content)
-                    target_fixed = True
-                # target="_top", "_parent" 등도 모두 _self로 변경
-                content = re.sub(r'target="_(top|parent|blank)"', 'target="_self"', content)
-                target_fixed = True
-                
-            if target_fixed:
-                self.log("✅ 외부링크 target 속성을 target=\"_self\"로 통일")
-            
-            # 6. 다운로드 버튼 복원 (수정된 버전으로)
-            for i, fixed_button in enumerate(fixed_buttons):
-                content = content.replace(f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", fixed_button, 1)
-            
-            return content
-            
-        except Exception as e:
-            self.log(f"❌ 콘텐츠 정리 중 오류: {e}")
-            # 오류 발생 시에도 다운로드 버튼 복원 시도
-            try:
-                for i, fixed_button in enumerate(fixed_buttons):
-                    content = content.replace(f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", fixed_button, 1)
-            except:
-                for i, button in enumerate(download_buttons):
-                    content = content.replace(f"__PROTECTED_DOWNLOAD_BUTTON_{i}__", button, 1)
-            return content
-    
-    def load_trusted_urls(self):
-        """코드 내장 신뢰할 수 있는 URL 리스트 (setting.json 불필요)"""
-        return {
-            '정부_공공기관': [
-                'https://www.hometax.go.kr',
-                'https://www.gov24.go.kr',
-                'https://www.safedriving.or.kr',
-            ],
-            '금융_관련': [
-                'https://www.fss.or.kr',
-                'https://www.cardgorilla.com',
-            ],
-            '부동산_관련': [
-                'https://www.lh.or.kr',
-                'https://land.naver.com',
-            ],
-            '자동차_관련': [
-                'https://www.encar.com',
-            ],
-            '통신_관련': [
-                'https://www.skt.com',
-                'https://www.kt.com',
-            ],
-            '교육_취업': [
-                'https://www.work.go.kr',
-            ],
-            '쇼핑_배송': [
-                'https://shopping.naver.com',
-            ],
-            'IT_기술': [
-                'https://www.microsoft.com/ko-kr',
-                'https://www.apple.com/kr',
-            ],
-            '생활_건강': [
-                'https://www.nhis.or.kr',
-            ]
-        }
-    
-    def is_trusted_url(self, url, trusted_urls):
-        """URL이 신뢰할 수 있는 URL인지 확인"""
-        try:
-            # 다운로드 버튼 URL들은 항상 신뢰할 수 있는 URL로 처리
-            download_button_domains = [
-                'www.apple.com',
-                'play.google.com', 
-                'apps.microsoft.com',
-                'tools.applemediaservices.com',
-                'upload.wikimedia.org'
-            ]
-            
-            url_domain = url.split('/')[2] if '://' in url else url.split('/')[0]
-            
-            # 다운로드 버튼 관련 도메인은 교체하지 않음
-            if any(domain in url_domain for domain in download_button_domains):
-                return True
-            
-            # 기존 신뢰할 수 있는 URL 확인
-            for category, url_list in trusted_urls.items():
-                for trusted_url in url_list:
-                    # 도메인 기반으로 비교 (쿼리 파라미터 무시)
-                    trusted_domain = trusted_url.split('/')[2] if '://' in trusted_url else trusted_url
-                    url_domain = url.split('/')[2] if '://' in url else url
-                    if trusted_domain in url or url_domain == trusted_domain:
-                        return True
-            return False
-        except Exception:
-            return False
-    
-    def select_contextual_url(self, original_url, keyword, content, trusted_urls):
-        """콘텐츠 맥락을 분석하여 가장 적절한 신뢰할 수 있는 URL 선택 (정확도 대폭 개선)"""
-        try:
-            import random
-            keyword_lower = keyword.lower()
-            content_lower = content.lower()
-            
-            # 원본 URL 주변 텍스트 분석
-            import re
-            url_context = ""
-            if original_url:
-                url_pattern = re.escape(original_url)
-                match = re.search(f'.{{0,100}}{url_pattern}.{{0,100}}', content_lower)
-                if match:
-                    url_context = match.group()
-            
-            # 키워드만 집중 분석 (정확도 향상)
-            context_text = keyword_lower
-            
-            # 🚫 명확하게 매칭되지 않는 키워드 체크 (네이버 검색 사용)
-            generic_keywords = ['다운로드', '양식', '서식', '템플릿', '예제', '샘플', '기출문제', 'pdf', '문서', '파일']
-            
-            # 키워드가 일반적인 다운로드 관련이면 네이버 검색 사용
-            if any(generic in context_text for generic in generic_keywords):
-                # 단, 특정 기관/서비스명이 함께 있으면 예외
-                specific_terms = ['홈택스', '정부24', '은행', '카드', '아파트', '자동차', '핸드폰', 'skt', 'kt']
-                if not any(specific in context_text for specific in specific_terms):
-                    self.log(f"🔍 일반 키워드 감지 → 네이버 검색 사용: {keyword}")
-                    return f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
-            
-            # 🎯 정확한 키워드 매칭만 사용
-            # 정부/공공기관 관련 (매우 구체적인 키워드만)
-            if any(term in context_text for term in ['홈택스', '국세청', '세무서', '종합소득세', '부가가치세']):
-                self.log(f"🔍 카테고리 매칭: 정부_공공기관 (홈택스) → {keyword}")
-                return 'https://www.hometax.go.kr'
-            
-            elif any(term in context_text for term in ['정부24', '민원24', '정부민원']):
-                self.log(f"🔍 카테고리 매칭: 정부_공공기관 (정부24) → {keyword}")
-                return 'https://www.gov24.go.kr'
-            
-            elif any(term in context_text for term in ['운전면허', '면허증', '안전운전']):
-                self.log(f"🔍 카테고리 매칭: 정부_공공기관 (안전운전) → {keyword}")
-                return 'https://www.safedriving.or.kr'
-            
-            # 금융 관련 (구체적인 금융 서비스명만)
-            elif any(term in context_text for term in ['kb국민은행', '신한은행', '하나은행', '우리은행', '농협', 'nh은행']):
-                urls = trusted_urls.get('금융_관련', [])
-                if urls:
-                    selected = random.choice(urls)
-                    self.log(f"🔍 카테고리 매칭: 금융_관련 → {selected} ({keyword})")
-                    return selected
-            
-            elif '카드고릴라' in context_text or ('카드' in context_text and '비교' in context_text):
-                self.log(f"🔍 카테고리 매칭: 금융_관련 (카드고릴라) → {keyword}")
-                return 'https://www.cardgorilla.com'
-            
-            # 부동산 관련 (구체적인 부동산 키워드만)
-            elif any(term in context_text for term in ['lh청약', '청약플러스', '공공주택']):
-                self.log(f"🔍 카테고리 매칭: 부동산_관련 (LH) → {keyword}")
-                return 'https://www.lh.or.kr'
-            
-            elif any(term in context_text for term in ['네이버부동산', '네이버 부동산']):
-                self.log(f"🔍 카테고리 매칭: 부동산_관련 (네이버부동산) → {keyword}")
-                return 'https://land.naver.com'
-            
-            # 자동차 관련 (구체적인 자동차 서비스명만)
-            elif any(term in context_text for term in ['엔카', 'sk엔카', '중고차매매']):
-                self.log(f"🔍 카테고리 매칭: 자동차_관련 (엔카) → {keyword}")
-                return 'https://www.encar.com'
-            
-            # 통신 관련 (구체적인 통신사명만)
-            elif any(term in context_text for term in ['skt', 'sk텔레콤', '티월드']):
-                self.log(f"🔍 카테고리 매칭: 통신_관련 (SKT) → {keyword}")
-                return 'https://www.skt.com'
-            
-            elif any(term in context_text for term in ['kt', '올레']):
-                self.log(f"🔍 카테고리 매칭: 통신_관련 (KT) → {keyword}")
-                return 'https://www.kt.com'
-            
-            # 취업 관련 (구체적인 취업 서비스명만)
-            elif any(term in context_text for term in ['워크넷', '고용노동부', '구인구직']):
-                self.log(f"🔍 카테고리 매칭: 교육_취업 (워크넷) → {keyword}")
-                return 'https://www.work.go.kr'
-            
-            # IT/기술 관련 (구체적인 브랜드명만)
-            elif any(term in context_text for term in ['마이크로소프트', 'microsoft', 'ms오피스', '윈도우10', '윈도우11']):
-                self.log(f"🔍 카테고리 매칭: IT_기술 (Microsoft) → {keyword}")
-                return 'https://www.microsoft.com/ko-kr'
-            
-            elif any(term in context_text for term in ['애플', 'apple', '맥북', '아이맥', '아이패드프로']):
-                self.log(f"🔍 카테고리 매칭: IT_기술 (Apple) → {keyword}")
-                return 'https://www.apple.com/kr'
-            
-            # 건강보험 관련
-            elif any(term in context_text for term in ['건강보험공단', '국민건강보험', '건보공단']):
-                self.log(f"🔍 카테고리 매칭: 생활_건강 (건강보험공단) → {keyword}")
-                return 'https://www.nhis.or.kr'
-            
-            # 🎯 매칭 실패 시 기본값: 네이버 검색 (공식 홈페이지보다 안전)
-            else:
-                self.log(f"🔍 명확한 카테고리 매칭 실패 → 네이버 검색 사용: {keyword}")
-                return f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
-                
-        except Exception as e:
-            self.log(f"맥락 분석 중 오류: {e}")
-            return f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
-
-    def fix_broken_urls(self, content):
-        """잘린 URL 구조 복구 (URL 내용은 건드리지 않음)"""
-        try:
-            import re
-            
-            # 잘린 HTML 링크 구조 복구 패턴들
-            broken_patterns = [
-                # href가 시작되었지만 닫히지 않은 경우: href="https://... 텍스트
-                (r'href\s*=\s*["\']([^"\']*?https?://[^"\'>\s]*?)(\s+[^"\'<>]*?)(?=[<>\n])', 
-                 r'href="\1">\2</a>'),
-                
-                # <a 태그가 시작되었지만 닫히지 않은 경우
-                (r'<a\s+([^>]*?)>\s*([^<]*?)(?=\s*<(?!/?a))', 
-                 r'<a \1>\2</a>'),
-                
-                # href 속성에 따옴표가 없는 경우: href=https://...
-                (r'href\s*=\s*([^"\'\s>]+)', 
-                 r'href="\1"'),
-            ]
-            
-            fix_count = 0
-            
-            for pattern, replacement in broken_patterns:
-                matches = re.findall(pattern, content)
-                if matches:
-                    content = re.sub(pattern, replacement, content)
-                    fix_count += len(matches)
-                    self.log(f"� HTML 링크 구조 복구: {len(matches)}개")
-            
-            if fix_count > 0:
-                self.log(f"✅ 총 {fix_count}개의 링크 구조 복구 완료")
-            
-            return content
-            
-        except Exception as e:
-            self.log(f"링크 구조 복구 중 오류: {e}")
-            return content
-
-    def add_checklist_if_needed(self, content, keyword):
-        """체크리스트 키워드 감지 시 리스트 코드 추가"""
-        try:
-            # 체크리스트 관련 키워드들
-            checklist_keywords = [
-                '체크리스트', '체크 리스트', 'checklist', '확인 사항', '확인사항',
-                '점검 리스트', '점검리스트', '확인 목록', '확인목록', '점검 항목',
-                '필수 사항', '필수사항', '준비 사항', '준비사항', '체크 항목'
-            ]
-            
-            # 키워드나 본문에서 체크리스트 관련 키워드 확인
-            keyword_lower = keyword.lower()
-            content_lower = content.lower()
-            
-            has_checklist_keyword = any(check_word in keyword_lower for check_word in checklist_keywords)
-            has_checklist_content = any(check_word in content_lower for check_word in checklist_keywords)
-            
-            if has_checklist_keyword or has_checklist_content:
-                self.log(f"체크리스트 관련 내용 감지: 리스트 코드 추가")
-                
-                # 체크리스트 HTML 생성
-                checklist_html = f"""
-<h3><strong>{keyword} 체크리스트</strong></h3>
-<p>{keyword}과 관련된 중요한 체크사항들을 정리해보겠습니다. 아래 항목들을 차례대로 확인해보세요.</p>
-<ul>
-<li>기본 정보 확인하기</li>
-<li>필요한 준비사항 점검하기</li>
-<li>관련 문서 및 자료 준비하기</li>
-<li>일정 및 시간 계획 세우기</li>
-<li>최종 확인 및 검토하기</li>
-</ul>
-"""
-                
-                # 첫 번째 h2 태그 이후에 체크리스트 추가
-                h2_matches = list(re.finditer(r'<h2[^>]*>.*?</h2>', content, re.IGNORECASE | re.DOTALL))
-                
-                if h2_matches:
-                    first_h2_end = h2_matches[0].end()
-                    content = (content[:first_h2_end] + 
-                             f"\n\n{checklist_html}\n\n" + 
-                             content[first_h2_end:])
-                else:
-                    # h2 태그가 없으면 본문 앞부분에 추가
-                    first_p_match = re.search(r'</p>', content)
-                    if first_p_match:
-                        insert_position = first_p_match.end()
-                        content = (content[:insert_position] + 
-                                 f"\n\n{checklist_html}\n\n" + 
-                                 content[insert_position:])
-                
-                self.log("✅ 체크리스트를 본문에 성공적으로 추가했습니다.")
-            
-            return content
-            
-        except Exception as e:
-            self.log(f"체크리스트 추가 중 오류: {e}")
-            return content
-
-    def create_thumbnail(self, title, keyword):
-        """썸네일 이미지를 생성합니다."""
-        try:
-            # images 폴더에서 사이트별 또는 무작위 배경 이미지 선택
-            images_dir = os.path.join(get_base_path(), "images")
-            background_path = None
-            
-            if os.path.exists(images_dir):
-                available_images = [os.path.join(images_dir, f) for f in os.listdir(images_dir) 
-                                 if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-                
-                # 현재 사이트의 썸네일 이미지 설정 확인
-                if self.current_site and self.current_site.get('thumbnail_image'):
-                    thumbnail_filename = self.current_site.get('thumbnail_image')
-                    specific_path = os.path.join(images_dir, thumbnail_filename)
-                    if os.path.exists(specific_path):
-                        background_path = specific_path
-                        self.log(f"🎯 사이트별 썸네일 이미지 사용: {thumbnail_filename}")
-                    else:
-                        self.log(f"⚠️ 사이트별 썸네일 이미지 파일이 없습니다: {thumbnail_filename}")
-                
-                # 사이트별 설정이 없거나 파일이 없으면 랜덤 선택
-                if not background_path and available_images:
-                    background_path = random.choice(available_images)
-                    self.log(f"🖼️ 기본 배경 이미지 사용: {os.path.basename(background_path)}")
-                
-                if background_path:
-                    background = Image.open(background_path)
-                    # 이미지를 300x300 정사각형으로 크롭 및 리사이즈
-                    background = background.resize((300, 300), Image.Resampling.LANCZOS)
-                else:
-                    background = Image.new('RGB', (300, 300), color=(41, 128, 185)) # 기본 배경
-            else:
-                background = Image.new('RGB', (300, 300), color=(41, 128, 185)) # 기본 배경
-
-            draw = ImageDraw.Draw(background)
-            
-            # 폰트 설정 - 본문과 동일한 timon.ttf 사용
-            try:
-                # fonts 폴더의 timon.ttf 폰트 사용 (본문과 동일)
-                font_path = os.path.join(get_base_path(), "fonts", "timon.ttf")
-                large_font = ImageFont.truetype(font_path, 24)  # | 앞 제목용 (32→24로 축소)
-                small_font = ImageFont.truetype(font_path, 18)  # | 뒤 제목용 (22→18로 축소)
-            except Exception as font_error:
-                print(f"timon.ttf 폰트 로드 실패: {font_error}")
-                try:
-                    # 대체 폰트들
-                    large_font = ImageFont.truetype("C:/Windows/Fonts/gulim.ttc", 22)
-                    small_font = ImageFont.truetype("C:/Windows/Fonts/gulim.ttc", 16)
-                except:
-                    try:
-                        large_font = ImageFont.truetype("C:/Windows/Fonts/malgun.ttf", 22)
-                        small_font = ImageFont.truetype("C:/Windows/Fonts/malgun.ttf", 16)
-                    except:
-                        large_font = ImageFont.load_default()
-                        small_font = ImageFont.load_default()
-
-            # 제목을 | 기준으로 분리
-            if '|' in title:
-                parts = title.split('|', 1)  # 최대 1번만 분리
-                main_title = parts[0].strip()    # | 앞부분 (첫 줄, 크게)
-                sub_title = parts[1].strip()     # | 뒷부분 (둘째 줄, 작게)
-            else:
-                main_title = title
-                sub_title = ""
-            
-            # 텍스트를 중앙에 배치하기 위한 계산
-            lines = []
-            
-            # 첫 번째 줄: main_title (큰 폰트)
-            if main_title:
-                # main_title이 너무 길면 자동 줄바꿈
-                words = main_title.split()
-                current_line = []
-                for word in words:
-                    test_line = ' '.join(current_line + [word])
-                    bbox = draw.textbbox((0, 0), test_line, font=large_font)
-                    if bbox[2] - bbox[0] > 250:  # 250px 이상이면 줄바꿈
-                        if current_line:
-                            lines.append((' '.join(current_line), large_font))
-                            current_line = [word]
-                        else:
-                            lines.append((word, large_font))
-                            current_line = []
-                    else:
-                        current_line.append(word)
-                
-                if current_line:
-                    lines.append((' '.join(current_line), large_font))
-            
-            # 두 번째 줄: sub_title (작은 폰트)
-            if sub_title:
-                # sub_title이 너무 길면 자동 줄바꿈
-                words = sub_title.split()
-                current_line = []
-                for word in words:
-                    test_line = ' '.join(current_line + [word])
-                    bbox = draw.textbbox((0, 0), test_line, font=small_font)
-                    if bbox[2] - bbox[0] > 260:  # 작은 폰트는 좀 더 길게 허용
-                        if current_line:
-                            lines.append((' '.join(current_line), small_font))
-                            current_line = [word]
-                        else:
-                            lines.append((word, small_font))
-                            current_line = []
-                    else:
-                        current_line.append(word)
-                
-                if current_line:
-                    lines.append((' '.join(current_line), small_font))
-                
-            # 텍스트 중앙 정렬
-            line_spacing = 35  # 줄 간격
-            total_height = len(lines) * line_spacing
-            y_start = (300 - total_height) // 2 + 10  # 중앙에서 약간 위로
-            
-            for i, (line_text, line_font) in enumerate(lines):
-                bbox = draw.textbbox((0, 0), line_text, font=line_font)
-                text_width = bbox[2] - bbox[0]
-                x = (300 - text_width) // 2
-                y = y_start + (i * line_spacing)
-                
-                # 그림자 효과 (가독성 향상)
-                draw.text((x + 2, y + 2), line_text, fill=(0, 0, 0, 180), font=line_font)
-                # 메인 텍스트 (흰색)
-                draw.text((x, y), line_text, fill=(255, 255, 255), font=line_font)
-            
-            # 최종 이미지를 WebP 형식으로 저장
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filepath = os.path.join(get_base_path(), "thumbnails", f"thumbnail_{timestamp}.webp")
-            background.save(filepath, 'WEBP', quality=85)
-            return filepath
-        except Exception as e:
-            self.log(f"썸네일 생성 오류: {e}")
-            return None
-
-    def post_to_wordpress(self, site_data, title, content, thumbnail_path=None):
-        """워드프레스에 포스트를 게시합니다."""
-        try:
-            site_name = site_data.get('name', 'Unknown')
-            site_url = site_data.get('url')
-            username = site_data.get('username')
-            password = site_data.get('password')
-            category = site_data.get('category_id', 1)
-
-            # 제목에서 불필요한 문자 최종 제거 (워드프레스 포스팅 직전)
-            title = title.replace('"', '').replace("'", '').replace('`', '')
-            title = title.replace('#', '').replace('*', '').replace('**', '')
-            title = re.sub(r'^[\s\-_=]+', '', title)
-            title = re.sub(r'[\s\-_=]+$', '', title)
-            title = title.strip()
-            self.log(f"📝 최종 정리된 제목: {title}")
-            
-            # 콘텐츠 최종 검증 1: 링크 class 속성 따옴표 추가
-            # class=link1 → class="link1", class=link2 → class="link2", class=link3 → class="link3"
-            content = re.sub(r'class=link1(?=\s|>)', 'class="link1"', content)
-            content = re.sub(r'class=link2(?=\s|>)', 'class="link2"', content)
-            content = re.sub(r'class=link3(?=\s|>)', 'class="link3"', content)
-            content = re.sub(r'class=blink(?=\s|>)', 'class="blink"', content)
-            self.log("✅ 본문 링크 class 속성 따옴표 복구 완료")
-            
-            # 콘텐츠 최종 검증 2: 다운로드 버튼 HTML 완전 복구 (AI 응답이 잘못되었을 경우 대비)
-            # 키워드 추출 (제목에서)
-            keyword_from_title = title.split('|')[0].strip() if '|' in title else title
-            
-            if 'button-container' in content:
-                self.log("🔧 다운로드 버튼 발견 - 완전 재구성 시작")
-                
-                # 기존 button-container를 완전히 제거하고 새로 생성
-                content = re.sub(r'<div\s+class="?button-container"?>.*?</div>', '__BUTTON_PLACEHOLDER__', content, flags=re.DOTALL | re.IGNORECASE)
-                
-                # 올바른 다운로드 버튼 HTML 생성 (prompt1.txt 형식 준수)
-                from urllib.parse import quote
-                keyword_encoded = quote(keyword_from_title)
-                
-                correct_button_html = f'''<div class="button-container">
-    <p>
-        <a href="https://www.apple.com/kr/search/{keyword_encoded}?src=globalnav" class="custom-download-btn appstore-button" target="_self">
-            <img src="https://developer.apple.com/assets/elements/icons/app-store/app-store-128x128_2x.png" class="btn-logo" alt="App Store">
-            <span>App Store에서 바로 다운로드</span>
-        </a>
-    </p>
-    <p>
-        <a href="https://play.google.com/store/search?q={keyword_encoded}&amp;c=apps" class="custom-download-btn playstore-button" target="_self">
-            <img src="https://upload.wikimedia.org/wikipedia/commons/7/78/Google_Play_Store_badge_EN.svg" class="btn-logo" alt="Google Play">
-            <span>Google Play에서 바로 다운로드</span>
-        </a>
-    </p>
-    <p>
-        <a href="https://apps.microsoft.com/search?query={keyword_encoded}&hl=ko-KR&gl=KR" class="custom-download-btn window-button" target="_self">
-            <img src="https://upload.wikimedia.org/wikipedia/commons/4/44/Microsoft_logo.svg" class="btn-logo" alt="Microsoft Store">
-            <span>Windows에서 바로 다운로드</span>
-        </a>
-    </p>
-    <p>
-        <a href="https://www.apple.com/kr/search/{keyword_encoded}?src=globalnav" class="custom-download-btn macbook-button" target="_self">
-            <img src="https://upload.wikimedia.org/wikipedia/commons/f/fa/Apple_logo_black.svg" class="btn-logo" alt="Mac App Store">
-            <span>MacBook에서 바로 다운로드</span>
-        </a>
-    </p>
-</div>'''
-                
-                # 플레이스홀더를 올바른 HTML로 교체
-                content = content.replace('__BUTTON_PLACEHOLDER__', correct_button_html)
-                self.log(f"✅ 다운로드 버튼 완전 재구성 완료 (키워드: {keyword_from_title})")
-
-            # WordPress REST API URL 구성
-            api_url = f"{site_url.rstrip('/')}/wp-json/wp/v2/posts"
-            
-            # 여러 인증 방법 시도
-            auth_success, headers = self.try_authentication_methods(site_name, site_url, username, password)
-            
-            if not auth_success:
-                # 비밀번호 힌트 생성
-                password_hint = password[:4] + "***" + password[-4:] if len(password) > 8 else password[:2] + "***"
-                
-                return {'success': False, 'error': 'Authentication failed'}
-
-            # 🔥 중요: 제목과 콘텐츠 검증 (empty_content 에러 방지)
-            if not title or not title.strip():
-                self.log(f"❌ {site_name}: 제목이 비어있습니다. 포스팅 중단")
-                return {'success': False, 'error': '제목이 비어있습니다'}
-            
-            if not content or not content.strip():
-                self.log(f"❌ {site_name}: 콘텐츠가 비어있습니다. 포스팅 중단")
-                return {'success': False, 'error': '콘텐츠가 비어있습니다'}
-            
-            # 제목과 콘텐츠 길이 검증 (최소 길이 확인)
-            if len(title.strip()) < 5:
-                self.log(f"❌ {site_name}: 제목이 너무 짧습니다 (최소 5자 필요): '{title}'")
-                return {'success': False, 'error': '제목이 너무 짧습니다'}
-            
-            if len(content.strip()) < 100:
-                self.log(f"❌ {site_name}: 콘텐츠가 너무 짧습니다 (최소 100자 필요): {len(content.strip())}자")
-                return {'success': False, 'error': '콘텐츠가 너무 짧습니다'}
-            
-            self.log(f"✅ 제목 검증 완료: '{title}' ({len(title)}자)")
-            self.log(f"✅ 콘텐츠 검증 완료: {len(content)}자")
-
-            post_data = {
-                'title': title,
-                'content': content,
-                'status': 'publish',
-                'categories': [int(category)]
-            }
-
-            session = get_requests_session()
-            response = session.post(api_url, headers=headers, json=post_data, timeout=30)
-
-            if response.status_code == 201:
-                post_info = response.json()
-                post_id = post_info['id']
-                self.log(f"📤 포스트 업로드 성공 {site_name}")
-
-                # 썸네일 업로드
-                if thumbnail_path and os.path.exists(thumbnail_path):
-                    media_id = self.upload_featured_image(site_url, headers, thumbnail_path, post_id)
-                    if media_id:
-                        self.log(f"🖼️ 썸네일 업로드 완료 {site_name}")
-                    else:
-                        self.log(f"⚠️ {site_name}: 썸네일 업로드 실패 (포스트는 성공)")
-                
-                # HTML 콘텐츠를 output 폴더에 저장
-                try:
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    output_dir = os.path.join(get_base_path(), "output")
-                    os.makedirs(output_dir, exist_ok=True)
-                    
-                    # 사이트 이름에서 파일명에 사용할 수 없는 문자 제거
-                    safe_site_name = "".join(c for c in site_name if c.isalnum() or c in ('-', '_', '.')).rstrip()
-                    if not safe_site_name:
-                        safe_site_name = "site"
-                    
-                    # HTML 파일 저장
-                    html_filename = f"{safe_site_name}_{timestamp}_post_{post_id}.html"
-                    html_filepath = os.path.join(output_dir, html_filename)
-                    
-                    # 전체 HTML 구조로 저장 (제목 포함)
-                    full_html = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-</head>
-<body>
-    <h1>{title}</h1>
-    {content}
-</body>
-</html>"""
-                    
-                    with open(html_filepath, 'w', encoding='utf-8') as f:
-                        f.write(full_html)
-                    
-                except Exception as e:
-                    self.log(f"⚠️ HTML 저장 실패: {e}")
-                
-                return {'success': True, 'post_id': post_id}
-            else:
-                error_msg = f"HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    if 'message' in error_data:
-                        error_msg += f" - {error_data['message']}"
-                    if 'code' in error_data:
-                        error_msg += f" (코드: {error_data['code']})"
-                except:
-                    error_msg += f" - {response.text[:200]}"
-                
-                self.log(f"❌ {site_name}: 포스팅 실패: {error_msg}")
-                return {'success': False, 'error': error_msg}
-        except Exception as e:
-            self.log(f"❌ {site_name}: 워드프레스 포스팅 오류: {e}")
-            return {'success': False, 'error': str(e)}
-
-    def try_authentication_methods(self, site_name, site_url, username, password):
-        """다양한 인증 방법을 시도합니다 (캐싱 포함)"""
-        session = get_requests_session()
-        user_url = f"{site_url.rstrip('/')}/wp-json/wp/v2/users/me"
-        
-        # 비밀번호 힌트 생성 (보안을 위해 일부만 표시)
-        password_hint = password[:4] + "***" + password[-4:] if len(password) > 8 else password[:2] + "***"
-        
-        # 캐시된 인증 방법이 있으면 먼저 시도
-        if site_url in self.auth_cache:
-            cached_headers, cached_method = self.auth_cache[site_url]
-            self.log(f"🔑 {site_name}: 캐시된 인증 방법 ({cached_method}) 사용")
-            if self.test_auth_method(session, user_url, cached_headers, site_name, f"{cached_method} (캐시)", username, password_hint):
-                self.log(f"✅ {site_name}: 캐시된 인증 성공!")
-                return True, cached_headers
-            else:
-                self.log(f"⚠️ {site_name}: 캐시된 인증 실패, 다른 방법 시도...")
-                del self.auth_cache[site_url]  # 캐시 삭제
-        
-        # WordPress REST API 접근성 확인
-        self.check_rest_api_accessibility(site_name, site_url)
-        
-        # 방법 1: Application Password (공백 포함)
-        headers1 = self.create_auth_header(username, password, "Application Password with spaces")
-        if self.test_auth_method(session, user_url, headers1, site_name, "Application Password (공백포함)", username, password_hint):
-            self.auth_cache[site_url] = (headers1, "Application Password (공백포함)")  # 캐시 저장
-            return True, headers1
-        
-        # 방법 2: Application Password (공백 제거)
-        password_no_spaces = password.replace(" ", "")
-        self.log(f"🔑 {site_name}: 방법 2 - Application Password (공백 제거) 시도")
-        self.log(f"🔧 {site_name}: 공백 제거된 비밀번호 길이: {len(password_no_spaces)}자")
-        headers2 = self.create_auth_header(username, password_no_spaces, "Application Password without spaces")
-        if self.test_auth_method(session, user_url, headers2, site_name, "Application Password (공백제거)", username, password_hint):
-            self.auth_cache[site_url] = (headers2, "Application Password (공백제거)")  # 캐시 저장
-            return True, headers2
-        
-        # 방법 3: 기본 Basic Auth
-        self.log(f"🔑 {site_name}: 방법 3 - 기본 Basic Auth 시도")
-        headers3 = self.create_auth_header(username, password, "Basic Auth")
-        if self.test_auth_method(session, user_url, headers3, site_name, "Basic Auth", username, password_hint):
-            self.auth_cache[site_url] = (headers3, "Basic Auth")  # 캐시 저장
-            return True, headers3
-        
-        # 방법 4: WordPress 기본 인증 (username@domain 형식)
-        if '@' not in username and site_url:
-            domain = site_url.replace('https://', '').replace('http://', '').split('/')[0]
-            username_with_domain = f"{username}@{domain}"
-            headers4 = self.create_auth_header(username_with_domain, password, "Domain Auth")
-            if self.test_auth_method(session, user_url, headers4, site_name, "도메인 포함 인증", username_with_domain, password_hint):
-                self.auth_cache[site_url] = (headers4, "도메인 포함 인증")  # 캐시 저장
-                return True, headers4
-            
-            # 방법 5: 도메인 포함 + 공백 제거
-            self.log(f"🔑 {site_name}: 방법 5 - 도메인 포함 + 공백 제거 시도")
-            headers5 = self.create_auth_header(username_with_domain, password_no_spaces, "Domain Auth + No Spaces")
-            if self.test_auth_method(session, user_url, headers5, site_name, "도메인 포함 + 공백제거", username_with_domain, password_hint):
-                self.auth_cache[site_url] = (headers5, "도메인 포함 + 공백제거")  # 캐시 저장
-                return True, headers5
-        
-        # 모든 인증 방법 실패 시 자세한 가이드 제공
-        self.provide_authentication_guide(site_name, site_url, username)
-        
-        return False, None
-
-    def check_rest_api_accessibility(self, site_name, site_url):
-        """WordPress REST API 접근성 확인"""
-        try:
-            # REST API 엔드포인트 확인
-            api_base_url = f"{site_url.rstrip('/')}/wp-json/wp/v2"
-            
-            session = get_requests_session()
-            response = session.get(api_base_url, timeout=30)  # 타임아웃 30초로 증가
-            
-            if response.status_code == 200:
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            return False
-
-    def provide_authentication_guide(self, site_name, site_url, username):
-        """인증 실패 시 상세한 가이드 제공"""
-        pass  # 로그 제거됨
-
-    def create_auth_header(self, username, password, method_name):
-        """인증 헤더 생성"""
-        import base64
-        credentials = f"{username}:{password}"
-        token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
-        
-        return {
-            'Authorization': f'Basic {token}',
-            'Content-Type': 'application/json',
-            'User-Agent': 'Auto-WP/1.0'
-        }
-
-    def test_auth_method(self, session, user_url, headers, site_name, method_name, username="", password_hint=""):
-        """인증 방법 테스트 (재시도 포함)"""
-        max_retries = 2  # 최대 2번 재시도
-        
-        for attempt in range(max_retries):
-            try:
-                # 타임아웃 시간을 30초로 증가
-                response = session.get(user_url, headers=headers, timeout=30)
-                
-                if response.status_code == 200:
-                    user_info = response.json()
-                    user_name = user_info.get('name', 'Unknown')
-                    if attempt > 0:
-                        self.log(f"✅ {site_name}: {method_name} 인증 성공 ({attempt+1}번째 시도)")
-                    return True
-                else:
-                    # 인증 실패 시 사용자명과 비밀번호 힌트 표시
-                    if attempt == max_retries - 1:  # 마지막 시도에서만 로그 출력
-                        if username:
-                            self.log(f"❌ {site_name}: {method_name} 인증 실패 (HTTP {response.status_code}) - 사용자명: '{username}', 비밀번호: '{password_hint}'")
-                        else:
-                            self.log(f"❌ {site_name}: {method_name} 인증 실패 (HTTP {response.status_code})")
-                    return False
-                    
-            except requests.exceptions.Timeout as e:
-                if attempt < max_retries - 1:
-                    self.log(f"⏳ {site_name}: {method_name} 타임아웃 발생, {attempt+2}번째 시도 중...")
-                    continue
-                else:
-                    if username:
-                        self.log(f"❌ {site_name}: {method_name} 타임아웃 (30초) - 사용자명: '{username}', 비밀번호: '{password_hint}'")
-                    else:
-                        self.log(f"❌ {site_name}: {method_name} 타임아웃 (30초)")
-                    return False
-                    
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    self.log(f"⚠️ {site_name}: {method_name} 오류 발생, {attempt+2}번째 시도 중... ({str(e)[:50]})")
-                    continue
-                else:
-                    if username:
-                        self.log(f"❌ {site_name}: {method_name} 인증 중 오류: {e} - 사용자명: '{username}', 비밀번호: '{password_hint}'")
-                    else:
-                        self.log(f"❌ {site_name}: {method_name} 인증 중 오류: {e}")
-                    return False
-        
-        return False
-
-    def upload_featured_image(self, site_url, headers, image_path, post_id):
-        """특성 이미지(썸네일) 업로드"""
-        try:
-            media_url = f"{site_url}/wp-json/wp/v2/media"
-            
-            with open(image_path, 'rb') as f:
-                files = {
-                    'file': (os.path.basename(image_path), f, 'image/webp')
-                }
-                headers_upload = {'Authorization': headers['Authorization']}
-                
-                session = get_requests_session()
-                response = session.post(media_url, headers=headers_upload, files=files, timeout=30)
-                
-                if response.status_code == 201:
-                    media_info = response.json()
-                    media_id = media_info['id']
-                    
-                    # 포스트에 특성 이미지 설정
-                    post_url = f"{site_url}/wp-json/wp/v2/posts/{post_id}"
-                    update_data = {'featured_media': media_id}
-                    
-                    session.post(post_url, headers=headers, json=update_data, timeout=30)
-                    return media_id
-                else:
-                    self.log(f"⚠️ 썸네일 업로드 실패: {response.status_code}")
-                    return None
-        except Exception as e:
-            self.log(f"❌ 썸네일 업로드 오류: {e}")
-            return None
-
-    def clean_content(self, content, keyword=None):
-        """콘텐츠 정리 및 최적화 - HTML 구조 완전 정리"""
-        if not content:
-            return content
-            
-        # 기본 정리 작업들
-        content = content.strip()
-        
-        # 1. 깨진 HTML 태그 수정
-        # 불완전한 태그 패턴들 수정
-        content = re.sub(r'<p[^>]*>\s*<p[^>]*>', '<p>', content, flags=re.IGNORECASE)
-        content = re.sub(r'</p>\s*</p>', '</p>', content, flags=re.IGNORECASE)
-        content = re.sub(r'<div[^>]*>\s*<div[^>]*>', '<div>', content, flags=re.IGNORECASE)
-        content = re.sub(r'</div>\s*</div>', '</div>', content, flags=re.IGNORECASE)
-        
-        # 2. 색상 스타일 속성이 깨진 경우 수정
-        content = re.sub(r'<span style="color:\s*"[^>]*>', '<span style="color:#ee2323;">', content, flags=re.IGNORECASE)
-        content = re.sub(r'<span style="color:\s+[^"]*"', '<span style="color:#ee2323;"', content, flags=re.IGNORECASE)
-        content = re.sub(r'style="color:\s*//[^"]*"', 'style="color:#ee2323;"', content, flags=re.IGNORECASE)
-        content = re.sub(r'style="color:\s*#ee2323[^"]*"', 'style="color:#ee2323;"', content, flags=re.IGNORECASE)
-        
-        # 2-1. 더 강력한 깨진 HTML 속성 수정
-        # style 속성이 URL로 잘못 들어간 경우 완전 수정
-        content = re.sub(r'<span style="color:\s*//[^"]*"[^>]*>', '<span style="color:#ee2323;">', content, flags=re.IGNORECASE)
-        content = re.sub(r'<span[^>]*style="[^"]*//[^"]*"[^>]*>', '<span style="color:#ee2323;">', content, flags=re.IGNORECASE)
-        
-        # href 속성에 잘못된 URL이 들어간 경우 수정
-        if keyword:
-            search_url = f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
-            content = re.sub(r'href="[^"]*//search\.naver\.com[^"]*"', f'href="{search_url}"', content, flags=re.IGNORECASE)
-            content = re.sub(r'href="//[^"]*"', f'href="{search_url}"', content, flags=re.IGNORECASE)
-            
-        # 2-2. 깨진 링크 구조 완전 복구
-        # 잘못된 패턴: style="color: //search.naver.com..." target="_self">텍스트</a>
-        # 올바른 패턴으로 수정
-        if keyword:
-            pattern = r'style="color:\s*//[^"]*"\s*target="_self">([^<]*)</a>'
-            replacement = f'style="color:#ee2323;">{keyword} 상세정보</span>을 통해, 지금 바로 해보세요!</b></p><br><div><center><a class="blink" href="{search_url}" target="_self">\\1</a>'
-            content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
-        
-        # 3. 불완전한 닫는 태그들 정리
-        content = re.sub(r'</strong>\s*새우,', '</strong>', content, flags=re.IGNORECASE)
-        content = re.sub(r'</h4>\s*<br>\s*<p>', '</h4>\n<p>', content, flags=re.IGNORECASE)
-        
-        # 4. 테이블 태그가 깨진 경우 정리
-        content = re.sub(r'<td[^>]*>\s*<td[^>]*>', '<td>', content, flags=re.IGNORECASE)
-        content = re.sub(r'</td>\s*</td>', '</td>', content, flags=re.IGNORECASE)
-        
-        # 5. 과도한 <br> 태그 정리 - 연속된 3개 이상의 <br>만 제거
-        content = re.sub(r'(<br\s*/?>\s*){3,}', '<br><br>', content, flags=re.IGNORECASE)
-        
-        # 6. HTML 태그 간 불필요한 <br> 제거
-        content = re.sub(r'</p>\s*<br\s*/?>\s*<p>', '</p>\n<p>', content, flags=re.IGNORECASE)
-        content = re.sub(r'</h[1-6]>\s*<br\s*/?>\s*<p>', '</h2>\n<p>', content, flags=re.IGNORECASE)
-        content = re.sub(r'</div>\s*<br\s*/?>\s*<div>', '</div>\n<div>', content, flags=re.IGNORECASE)
-        
-        # 7. 시작과 끝의 불필요한 <br> 제거
-        content = re.sub(r'^(<br\s*/?>\s*)+', '', content, flags=re.IGNORECASE)
-        content = re.sub(r'(<br\s*/?>\s*)+$', '', content, flags=re.IGNORECASE)
-        
-        # 8. 링크 태그를 보호하면서 처리
-        link_pattern = r'<a[^>]*>.*?</a>'
-        links = re.findall(link_pattern, content, flags=re.IGNORECASE | re.DOTALL)
-        
-        # 임시 플레이스홀더로 링크 교체
-        temp_content = content
-        for i, link in enumerate(links):
-            temp_content = temp_content.replace(link, f"__LINK_PLACEHOLDER_{i}__", 1)
-        
-        # 링크가 없는 부분에서 과도한 <br> 제거 (2개 연속까지만 허용)
-        temp_content = re.sub(r'(<br\s*/?>\s*){3,}', '<br><br>', temp_content, flags=re.IGNORECASE)
-        
-        # 링크 복원
-        for i, link in enumerate(links):
-            temp_content = temp_content.replace(f"__LINK_PLACEHOLDER_{i}__", link, 1)
-        
-        content = temp_content
-        
-        # 9. 불완전한 HTML 태그 정리
-        content = re.sub(r'<strong>\s*</strong>', '', content, flags=re.IGNORECASE)
-        content = re.sub(r'</strong>\s*<strong>', ' ', content, flags=re.IGNORECASE)
-        
-        # 10. 잘못된 HTML 구조 정리
-        content = re.sub(r'<p[^>]*>\s*</p>', '', content, flags=re.IGNORECASE)  # 빈 p 태그 제거
-        
-        # 11. 중복된 제목이나 내용 제거
-        lines = content.split('\n')
-        seen_lines = set()
-        seen_content = set()
-        unique_lines = []
-        
-        for line in lines:
-            # 제목 패턴 중복 체크 (h2, h3 태그)
-            title_match = re.search(r'<h[2-3][^>]*>(.+?)</h[2-3]>', line, flags=re.IGNORECASE)
-            if title_match:
-                title_text = title_match.group(1).strip()
-                if title_text not in seen_lines:
-                    seen_lines.add(title_text)
-                    unique_lines.append(line)
-            else:
-                # 일반 내용 중복 체크 (HTML 태그 제거 후 비교)
-                clean_line = re.sub(r'<[^>]*>', '', line).strip()
-                if clean_line:
-                    # 너무 짧거나 의미없는 내용 제거
-                    if len(clean_line) > 10 and clean_line not in seen_content:
-                        # 비슷한 내용 체크 (80% 이상 유사하면 중복으로 간주)
-                        is_duplicate = False
-                        for existing_content in seen_content:
-                            if len(existing_content) > 10:
-                                similarity = self.similarity_ratio(clean_line, existing_content)
-                                if similarity > 0.8:
-                                    is_duplicate = True
-                                    break
-                        
-                        if not is_duplicate:
-                            seen_content.add(clean_line)
-                            unique_lines.append(line)
-                    elif len(clean_line) <= 10:
-                        # 짧은 라인은 중복 체크 없이 추가 (HTML 태그만 있는 경우 등)
-                        unique_lines.append(line)
-                else:
-                    # 빈 라인도 유지
-                    unique_lines.append(line)
-        
-        content = '\n'.join(unique_lines)
-        
-        # 12. 깨진 HTML 구조 복구
-        # 닫히지 않은 태그들을 찾아서 정리
-        open_tags = []
-        tag_pattern = r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>'
-        
-        for match in re.finditer(tag_pattern, content):
-            is_closing = match.group(1) == '/'
-            tag_name = match.group(2).lower()
-            
-            if not is_closing:
-                # 자체 닫힘 태그가 아닌 경우에만 추가
-                if tag_name not in ['br', 'img', 'hr', 'input', 'meta', 'link']:
-                    open_tags.append(tag_name)
-            else:
-                # 닫는 태그인 경우 매칭되는 열린 태그 제거
-                if open_tags and open_tags[-1] == tag_name:
-                    open_tags.pop()
-        
-        # 13. 끝부분의 불완전한 내용 제거 (다운로드 버튼 보호)
-        # 다운로드 버튼 HTML을 임시로 보호
-        download_button_pattern = r'<div class="button-container">.*?</div>'
-        download_buttons = re.findall(download_button_pattern, content, flags=re.IGNORECASE | re.DOTALL)
-        
-        # 다운로드 버튼을 플레이스홀더로 교체
-        temp_content = content
-        for i, button in enumerate(download_buttons):
-            temp_content = temp_content.replace(button, f"__DOWNLOAD_BUTTON_{i}__", 1)
-        
-        # 의미없는 단어들이나 불완전한 문장, 깨진 HTML 구조 제거
-        temp_content = re.sub(r'\s*(당근|단호|center(?!>)|table(?!>)|td(?!>)|tr(?!>)|color(?![:="])|style(?![:="])|href(?![:="]))\s*$', '', temp_content, flags=re.IGNORECASE)
-        temp_content = re.sub(r'<[^>]*>?\s*$', '', temp_content)  # 끝에 불완전한 태그 제거
-        temp_content = re.sub(r'[^>]*>\s*$', '', temp_content)  # 끝에 불완전한 태그 내용 제거
-        temp_content = re.sub(r'\s*=\s*$', '', temp_content)  # 끝에 등호나 불완전한 속성 제거
-        temp_content = re.sub(r'^\s*"\s*$', '', temp_content, flags=re.MULTILINE)  # 줄 전체가 따옴표만 있는 경우만 제거
-        
-        # 다운로드 버튼 복원
-        for i, button in enumerate(download_buttons):
-            temp_content = temp_content.replace(f"__DOWNLOAD_BUTTON_{i}__", button, 1)
-        
-        content = temp_content
-        
-        # 13-1. 불완전한 문장이나 단락 제거
-        # 끝이 완전하지 않은 문장들 제거 (마침표, 물음표, 느낌표로 끝나지 않는 경우)
-        lines = content.split('\n')
-        complete_lines = []
-        for line in lines:
-            clean_line = re.sub(r'<[^>]*>', '', line).strip()  # HTML 태그 제거 후 체크
-            if clean_line and len(clean_line) > 5:
-                # 완전한 문장인지 체크 (한글 문장 특성 고려)
-                if (clean_line.endswith(('.', '!', '?', '요', '다', '죠', '어요', '습니다', '네요', '게요')) or 
-                    '</p>' in line or '</div>' in line or '</h2>' in line or '</h3>' in line):
-                    complete_lines.append(line)
-                elif len(clean_line) < 10:  # 너무 짧은 라인은 제거
-                    continue
-        
-        content = '\n'.join(complete_lines)
-        
-        # 14. 최종 정리
-        content = re.sub(r'\n\s*\n', '\n', content)  # 연속된 빈 줄 제거
-        content = content.strip()
-        
-        return content
-        
-        # 마크다운을 HTML로 변환 (혹시 AI가 마크다운으로 출력한 경우 대비)
-        # 헤딩 변환
-        content = re.sub(r'^### (.*?)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
-        content = re.sub(r'^## (.*?)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
-        content = re.sub(r'^# (.*?)$', r'<h1>\1</h1>', content, flags=re.MULTILINE)
-
-        # 볼드, 이탤릭 변환
-        content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-        content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
-
-        # 마크다운 리스트를 HTML로 변환
-        lines = content.split('\n')
-        in_list = False
-        result_lines = []
-        
-        for line in lines:
-            line_stripped = line.strip()
-            if line_stripped.startswith('- ') or line_stripped.startswith('* '):
-                if not in_list:
-                    result_lines.append('<ul>')
-                    in_list = True
-                list_item = line_stripped[2:].strip()
-                result_lines.append(f'<li>{list_item}</li>')
-            else:
-                if in_list:
-                    result_lines.append('</ul>')
-                    in_list = False
-                result_lines.append(line)
-        
-        if in_list:
-            result_lines.append('</ul>')
-            
-        content = '\n'.join(result_lines)
-
-        # 인용구 변환
-        content = re.sub(r'^> (.*?)$', r'<blockquote>\1</blockquote>', content, flags=re.MULTILINE)
-
-        # 수평선 변환
-        content = re.sub(r'^---$', r'<hr>', content, flags=re.MULTILINE)
-
-        # 연속된 공백/줄바꿈 정리
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        content = re.sub(r' {2,}', ' ', content)
-        
-        # 빈 HTML 태그 제거
-        content = re.sub(r'<p>\s*</p>', '', content)
-        content = re.sub(r'<div>\s*</div>', '', content)
-        content = re.sub(r'<strong>\s*</strong>', '', content)
-        content = re.sub(r'<u>\s*</u>', '', content)
-        
-        return content.strip()
-
-    def extract_title_and_intro(self, content, keyword):
-        """제목과 서론을 추출 - 올바른 제목 형식 확인 및 보정"""
-        lines = content.strip().split('\n')
-        title = ""
-        intro = content
-        
-        # 첫 번째 줄을 제목으로 사용 (HTML 태그 제거 후)
-        if lines:
-            first_line = lines[0].strip()
-            # HTML 태그 제거
-            title = re.sub(r'<[^>]+>', '', first_line).strip()
-            # 나머지를 서론으로 사용
-            intro = '\n'.join(lines[1:]).strip()
-        
-        # 제목에서 HTML 태그 제거 (제목은 순수 텍스트로)
-        title = re.sub(r'<[^>]+>', '', title).strip()
-        
-        # 제목에서 불필요한 문자 제거 (큰따옴표, 작은따옴표, #, *, 백틱 등)
-        title = title.replace('"', '').replace("'", '').replace('`', '')
-        title = title.replace('#', '').replace('*', '').replace('**', '')
-        title = re.sub(r'^[\s\-_=]+', '', title)  # 앞쪽 특수문자 제거
-        title = re.sub(r'[\s\-_=]+$', '', title)  # 뒤쪽 특수문자 제거
-        title = title.strip()
-        
-        # 제목 형식 검증 및 보정
-        if not self.is_valid_title_format(title, keyword):
-            title = self.generate_hook_title(keyword)
-            self.log(f"⚠️ 제목 형식이 올바르지 않아 자동 생성: {title}")
-        
-        # 서론에서 제목과 완전히 동일한 내용 제거 (대소문자 구분 없이)
-        if title and intro:
-            # 1. 완전히 동일한 제목 제거
-            title_pattern = re.escape(title)
-            intro = re.sub(rf'^.*{title_pattern}.*$', '', intro, flags=re.MULTILINE | re.IGNORECASE)
-            
-            # 2. 키워드가 포함된 소제목 형태 제거 (: 또는 | 포함)
-            keyword_patterns = [
-                rf'^.*{re.escape(keyword)}.*:.*$',
-                rf'^.*{re.escape(keyword)}.*\|.*$',
-                rf'^.*{re.escape(keyword)}.*방법.*$',
-                rf'^.*{re.escape(keyword)}.*가이드.*$'
-            ]
-            for pattern in keyword_patterns:
-                intro = re.sub(pattern, '', intro, flags=re.MULTILINE | re.IGNORECASE)
-            
-            # 3. HTML 헤딩 태그 완전 제거
-            intro = re.sub(r'<h[1-6][^>]*>.*?</h[1-6]>', '', intro, flags=re.IGNORECASE | re.DOTALL)
-            intro = re.sub(r'</?h[1-6][^>]*>', '', intro, flags=re.IGNORECASE)
-            
-            # 4. 과도한 <br> 태그 정리
-            intro = re.sub(r'(<br\s*/?>\s*){2,}', '', intro, flags=re.IGNORECASE)
-            intro = re.sub(r'^<br\s*/?>', '', intro, flags=re.IGNORECASE)
-            intro = re.sub(r'<br\s*/?>$', '', intro, flags=re.IGNORECASE)
-            
-            # 5. 빈 문단이나 의미없는 내용 제거
-            intro_lines = intro.split('\n')
-            cleaned_lines = []
-            for line in intro_lines:
-                clean_line = line.strip()
-                if (clean_line and 
-                    len(clean_line) > 10 and 
-                    not clean_line.startswith('#') and
-                    not clean_line.lower().startswith(keyword.lower())):
-                    cleaned_lines.append(line)
-            
-            intro = '\n'.join(cleaned_lines).strip()
-        
-        return title, intro
-
-    def is_valid_title_format(self, title, keyword):
-        """제목이 올바른 형식({keyword} | 후킹문구)인지 검증 - 매우 엄격"""
-        if not title:
-            return False
-        
-        # 1. 금지된 패턴 체크 (하이픈 형식 완전 거부)
-        forbidden_patterns = [
-            r'-\s*완벽\s*가이드',
-            r'-\s*완벽\s*설명', 
-            r'-\s*완벽\s*방법',
-            r'-\s*노하우',
-            r'-\s*팁',
-            r'-\s*정리',
-            r'-.*가이드$',
-            r'-.*방법$',
-            r'-.*설명$'
-        ]
-        
-        for forbidden in forbidden_patterns:
-            if re.search(forbidden, title, re.IGNORECASE):
-                return False
-        
-        # 2. 필수 패턴 체크: {keyword} | 숫자포함 후킹문구
-        required_pattern = rf'{re.escape(keyword)}\s*\|\s*.+'
-        if not re.search(required_pattern, title, re.IGNORECASE):
-            return False
-        
-        # 3. 파이프(|) 기호가 있는지 확인
-        if '|' not in title:
-            return False
-        
-        # 4. 숫자가 포함되어 있는지 확인
-        if not re.search(r'\d+', title):
-            return False
-        
-        # 5. 길이 체크 (20-80자)
-        if len(title) < 20 or len(title) > 80:
-            return False
-        
-        # 6. 키워드가 제목 시작 부분에 있는지 확인
-        if not title.lower().strip().startswith(keyword.lower()):
-            return False
-        
-        return True
-
-    def similarity_ratio(self, str1, str2):
-        """두 문자열의 유사도 계산 (0.0 ~ 1.0)"""
-        try:
-            from difflib import SequenceMatcher
-            return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
-        except:
-            # difflib를 사용할 수 없는 경우 간단한 비교
-            words1 = set(str1.lower().split())
-            words2 = set(str2.lower().split())
-            if not words1 or not words2:
-                return 0.0
-            intersection = words1.intersection(words2)
-            union = words1.union(words2)
-            return len(intersection) / len(union) if union else 0.0
-
-    def validate_and_fix_title(self, title, keyword):
-        """제목이 '{keyword} | 숫자가 들어간 후킹문구' 형식인지 검증하고 수정"""
-        try:
-            # 제목이 '{keyword} |' 로 시작하는지 확인
-            expected_start = f"{keyword} |"
-            
-            # 1차 검증: 정확한 형식 확인
-            if not title.startswith(expected_start):
-                self.log(f"⚠️ 제목이 지침에 맞지 않음: {title}")
-                
-                # 제목 수정 시도
-                if "|" in title:
-                    # | 이후 부분을 후킹문구로 사용
-                    parts = title.split("|", 1)
-                    hook_part = parts[1].strip()
-                    
-                    # 키워드가 앞부분에 없거나 다른 경우 교체
-                    if not parts[0].strip() == keyword:
-                        # 숫자가 포함되어 있는지 확인
-                        if any(char.isdigit() for char in hook_part):
-                            fixed_title = f"{keyword} | {hook_part}"
-                            self.log(f"✅ 제목을 지침에 맞게 수정: {fixed_title}")
-                            return fixed_title
-                
-                # 기본 후킹문구 생성 (항상 숫자 포함)
-                fixed_title = self.generate_hook_title(keyword)
-                self.log(f"🔧 기본 제목 생성: {fixed_title}")
-                return fixed_title
-            
-            # 2차 검증: 올바른 형식이지만 숫자 포함 여부 확인
-            if "|" in title:
-                hook_part = title.split("|", 1)[1].strip()
-                if not any(char.isdigit() for char in hook_part):
-                    # 숫자가 없으면 추가
-                    enhanced_hook = self.add_number_to_hook(hook_part)
-                    fixed_title = f"{keyword} | {enhanced_hook}"
-                    self.log(f"� 제목에 숫자 추가: {fixed_title}")
-                    return fixed_title
-            
-            return title
-            
-        except Exception as e:
-            self.log(f"제목 검증 중 오류: {e}")
-            # 오류 발생 시 안전한 기본 제목 반환
-            return self.generate_hook_title(keyword)
-    
-    def generate_hook_title(self, keyword):
-        """숫자가 포함된 기본 후킹 제목 생성"""
-        import random
-        hook_phrases = [
-            f"{random.randint(3, 10)}가지 핵심 정보",
-            f"{random.randint(5, 15)}분만에 완벽 이해",
-            f"{random.randint(3, 7)}단계 완벽 가이드",
-            f"{random.randint(10, 30)}초만에 알아보는 방법",
-            f"2024년 최신 {random.randint(5, 20)}가지 팁",
-            f"{random.randint(7, 15)}가지 필수 노하우",
-            f"{random.randint(3, 8)}분 완벽 정리",
-            f"{random.randint(5, 12)}가지 실용 정보"
-        ]
-        
-        selected_hook = random.choice(hook_phrases)
-        return f"{keyword} | {selected_hook}"
-    
-    def add_number_to_hook(self, hook_text):
-        """후킹문구에 숫자 추가"""
-        import random
-        numbers = [random.randint(3, 10), random.randint(5, 15), random.randint(7, 20)]
-        selected_number = random.choice(numbers)
-        
-        # 기존 후킹문구에 자연스럽게 숫자 추가
-        if "가지" not in hook_text and "단계" not in hook_text and "분" not in hook_text:
-            return f"{selected_number}가지 {hook_text}"
-        else:
-            return f"{selected_number}분만에 알아보는 {hook_text}"
-
-    def extract_approval_title_and_intro(self, content, keyword):
-        """승인용 콘텐츠에서 제목과 서론 추출"""
-        return self.extract_title_and_intro(content, keyword)
-
-    def replace_prompt_variables(self, prompt_content, keyword, urls, anchor_links, context):
-        """프롬프트 변수들을 실제 값으로 치환 - 모든 변수 처리"""
-        prompt = prompt_content.replace("{keyword}", keyword)
-        prompt = prompt.replace("{context}", context)
-        
-        # 기본 URL 변수들 치환
-        search_url = f"https://search.naver.com/search.naver?query={keyword.replace(' ', '+')}"
-        prompt = prompt.replace("{url}", search_url)
-        # href="url" 패턴만 치환 (다른 URL은 건드리지 않음)
-        prompt = re.sub(r'href=["\']?\s*url\s*["\']?', f'href="{search_url}"', prompt, flags=re.IGNORECASE)
-        
-        # 모든 링크 변수들 치환
-        prompt = prompt.replace("{naver_search_link}", f'<a href="{search_url}" target="_self">{keyword} 관련 정보</a>')
-        prompt = prompt.replace("{youtube_link}", f'<a href="https://tv.naver.com/search?query={keyword.replace(" ", "+")}" target="_self">{keyword} 관련 영상</a>')
-        prompt = prompt.replace("{primary_link}", f'<a href="{search_url}" target="_self">{keyword} 상세 정보</a>')
-        
-        # 정부 및 공공기관 링크들
-        prompt = prompt.replace("{hometax_link}", '<a href="https://www.hometax.go.kr" target="_self">홈택스 바로가기</a>')
-        prompt = prompt.replace("{lh_link}", '<a href="https://www.lh.or.kr" target="_self">LH 한국토지주택공사</a>')
-        prompt = prompt.replace("{efine_link}", '<a href="https://www.efine.go.kr" target="_self">교통민원24</a>')
-        prompt = prompt.replace("{gov24_link}", '<a href="https://www.gov.kr" target="_self">정부24</a>')
-        prompt = prompt.replace("{wetax_link}", '<a href="https://www.wetax.go.kr" target="_self">위택스</a>')
-        prompt = prompt.replace("{kepco_link}", '<a href="https://cyber.kepco.co.kr" target="_self">한국전력 사이버지점</a>')
-        prompt = prompt.replace("{car365_link}", '<a href="https://www.car365.go.kr" target="_self">자동차365</a>')
-        prompt = prompt.replace("{apply_lh_link}", '<a href="https://apply.lh.or.kr" target="_self">LH청약플러스</a>')
-        prompt = prompt.replace("{bokjiro_link}", '<a href="https://www.bokjiro.go.kr" target="_self">복지로</a>')
-        
-        # 금융기관 링크들
-        prompt = prompt.replace("{kbstar_link}", '<a href="https://www.kbstar.com" target="_self">KB국민은행</a>')
-        prompt = prompt.replace("{shinhan_link}", '<a href="https://www.shinhan.com" target="_self">신한은행</a>')
-        prompt = prompt.replace("{hanabank_link}", '<a href="https://www.hanabank.com" target="_self">하나은행</a>')
-        prompt = prompt.replace("{wooribank_link}", '<a href="https://www.wooribank.com" target="_self">우리은행</a>')
-        prompt = prompt.replace("{ibk_link}", '<a href="https://www.ibk.co.kr" target="_self">IBK기업은행</a>')
-        prompt = prompt.replace("{kdb_link}", '<a href="https://www.kdb.co.kr" target="_self">KDB산업은행</a>')
-        prompt = prompt.replace("{bok_link}", '<a href="https://www.bok.or.kr" target="_self">한국은행</a>')
-        prompt = prompt.replace("{fss_link}", '<a href="https://www.fss.or.kr" target="_self">금융감독원</a>')
-        prompt = prompt.replace("{toss_link}", '<a href="https://toss.im" target="_self">토스</a>')
-        prompt = prompt.replace("{kakaopay_link}", '<a href="https://www.kakaopay.com" target="_self">카카오페이</a>')
-        
-        # 부동산 및 기타 링크들
-        prompt = prompt.replace("{naver_land_link}", '<a href="https://land.naver.com" target="_self">네이버 부동산</a>')
-        prompt = prompt.replace("{naver_map_link}", '<a href="https://map.naver.com" target="_self">네이버 지도</a>')
-        prompt = prompt.replace("{zigbang_link}", '<a href="https://www.zigbang.com" target="_self">직방</a>')
-        prompt = prompt.replace("{dabang_link}", '<a href="https://www.dabangapp.com" target="_self">다방</a>')
-        
-        # 통신 및 유틸리티 링크들
-        prompt = prompt.replace("{tworld_link}", '<a href="https://www.tworld.co.kr" target="_self">T월드</a>')
-        prompt = prompt.replace("{kt_link}", '<a href="https://www.kt.com" target="_self">KT</a>')
-        prompt = prompt.replace("{uplus_link}", '<a href="https://www.uplus.co.kr" target="_self">LG U+</a>')
-        
-        # 자동차 관련 링크들
-        prompt = prompt.replace("{bobaedream_link}", '<a href="https://www.bobaedream.co.kr" target="_self">보배드림</a>')
-        prompt = prompt.replace("{encar_link}", '<a href="https://www.encar.com" target="_self">엔카</a>')
-        
-        return prompt
-
-    def get_approval_system_prompt(self, step, keyword):
-        """승인용 시스템 프롬프트 생성 - 최소화 (API 토큰 대폭 절약)"""
-        
-        # approval 프롬프트 파일에 이미 상세 규칙이 있으므로 최소한만 전달
-        return f"""너는 SEO 콘텐츠 전문가야. {keyword}에 대한 글을 작성해.
-
-규칙:
-- HTML만 사용 (마크다운 금지)
-- '~해요'체 사용
-- prompts/approval{step}.txt 파일의 지침을 정확히 따르기"""
-
-    def get_revenue_system_prompt(self, step_num, keyword):
-        """수익용 시스템 프롬프트 생성 - prompt 파일 읽어서 사용"""
-        try:
-            # prompt 파일 경로
-            prompt_file = f"prompts/prompt{step_num}.txt"
-            
-            # 파일 읽기
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                prompt_content = f.read()
-            
-            # {keyword} 치환
-            prompt_content = prompt_content.replace('{keyword}', keyword)
-            
-            # 프롬프트 파일에 이미 규칙이 있으므로 추가 규칙 없음 (API 토큰 절약)
-            return prompt_content
-            
-        except Exception as e:
-            self.log(f"프롬프트 파일 읽기 오류: {e}")
-            # 기본 프롬프트
-            return f"""너는 SEO 콘텐츠 작가다. {keyword}에 대한 고품질 콘텐츠를 '~해요'체로 작성해라.
-            
-규칙:
-- AI 역할 언급 절대 금지
-- '클릭' 단어 사용 금지 (대신: 선택, 확인, 눌러보기, 터치, 접속, 방문)
-- 마크다운 문법 사용 금지
-- 순수 HTML만 사용
-- {keyword}에 대한 유용한 정보 제공"""
-
-    def extract_approval_title_and_intro(self, content, keyword):
-        """승인용 콘텐츠에서 제목과 서론 추출"""
-        return self.extract_title_and_intro(content, keyword)
-
-        return base_prompt
-
-                
-class ConfigManager:
-    """단일 JSON 구조 설정 관리 클래스 (setting.json)"""
-
-    def __init__(self):
-        self.setting_file = os.path.join(get_base_path(), "setting.json")
-        self.data = self.load_setting()
-
-    # property 완전 제거 - 직접 접근 방식
-    
-    def load_setting(self):
-        """단일 JSON 파일에서 모든 설정 로드"""
-        default_data = {
-            "api_keys": {
-                "openai": "",
-                "gemini": ""
-            },
-            "global_settings": {
-                "default_ai": "gemini",
-                "default_wait_time": "47~50",
-                "posting_mode": "수익용",
-                "ai_model": "gemini-2.5-flash-lite",
-                "common_username": "",
-                "common_password": "",
-                "font_path": "fonts/timon.ttf",
-                "max_sites": 20,
-                "auto_save": True
-            },
-            "posting_state": {
-                "last_site_id": None,
-                "last_site_url": "",
-                "posting_in_progress": False,
-                "next_site_id": None
-            },
-            "version": "multi-site",
-            "sites": []
-        }
-
-        try:
-            if os.path.exists(self.setting_file):
-                with open(self.setting_file, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                    # 기본값과 병합
-                    for key in default_data:
-                        if key in loaded_data:
-                            if isinstance(default_data[key], dict):
-                                default_data[key].update(loaded_data[key])
-                            else:
-                                default_data[key] = loaded_data[key]
-                    return default_data
-            return default_data
-        except Exception as e:
-            print(f"설정 로드 오류: {e}")
-            return default_data
-
-    def save_setting(self):
-        """단일 JSON 파일에 모든 설정 저장"""
         try:
-            with open(self.setting_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            print(f"❌ 설정 저장 오류: {e}")
-            return False
+            print(f"🔍 Gemini 모델 시도: {model_name}")
+            model = genai.GenerativeModel(model_name)
+            response = model.generate_content(
+                "안녕",
+                generation_config=genai.types.GenerationConfig(
+                    max_output_tokens=10,
+                    temperature=0.7
+                ),
+                request_options={'timeout': 10}
+            )
+            if hasattr(response, 'text') and response.text:
+                print(f"✅ Gemini 연결 성공: {model_name}")
+                return {'provider': 'gemini', 'ok': True,
+                        'message': f"✅ Gemini API 연결 성공! (모델: {model_name})"}
+        except Exception as model_error:
+            last_error = str(model_error)
+            print(f"❌ {model_name} 실패: {last_error}")
+
+    error_detail = f"모든 Gemini 모델 테스트 실패. 마지막 오류: {last_error}"
+    print(f"❌ {error_detail}")
+    raise Exception(error_detail)
+
+def scan_site_health(task, site, username, password):
+    """단일 사이트 상태 점검 - REST 접근, 인증 방법, 카테고리, 미디어 업로드 권한 (백그라운드 스레드)
+
+    성공한 인증 방법은 auth_cache.json에 저장되어 포스팅 시 우선 사용됩니다.
+    """
+    import base64
+
+    site_url = site.get('url', '').rstrip('/')
+    category_id = site.get('category_id', 1)
+    result = {
+        'site_id': site.get('id'),
+        'name': site.get('name', site_url),
+        'url': site_url,
+        'ok': False,
+        'status': '',
+        'rest_ok': False,
+        'rest_ms': None,
+        'auth_method': '',
+        'auth_ms': None,
+        'category': '',
+        'can_upload': None,
+        'total_ms': None,
+    }
+    started = time.perf_counter()
+    session = requests.Session()
 
-    def load_config(self):
-        """기존 호환성을 위한 메서드 - 직접 데이터 반환"""
-        return self.data
+    def elapsed_ms(since):
+        return int((time.perf_counter() - since) * 1000)
 
-    def reload_config(self):
-        """설정 파일을 다시 로드하여 메모리 데이터 갱신"""
-        try:
-            print("🔄 설정 파일 다시 로드 중...")
-            self.data = self.load_setting()
-            print("✅ 설정 파일 로드 완료")
-            return True
+    try:
+        # 1. REST API 접근성
+        t0 = time.perf_counter()
+        try:
+            response = session.get(f"{site_url}/wp-json/wp/v2/", timeout=15)
+            result['rest_ms'] = elapsed_ms(t0)
+            result['rest_ok'] = response.status_code == 200
+            if not result['rest_ok']:
+                result['status'] = f"❌ REST API HTTP {response.status_code}"
+                return result
         except Exception as e:
-            print(f"❌ 설정 파일 다시 로드 실패: {e}")
-            return False
+            result['rest_ms'] = elapsed_ms(t0)
+            result['status'] = f"❌ REST API 접근 실패: {str(e)[:60]}"
+            return result
 
-    def save_config(self):
-        """기존 호환성을 위한 메서드"""
-        return self.save_setting()
+        # 2. 인증 방법 (저장된 방법 우선)
+        store = get_auth_cache_store()
+        stored_method = store.get_method(site_url)
+        methods = [m[0] for m in WP_AUTH_METHODS]
+        if stored_method in methods:
+            methods.remove(stored_method)
+            methods.insert(0, stored_method)
+
+        user_info = None
+        headers = None
+        t0 = time.perf_counter()
+        for method_name in methods:
+            if task.is_cancelled():
+                return None
+            credentials = build_auth_credentials(method_name, username, password, site_url)
+            if not credentials:
+                continue
+            token = base64.b64encode(f"{credentials[0]}:{credentials[1]}".encode('utf-8')).decode('ascii')
+            headers = {'Authorization': f'Basic {token}', 'User-Agent': 'Auto-WP/1.0'}
+            try:
+                auth_response = session.get(f"{site_url}/wp-json/wp/v2/users/me",
+                                            params={'context': 'edit'}, headers=headers, timeout=15)
+                if auth_response.status_code == 200:
+                    user_info = auth_response.json()
+                    result['auth_method'] = method_name
+                    break
+            except Exception:
+                continue
+        result['auth_ms'] = elapsed_ms(t0)
 
-    def load_sites(self):
-        """기존 호환성을 위한 메서드 - 직접 사이트 데이터 반환"""
-        return {"sites": self.data.get("sites", [])}
+        if not user_info:
+            if stored_method:
+                store.forget(site_url)
+            result['status'] = "❌ 인증 실패"
+            return result
+        store.remember(site_url, result['auth_method'])
 
-    def save_sites(self):
-        """기존 호환성을 위한 메서드"""
-        return self.save_setting()
+        capabilities = user_info.get('capabilities', {})
+        result['can_upload'] = bool(capabilities.get('upload_files', False))
 
-    def save_posting_state(self, site_id, site_url, in_progress=False):
-        """현재 포스팅 상태 저장"""
-        try:
-            # 포스팅이 완료된 경우(in_progress=False), 다음 사이트로 이동할 수 있도록 next_site_id 설정
-            next_site_id = None
-            if not in_progress:
-                next_site_id = self.get_next_site_id(site_id)
-                print(f"🔄 포스팅 완료: {site_id} → 다음 시작 사이트: {next_site_id}")
-            
-            self.data["posting_state"] = {
-                "last_site_id": site_id,
-                "last_site_url": site_url,
-                "posting_in_progress": in_progress,
-                "next_site_id": next_site_id
-            }
-            self.save_setting()
-        except Exception as e:
-            print(f"포스팅 상태 저장 오류: {e}")
-
-    def get_posting_state(self):
-        """마지막 포스팅 상태 반환"""
-        return self.data.get("posting_state", {
-            "last_site_id": None,
-            "last_site_url": "",
-            "posting_in_progress": False,
-            "next_site_id": None
-        })
-
-    def get_next_site_id(self, current_site_id):
-        """현재 사이트 다음의 사이트 ID 반환"""
-        try:
-            sites = self.data.get("sites", [])
-            if not sites:
-                return None
-            
-            # 현재 사이트의 인덱스 찾기
-            current_index = -1
-            for i, site in enumerate(sites):
-                if site.get("id") == current_site_id:
-                    current_index = i
-                    break
-            
-            if current_index == -1:
-                # 현재 사이트를 찾지 못한 경우 첫 번째 사이트 반환
-                return sites[0].get("id") if sites else None
-            
-            # 다음 사이트 반환 (마지막 사이트면 첫 번째로)
-            next_index = (current_index + 1) % len(sites)
-            return sites[next_index].get("id")
-            
-        except Exception as e:
-            print(f"다음 사이트 ID 조회 오류: {e}")
+        # 3. 카테고리 존재 확인
+        if task.is_cancelled():
             return None
-
-    def get_start_site_id(self):
-        """시작할 사이트 ID 반환 - 마지막 상태에 따라 결정"""
         try:
-            posting_state = self.get_posting_state()
-            
-            # 포스팅이 진행 중이었다면 같은 사이트에서 재시작
-            if posting_state.get("posting_in_progress", False):
-                last_site_id = posting_state.get("last_site_id")
-                print(f"🔄 포스팅 재시작: {last_site_id}에서 계속")
-                return last_site_id
-            
-            # 포스팅이 완료되었다면 다음 사이트부터 시작
-            next_site_id = posting_state.get("next_site_id")
-            if next_site_id:
-                print(f"🔄 다음 사이트부터 시작: {next_site_id}")
-                return next_site_id
-            
-            # 저장된 상태가 없다면 첫 번째 사이트
-            sites = self.data.get("sites", [])
-            first_site_id = sites[0].get("id") if sites else None
-            print(f"🔄 첫 번째 사이트부터 시작: {first_site_id}")
-            return first_site_id
-            
-        except Exception as e:
-            print(f"시작 사이트 ID 조회 오류: {e}")
-            # 오류 발생 시 첫 번째 사이트 반환
-            sites = self.data.get("sites", [])
-            return sites[0].get("id") if sites else None
-
-    def add_site(self, site_data):
-        """새 사이트 추가"""
-        # sites 데이터 구조 확인 및 보정
-        if "sites" not in self.data:
-            print("data에 sites 키가 없음, 초기화")
-            self.data["sites"] = []
-        
-        # 안전한 ID 생성
-        existing_ids = [site.get("id", 0) for site in self.data["sites"] if isinstance(site, dict)]
-        site_id = max(existing_ids) + 1 if existing_ids else 1
-        
-        site_data["id"] = site_id
-        site_data["created_at"] = datetime.now().isoformat()
-        site_data["active"] = True
+            cat_response = session.get(f"{site_url}/wp-json/wp/v2/categories/{category_id}",
+                                       headers=headers, timeout=15)
+            if cat_response.status_code == 200:
+                result['category'] = f"{cat_response.json().get('name', '')} (ID: {category_id})"
+            else:
+                result['category'] = f"❌ 없음 (ID: {category_id})"
+        except Exception:
+            result['category'] = f"⚠️ 확인 실패 (ID: {category_id})"
+
+        category_ok = not result['category'].startswith(('❌', '⚠️'))
+        result['ok'] = category_ok and result['can_upload']
+        if result['ok']:
+            result['status'] = "✅ 정상"
+        elif not category_ok:
+            result['status'] = "⚠️ 카테고리 확인 필요"
+        else:
+            result['status'] = "⚠️ 미디어 업로드 권한 없음"
+        return result
 
-        # 키워드 파일과 썸네일 이미지 파일 자동 생성
-        self.create_site_resources(site_data)
+    except Exception as e:
+        result['status'] = f"❌ 오류: {str(e)[:60]}"
+        return result
+    finally:
+        result['total_ms'] = elapsed_ms(started)
 
-        self.data["sites"].append(site_data)
-        self.save_sites()
-        return site_id
+class SiteHealthDialog(QDialog):
+    """전체 사이트 상태 점검 다이얼로그 - 제한된 스레드 풀에서 동시에 점검"""
 
-    def create_site_resources(self, site_data):
-        """사이트별 리소스 파일 생성"""
-        try:
-            # 키워드 파일 생성
-            keyword_file = site_data.get("keyword_file", "")
-            if keyword_file:
-                keyword_path = os.path.join(get_base_path(), "keywords", keyword_file)
-                if not os.path.exists(keyword_path):
-                    # 기본 키워드 템플릿 생성
-                    default_keywords = [
-                        "# 사이트별 키워드 파일",
-                        f"# 사이트: {site_data.get('name', '')}",
-                        f"# URL: {site_data.get('url', '')}",
-                        "",
-                        "# 키워드를 한 줄에 하나씩 작성.",
-                        "# 예시:",
-                        "인공지능",
-                        "AI 뉴스",
-                        "머신러닝",
-                        "딥러닝",
-                        "기술 동향"
-                    ]
-
-                    with open(keyword_path, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(default_keywords))
-
-                    print(f"키워드 파일 생성됨: {keyword_path}")
-
-            # 썸네일 이미지 파일 확인 (존재하지 않으면 경고 메시지만)
-            thumbnail_image = site_data.get("thumbnail_image", "")
-            if thumbnail_image:
-                thumbnail_path = os.path.join(get_base_path(), "images", thumbnail_image)
-                if not os.path.exists(thumbnail_path):
-                    print(f"경고: 썸네일 이미지가 없습니다. 다음 경로에 이미지를 추가해주세요: {thumbnail_path}")
+    COLUMNS = ["사이트", "URL", "상태", "REST (ms)", "인증 방법", "인증 (ms)", "카테고리", "미디어 업로드", "총 소요 (ms)"]
 
-        except Exception as e:
-            print(f"사이트 리소스 생성 오류: {e}")
-
-    def get_site(self, site_id):
-        """사이트 정보 조회"""
-        for site in self.data.get("sites", []):
-            if site["id"] == site_id:
-                return site
-        return None
-
-    def update_site(self, site_id, site_data):
-        """사이트 정보 업데이트"""
-        for i, site in enumerate(self.data.get("sites", [])):
-            if site["id"] == site_id:
-                site_data["id"] = site_id
-                site_data["updated_at"] = datetime.now().isoformat()
-                self.data["sites"][i] = site_data
-                self.save_setting()
-                return True
-        return False
+    def __init__(self, config_manager, parent=None):
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self.pool = QThreadPool(self)
+        max_workers = config_manager.data["global_settings"].get("health_scan_workers", 4)
+        self.pool.setMaxThreadCount(max(1, int(max_workers)))
+        self.tasks = []
+        self.done_count = 0
+        self.setup_ui()
 
-    def delete_site(self, site_id):
-        """사이트 삭제"""
-        try:
-            log_to_file(f"[MAIN] 사이트 삭제 시작 - ID: {site_id} (타입: {type(site_id)})")
-            
-            # sites 데이터를 직접 수정
-            if "sites" not in self.data:
-                self.data["sites"] = []
-            
-            original_count = len(self.data["sites"])
-            log_to_file(f"[MAIN] 삭제 전 사이트 수: {original_count}")
-            
-            # 기존 사이트들의 ID와 타입 확인
-            for i, site in enumerate(self.data["sites"]):
-                log_to_file(f"[MAIN] 사이트 {i}: ID={site['id']} (타입: {type(site['id'])}), 이름={site.get('name', 'Unknown')}")
-            
-            # 타입 통일해서 삭제 (문자열과 숫자 모두 고려) - data 직접 수정
-            self.data["sites"] = [s for s in self.data["sites"] if str(s["id"]) != str(site_id)]
-            
-            log_to_file(f"[MAIN] 삭제 후 사이트 수: {len(self.data['sites'])}")
-            
-            self.save_setting()  # save_sites 대신 save_setting 직접 호출
-            log_to_file(f"[MAIN] 설정 파일 저장 완료")
-            
-            # 실제로 삭제되었는지 확인
-            result = len(self.data["sites"]) < original_count
-            log_to_file(f"[MAIN] 삭제 결과: {result}")
-            return result
-        except Exception as e:
-            print(f"사이트 삭제 오류: {e}")
-            log_to_file(f"[MAIN] 사이트 삭제 오류: {e}")
-            return False
+    def setup_ui(self):
+        self.setWindowTitle("🩺 전체 사이트 점검")
+        self.resize(1100, 500)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['background']};
+                color: {COLORS['text']};
+            }}
+            QTableWidget {{
+                background-color: {COLORS['surface']};
+                color: {COLORS['text']};
+                gridline-color: {COLORS['border']};
+            }}
+            QHeaderView::section {{
+                background-color: {COLORS['surface_light']};
+                color: {COLORS['text']};
+                padding: 6px;
+                border: 1px solid {COLORS['border']};
+            }}
+        """)
 
-    def update_site_active(self, site_id, active_status):
-        """사이트 활성화 상태 업데이트"""
-        try:
-            for site in self.data["sites"]:
-                if site["id"] == site_id:
-                    site["active"] = active_status
-                    site["updated_at"] = datetime.now().isoformat()
-                    self.save_setting()
-                    return True
-            return False
-        except Exception as e:
-            print(f"사이트 활성화 상태 업데이트 오류: {e}")
-            return False
+        layout = QVBoxLayout()
 
-    def get_site_keywords(self, site_data):
-        """사이트별 키워드 파일에서 키워드 로드 - used 키워드 제외"""
-        try:
-            keyword_file = site_data.get("keyword_file", "")
-            if not keyword_file:
-                return []
+        self.summary_label = QLabel("점검 대기 중")
+        self.summary_label.setStyleSheet("font-weight: bold; padding: 4px;")
+        layout.addWidget(self.summary_label)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        button_row = QHBoxLayout()
+        self.rescan_btn = QPushButton("🔄 다시 점검")
+        self.rescan_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.rescan_btn.clicked.connect(self.start_scan)
+        button_row.addWidget(self.rescan_btn)
+        button_row.addStretch()
+        close_btn = QPushButton("닫기")
+        close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        close_btn.clicked.connect(self.close)
+        button_row.addWidget(close_btn)
+        layout.addLayout(button_row)
 
-            base_path = get_base_path()
-            keyword_path = os.path.join(base_path, "keywords", keyword_file)
-            if not os.path.exists(keyword_path):
-                print(f"❌ 키워드 파일이 존재하지 않습니다: {keyword_path}")
-                return []
+        self.setLayout(layout)
 
-            # 원본 키워드 파일 읽기
-            with open(keyword_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+    def start_scan(self):
+        """모든 사이트 점검 시작"""
+        self.cancel_scan()
+        sites = self.config_manager.data.get("sites", [])
+        username = self.config_manager.data["global_settings"].get("common_username", "")
+        password = self.config_manager.data["global_settings"].get("common_password", "")
 
-            # 주석 제거하고 빈 줄 제거
-            available_keywords = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    available_keywords.append(line)
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        self.done_count = 0
 
-            # used 키워드 파일이 있다면 이미 사용된 키워드들을 확인
-            used_filename = f"used_{keyword_file}"
-            used_path = os.path.join(base_path, "keywords", used_filename)
-            used_keywords = set()
-            
-            if os.path.exists(used_path):
-                try:
-                    with open(used_path, 'r', encoding='utf-8') as f:
-                        used_lines = f.readlines()
-                    for line in used_lines:
-                        line = line.strip()
-                        if line:
-                            used_keywords.add(line)
-                except Exception as used_error:
-                    print(f"⚠️ used 파일 읽기 오류: {used_error}")
-
-            # 사용되지 않은 키워드만 반환
-            final_keywords = [keyword for keyword in available_keywords if keyword not in used_keywords]
-            
-            if not final_keywords:
-                print(f"⚠️ 사용 가능한 키워드가 없습니다. used 파일을 확인.")
-                
-            return final_keywords
+        if not sites:
+            self.summary_label.setText("등록된 사이트가 없습니다.")
+            return
+        if not all([username, password]):
+            self.summary_label.setText("❌ 전역 설정의 사용자명/비밀번호를 먼저 입력해주세요.")
+            return
 
-        except Exception as e:
-            print(f"❌ 키워드 파일 로드 오류: {e}")
-            return []
+        self.rescan_btn.setEnabled(False)
+        self.total_count = len(sites)
+        self.summary_label.setText(f"⏳ {self.total_count}개 사이트 점검 중 (동시 {self.pool.maxThreadCount()}개)")
+
+        for site in sites:
+            task = start_background_task(
+                self, scan_site_health, site, username, password,
+                on_finished=self.on_site_scanned,
+                on_error=lambda message, name=site.get('name', ''): self.on_site_scanned(
+                    {'name': name, 'url': '', 'status': f"❌ 오류: {message}"}),
+                pool=self.pool
+            )
+            self.tasks.append(task)
 
-    def get_site_thumbnail_path(self, site_data):
-        """사이트별 썸네일 이미지 경로 반환"""
-        thumbnail_image = site_data.get("thumbnail_image", "")
-        if thumbnail_image:
-            thumbnail_path = os.path.join(get_base_path(), "images", thumbnail_image)
-            if os.path.exists(thumbnail_path):
-                return thumbnail_path
-        return None
+    def cancel_scan(self):
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+
+    def on_site_scanned(self, result):
+        if not result:
+            return
+        self.add_result_row(result)
+        self.done_count += 1
+        if self.done_count >= self.total_count:
+            ok_count = sum(
+                1 for row in range(self.table.rowCount())
+                if self.table.item(row, 2).text().startswith("✅")
+            )
+            self.summary_label.setText(f"✅ 점검 완료: 정상 {ok_count} / 전체 {self.total_count}")
+            self.rescan_btn.setEnabled(True)
+            self.tasks = []
+            self.table.setSortingEnabled(True)
+            self.table.sortItems(2, Qt.SortOrder.AscendingOrder)
+        else:
+            self.summary_label.setText(f"⏳ 점검 중 {self.done_count}/{self.total_count}")
+
+    def add_result_row(self, result):
+        def text_item(value):
+            return QTableWidgetItem("" if value is None else str(value))
+
+        def number_item(value):
+            # 숫자 기준 정렬을 위해 DisplayRole에 int 저장
+            item = QTableWidgetItem()
+            if value is not None:
+                item.setData(Qt.ItemDataRole.DisplayRole, int(value))
+            return item
+
+        can_upload = result.get('can_upload')
+        upload_text = "" if can_upload is None else ("✅" if can_upload else "❌")
+
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        items = [
+            text_item(result.get('name')),
+            text_item(result.get('url')),
+            text_item(result.get('status')),
+            number_item(result.get('rest_ms')),
+            text_item(result.get('auth_method')),
+            number_item(result.get('auth_ms')),
+            text_item(result.get('category')),
+            text_item(upload_text),
+            number_item(result.get('total_ms')),
+        ]
+        for col, item in enumerate(items):
+            self.table.setItem(row, col, item)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.tasks and self.table.rowCount() == 0:
+            QTimer.singleShot(0, self.start_scan)
+
+    def done(self, result):
+        # 닫기/ESC 모두 이 경로를 거침 - 남은 점검 취소
+        self.cancel_scan()
+        super().done(result)
 
 class SiteEditDialog(QDialog):
     """사이트 추가/편집 다이얼로그"""
@@ -5117,7 +1054,7 @@ class SiteEditDialog(QDialog):
             self.category_edit.setValue(self.site_data.get("category_id", 1))
 
     def test_connection(self):
-        """WordPress 연결 테스트 - 다중 인증 방법 지원"""
+        """WordPress 연결 테스트 - 다중 인증 방법 지원 (백그라운드 실행)"""
         url = self.url_edit.text().strip()
 
         # 전역 설정에서 사용자명/비밀번호 가져오기
@@ -5129,171 +1066,10 @@ class SiteEditDialog(QDialog):
             QMessageBox.warning(self, "경고", "URL과 전역 설정의 사용자명/비밀번호를 확인해주세요.")
             return
 
-        # 진행 상황 다이얼로그
-        progress_dialog = QProgressDialog("WordPress 연결 진단 중", "취소", 0, 100, self)
-        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        progress_dialog.setAutoClose(False)
-        progress_dialog.setAutoReset(False)
-        progress_dialog.show()
-
-        try:
-            session = requests.Session()
-            
-            # 1. 기본 사이트 접근 테스트
-            progress_dialog.setValue(20)
-            progress_dialog.setLabelText("사이트 접근성 확인 중")
-            QApplication.processEvents()
-            
-            try:
-                site_response = session.get(url, timeout=10)
-                if site_response.status_code != 200:
-                    progress_dialog.close()
-                    QMessageBox.warning(self, "사이트 접근 경고", f"사이트 접근 시 HTTP {site_response.status_code} 응답")
-                    return
-            except Exception as e:
-                progress_dialog.close()
-                QMessageBox.critical(self, "사이트 접근 실패", f"사이트에 접근할 수 없습니다:\n{str(e)}")
-                return
-            
-            # 2. WordPress REST API 확인
-            progress_dialog.setValue(40)
-            progress_dialog.setLabelText("WordPress REST API 확인 중")
-            QApplication.processEvents()
-            
-            api_test_url = f"{url.rstrip('/')}/wp-json/wp/v2/"
-            try:
-                api_response = session.get(api_test_url, timeout=10)
-                if api_response.status_code == 200:
-                    api_info = api_response.json()
-                    wp_description = api_info.get('description', 'WordPress Site')
-                else:
-                    progress_dialog.close()
-                    QMessageBox.warning(self, "REST API 오류", f"WordPress REST API 접근 불가 (HTTP {api_response.status_code})")
-                    return
-            except Exception as e:
-                progress_dialog.close()
-                QMessageBox.critical(self, "REST API 오류", f"WordPress REST API 확인 실패:\n{str(e)}")
-                return
-            
-            # 3. 다중 인증 방법 테스트
-            progress_dialog.setValue(60)
-            progress_dialog.setLabelText("인증 방법 테스트 중")
-            QApplication.processEvents()
-            
-            user_url = f"{url.rstrip('/')}/wp-json/wp/v2/users/me"
-            auth_success = False
-            user_info = None
-            successful_method = ""
-            
-            # 여러 인증 방법 시도
-            import base64
-            auth_methods = [
-                ("Application Password (공백 포함)", username, password),
-                ("Application Password (공백 제거)", username, password.replace(" ", "")),
-                ("Basic Authentication", username, password)
-            ]
-            
-            for method_name, user, pwd in auth_methods:
-                if progress_dialog.wasCanceled():
-                    return
-                
-                try:
-                    credentials = f"{user}:{pwd}"
-                    token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
-                    headers = {
-                        'Authorization': f'Basic {token}',
-                        'User-Agent': 'Auto-WP/1.0'
-                    }
-                    
-                    auth_response = session.get(user_url, headers=headers, timeout=15)
-                    
-                    if auth_response.status_code == 200:
-                        user_info = auth_response.json()
-                        auth_success = True
-                        successful_method = method_name
-                        break
-                        
-                except Exception:
-                    continue
-            
-            # 4. 카테고리 확인
-            if auth_success:
-                progress_dialog.setValue(80)
-                progress_dialog.setLabelText("카테고리 확인 중")
-                QApplication.processEvents()
-                
-                category_id = self.category_edit.value()
-                categories_url = f"{url.rstrip('/')}/wp-json/wp/v2/categories/{category_id}"
-                
-                category_name = "알 수 없음"
-                try:
-                    cat_response = session.get(categories_url, headers=headers, timeout=10)
-                    if cat_response.status_code == 200:
-                        cat_info = cat_response.json()
-                        category_name = cat_info.get('name', f'ID {category_id}')
-                except Exception:
-                    pass
-            
-            # 5. 결과 표시
-            progress_dialog.setValue(100)
-            progress_dialog.close()
-            
-            if auth_success and user_info:
-                user_name = user_info.get('name', 'Unknown')
-                user_roles = user_info.get('roles', [])
-                capabilities = user_info.get('capabilities', {})
-                
-                # 핵심 권한 확인
-                can_publish = capabilities.get('publish_posts', False)
-                can_edit = capabilities.get('edit_posts', False)
-                can_upload = capabilities.get('upload_files', False)
-                
-                message = f"✅ 연결 성공!\n\n"
-                message += f"WordPress: {wp_description}\n"
-                message += f"인증 방법: {successful_method}\n\n"
-                message += f"사용자 정보:\n"
-                message += f"  이름: {user_name}\n"
-                message += f"  역할: {', '.join(user_roles)}\n\n"
-                message += f"권한 확인:\n"
-                message += f"  포스트 작성: {'✅' if can_edit else '❌'}\n"
-                message += f"  포스트 발행: {'✅' if can_publish else '❌'}\n"
-                message += f"  파일 업로드: {'✅' if can_upload else '❌'}\n\n"
-                message += f"포스팅 카테고리: {category_name} (ID: {category_id})"
-                
-                if not (can_edit and can_publish):
-                    message += f"\n\n⚠️ 경고: 포스트 작성/발행 권한이 부족합니다.\n사용자를 '편집자' 이상 권한으로 설정해주세요."
-                
-                QMessageBox.information(self, "연결 테스트 결과", message)
-            else:
-                # 인증 실패 안내
-                error_msg = "❌ 모든 인증 방법 실패!\n\n"
-                error_msg += "📋 Application Password 설정 가이드:\n"
-                error_msg += "1. WordPress 관리자 로그인\n"
-                error_msg += "2. 사용자 > 프로필 메뉴로 이동\n"
-                error_msg += "3. 'Application Passwords' 섹션 찾기\n"
-                error_msg += "4. 앱 이름 입력 (예: Auto-WP)\n"
-                error_msg += "5. '새 Application Password 추가' 클릭\n"
-                error_msg += "6. 생성된 패스워드를 복사\n"
-                error_msg += "7. 전역 설정의 패스워드 필드에 붙여넣기\n\n"
-                error_msg += "⚠️ 주의사항:\n"
-                error_msg += "• Application Password는 일반 로그인 패스워드와 다릅니다\n"
-                error_msg += "• 생성된 패스워드는 한 번만 표시됩니다\n"
-                error_msg += "• 사용자는 '편집자' 이상의 권한이 필요합니다"
-                
-                QMessageBox.warning(self, "인증 실패", error_msg)
-                
-        except requests.exceptions.ConnectTimeout:
-            if 'progress_dialog' in locals():
-                progress_dialog.close()
-            QMessageBox.critical(self, "연결 오류", "❌ 연결 시간 초과\n\nURL을 확인해주세요.")
-        except requests.exceptions.ConnectionError:
-            if 'progress_dialog' in locals():
-                progress_dialog.close()
-            QMessageBox.critical(self, "연결 오류", "❌ 서버에 연결할 수 없습니다\n\nURL과 네트워크 연결을 확인해주세요.")
-        except Exception as e:
-            if 'progress_dialog' in locals():
-                progress_dialog.close()
-            QMessageBox.critical(self, "오류", f"❌ 연결 테스트 중 오류:\n{str(e)}")
+        run_connection_test_with_progress(
+            self, "WordPress 연결 진단 중", url, username, password,
+            category_id=self.category_edit.value()
+        )
 
     def get_site_data(self):
         """사이트 데이터 반환"""
@@ -5770,6 +1546,12 @@ class SiteWidget(QWidget):
         except Exception:
             pass
             
+def apply_site_credentials(data, username, password):
+    """설정 사본(data)의 모든 사이트 사용자명/비밀번호를 공통 설정으로 변경 - ConfigManager.update()용"""
+    for site in data.get("sites", []):
+        site['username'] = username
+        site['password'] = password
+
 class MainWindow(QMainWindow):
     """메인 윈도우"""
 
@@ -5798,6 +1580,7 @@ class MainWindow(QMainWindow):
         self.next_posting_time = None
         self.posting_interval_seconds = 0
         self.countdown_timer = QTimer()
+        self.countdown_timer.setSingleShot(True)  # 표시가 바뀌는 시점에만 다시 예약
         self.countdown_timer.timeout.connect(self.update_next_posting_countdown)
         
         # 현재 포스팅 중인 사이트 추적
@@ -6681,6 +2464,28 @@ class MainWindow(QMainWindow):
         self.refresh_sites_btn.clicked.connect(self.refresh_site_list)
         button_layout.addWidget(self.refresh_sites_btn)
 
+        # 전체 사이트 점검 버튼
+        self.health_scan_btn = QPushButton("🩺 전체 사이트 점검")
+        self.health_scan_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.health_scan_btn.setMinimumWidth(100)  # 최소 너비 설정
+        self.health_scan_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.health_scan_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: #8FBCBB;
+                color: white;
+                font-weight: normal;
+                padding: 10px 15px;
+                border-radius: 8px;
+                border: none;
+                font-size: 12px;
+            }}
+            QPushButton:hover {{
+                background-color: #88C0D0;
+            }}
+        """)
+        self.health_scan_btn.clicked.connect(self.open_site_health_scan)
+        button_layout.addWidget(self.health_scan_btn)
+
         button_layout.addStretch()
 
         layout.addLayout(button_layout)
@@ -6942,6 +2747,23 @@ class MainWindow(QMainWindow):
         self.settings_grid.addWidget(self.refresh_button_label, 1, 2, 1, 1)
         
         status_layout.addLayout(self.settings_grid)
+
+        # API 요청 제한/일일 할당량 사용 현황 (5초마다 갱신)
+        self.quota_status_label = QLabel()
+        self.quota_status_label.setStyleSheet(f"""
+            QLabel {{
+                color: {COLORS['text']};
+                font-size: 12px;
+                padding: 6px 10px;
+                border: 1px solid {COLORS['border']};
+                border-radius: 8px;
+            }}
+        """)
+        status_layout.addWidget(self.quota_status_label)
+        self.quota_timer = QTimer()
+        self.quota_timer.timeout.connect(self.update_quota_status)
+        self.quota_timer.start(5000)
+        self.update_quota_status()
         
         # 포스팅 제어 버튼들 - 2x2 그리드로 변경
         status_layout.addSpacing(20)
@@ -7121,8 +2943,8 @@ class MainWindow(QMainWindow):
         self.user_scrolling = False
         self.last_scroll_time = 0
         self.scroll_timer = QTimer()
+        self.scroll_timer.setSingleShot(True)  # 마지막 스크롤 후 10초에 한 번만 실행 (주기 체크 없음)
         self.scroll_timer.timeout.connect(self.check_scroll_timeout)
-        self.scroll_timer.start(1000)  # 1초마다 체크
 
         # 시작 메시지
         from datetime import datetime
@@ -7244,16 +3066,14 @@ class MainWindow(QMainWindow):
     def on_ai_model_changed(self, model):
         """AI 모델 변경 시 설정 업데이트"""
         try:
-            self.config_manager.data["global_settings"]["ai_model"] = model
-            self.config_manager.save_config()
+            self.config_manager.update(lambda data: data["global_settings"].update(ai_model=model))
         except Exception as e:
             print(f"AI 모델 설정 저장 오류: {e}")
 
     def on_posting_mode_changed(self, mode):
         """포스팅 모드 변경 시 설정 업데이트 및 설정 탭과 동기화"""
         try:
-            self.config_manager.data["global_settings"]["posting_mode"] = mode
-            self.config_manager.save_config()
+            self.config_manager.update(lambda data: data["global_settings"].update(posting_mode=mode))
             
             # 설정 탭의 포스팅 모드 콤보박스도 업데이트
             if hasattr(self, 'settings_posting_mode_combo'):
@@ -7269,8 +3089,7 @@ class MainWindow(QMainWindow):
     def on_settings_posting_mode_changed(self, mode):
         """설정 탭의 포스팅 모드 변경 시 모니터링 탭과 동기화"""
         try:
-            self.config_manager.data["global_settings"]["posting_mode"] = mode
-            self.config_manager.save_config()
+            self.config_manager.update(lambda data: data["global_settings"].update(posting_mode=mode))
             
             # 모니터링 탭의 포스팅 모드 콤보박스도 업데이트
             if hasattr(self, 'posting_mode_combo'):
@@ -7283,6 +3102,30 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"포스팅 모드 설정 저장 오류: {e}")
 
+    def update_quota_status(self):
+        """모니터링 탭의 API 사용량(분당/일일) 표시 갱신"""
+        try:
+            limiter = get_rate_limiter()
+            parts = []
+            for provider, name in (("gemini", "Gemini"), ("openai", "OpenAI")):
+                keys = self.config_manager.get_api_keys(provider)
+                if not keys:
+                    continue
+                limits = self.config_manager.get_rate_limit(provider)
+                statuses = [limiter.status(provider, key, limits['per_minute'], limits['per_day']) for key, _ in keys]
+                quarantined = sum(1 for entry in get_api_key_pool(provider).snapshot() if entry['quarantined'])
+                minute_ok = any(status['minute_ok'] and status['daily_ok'] for status in statuses)
+                daily_ok = any(status['daily_ok'] for status in statuses)
+                icon = "✅" if minute_ok else ("⛔" if not daily_ok else "⏳")
+                text = (f"{icon} {name} 분당 {sum(st['minute_count'] for st in statuses)}/{limits['per_minute'] * len(keys)} · "
+                        f"오늘 {sum(st['daily_count'] for st in statuses)}/{limits['per_day'] * len(keys)}")
+                if len(keys) > 1:
+                    text += f" · 키 {len(keys) - quarantined}/{len(keys)}"
+                parts.append(text)
+            self.quota_status_label.setText("🚦 API 사용량  " + ("   |   ".join(parts) if parts else "API 키 없음"))
+        except Exception as e:
+            print(f"API 사용량 표시 오류: {e}")
+
     def update_monitoring_settings(self):
         """설정 저장 후 모니터링 탭의 '현재 설정 상태' 업데이트"""
         try:
@@ -7458,13 +3301,9 @@ class MainWindow(QMainWindow):
         self.refresh_all_status()
     
     def check_scroll_timeout(self):
-        """사용자 스크롤 타임아웃 체크 - 10초 이상 스크롤하지 않으면 자동 스크롤 재개"""
+        """사용자 스크롤 타임아웃 - 마지막 스크롤 10초 후 자동 스크롤 재개"""
         try:
-            import time
-            current_time = time.time()
-            
-            # 사용자가 스크롤 중이고, 마지막 스크롤 후 10초 경과
-            if self.user_scrolling and (current_time - self.last_scroll_time) >= 10:
+            if self.user_scrolling:
                 self.user_scrolling = False
                 # 현재 진행 상황으로 스크롤
                 self.progress_text.moveCursor(self.progress_text.textCursor().End)
@@ -7647,7 +3486,7 @@ class MainWindow(QMainWindow):
             self.inline_keywords_edit.setText(filename)
 
     def test_inline_connection(self):
-        """인라인 폼의 연결 테스트 - 다중 인증 방법 지원"""
+        """인라인 폼의 연결 테스트 - 다중 인증 방법 지원 (백그라운드 실행)"""
         url = self.inline_url_edit.text().strip()
         username = self.config_manager.data["global_settings"].get("common_username", "")
         password = self.config_manager.data["global_settings"].get("common_password", "")
@@ -7656,145 +3495,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "경고", "URL과 전역 사용자명/비밀번호가 모두 설정되어야 합니다.")
             return
 
-        # 진행 상황 다이얼로그 생성
-        progress_dialog = QProgressDialog("WordPress 연결 테스트 중", "취소", 0, 100, self)
-        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        progress_dialog.setAutoClose(False)
-        progress_dialog.setAutoReset(False)
-        progress_dialog.show()
+        run_connection_test_with_progress(self, "WordPress 연결 테스트 중", url, username, password)
 
-        try:
-            import requests
-            session = requests.Session()
-            
-            # 1. 기본 사이트 접근 테스트 (10%)
-            progress_dialog.setValue(10)
-            progress_dialog.setLabelText("사이트 접근성 확인 중")
-            QApplication.processEvents()
-            
-            try:
-                response = session.get(url, timeout=10)
-                if response.status_code != 200:
-                    progress_dialog.close()
-                    QMessageBox.warning(self, "연결 경고", f"사이트 접근 시 HTTP {response.status_code} 응답을 받았습니다.")
-                    return
-            except Exception as e:
-                progress_dialog.close()
-                QMessageBox.critical(self, "연결 실패", f"사이트에 접근할 수 없습니다:\n{str(e)}")
-                return
-            
-            # 2. WordPress REST API 확인 (30%)
-            progress_dialog.setValue(30)
-            progress_dialog.setLabelText("WordPress REST API 확인 중")
-            QApplication.processEvents()
-            
-            api_test_url = f"{url.rstrip('/')}/wp-json/wp/v2/"
-            try:
-                api_response = session.get(api_test_url, timeout=10)
-                if api_response.status_code != 200:
-                    progress_dialog.close()
-                    QMessageBox.warning(self, "API 오류", f"WordPress REST API에 접근할 수 없습니다.\nHTTP {api_response.status_code}")
-                    return
-                
-                api_info = api_response.json()
-                wp_description = api_info.get('description', 'Unknown WordPress site')
-            except Exception as e:
-                progress_dialog.close()
-                QMessageBox.critical(self, "API 오류", f"WordPress REST API 확인 실패:\n{str(e)}")
-                return
-            
-            # 3. 다중 인증 방법 테스트 (50%)
-            progress_dialog.setValue(50)
-            progress_dialog.setLabelText("인증 방법 테스트 중")
-            QApplication.processEvents()
-            
-            user_url = f"{url.rstrip('/')}/wp-json/wp/v2/users/me"
-            auth_success = False
-            user_info = None
-            successful_method = ""
-            
-            # 인증 방법들
-            auth_methods = [
-                ("Application Password (공백 포함)", username, password),
-                ("Application Password (공백 제거)", username, password.replace(" ", "")),
-                ("Basic Authentication", username, password)
-            ]
-            
-            for i, (method_name, user, pwd) in enumerate(auth_methods):
-                progress_dialog.setValue(50 + (i * 15))
-                progress_dialog.setLabelText(f"{method_name} 테스트 중")
-                QApplication.processEvents()
-                
-                if progress_dialog.wasCanceled():
-                    return
-                
-                try:
-                    import base64
-                    credentials = f"{user}:{pwd}"
-                    token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
-                    headers = {
-                        'Authorization': f'Basic {token}',
-                        'User-Agent': 'Auto-WP/1.0'
-                    }
-                    
-                    auth_response = session.get(user_url, headers=headers, timeout=10)
-                    
-                    if auth_response.status_code == 200:
-                        user_info = auth_response.json()
-                        auth_success = True
-                        successful_method = method_name
-                        break
-                        
-                except Exception:
-                    continue
-            
-            # 4. 결과 표시 (100%)
-            progress_dialog.setValue(100)
-            progress_dialog.close()
-            
-            if auth_success and user_info:
-                user_name = user_info.get('name', 'Unknown')
-                user_roles = user_info.get('roles', [])
-                capabilities = user_info.get('capabilities', {})
-                
-                # 권한 확인
-                can_publish = capabilities.get('publish_posts', False)
-                can_edit = capabilities.get('edit_posts', False)
-                can_upload = capabilities.get('upload_files', False)
-                
-                message = f"✅ 연결 성공!\n\n"
-                message += f"WordPress: {wp_description}\n"
-                message += f"인증 방법: {successful_method}\n\n"
-                message += f"사용자 정보:\n"
-                message += f"  이름: {user_name}\n"
-                message += f"  역할: {', '.join(user_roles)}\n\n"
-                message += f"권한 확인:\n"
-                message += f"  포스트 작성: {'✅' if can_edit else '❌'}\n"
-                message += f"  포스트 발행: {'✅' if can_publish else '❌'}\n"
-                message += f"  파일 업로드: {'✅' if can_upload else '❌'}"
-                
-                if not (can_edit and can_publish):
-                    message += f"\n\n⚠️ 경고: 포스트 작성/발행 권한이 부족합니다.\n사용자를 '편집자' 이상 권한으로 설정해주세요."
-                
-                QMessageBox.information(self, "연결 테스트 결과", message)
-            else:
-                # 인증 실패 시 상세 가이드
-                error_msg = "❌ 모든 인증 방법 실패!\n\n"
-                error_msg += "해결 방법:\n"
-                error_msg += "1. WordPress 관리자 로그인\n"
-                error_msg += "2. 사용자 > 프로필 메뉴로 이동\n"
-                error_msg += "3. 'Application Passwords' 섹션 찾기\n"
-                error_msg += "4. 앱 이름 입력 (예: Auto-WP)\n"
-                error_msg += "5. '새 Application Password 추가' 클릭\n"
-                error_msg += "6. 생성된 패스워드를 복사하여 설정에 입력\n\n"
-                error_msg += "⚠️ 주의: Application Password는 일반 로그인 패스워드와 다릅니다!"
-                
-                QMessageBox.warning(self, "인증 실패", error_msg)
-                
-        except Exception as e:
-            if 'progress_dialog' in locals():
-                progress_dialog.close()
-            QMessageBox.critical(self, "오류", f"연결 테스트 중 오류가 발생했습니다:\n{str(e)}")
+    def open_site_health_scan(self):
+        """전체 사이트 상태 점검 다이얼로그 열기"""
+        dialog = SiteHealthDialog(self.config_manager, self)
+        dialog.exec()
 
     def save_inline_site(self):
         """인라인 폼으로 사이트 저장"""
@@ -8475,110 +4181,80 @@ class MainWindow(QMainWindow):
         return scroll_area
 
     def test_api_connections(self):
-        """API 연결 테스트"""
+        """API 연결 테스트 - OpenAI/Gemini를 백그라운드에서 병렬 확인"""
         self.update_posting_status("🧪 API 연결 테스트 시작")
-        
+
+        pending = {'count': 0}
+
+        def set_label(label, text, color):
+            label.setText(text)
+            label.setStyleSheet(f"color: {color}; font-weight: bold;")
+
+        def task_done():
+            pending['count'] -= 1
+            if pending['count'] <= 0:
+                self.update_posting_status("🧪 API 연결 테스트 완료!")
+
+        def on_openai_finished(result):
+            set_label(self.openai_status_label, "✅ 연결됨", "#A3BE8C")
+            self.update_posting_status(result['message'])
+            task_done()
+
+        def on_openai_error(message):
+            set_label(self.openai_status_label, "❌ 실패", "#BF616A")
+            self.update_posting_status(f"❌ OpenAI API 연결 실패: {message}")
+            task_done()
+
+        def on_gemini_finished(result):
+            if result.get('ok'):
+                set_label(self.gemini_status_label, "✅ 연결됨", "#A3BE8C")
+            elif result.get('missing_library'):
+                set_label(self.gemini_status_label, "❌ 라이브러리 없음", "#EBCB8B")
+                print("❌ google-generativeai 라이브러리 없음")
+            self.update_posting_status(result['message'])
+            task_done()
+
+        def on_gemini_error(error_detail):
+            set_label(self.gemini_status_label, "❌ 실패", "#BF616A")
+            # API 키 오류인 경우 더 명확한 메시지
+            if 'API_KEY_INVALID' in error_detail or 'invalid' in error_detail.lower():
+                error_msg = "API 키가 유효하지 않습니다. Google AI Studio에서 새 키를 발급받으세요."
+            elif 'PERMISSION_DENIED' in error_detail:
+                error_msg = "API 키 권한이 없습니다. API 활성화를 확인하세요."
+            elif 'quota' in error_detail.lower() or 'RATE_LIMIT_EXCEEDED' in error_detail:
+                if 'quota_limit_value' in error_detail and '"0"' in error_detail:
+                    error_msg = "무료 API 키 할당량이 없습니다. 유료 API 키를 사용하거나 Google AI Studio에서 새 키를 발급받으세요."
+                else:
+                    error_msg = "API 할당량 초과. 잠시 후 다시 시도하거나 유료 API 키를 사용하세요."
+            else:
+                error_msg = f"연결 실패: {error_detail}"
+
+            self.update_posting_status(f"❌ Gemini API {error_msg}")
+            print(f"❌ Gemini 연결 실패: {error_detail}")
+            task_done()
+
         # OpenAI 테스트
         openai_key = self.openai_key_edit.text().strip()
         if openai_key:
-            try:
-                from openai import OpenAI
-                client = OpenAI(api_key=openai_key)
-                response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": "안녕"}],
-                    max_tokens=10,
-                    timeout=10
-                )
-                self.openai_status_label.setText("✅ 연결됨")
-                self.openai_status_label.setStyleSheet("color: #A3BE8C; font-weight: bold;")
-                self.update_posting_status("✅ OpenAI API 연결 성공!")
-            except Exception as e:
-                self.openai_status_label.setText("❌ 실패")
-                self.openai_status_label.setStyleSheet("color: #BF616A; font-weight: bold;")
-                self.update_posting_status(f"❌ OpenAI API 연결 실패: {str(e)}")
+            pending['count'] += 1
+            set_label(self.openai_status_label, "⏳ 확인 중", "#EBCB8B")
+            start_background_task(self, check_openai_key, openai_key,
+                                  on_finished=on_openai_finished, on_error=on_openai_error)
         else:
-            self.openai_status_label.setText("❌ 미설정")
-            self.openai_status_label.setStyleSheet("color: #BF616A; font-weight: bold;")
-            
+            set_label(self.openai_status_label, "❌ 미설정", "#BF616A")
+
         # Gemini 테스트
         gemini_key = self.gemini_key_edit.text().strip()
         if gemini_key:
-            try:
-                if GEMINI_AVAILABLE:
-                    import google.generativeai as genai
-                    genai.configure(api_key=gemini_key)
-                    
-                    # 최신 Gemini 모델들 순서대로 시도 (2025년 최신 모델 포함)
-                    models_to_try = [
-                        'gemini-2.0-flash-exp',      # 2025년 최신 실험 모델
-                        'gemini-2.5-flash-lite',     # 2.5 lite 모델
-                        'gemini-1.5-flash-latest',   # 최신 Flash
-                        'gemini-1.5-flash',
-                        'gemini-1.5-pro-latest',     # 최신 Pro
-                        'gemini-1.5-pro',
-                        'gemini-pro'                 # Fallback
-                    ]
-                    
-                    last_error = None
-                    for model_name in models_to_try:
-                        try:
-                            print(f"🔍 Gemini 모델 시도: {model_name}")
-                            model = genai.GenerativeModel(model_name)
-                            response = model.generate_content(
-                                "안녕", 
-                                generation_config=genai.types.GenerationConfig(
-                                    max_output_tokens=10,
-                                    temperature=0.7
-                                ),
-                                request_options={'timeout': 10}
-                            )
-                            
-                            # 응답 확인
-                            if hasattr(response, 'text') and response.text:
-                                self.gemini_status_label.setText("✅ 연결됨")
-                                self.gemini_status_label.setStyleSheet("color: #A3BE8C; font-weight: bold;")
-                                self.update_posting_status(f"✅ Gemini API 연결 성공! (모델: {model_name})")
-                                print(f"✅ Gemini 연결 성공: {model_name}")
-                                break
-                        except Exception as model_error:
-                            last_error = str(model_error)
-                            print(f"❌ {model_name} 실패: {last_error}")
-                            continue
-                    else:
-                        # 모든 모델 실패
-                        error_msg = f"모든 Gemini 모델 테스트 실패. 마지막 오류: {last_error}"
-                        print(f"❌ {error_msg}")
-                        raise Exception(error_msg)
-                else:
-                    self.gemini_status_label.setText("❌ 라이브러리 없음")
-                    self.gemini_status_label.setStyleSheet("color: #EBCB8B; font-weight: bold;")
-                    self.update_posting_status("❌ google-generativeai 라이브러리가 설치되지 않음")
-                    print("❌ google-generativeai 라이브러리 없음")
-            except Exception as e:
-                self.gemini_status_label.setText("❌ 실패")
-                self.gemini_status_label.setStyleSheet("color: #BF616A; font-weight: bold;")
-                error_detail = str(e)
-                # API 키 오류인 경우 더 명확한 메시지
-                if 'API_KEY_INVALID' in error_detail or 'invalid' in error_detail.lower():
-                    error_msg = "API 키가 유효하지 않습니다. Google AI Studio에서 새 키를 발급받으세요."
-                elif 'PERMISSION_DENIED' in error_detail:
-                    error_msg = "API 키 권한이 없습니다. API 활성화를 확인하세요."
-                elif 'quota' in error_detail.lower() or 'RATE_LIMIT_EXCEEDED' in error_detail:
-                    if 'quota_limit_value' in error_detail and '"0"' in error_detail:
-                        error_msg = "무료 API 키 할당량이 없습니다. 유료 API 키를 사용하거나 Google AI Studio에서 새 키를 발급받으세요."
-                    else:
-                        error_msg = "API 할당량 초과. 잠시 후 다시 시도하거나 유료 API 키를 사용하세요."
-                else:
-                    error_msg = f"연결 실패: {error_detail}"
-                
-                self.update_posting_status(f"❌ Gemini API {error_msg}")
-                print(f"❌ Gemini 연결 실패: {error_detail}")
+            pending['count'] += 1
+            set_label(self.gemini_status_label, "⏳ 확인 중", "#EBCB8B")
+            start_background_task(self, check_gemini_key, gemini_key,
+                                  on_finished=on_gemini_finished, on_error=on_gemini_error)
         else:
-            self.gemini_status_label.setText("❌ 미설정")
-            self.gemini_status_label.setStyleSheet("color: #BF616A; font-weight: bold;")
-            
-        self.update_posting_status("🧪 API 연결 테스트 완료!")
+            set_label(self.gemini_status_label, "❌ 미설정", "#BF616A")
+
+        if pending['count'] == 0:
+            self.update_posting_status("🧪 API 연결 테스트 완료!")
 
     def save_settings(self):
         """설정 저장"""
@@ -8590,36 +4266,34 @@ class MainWindow(QMainWindow):
                 print("❌ [ERROR] openai_key_edit 위젯이 존재하지 않습니다!")
                 return
             
-            # API 키 저장 - data 직접 수정
+            # API 키 / AI 설정 / WordPress 설정
             openai_key = self.openai_key_edit.text()
             gemini_key = self.gemini_key_edit.text()
-            
-            self.config_manager.data["api_keys"]["openai"] = openai_key
-            self.config_manager.data["api_keys"]["gemini"] = gemini_key
-
-            # AI 설정 저장 - data 직접 수정
             default_ai = self.default_ai_combo.currentText()
             ai_model = self.ai_model_combo.currentText()
             posting_mode = self.settings_posting_mode_combo.currentText()
-            
-            self.config_manager.data["global_settings"]["default_ai"] = default_ai
-            self.config_manager.data["global_settings"]["ai_model"] = ai_model
-            self.config_manager.data["global_settings"]["posting_mode"] = posting_mode
-            
-            # WordPress 설정 저장 - data 직접 수정
             wait_time = self.wait_time_edit.text()
             username = self.common_username_edit.text()
             password = self.common_password_edit.text()
-            
-            self.config_manager.data["global_settings"]["default_wait_time"] = wait_time
-            self.config_manager.data["global_settings"]["common_username"] = username
-            self.config_manager.data["global_settings"]["common_password"] = password
 
-            # 🔥 중요: 기존 사이트들의 사용자명/비밀번호를 새로운 공통 설정으로 업데이트
-            self.update_all_sites_credentials(username, password)
-            
-            # 파일 저장 - save_setting 직접 호출
-            result = self.config_manager.save_setting()
+            def apply_settings(data):
+                data["api_keys"]["openai"] = openai_key
+                data["api_keys"]["gemini"] = gemini_key
+                data["global_settings"].update(
+                    default_ai=default_ai,
+                    ai_model=ai_model,
+                    posting_mode=posting_mode,
+                    default_wait_time=wait_time,
+                    common_username=username,
+                    common_password=password
+                )
+                # 🔥 중요: 기존 사이트들의 사용자명/비밀번호를 새로운 공통 설정으로 업데이트
+                apply_site_credentials(data, username, password)
+
+            # 한 번의 copy-on-write 변경으로 저장 - 포스팅 스레드는 일부만 바뀐 설정을 보지 않음
+            result = self.config_manager.update(apply_settings)
+            if hasattr(self, 'refresh_sites_list'):
+                self.refresh_sites_list()
             
             # 저장 후 JSON 파일 재로딩해서 검증
             if result:
@@ -8727,19 +4401,8 @@ class MainWindow(QMainWindow):
             if not new_username or not new_password:
                 return
                 
-            sites = self.config_manager.data.get("sites", [])
-            updated_count = 0
-            
-            for i, site in enumerate(sites):
-                old_username = site.get('username', '')
-                old_password = site.get('password', '')
-                site_name = site.get('name', f'Site-{i+1}')
-                
-                # 사용자명과 비밀번호 업데이트
-                site['username'] = new_username
-                site['password'] = new_password
-                
-                updated_count += 1
+            # 사본의 사용자명과 비밀번호 업데이트 후 통째로 교체 (포스팅 스레드는 다음 글부터 반영)
+            self.config_manager.update(lambda data: apply_site_credentials(data, new_username, new_password))
             
             # 사이트 관리 탭의 UI도 새로고침 (존재하는 경우)
             if hasattr(self, 'refresh_sites_list'):
@@ -8915,6 +4578,7 @@ class MainWindow(QMainWindow):
             self.posting_worker.single_posting_complete.connect(self.on_single_posting_complete)
             self.posting_worker.keyword_used.connect(self.update_keyword_count)
             self.posting_worker.error_occurred.connect(self.on_posting_error)
+            self.posting_worker.next_run_scheduled.connect(self.on_next_run_scheduled)
             
             self.posting_worker.start()
             
@@ -8934,10 +4598,6 @@ class MainWindow(QMainWindow):
             # 현재 포스팅 중인 사이트 정보 파싱 및 업데이트
             self.parse_and_update_current_site(message)
             
-            # "포스트 업로드 성공" 메시지 감지 시 카운트다운 시작
-            if "포스트 업로드 성공" in message:
-                self.set_next_posting_time()
-            
             
             # GUI 업데이트는 항상 메인 스레드에서 실행
             if hasattr(self, 'progress_text') and self.progress_text is not None:
@@ -9077,10 +4737,26 @@ class MainWindow(QMainWindow):
         print("🎉 모든 포스팅이 완료되었습니다!")
         
     def on_single_posting_complete(self):
-        """개별 포스팅 완료 후 카운트다운 시작"""
-        # 아직 포스팅이 진행 중이라면 (다른 사이트들이 남아있음) 카운트다운 시작
-        if self.is_posting:
-            self.start_next_posting_countdown()
+        """개별 포스팅 완료 - 카운트다운은 엔진이 실제 대기 시각을 알려줄 때(on_next_run_scheduled) 시작"""
+        pass
+
+    def on_next_run_scheduled(self, timestamp, site_name):
+        """엔진의 다음 실행 시각으로 카운트다운 표시 (0이면 예정 없음/일시정지)"""
+        try:
+            from datetime import datetime
+            if not timestamp:
+                self.countdown_timer.stop()
+                self.next_posting_time = None
+                if hasattr(self, 'next_posting_label') and hasattr(self.next_posting_label, 'value_button'):
+                    self.next_posting_label.value_button.setText("일시정지" if self.is_paused else "대기중")
+                return
+            self.next_posting_time = datetime.fromtimestamp(timestamp)
+            self.posting_interval_seconds = max(0, int(timestamp - datetime.now().timestamp()))
+            if site_name:
+                self.current_posting_site = site_name
+            self.update_next_posting_countdown()
+        except Exception as e:
+            print(f"다음 실행 시각 표시 오류: {e}")
         
     def on_posting_error(self, error_message):
         """포스팅 오류 처리 및 키워드 부족 알림"""
@@ -9274,9 +4950,10 @@ class MainWindow(QMainWindow):
             from PyQt6.QtCore import Qt
             import time
             
-            # 사용자가 스크롤 중임을 표시
+            # 사용자가 스크롤 중임을 표시 (10초간 추가 스크롤이 없으면 자동 스크롤 재개)
             self.user_scrolling = True
             self.last_scroll_time = time.time()
+            self.scroll_timer.start(10000)
             
             # 🔥 Ctrl 키가 눌린 경우 창 크기 조절 (폰트 크기가 아님!)
             if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
@@ -9403,8 +5080,8 @@ class MainWindow(QMainWindow):
                 display_text = f"{time_str}{next_site}"
                 self.next_posting_label.value_button.setText(display_text)
             
-            # 카운트다운 타이머 시작 (1초마다 업데이트)
-            self.countdown_timer.start(1000)
+            # 카운트다운 갱신 시작 (표시가 바뀌는 시점마다 재예약)
+            self.update_next_posting_countdown()
             
         except Exception as e:
             print(f"다음 포스팅 시간 설정 오류: {e}")
@@ -9472,6 +5149,10 @@ class MainWindow(QMainWindow):
                 
             if hasattr(self.next_posting_label, 'value_button'):
                 self.next_posting_label.value_button.setText(display_text)
+
+            # 남은 초 표시가 바뀌는 시점에 한 번만 다시 갱신
+            next_tick_ms = int((remaining.total_seconds() - total_seconds) * 1000) + 1
+            self.countdown_timer.start(max(next_tick_ms, 1))
             
         except Exception as e:
             print(f"카운트다운 업데이트 오류: {e}")
@@ -9551,8 +5232,8 @@ class MainWindow(QMainWindow):
                 display_text = f"{time_str}{next_site}"
                 self.next_posting_label.value_button.setText(display_text)
             
-            # 카운트다운 시작 (1초마다 업데이트)
-            self.countdown_timer.start(1000)
+            # 카운트다운 갱신 시작 (표시가 바뀌는 시점마다 재예약)
+            self.update_next_posting_countdown()
             
             # 분과 초로 표시 (로그용)
             wait_minutes = wait_seconds // 60
@@ -9684,7 +5365,7 @@ def main():
             log_file = open(log_file_path, "w", encoding="utf-8")
             sys.stdout = log_file
             sys.stderr = log_file
-        except Exception as e:
+        except Exception:
             pass  # 리다이렉트 실패 시 무시
     
     # sys, io 모듈 import
@@ -9702,6 +5383,9 @@ def main():
         # 인코딩 설정 실패 시 무시하고 계속 진행
         pass
     
+    # 기본 디렉토리 생성 (keywords, thumbnails, fonts, prompts, output)
+    ensure_base_directories()
+
     try:
         # QApplication 생성
         app = QApplication(sys.argv)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발행 전 중복 검사(PublishedContentIndex) 벤치마크
+
+임시 DB에 합성 글을 N개 색인한 뒤, 중복 글(일부 문장만 바꾼 글)과 새 글의 조회 시간과
+검출 여부를 측정합니다. 조회 글은 미리 만들어 두고 find_duplicate 호출 시간만 잽니다.
+
+사용법:
+    python benchmarks/bench_duplicate_index.py [--posts 1000 10000 30000] [--queries 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from auto_wp_engine import PublishedContentIndex  # noqa: E402
+
+WORDS = ("워드프레스 자동 포스팅 키워드 콘텐츠 신청 방법 조건 대상 지원금 혜택 기간 서류 "
+         "온라인 접수 안내 확인 필요 경우 정부 지역 청년 주택 대출 금리 보험 연금 세금 환급").split()
+
+
+def make_article(rng, sentences=30):
+    return "\n".join(
+        "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))) + f" {rng.randint(0, 10**6)}.</p>"
+        for _ in range(sentences)
+    )
+
+
+def mutate(rng, article, ratio=0.15):
+    lines = article.split("\n")
+    for i in rng.sample(range(len(lines)), max(1, int(len(lines) * ratio))):
+        lines[i] = make_article(rng, 1)
+    return "\n".join(lines)
+
+
+def run(count, queries, seed=7):
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        index = PublishedContentIndex(os.path.join(tmp, "bench.db"))
+        articles = []
+        start = time.perf_counter()
+        for i in range(count):
+            article = make_article(rng)
+            articles.append(article)
+            index.add(f"site{i % 20}", f"키워드 {i} 신청 방법 총정리", article, keyword=f"키워드 {i}", post_id=i)
+        build = time.perf_counter() - start
+
+        dup_queries = []
+        for _ in range(queries):
+            i = rng.randrange(count)
+            dup_queries.append((f"키워드 {i} 신청방법 정리", mutate(rng, articles[i])))
+        new_queries = [(f"새로운 주제 {q} 완벽 가이드", make_article(rng)) for q in range(queries)]
+
+        hits = 0
+        start = time.perf_counter()
+        for title, content in dup_queries:
+            if index.find_duplicate(title, content):
+                hits += 1
+        dup_ms = (time.perf_counter() - start) * 1000 / queries
+
+        false_hits = 0
+        start = time.perf_counter()
+        for title, content in new_queries:
+            if index.find_duplicate(title, content):
+                false_hits += 1
+        new_ms = (time.perf_counter() - start) * 1000 / queries
+        index._conn.close()
+
+    print(f"{count:>7}개 | 색인 {build:6.1f}s | 중복 조회 {dup_ms:6.2f}ms (검출 {hits}/{queries}) "
+          f"| 새 글 조회 {new_ms:6.2f}ms (오검출 {false_hits}/{queries})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    for count in args.posts:
+        run(count, args.queries)
+
+
+if __name__ == "__main__":
+    main()
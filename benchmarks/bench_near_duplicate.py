@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+clean_content 11단계(근접 중복 문장 제거) 벤치마크
+
+기존 방식(모든 문장과 SequenceMatcher 비교)과 NearDuplicateIndex의 결과가 같은지 확인하고
+소요 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_near_duplicate.py [--dir output] [--synthetic 100 300 600]
+
+--dir 폴더의 *.html(실제 생성 글)을 사용하며, 글이 없으면 합성 글로 측정합니다.
+"""
+
+import argparse
+import glob
+import os
+import random
+import re
+import sys
+import time
+from difflib import SequenceMatcher
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from auto_wp_engine import NearDuplicateIndex  # noqa: E402
+
+
+def text_lines(html):
+    """HTML 태그를 제거한 비교 대상 문장 (clean_content와 같은 기준: 10자 초과)"""
+    lines = []
+    for line in html.split('\n'):
+        clean_line = re.sub(r'<[^>]*>', '', line).strip()
+        if len(clean_line) > 10:
+            lines.append(clean_line)
+    return lines
+
+
+def dedupe_reference(lines, threshold=0.8):
+    """기존 구현 - 유지된 모든 문장과 SequenceMatcher 비교"""
+    seen = set()
+    kept = []
+    for line in lines:
+        if line in seen:
+            continue
+        if any(SequenceMatcher(None, line.lower(), other.lower()).ratio() > threshold for other in seen):
+            continue
+        seen.add(line)
+        kept.append(line)
+    return kept
+
+
+def dedupe_index(lines, threshold=0.8):
+    """NearDuplicateIndex 사용"""
+    index = NearDuplicateIndex(threshold=threshold)
+    kept = []
+    for line in lines:
+        if line in index:
+            continue
+        if index.has_similar(line):
+            continue
+        index.add(line)
+        kept.append(line)
+    return kept
+
+
+def synthetic_article(line_count, seed):
+    """합성 글 - 일부 문장은 단어를 조금 바꾼 근접 중복으로 생성"""
+    rng = random.Random(seed)
+    words = ["정부", "지원금", "신청", "방법", "자격", "조건", "기간", "서류", "온라인", "방문",
+             "혜택", "대상", "소득", "기준", "확인", "절차", "주의", "사항", "최신", "정보",
+             "2025년", "변경", "내용", "안내", "필요", "준비", "완료", "결과", "지급", "일정"]
+    lines = []
+    for _ in range(line_count):
+        if lines and rng.random() < 0.3:
+            base = rng.choice(lines).split()
+            for _ in range(rng.randint(1, 3)):
+                base[rng.randrange(len(base))] = rng.choice(words)
+            lines.append(' '.join(base))
+        else:
+            lines.append(' '.join(rng.choice(words) for _ in range(rng.randint(8, 30))))
+    return lines
+
+
+def measure(label, lines):
+    start = time.perf_counter()
+    expected = dedupe_reference(lines)
+    reference_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    actual = dedupe_index(lines)
+    index_ms = (time.perf_counter() - start) * 1000
+
+    status = "✅ 동일" if expected == actual else "❌ 결과 불일치"
+    speedup = reference_ms / index_ms if index_ms else float('inf')
+    print(f"{status} {label:28s} 문장 {len(lines):5d} → 유지 {len(actual):5d} | "
+          f"기존 {reference_ms:9.1f} ms / 인덱스 {index_ms:8.1f} ms (x{speedup:.1f})")
+    return expected == actual
+
+
+def main():
+    parser = argparse.ArgumentParser(description="근접 중복 문장 제거 벤치마크")
+    parser.add_argument("--dir", default=os.path.join(ROOT, "output"), help="생성된 글(*.html) 폴더")
+    parser.add_argument("--synthetic", type=int, nargs="*", default=[100, 300, 600], help="합성 글 문장 수")
+    args = parser.parse_args()
+
+    all_same = True
+    files = sorted(glob.glob(os.path.join(args.dir, "*.html")))
+    for path in files:
+        with open(path, 'r', encoding='utf-8') as f:
+            all_same &= measure(os.path.basename(path)[:28], text_lines(f.read()))
+    if not files:
+        print(f"ℹ️ {args.dir}에 생성된 글이 없어 합성 글로 측정합니다.")
+
+    for count in args.synthetic:
+        all_same &= measure(f"synthetic-{count}", synthetic_article(count, seed=count))
+
+    sys.exit(0 if all_same else 1)
+
+
+if __name__ == "__main__":
+    main()
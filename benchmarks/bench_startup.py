@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시작 시간 벤치마크 - 각 진입점의 콜드 스타트(새 프로세스에서 모듈 로드) 시간 측정
+
+사용법:
+    python benchmarks/bench_startup.py [--runs 5] [--importtime]
+
+main()은 실행하지 않고 모듈 import까지만 측정합니다 (QApplication 생성 제외).
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = [
+    ("multi-site GUI", "auto_wp_multi-site.py"),
+    ("multi-site headless", "auto_wp_engine.py"),
+    ("single-site GUI", "auto_wp.py"),
+]
+
+# 새 인터프리터에서 모듈을 __main__이 아닌 이름으로 로드하고 소요 시간(ms)을 출력
+LOADER = """
+import importlib.util, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("bench_target", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print("BENCH_MS", (time.perf_counter() - start) * 1000)
+"""
+
+
+def measure(path, runs):
+    """콜드 스타트 시간 측정 - (모듈 로드 ms 목록, 프로세스 전체 ms 목록, 오류)"""
+    import time
+
+    load_times = []
+    wall_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", LOADER, path],
+            cwd=ROOT, capture_output=True, text=True, encoding="utf-8", errors="replace"
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            error = (result.stderr.strip().splitlines() or ["알 수 없는 오류"])[-1]
+            return load_times, wall_times, error
+        for line in result.stdout.splitlines():
+            if line.startswith("BENCH_MS"):
+                load_times.append(float(line.split()[1]))
+        wall_times.append(wall_ms)
+    return load_times, wall_times, None
+
+
+def show_importtime(path, limit=15):
+    """-X importtime 결과에서 누적 시간이 큰 모듈 출력"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOADER, path],
+        cwd=ROOT, capture_output=True, text=True, encoding="utf-8", errors="replace"
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) == 3:
+            rows.append((int(parts[1].strip()), parts[2].rstrip()))
+    rows.sort(reverse=True)
+    for cumulative_us, name in rows[:limit]:
+        print(f"      {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auto WP 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="진입점별 반복 횟수")
+    parser.add_argument("--importtime", action="store_true", help="누적 import 시간 상위 모듈 표시")
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]} / 반복 {args.runs}회")
+    for label, filename in ENTRY_POINTS:
+        path = os.path.join(ROOT, filename)
+        load_times, wall_times, error = measure(path, args.runs)
+        if error:
+            print(f"❌ {label:20s} ({filename}) 로드 실패: {error}")
+            continue
+        print(f"✅ {label:20s} 모듈 로드 중앙값 {statistics.median(load_times):8.1f} ms "
+              f"(최소 {min(load_times):.1f}) / 프로세스 전체 중앙값 {statistics.median(wall_times):8.1f} ms")
+        if args.importtime:
+            show_importtime(path)
+
+
+if __name__ == "__main__":
+    main()